@@ -0,0 +1,8 @@
+"""Benchmarks for Passphrase.
+
+Each benchmark module exposes a `run()` function returning a dict with its
+results, and can be executed on its own, i.e.:
+`python3 -m benchmarks.bench_random`. Run `python3 -m benchmarks` to run
+them all and get their results as JSON.
+
+"""
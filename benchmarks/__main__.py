@@ -0,0 +1,162 @@
+"""Run the benchmarks and output their results as JSON.
+
+Usage: python3 -m benchmarks [-o FILE] [--compare FILE] [--list] [NAME ...]
+
+Results of two runs, i.e. from two commits, can be compared with --compare:
+every number is printed along with its ratio to the previous one.
+
+"""
+
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from importlib import import_module
+from os import cpu_count
+from os.path import dirname
+from pkgutil import iter_modules
+from subprocess import run as subprocess_run, PIPE, DEVNULL
+import json
+import platform
+import sys
+
+PREFIX = 'bench_'
+
+
+def available() -> list:
+    """Return the names of the available benchmarks."""
+    return sorted(
+        name[len(PREFIX):] for _, name, _ in iter_modules([dirname(__file__)])
+        if name.startswith(PREFIX)
+    )
+
+
+def _commit() -> str:
+    try:
+        result = subprocess_run(
+            ['git', 'rev-parse', 'HEAD'],
+            stdout=PIPE,
+            stderr=DEVNULL,
+            cwd=dirname(__file__)
+        )
+    except OSError:
+        return None
+    return result.stdout.decode('utf-8').strip() or None
+
+
+def run(names: list) -> dict:
+    """Run the given benchmarks and return their results with metadata."""
+    results = {}
+    for name in names:
+        print('Running {}...'.format(name), file=sys.stderr)
+        module = import_module('{}.{}{}'.format(__package__, PREFIX, name))
+        try:
+            # Benchmarks must not mix their output with the results
+            with redirect_stdout(sys.stderr):
+                results[name] = module.run()
+        except Exception as exc:
+            results[name] = {'error': '{}: {}'.format(type(exc).__name__, exc)}
+    return {
+        'commit': _commit(),
+        'date': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': cpu_count(),
+        'results': results,
+    }
+
+
+def _flatten(results: dict, prefix: str = '') -> dict:
+    values = {}
+    for key, value in results.items():
+        path = prefix + str(key)
+        if isinstance(value, dict):
+            values.update(_flatten(value, path + '.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[path] = value
+    return values
+
+
+def compare(previous: dict, current: dict) -> None:
+    """Print every number of the current results against the previous."""
+    before = _flatten(previous['results'])
+    after = _flatten(current['results'])
+    print('{:<60} {:>12} {:>12} {:>8}'.format(
+        '{} -> {}'.format(
+            (previous.get('commit') or '?')[:10],
+            (current.get('commit') or '?')[:10]
+        ),
+        'before',
+        'after',
+        'ratio'
+    ))
+    for path, value in after.items():
+        if path not in before:
+            continue
+        ratio = value / before[path] if before[path] else float('nan')
+        print('{:<60} {:12.3f} {:12.3f} {:8.2f}'.format(
+            path,
+            before[path],
+            value,
+            ratio
+        ))
+
+
+def main() -> int:
+    """Benchmarks runner CLI."""
+    names = available()
+    parser = ArgumentParser(prog='python3 -m benchmarks')
+    parser.add_argument(
+        'names',
+        nargs='*',
+        metavar='NAME',
+        help='benchmarks to run (all by default): {}'.format(', '.join(names))
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        help='write the results to this file instead of standard output'
+    )
+    parser.add_argument(
+        '--compare',
+        metavar='FILE',
+        help='compare the results against the ones saved in this file'
+    )
+    parser.add_argument(
+        '--list',
+        action='store_true',
+        help='list the available benchmarks and exit'
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(names))
+        return 0
+    selected = [
+        name[len(PREFIX):] if name.startswith(PREFIX) else name
+        for name in args.names
+    ]
+    for name in selected:
+        if name not in names:
+            parser.error('unknown benchmark: {}'.format(name))
+
+    previous = None
+    if args.compare is not None:
+        with open(args.compare, encoding='utf-8') as infile:
+            previous = json.load(infile)
+
+    results = run(selected or names)
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as outfile:
+            outfile.write(output + '\n')
+    elif previous is None:
+        print(output)
+
+    if previous is not None:
+        compare(previous, results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Event loop lag while serving bulk requests, blocking against asyncio."""
+
+from asyncio import gather, new_event_loop, sleep
+from timeit import default_timer
+
+from passphrase.aio import AsyncPassphrase
+from passphrase.passphrase import Passphrase
+
+# Concurrent clients, and requests per client
+CLIENTS = 8
+REQUESTS = 10
+BATCH = 2000
+# A big custom wordlist, whose entropy must be calculated
+WORDS = 300000
+# The loop is probed this often
+TICK = 0.001
+
+
+async def _probe(lags: list, done: list) -> None:
+    while not done:
+        start = default_timer()
+        await sleep(TICK)
+        lags.append(default_timer() - start - TICK)
+
+
+def _blocking_client(passp: Passphrase):
+    async def client():
+        passp.words_amount_needed()
+        for _ in range(REQUESTS):
+            passp.generate_password_many(BATCH)
+            await sleep(0)
+    return client()
+
+
+def _async_client(apassp: AsyncPassphrase):
+    async def client():
+        await apassp.words_amount_needed()
+        for _ in range(REQUESTS):
+            await apassp.generate_password_many(BATCH)
+    return client()
+
+
+def _measure(loop, make_client) -> dict:
+    lags = []
+    done = []
+
+    async def main():
+        probe = loop.create_task(_probe(lags, done))
+        await sleep(TICK * 3)
+        await gather(*(make_client() for _ in range(CLIENTS)))
+        done.append(True)
+        await probe
+
+    start = default_timer()
+    loop.run_until_complete(main())
+    elapsed = default_timer() - start
+    lags.sort()
+    return {
+        'elapsed_msec': elapsed * 1e3,
+        'lag_p50_msec': lags[len(lags) // 2] * 1e3,
+        'lag_p99_msec': lags[int(len(lags) * 0.99)] * 1e3,
+        'lag_max_msec': lags[-1] * 1e3,
+    }
+
+
+def _passphrase() -> Passphrase:
+    passp = Passphrase()
+    passp.passwordlen = 20
+    passp.amount_n = 0
+    passp.entropy_bits_req = 77
+    passp.wordlist = ['word{}'.format(i) for i in range(WORDS)]
+    return passp
+
+
+def run() -> dict:
+    """Run the benchmark and return its results."""
+    blocking = _passphrase()
+    apassp = AsyncPassphrase(_passphrase())
+    loop = new_event_loop()
+    try:
+        return {
+            'blocking': _measure(loop, lambda: _blocking_client(blocking)),
+            'asyncio': _measure(loop, lambda: _async_client(apassp)),
+        }
+    finally:
+        loop.close()
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for name, result in run().items():
+        print('{:<8} total {elapsed_msec:7.1f} ms  lag p50 {lag_p50_msec:6.2f}'
+              ' ms  p99 {lag_p99_msec:6.2f} ms  max {lag_max_msec:6.2f} ms'
+              .format(name, **result))
+
+
+if __name__ == '__main__':
+    main()
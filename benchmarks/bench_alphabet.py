@@ -0,0 +1,56 @@
+"""Password generation per character against a compiled Alphabet."""
+
+from string import ascii_lowercase, ascii_uppercase, digits, punctuation
+from timeit import default_timer
+
+from passphrase.secrets import randchoice, randbelow_many, Alphabet
+
+ROUNDS = 20000
+CHARACTERSET = ascii_lowercase + ascii_uppercase + digits + punctuation
+LENGTHS = (12, 32, 128)
+
+
+def _per_char(length: int) -> str:
+    return ''.join([randchoice(CHARACTERSET) for _ in range(length)])
+
+
+def _many(length: int) -> str:
+    return ''.join([
+        CHARACTERSET[index]
+        for index in randbelow_many(len(CHARACTERSET), length)
+    ])
+
+
+def _measure(generator, length: int) -> float:
+    start = default_timer()
+    for _ in range(ROUNDS):
+        generator(length)
+    return (default_timer() - start) * 1e6 / ROUNDS
+
+
+def run() -> dict:
+    """Run the benchmark and return its results (usec per password)."""
+    alphabet = Alphabet(CHARACTERSET)
+    return {
+        str(length): {
+            'randchoice': _measure(_per_char, length),
+            'randbelow_many': _measure(_many, length),
+            'alphabet': _measure(alphabet.randstring, length),
+        }
+        for length in LENGTHS
+    }
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for length, generators in run().items():
+        for generator, usec in generators.items():
+            print('{:>4} chars {:<15} {:8.2f} us'.format(
+                length,
+                generator,
+                usec
+            ))
+
+
+if __name__ == '__main__':
+    main()
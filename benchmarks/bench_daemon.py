@@ -0,0 +1,66 @@
+"""Latency of cold CLI runs against asking a running daemon."""
+
+from contextlib import redirect_stdout
+from os import getcwd, devnull
+from os.path import join as os_path_join
+from subprocess import run as subprocess_run, Popen, DEVNULL
+from sys import executable
+from tempfile import TemporaryDirectory
+from time import sleep
+from timeit import default_timer
+
+from passphrase.client import connect
+
+ROUNDS = 40
+ARGS = ['-w', '6', '-n', '1']
+
+
+def _msec_per_run(cmd: list) -> float:
+    start = default_timer()
+    for _ in range(ROUNDS):
+        subprocess_run(cmd, stdout=DEVNULL, check=True)
+    return (default_timer() - start) * 1e3 / ROUNDS
+
+
+def _msec_per_request(path: str) -> float:
+    # What a long-lived client pays, without starting an interpreter
+    with open(devnull, 'w') as null, redirect_stdout(null):
+        start = default_timer()
+        for _ in range(ROUNDS * 10):
+            connect(path, ARGS, getcwd())
+    return (default_timer() - start) * 1e3 / (ROUNDS * 10)
+
+
+def run() -> dict:
+    """Run the benchmark and return its results."""
+    cli = [executable, '-m', 'passphrase']
+    results = {'cold_cli_msec': _msec_per_run(cli + ARGS)}
+    with TemporaryDirectory() as tmpdir:
+        path = os_path_join(tmpdir, 'passphrase.sock')
+        daemon = Popen(cli + ['--serve', path])
+        try:
+            for _ in range(100):
+                try:
+                    with open(devnull, 'w') as null, redirect_stdout(null):
+                        connect(path, ['--version'], getcwd())
+                    break
+                except OSError:
+                    sleep(0.05)
+            results['connect_cli_msec'] = _msec_per_run(
+                cli + ['--connect', path] + ARGS
+            )
+            results['connect_request_msec'] = _msec_per_request(path)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+    return results
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for name, value in run().items():
+        print('{:<22} {:8.2f}'.format(name, value))
+
+
+if __name__ == '__main__':
+    main()
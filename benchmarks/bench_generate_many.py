@@ -0,0 +1,61 @@
+"""Per-item cost of batch generation against the single-shot path."""
+
+from timeit import default_timer
+
+from passphrase.passphrase import Passphrase
+
+COUNT = 10000
+
+
+def _single_passphrase(passp: Passphrase, count: int) -> list:
+    results = []
+    for _ in range(count):
+        passp.generate()
+        results.append(str(passp))
+    return results
+
+
+def _single_password(passp: Passphrase, count: int) -> list:
+    results = []
+    for _ in range(count):
+        passp.generate_password()
+        results.append(str(passp))
+    return results
+
+
+def _usec_per_item(generate, passp: Passphrase) -> float:
+    start = default_timer()
+    generate(passp, COUNT)
+    return (default_timer() - start) * 1e6 / COUNT
+
+
+def run() -> dict:
+    """Run the benchmark and return its results."""
+    passp = Passphrase('internal')
+    passp.amount_w = 6
+    passp.amount_n = 1
+    passp.passwordlen = 20
+
+    results = {
+        'passphrase': {
+            'single': _usec_per_item(_single_passphrase, passp),
+            'many': _usec_per_item(Passphrase.generate_many, passp),
+        },
+    }
+    passp.separator = ''
+    results['password'] = {
+        'single': _usec_per_item(_single_password, passp),
+        'many': _usec_per_item(Passphrase.generate_password_many, passp),
+    }
+    return results
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for name, modes in run().items():
+        for mode, usec in modes.items():
+            print('{:<10} {:<6} {:8.2f} us/item'.format(name, mode, usec))
+
+
+if __name__ == '__main__':
+    main()
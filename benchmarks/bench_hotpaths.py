@@ -0,0 +1,77 @@
+"""Time per call of the hot paths, from the random source to Passphrase."""
+
+from timeit import repeat
+
+from passphrase.aux import Aux
+from passphrase.calc import entropy_bits
+from passphrase.passphrase import Passphrase
+from passphrase.random import randint
+from passphrase.secrets import randbelow, randchoice, randhex
+
+# Each measure is the best of REPEAT runs of NUMBER calls
+REPEAT = 5
+NUMBER = 2000
+ENTROPY_SIZES = (10, 100, 1000, 7776)
+
+
+def _usec_per_call(func, number: int = NUMBER) -> float:
+    return min(repeat(func, number=number, repeat=REPEAT)) * 1e6 / number
+
+
+def run() -> dict:
+    """Run the benchmark and return its results (usec per call)."""
+    passp = Passphrase('internal')
+    passp.amount_w = 6
+    passp.amount_n = 1
+    passp.passwordlen = 20
+    words = list(passp.wordlist)
+    phrase = passp.generate()[:6]
+
+    results = {
+        'random': {
+            'randint_32': _usec_per_call(lambda: randint(32)),
+            'randint_256': _usec_per_call(lambda: randint(256)),
+        },
+        'secrets': {
+            'randbelow_7776': _usec_per_call(lambda: randbelow(7776)),
+            'randbelow_2_64': _usec_per_call(lambda: randbelow(2 ** 64)),
+            'randchoice_list': _usec_per_call(lambda: randchoice(words)),
+            'randchoice_str': _usec_per_call(
+                lambda: randchoice('abcdefghijklmnopqrstuvwxyz')
+            ),
+            'randhex_32': _usec_per_call(lambda: randhex(32)),
+        },
+        'calc': {},
+        'aux': {
+            'make_chars_uppercase_2': _usec_per_call(
+                lambda: Aux.make_chars_uppercase(phrase, 2)
+            ),
+            'make_chars_uppercase_2_indexed': _usec_per_call(
+                lambda: Aux.make_chars_uppercase(phrase, 2, indexed=True)
+            ),
+        },
+        'passphrase': {
+            'generate': _usec_per_call(passp.generate),
+            'generate_uppercase_2': _usec_per_call(lambda: passp.generate(2)),
+            'generate_password': _usec_per_call(passp.generate_password),
+            'generate_uuid4': _usec_per_call(passp.generate_uuid4),
+        },
+    }
+    for size in ENTROPY_SIZES:
+        lst = (words * (size // len(words) + 1))[:size]
+        results['calc']['entropy_bits_{}'.format(size)] = _usec_per_call(
+            lambda: entropy_bits(lst),
+            max(NUMBER * 10 // size, 10)
+        )
+    return results
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for name, calls in run().items():
+        for call, usec in calls.items():
+            print('{:<12} {:<32} {:10.2f} us'.format(name, call, usec))
+
+
+if __name__ == '__main__':
+    main()
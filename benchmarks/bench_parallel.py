@@ -0,0 +1,48 @@
+"""Throughput of bulk password generation for several amounts of jobs."""
+
+from os import cpu_count
+from timeit import default_timer
+
+from passphrase.parallel import generate
+from passphrase.passphrase import Passphrase
+
+COUNT = 200000
+PASSWORDLEN = 20
+
+
+def _measure(passp: Passphrase, jobs: int) -> float:
+    start = default_timer()
+    total = 0
+    for chunk in generate(passp, COUNT, jobs=jobs, kind='password',
+                          ordered=False):
+        total += len(chunk)
+    assert total == COUNT
+    return COUNT / (default_timer() - start)
+
+
+def run() -> dict:
+    """Run the benchmark and return its results."""
+    passp = Passphrase()
+    passp.passwordlen = PASSWORDLEN
+    jobs = sorted({1, 2, 4, cpu_count() or 1})
+    return {
+        'cpus': cpu_count(),
+        'per_second': {str(job): _measure(passp, job) for job in jobs},
+    }
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    results = run()
+    print('{} CPUs, {} passwords of {} chars'.format(
+        results['cpus'], COUNT, PASSWORDLEN
+    ))
+    base = results['per_second']['1']
+    for jobs, rate in results['per_second'].items():
+        print('jobs {:>3}: {:10.0f}/s  x{:.2f}'.format(
+            jobs, rate, rate / base
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Latency of generating inline against taking from a PassphrasePool."""
+
+from time import sleep
+from timeit import default_timer
+
+from passphrase.passphrase import Passphrase
+from passphrase.prefetch import PassphrasePool
+
+ROUNDS = 5000
+# Pause between requests, as a server would have
+PAUSE = 0.0002
+
+
+def _percentiles(latencies: list) -> dict:
+    latencies = sorted(latencies)
+    return {
+        'p50_usec': latencies[len(latencies) // 2] * 1e6,
+        'p99_usec': latencies[int(len(latencies) * 0.99)] * 1e6,
+        'max_usec': latencies[-1] * 1e6,
+    }
+
+
+def _measure(func) -> dict:
+    latencies = []
+    for _ in range(ROUNDS):
+        start = default_timer()
+        func()
+        latencies.append(default_timer() - start)
+        sleep(PAUSE)
+    return _percentiles(latencies)
+
+
+def run() -> dict:
+    """Run the benchmark and return its results."""
+    passp = Passphrase('internal')
+    passp.amount_w = 6
+    passp.amount_n = 0
+    results = {'inline': _measure(lambda: passp.generate_many(1, 2))}
+    with PassphrasePool(passp, size=256, uppercase=2) as pool:
+        pool.wait()
+        results['pool'] = _measure(pool.take)
+        results['pool'].update(
+            hit_rate=pool.hits / (pool.hits + pool.misses),
+            refill_latency_max_usec=pool.refill_latency_max * 1e6
+        )
+    return results
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for name, result in run().items():
+        print('{:<7} p50 {p50_usec:7.2f} us  p99 {p99_usec:7.2f} us  max '
+              '{max_usec:8.2f} us'.format(name, **result))
+        if 'hit_rate' in result:
+            print('        hit rate {hit_rate:.3f}, max refill '
+                  '{refill_latency_max_usec:.0f} us'.format(**result))
+
+
+if __name__ == '__main__':
+    main()
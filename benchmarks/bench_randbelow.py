@@ -0,0 +1,58 @@
+"""Randomness used by randbelow() against randbelow_lemire()."""
+
+from timeit import default_timer
+
+import passphrase.random
+from passphrase.secrets import randbelow, randbelow_lemire
+
+ROUNDS = 20000
+BOUNDS = {
+    'eff_list': 7776,
+    'custom_list': 7777,
+    'numbers': 900000,
+    'pow2_plus_1': 2 ** 20 + 1,
+    'eff_list_6_words': 7776 ** 6,
+}
+
+
+def _measure(sampler, num: int) -> dict:
+    reservoir = passphrase.random.get_reservoir()
+    requests = reservoir.requests
+    bits_served = reservoir.bits_served
+
+    start = default_timer()
+    for _ in range(ROUNDS):
+        sampler(num)
+    elapsed = default_timer() - start
+
+    return {
+        'draws_per_sample': (reservoir.requests - requests) / ROUNDS,
+        'bits_per_sample': (reservoir.bits_served - bits_served) / ROUNDS,
+        'usec_per_sample': elapsed * 1e6 / ROUNDS,
+    }
+
+
+def run() -> dict:
+    """Run the benchmark and return its results."""
+    return {
+        name: {
+            'randbelow': _measure(randbelow, num),
+            'randbelow_lemire': _measure(randbelow_lemire, num),
+        }
+        for name, num in BOUNDS.items()
+    }
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for name, samplers in run().items():
+        for sampler, result in samplers.items():
+            print(
+                '{:<17} {:<17} {draws_per_sample:6.3f} draws '
+                '{bits_per_sample:6.2f} bits {usec_per_sample:6.2f} '
+                'us'.format(name, sampler, **result)
+            )
+
+
+if __name__ == '__main__':
+    main()
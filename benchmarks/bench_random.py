@@ -0,0 +1,66 @@
+"""Syscalls and time per passphrase/password, unbuffered vs. pooled."""
+
+from timeit import default_timer
+
+import passphrase.random
+from passphrase.random import RandomPool, POOL_SIZE
+from passphrase.passphrase import Passphrase
+from passphrase.secrets import randbool
+
+ROUNDS = 1000
+
+
+def _measure(pool: RandomPool, generate) -> dict:
+    previous = passphrase.random.get_pool()
+    passphrase.random.set_pool(pool)
+    try:
+        start = default_timer()
+        for _ in range(ROUNDS):
+            generate()
+        elapsed = default_timer() - start
+    finally:
+        passphrase.random.set_pool(previous)
+
+    return {
+        'syscalls_per_item': pool.syscalls / ROUNDS,
+        'bytes_per_item': pool.bytes_served / ROUNDS,
+        'usec_per_item': elapsed * 1e6 / ROUNDS,
+    }
+
+
+def run() -> dict:
+    """Run the benchmark and return its results."""
+    passp = Passphrase('internal')
+    passp.amount_w = 6
+    passp.amount_n = 0
+    passp.passwordlen = 20
+
+    results = {}
+    for name, generate in (
+            ('passphrase', passp.generate),
+            ('password', passp.generate_password),
+            ('coin', randbool),
+    ):
+        results[name] = {
+            'unbuffered': _measure(RandomPool(0), generate),
+            'pooled': _measure(RandomPool(POOL_SIZE), generate),
+        }
+    return results
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for name, modes in run().items():
+        for mode, result in modes.items():
+            print(
+                '{:<10} {:<10} {syscalls_per_item:8.3f} syscalls '
+                '{bytes_per_item:6.1f} bytes {usec_per_item:8.2f} us'.format(
+                    name,
+                    mode,
+                    **result
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Memory of worker processes: own wordlist copy against a shared one."""
+
+from os.path import join as os_path_join
+from subprocess import run as subprocess_run, PIPE
+from sys import executable
+from tempfile import TemporaryDirectory
+
+from passphrase.passphrase import Passphrase
+from passphrase.wordlist import EFF_LONG_WORDLIST
+
+SIZES = (7776, 7776 * 10, 7776 * 40)
+
+# Prints the RSS of the worker, in KiB, once its wordlist is ready
+WORKER = '''
+from passphrase.passphrase import Passphrase
+from passphrase import wordcache
+wordcache.WORDLIST_CACHE = False
+passp = Passphrase()
+if {attach}:
+    passp.attach_wordlist({source!r})
+else:
+    passp.import_words_from_file({source!r}, False)
+passp.amount_n = 0
+passp.amount_w = 6
+passp.generate()
+with open('/proc/self/status') as status:
+    print([line for line in status if line.startswith('VmRSS')][0].split()[1])
+'''
+
+
+def _worker_rss(source: str, attach: bool) -> int:
+    proc = subprocess_run(
+        [executable, '-c', WORKER.format(source=source, attach=attach)],
+        stdout=PIPE,
+        check=True
+    )
+    return int(proc.stdout)
+
+
+def run() -> dict:
+    """Run the benchmark and return its results (worker RSS in KiB)."""
+    results = {}
+    with TemporaryDirectory() as tmpdir:
+        for size in SIZES:
+            words = [
+                '{}{}'.format(word, suffix)
+                for suffix in range(size // len(EFF_LONG_WORDLIST))
+                for word in EFF_LONG_WORDLIST
+            ]
+            inputfile = os_path_join(tmpdir, 'words.list')
+            with open(inputfile, mode='wt') as wordfile:
+                wordfile.write('\n'.join(words))
+
+            passp = Passphrase()
+            passp.wordlist = words
+            name = passp.share_wordlist()
+            try:
+                results[str(size)] = {
+                    'copy_kib': _worker_rss(inputfile, False),
+                    'shared_kib': _worker_rss(name, True),
+                }
+            finally:
+                passp.unshare_wordlist()
+
+    return results
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for size, result in run().items():
+        print('{:>7} words: own copy {copy_kib:>7} KiB, shared '
+              '{shared_kib:>7} KiB'.format(size, **result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Per-item cost of a compiled PassphraseSpec against Passphrase calls."""
+
+from timeit import default_timer
+
+from passphrase.passphrase import Passphrase
+
+COUNT = 10000
+
+
+def _usec_per_item(generate) -> float:
+    start = default_timer()
+    for _ in range(COUNT):
+        generate()
+    return (default_timer() - start) * 1e6 / COUNT
+
+
+def run() -> dict:
+    """Run the benchmark and return its results."""
+    passp = Passphrase('internal')
+    passp.amount_w = 6
+    passp.amount_n = 1
+    passp.passwordlen = 20
+    spec = passp.compile(uppercase=2)
+    return {
+        'passphrase': {
+            'passphrase': _usec_per_item(lambda: passp.generate(2)),
+            'spec': _usec_per_item(spec.sample),
+        },
+        'password': {
+            'passphrase': _usec_per_item(passp.generate_password),
+            'spec': _usec_per_item(spec.generate_password),
+        },
+    }
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for name, modes in run().items():
+        for mode, usec in modes.items():
+            print('{:<10} {:<10} {:8.2f} us/item'.format(name, mode, usec))
+
+
+if __name__ == '__main__':
+    main()
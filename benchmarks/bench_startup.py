@@ -0,0 +1,69 @@
+"""Startup cost of the CLI and of the system entropy check."""
+
+from subprocess import run as subprocess_run, Popen, PIPE, DEVNULL
+from sys import executable
+from timeit import default_timer
+
+from passphrase.aux import Aux
+
+ROUNDS = 20
+ENTROPY_ROUNDS = 200
+CLI_MODES = (
+    ('version', ['--version']),
+    ('password', ['-p', '20']),
+    ('uuid4', ['--uuid4']),
+    ('passphrase', []),
+)
+
+
+def _popen_system_entropy() -> int:
+    # How Aux.system_entropy() used to read the entropy count
+    arg = ['cat', '/proc/sys/kernel/random/entropy_avail']
+    proc = Popen(arg, stdout=PIPE, stderr=DEVNULL)
+    response = proc.communicate()[0]
+    return int(response) if response else -1
+
+
+def _usec_per_call(func, rounds: int) -> float:
+    start = default_timer()
+    for _ in range(rounds):
+        func()
+    return (default_timer() - start) * 1e6 / rounds
+
+
+def _msec_per_run(args: list) -> float:
+    cmd = [executable, '-m', 'passphrase'] + args
+    start = default_timer()
+    for _ in range(ROUNDS):
+        subprocess_run(cmd, stdout=DEVNULL, check=True)
+    return (default_timer() - start) * 1e3 / ROUNDS
+
+
+def run() -> dict:
+    """Run the benchmark and return its results."""
+    return {
+        'system_entropy_usec': {
+            'subprocess': _usec_per_call(
+                _popen_system_entropy,
+                ENTROPY_ROUNDS
+            ),
+            'direct': _usec_per_call(
+                Aux._read_system_entropy,
+                ENTROPY_ROUNDS
+            ),
+        },
+        'cli_msec': {
+            mode: _msec_per_run(args) for mode, args in CLI_MODES
+        },
+    }
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for name, modes in run().items():
+        for mode, value in modes.items():
+            print('{:<20} {:<12} {:10.2f}'.format(name, mode, value))
+
+
+if __name__ == '__main__':
+    main()
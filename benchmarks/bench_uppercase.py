@@ -0,0 +1,58 @@
+"""Worst case of Aux.make_chars_uppercase: all lowercase chars but one."""
+
+from timeit import default_timer
+
+import passphrase.random
+from passphrase.aux import Aux
+
+ROUNDS = 2000
+PHRASES = {
+    'short_words': ['ace', 'ant', 'ask', 'bad', 'big', 'bud'],
+    'eff_words': [
+        'unwashed', 'spearhead', 'catalyst', 'handiwork', 'rebuttal',
+        'obnoxious',
+    ],
+    'long_phrase': ['unwashed', 'spearhead', 'catalyst', 'handiwork'] * 8,
+}
+
+
+def _measure(phrase: list, indexed: bool) -> dict:
+    reservoir = passphrase.random.get_reservoir()
+    requests = reservoir.requests
+    uppercase = Aux.lowercase_count(phrase) - 1
+
+    start = default_timer()
+    for _ in range(ROUNDS):
+        Aux.make_chars_uppercase(phrase, uppercase, indexed=indexed)
+    elapsed = default_timer() - start
+
+    return {
+        'draws': (reservoir.requests - requests) / ROUNDS,
+        'usec': elapsed * 1e6 / ROUNDS,
+    }
+
+
+def run() -> dict:
+    """Run the benchmark and return its results (per call)."""
+    return {
+        name: {
+            'retry': _measure(phrase, False),
+            'indexed': _measure(phrase, True),
+        }
+        for name, phrase in PHRASES.items()
+    }
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    for name, modes in run().items():
+        for mode, result in modes.items():
+            print('{:<12} {:<8} {draws:9.1f} draws {usec:10.2f} us'.format(
+                name,
+                mode,
+                **result
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Loading a big text wordlist against its compiled, cached version."""
+
+from os.path import join as os_path_join
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+from unittest import mock
+
+from passphrase.passphrase import Passphrase
+from passphrase.wordlist import EFF_LONG_WORDLIST
+
+# ~300k words
+WORDS = [
+    '{}{}'.format(word, suffix)
+    for suffix in range(40) for word in EFF_LONG_WORDLIST
+]
+
+
+def _measure(inputfile: str) -> float:
+    start = default_timer()
+    passp = Passphrase(inputfile)
+    passp.amount_n = 0
+    passp.amount_w = 6
+    passp.generate()
+    passp.generated_passphrase_entropy()
+    return (default_timer() - start) * 1e3
+
+
+def run() -> dict:
+    """Run the benchmark and return its results (ms to load and generate)."""
+    with TemporaryDirectory() as tmpdir:
+        inputfile = os_path_join(tmpdir, 'words.list')
+        with open(inputfile, mode='wt') as wordfile:
+            wordfile.write('\n'.join(WORDS))
+
+        with mock.patch(
+                'passphrase.wordcache.WORDLIST_CACHE_DIR',
+                os_path_join(tmpdir, 'cache')
+        ):
+            with mock.patch('passphrase.wordcache.WORDLIST_CACHE', False):
+                text = _measure(inputfile)
+            compile_ = _measure(inputfile)
+            cached = _measure(inputfile)
+
+    return {
+        'words': len(WORDS),
+        'text_ms': text,
+        'compile_ms': compile_,
+        'cached_ms': cached,
+    }
+
+
+def main() -> None:
+    """Print the benchmark results."""
+    result = run()
+    print(
+        '{words} words: text {text_ms:.1f} ms, first load (compile) '
+        '{compile_ms:.1f} ms, cached {cached_ms:.1f} ms'.format(**result)
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,36 @@ by HacKan (https://hackan.net) under GNU GPL v3.0+.
 
 """
 
-from .passphrase import Passphrase
-from .aux import Aux
+import sys
 
 __all__ = ('Passphrase', 'Aux', )
+
+# Module of each attribute, imported on first access so that using a single
+# submodule, such as passphrase.secrets, doesn't load the rest (PEP 562)
+_LAZY_ATTRIBUTES = {
+    'Passphrase': 'passphrase',
+    'Aux': 'aux',
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name)
+        )
+    # Same as: from .module import name
+    value = getattr(__import__(module, globals(), None, (name, ), 1), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # No module __getattr__ support
+    from .passphrase import Passphrase  # noqa: F401
+    from .aux import Aux  # noqa: F401
@@ -27,14 +27,18 @@ by HacKan (https://hackan.net) under GNU GPL v3.0+.
 """
 
 from sys import version_info, exit as sys_exit, argv as sys_argv
+from sys import stdout as sys_stdout
 from os.path import dirname as os_path_dirname
-from os import makedirs as os_makedirs
+from os import makedirs as os_makedirs, open as os_open, dup2 as os_dup2
+from os import devnull as os_devnull, O_WRONLY, getcwd as os_getcwd
+from os.path import join as os_path_join
 from argparse import ArgumentParser, ArgumentTypeError
 from argparse import RawDescriptionHelpFormatter
 
 from .settings import ENTROPY_BITS_MIN, SYSTEM_ENTROPY_BITS_MIN
-from .passphrase import Passphrase
+from .settings import COUNT_CHUNK_SIZE, MIN_NUM, MAX_NUM
 from .secrets import randbool
+from .random import enable_stats, reset_stats, stats as random_stats
 from .aux import Aux
 
 __author__ = 'HacKan'
@@ -58,22 +62,70 @@ def _bigger_than_zero(value: str) -> int:
     return ivalue
 
 
-def main(argv: list) -> int:
-    """Passphrase CLI interface."""
-    passphrase = Passphrase()
+def _connect_path(argv: list) -> str:
+    """Return the socket path given by --connect, or None."""
+    for index, arg in enumerate(argv):
+        if arg == '--':
+            break
+        if arg == '--connect' and index + 1 < len(argv):
+            return argv[index + 1]
+        if arg.startswith('--connect='):
+            return arg[len('--connect='):]
+    return None
+
+
+def _print_stats(stats: dict) -> None:
+    """Print the randomness stats to stderr."""
+    Aux.print_stderr(
+        'Randomness: {urandom_calls} reads from the system ({urandom_bytes} '
+        'bytes), {bytes_requested} bytes and {bits_requested} bits '
+        'requested, {bits_discarded} bits discarded, {bits_rejected} bits '
+        'rejected'.format(**stats)
+    )
+    for method, bounds in sorted(stats['randbelow'].items()):
+        for bits, counts in sorted(bounds.items()):
+            Aux.print_stderr(
+                'Random numbers below a {bits}-bit bound ({method}): '
+                '{calls} drawn, {retries} retries'.format(
+                    bits=bits,
+                    method=method,
+                    **counts
+                )
+            )
 
-    # Set defaults
+
+def _connect(path: str, argv: list) -> int:
+    """Run the CLI in the daemon serving on path."""
+    # Imported here so it's not loaded unless needed
+    from .client import connect
+
+    try:
+        return connect(path, argv, os_getcwd())
+    except KeyboardInterrupt:
+        return 0
+    except OSError as exc:
+        Aux.print_stderr(
+            "Error: can't connect to the daemon on {}: {}".format(path, exc)
+        )
+        return 1
+
+
+# To avoid loading the wordlist unnecessarily, I'm hardcoding this value
+# It's ok, it's only used to show help information
+_AMOUNT_W_DEFAULT = 6
+_AMOUNT_N_DEFAULT = 0
+
+
+def _description() -> str:
+    """Return the description shown by --help."""
+    # Imported here so it's not loaded unless needed
+    from .passphrase import Passphrase
+
+    passphrase = Passphrase()
     passphrase.entropy_bits_req = ENTROPY_BITS_MIN
     passwordlen_default = passphrase.password_length_needed()
-    amount_n_default = 0
-    passphrase.amount_n = amount_n_default
-    # To avoid loading the wordlist unnecessarily, I'm hardcoding this value
-    # It's ok, it's only used to show help information
-    amount_w_default = 6
-
-    parser = ArgumentParser(
-        formatter_class=RawDescriptionHelpFormatter,
-        description='{version_string}\n\n'
+    return (
+        '{version_string}\n\n'
         'Generates a cryptographically secure passphrase, based on '
         'a wordlist, or a\npassword, and prints it to standard output.\n'
         'By default, it uses an embedded EFF Large Wordlist for passphrases.\n'
@@ -94,6 +146,8 @@ def main(argv: list) -> int:
         'the input\nfile is treated as a diceware wordlist (two columns).'
         '\nOptionally, -o | --output can be used to specify an output file '
         '(existing \nfile is overwritten).\n'
+        'Many of them can be generated at once, one per line, by -c | '
+        '--count,\nusing many processes with -j | --jobs.\n'
         'The number of words is {wordsamountmin} by default, but it '
         'can be changed by -w | --words.\n'
         'The number of numbers is {numsamountmin} by default, but it can be '
@@ -101,20 +155,37 @@ def main(argv: list) -> int:
         '{minnum} and {maxnum}.\n'
         'The default separator is a blank space, but any character or '
         'character\nsequence can be specified by -s | --separator.\n'
+        'To avoid the startup cost on repeated calls, run a daemon by '
+        '--serve and\nsend it the options by --connect, both followed by '
+        'the path to a Unix socket.\n'
         '\nExample output:\n'
         '\tDefault parameters:\tchalice sheath postcard modular cider size\n'
         '\tWords=3, Numbers=2:\tdepraved widow office 184022 320264\n'
         '\tPassword, 20 chars:\tsF#s@B+iR#ZIL-yUWKPR'.format(
             version_string=__version_string__,
-            minnum=passphrase.randnum_min,
-            maxnum=passphrase.randnum_max,
-            wordsamountmin=amount_w_default,
-            numsamountmin=amount_n_default,
+            minnum=MIN_NUM,
+            maxnum=MAX_NUM,
+            wordsamountmin=_AMOUNT_W_DEFAULT,
+            numsamountmin=_AMOUNT_N_DEFAULT,
             passwdmin=passwordlen_default,
             passwdpref=passwordlen_default + 4
         )
     )
 
+
+class _ArgumentParser(ArgumentParser):
+    """ArgumentParser building its description only to show the help."""
+
+    def format_help(self) -> str:
+        if self.description is None:
+            self.description = _description()
+        return super().format_help()
+
+
+def _build_parser() -> ArgumentParser:
+    """Return the CLI arguments parser."""
+    parser = _ArgumentParser(formatter_class=RawDescriptionHelpFormatter)
+
     parser.add_argument(
         '--version',
         action='store_true',
@@ -148,6 +219,16 @@ def main(argv: list) -> int:
         default=False,
         help='print additional information (can coexist with -m | --mute)'
     )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        default=False,
+        help='print the randomness used to standard error after generating: '
+             'reads from the system, bits requested, discarded and rejected, '
+             'and retries of rejection sampling per bound size (processes '
+             'from -j | --jobs are not counted; not available through a '
+             'daemon)'
+    )
     parser.add_argument(
         '-e',
         '--entropybits',
@@ -168,6 +249,24 @@ def main(argv: list) -> int:
         default=False,
         help='generate a random coin throw: heads or tails'
     )
+    parser.add_argument(
+        '-c',
+        '--count',
+        type=_bigger_than_zero,
+        default=1,
+        help='specify the amount of passphrases/passwords to generate, one '
+             'per line, or 0 to generate them until interrupted (defaults '
+             'to 1)'
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=_bigger_than_zero,
+        default=1,
+        help='specify the amount of processes generating passphrases/'
+             'passwords when many are requested, or 0 for one per CPU '
+             '(defaults to 1; not available through a daemon)'
+    )
     parser.add_argument(
         '-p',
         '--password',
@@ -227,7 +326,7 @@ def main(argv: list) -> int:
         '-n',
         '--numbers',
         type=_bigger_than_zero,
-        default=amount_n_default,
+        default=_AMOUNT_N_DEFAULT,
         help='specify the amount of numbers (0 or more)'
     )
     parser.add_argument(
@@ -258,6 +357,40 @@ def main(argv: list) -> int:
         help='specify input file as a diceware list (format: two colums)'
     )
 
+    parser.add_argument(
+        '--serve',
+        type=str,
+        metavar='SOCKET',
+        help='run a daemon generating passphrases/passwords for clients '
+             'connecting to the given Unix socket path'
+    )
+    parser.add_argument(
+        '--connect',
+        type=str,
+        metavar='SOCKET',
+        help='send the rest of the options to the daemon serving on the given '
+             'Unix socket path, and print its output'
+    )
+
+    return parser
+
+
+def main(argv: list, cwd: str = None) -> int:
+    """Passphrase CLI interface.
+
+    Keyword arguments:
+    argv -- The CLI arguments.
+    cwd -- Directory to which input and output paths are relative, when
+    running for a client of the daemon.
+
+    """
+    if cwd is None:
+        # Don't set anything up, it's done by the daemon
+        connect_path = _connect_path(argv)
+        if connect_path is not None:
+            return _connect(connect_path, argv)
+
+    parser = _build_parser()
     args = parser.parse_args(argv)
 
     inputfile = args.input
@@ -280,11 +413,51 @@ def main(argv: list) -> int:
     p_alphanumeric = args.use_alphanumeric
     entropy_bits = args.entropybits
     gen_insecure = args.insecure
+    count = args.count
+    jobs = args.jobs
+    serve_path = args.serve
+    show_stats = args.stats
 
     if show_version:
         print(__version_string__)
         return 0
 
+    if serve_path is not None:
+        if cwd is not None:
+            Aux.print_stderr("Error: a daemon can't be run by another one")
+            return 1
+
+        # Imported here so it's not loaded unless needed
+        from .daemon import serve
+
+        if verbose:
+            Aux.print_stderr('Serving on {}'.format(serve_path))
+        try:
+            serve(serve_path, main)
+        except OSError as exc:
+            Aux.print_stderr(
+                "Error: can't serve on {}: {}".format(serve_path, exc)
+            )
+            return 1
+        return 0
+
+    if cwd is not None:
+        # The stats are global to the daemon, and its threads can't fork
+        if show_stats:
+            Aux.print_stderr("Error: --stats can't be used through a daemon")
+            return 1
+        if jobs != 1:
+            Aux.print_stderr(
+                "Error: -j | --jobs can't be used through a daemon"
+            )
+            return 1
+
+        # Paths are relative to the client's directory
+        if inputfile is not None:
+            inputfile = os_path_join(cwd, inputfile)
+        if outputfile is not None:
+            outputfile = os_path_join(cwd, outputfile)
+
     if verbose:
         Aux.print_stderr(__version_string__)
 
@@ -320,6 +493,15 @@ def main(argv: list) -> int:
             'Warning: insecure number of bits for entropy calculations '
             'chosen! Should be bigger than {}'.format(ENTROPY_BITS_MIN)
         )
+
+    if show_stats:
+        reset_stats()
+        enable_stats()
+
+    # Imported here so --version, --help and --connect don't load it
+    from .passphrase import Passphrase
+
+    passphrase = Passphrase()
     passphrase.entropy_bits_req = entropy_bits
 
     # Generate whatever is requested
@@ -330,8 +512,10 @@ def main(argv: list) -> int:
         gen_what = 'UUID v4'
         gen_ent = 120
 
-        passphrase.generate_uuid4()
-        passphrase.separator = '-'
+        def generate_batch(size: int) -> list:
+            return [
+                '-'.join(passphrase.generate_uuid4()) for _ in range(size)
+            ]
     elif gen_coin:
         # Generate a coin throw
         if verbose:
@@ -339,7 +523,10 @@ def main(argv: list) -> int:
         gen_what = 'coin'
         gen_ent = 1
 
-        passphrase = 'Heads' if randbool() else 'Tails'
+        def generate_batch(size: int) -> list:
+            return [
+                'Heads' if randbool() else 'Tails' for _ in range(size)
+            ]
     elif passwordlen is not None:
         # Generate a password
         gen_what = 'password'
@@ -401,8 +588,8 @@ def main(argv: list) -> int:
                 ) else verbose_string
             )
 
-        passphrase.generate_password()
-        passphrase.separator = ''
+        generate_batch = passphrase.generate_password_many
+        gen_kind = 'password'
     else:
         # Generate a passphrase
         gen_what = 'passphrase'
@@ -448,9 +635,12 @@ def main(argv: list) -> int:
             )
 
         case = (-1 * p_lowercase) if p_lowercase else p_uppercase
-        passphrase.generate(case)
         passphrase.separator = separator
 
+        def generate_batch(size: int) -> list:
+            return passphrase.generate_many(size, case)
+        gen_kind = 'passphrase'
+
     if verbose:
         Aux.print_stderr(
             'The entropy of this {what} is {ent:.2f} bits'.format(
@@ -462,12 +652,7 @@ def main(argv: list) -> int:
     if not gen_coin and gen_ent < ENTROPY_BITS_MIN:
         Aux.print_stderr('Warning: the {} is too short!'.format(gen_what))
 
-    if not mute:
-        if no_newline:
-            print(passphrase, end='')
-        else:
-            print(passphrase)
-
+    outfile = None
     if outputfile is not None:
         # ensure path to file exists or create
         dir_ = os_path_dirname(outputfile)
@@ -482,10 +667,7 @@ def main(argv: list) -> int:
                 )
                 return 1
         try:
-            with open(outputfile, mode='wt', encoding='utf-8') as outfile:
-                linefeed = '' if no_newline else '\n'
-                outfile.write(str(passphrase) + linefeed)
-
+            outfile = open(outputfile, mode='wt', encoding='utf-8')
         except IOError:
             Aux.print_stderr(
                 "Error: file {} can't be opened or written".format(
@@ -494,6 +676,68 @@ def main(argv: list) -> int:
             )
             return 1
 
+    if jobs != 1 and count != 1 and not (gen_uuid4 or gen_coin):
+        # Imported here so it's not loaded unless needed
+        from .parallel import generate as parallel_generate
+
+        # Order is meaningless for random results, so take them when ready
+        chunks = parallel_generate(
+            passphrase,
+            count,
+            jobs=jobs or None,
+            kind=gen_kind,
+            uppercase=None if gen_kind == 'password' else case,
+            ordered=False
+        )
+    else:
+        def generate_chunks():
+            remaining = count
+            while count == 0 or remaining > 0:
+                size = COUNT_CHUNK_SIZE if count == 0 else min(
+                    remaining,
+                    COUNT_CHUNK_SIZE
+                )
+                remaining -= size
+                yield generate_batch(size)
+
+        chunks = generate_chunks()
+
+    # Results are written in chunks of many lines: one per line, except for
+    # the last one which honors --no-newline
+    linefeed = '' if no_newline else '\n'
+    remaining = count
+    try:
+        for results in chunks:
+            remaining -= len(results)
+            chunk = '\n'.join(results)
+            chunk += '\n' if count == 0 or remaining > 0 else linefeed
+            if not mute:
+                print(chunk, end='')
+            if outfile is not None:
+                try:
+                    outfile.write(chunk)
+                except IOError:
+                    Aux.print_stderr(
+                        "Error: file {} can't be opened or written".format(
+                            outputfile,
+                        )
+                    )
+                    return 1
+    except BrokenPipeError:
+        # Stdout was closed (i.e.: piped to `head`), nothing else to do
+        devnull = os_open(os_devnull, O_WRONLY)
+        os_dup2(devnull, sys_stdout.fileno())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        chunks.close()
+        if outfile is not None:
+            outfile.close()
+
+    if show_stats:
+        enable_stats(False)
+        _print_stats(random_stats())
+
     return 0
 
 
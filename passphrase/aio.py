@@ -0,0 +1,291 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+"""Generation of passphrases and passwords from asyncio code.
+
+Single passphrases or passwords are generated right away in the event loop,
+since that takes a few microseconds. Anything that may take longer, such as
+loading a wordlist, calculating its entropy or generating large batches, is
+run in an executor so the loop is not blocked.
+
+"""
+
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+
+try:
+    from asyncio import get_running_loop
+except ImportError:     # Python < 3.7
+    from asyncio import get_event_loop as get_running_loop
+
+from .passphrase import Passphrase
+from .settings import COUNT_CHUNK_SIZE
+
+__version__ = '0.1.0'
+
+KINDS = ('passphrase', 'password')
+
+# Batches up to this size are generated in the event loop.
+INLINE_MAX = 16
+
+
+class AsyncPassphrase:
+    """Asyncio facade for a Passphrase.
+
+    The Passphrase is set up as usual through the passphrase attribute, but
+    changing it while a call to this object is pending is not supported.
+
+    >>> apassphrase = await AsyncPassphrase.load('internal')  #doctest:+SKIP
+    >>> apassphrase.passphrase.amount_n = 0  #doctest:+SKIP
+    >>> apassphrase.passphrase.amount_w = 6  #doctest:+SKIP
+    >>> await apassphrase.generate_many(2)  #doctest:+SKIP
+    ['stump agile unsafe skewed dares ridden',
+     'shrimp mummy aloof spruce gag pacifism']
+    >>> async for item in apassphrase.stream(10000):  #doctest:+SKIP
+    ...     print(item)
+
+    """
+
+    def __init__(self,
+                 passphrase: Passphrase = None,
+                 executor: Executor = None,
+                 inline_max: int = INLINE_MAX) -> None:
+        """Wrap a Passphrase, or a new empty one.
+
+        Keyword arguments:
+        passphrase -- The Passphrase to use.
+        executor -- Executor for the blocking work, by default the one of
+        the event loop.
+        inline_max -- Batches up to this size are generated in the event
+        loop.
+
+        """
+        if passphrase is None:
+            passphrase = Passphrase()
+        elif not isinstance(passphrase, Passphrase):
+            raise TypeError('passphrase must be a Passphrase')
+        if executor is not None and not isinstance(executor, Executor):
+            raise TypeError('executor must be an Executor')
+        if not isinstance(inline_max, int):
+            raise TypeError('inline_max can only be int')
+        if inline_max < 0:
+            raise ValueError('inline_max should be greater than or equal to '
+                             '0')
+
+        self._passphrase = passphrase
+        self._executor = executor
+        self._inline_max = inline_max
+
+    @classmethod
+    async def load(cls,
+                   inputfile: str,
+                   is_diceware: bool = False,
+                   executor: Executor = None,
+                   inline_max: int = INLINE_MAX) -> 'AsyncPassphrase':
+        """Create a Passphrase loading the wordlist in the executor.
+
+        Keyword arguments:
+        inputfile -- As in Passphrase().
+        is_diceware -- As in Passphrase().
+        executor -- As in AsyncPassphrase().
+        inline_max -- As in AsyncPassphrase().
+
+        """
+        passphrase = await get_running_loop().run_in_executor(
+            executor,
+            partial(Passphrase, inputfile, is_diceware)
+        )
+        return cls(passphrase, executor, inline_max)
+
+    @property
+    def passphrase(self) -> Passphrase:
+        """The wrapped Passphrase."""
+        return self._passphrase
+
+    def _run(self, func, *args):
+        return get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def import_words_from_file(self,
+                                     inputfile: str,
+                                     is_diceware: bool) -> None:
+        """Import words for the wordlist from a file, in the executor."""
+        await self._run(
+            self._passphrase.import_words_from_file,
+            inputfile,
+            is_diceware
+        )
+
+    async def words_amount_needed(self) -> int:
+        """Calculate the amount of words needed for the passphrase.
+
+        As in Passphrase.words_amount_needed(). The entropy of the wordlist
+        is calculated in the executor, if needed.
+
+        """
+        if self._passphrase.wordlist_ready():
+            return self._passphrase.words_amount_needed()
+        return await self._run(self._passphrase.words_amount_needed)
+
+    async def generated_passphrase_entropy(self) -> float:
+        """Calculate the entropy of the generated passphrase.
+
+        As in Passphrase.generated_passphrase_entropy(). The entropy of the
+        wordlist is calculated in the executor, if needed.
+
+        """
+        if self._passphrase.wordlist_ready():
+            return self._passphrase.generated_passphrase_entropy()
+        return await self._run(self._passphrase.generated_passphrase_entropy)
+
+    async def generate(self, uppercase: int = None) -> list:
+        """Generate a passphrase, see Passphrase.generate."""
+        if not self._passphrase.wordlist_ready(uppercase):
+            return await self._run(self._passphrase.generate, uppercase)
+        return self._passphrase.generate(uppercase)
+
+    async def generate_password(self) -> list:
+        """Generate a password, see Passphrase.generate_password."""
+        return self._passphrase.generate_password()
+
+    async def generate_many(self, count: int, uppercase: int = None) -> list:
+        """Generate many passphrases, see Passphrase.generate_many.
+
+        Batches bigger than inline_max are generated in the executor.
+
+        """
+        if (
+                count <= self._inline_max
+                and self._passphrase.wordlist_ready(uppercase)
+        ):
+            return self._passphrase.generate_many(count, uppercase)
+        return await self._run(
+            self._passphrase.generate_many,
+            count,
+            uppercase
+        )
+
+    async def generate_password_many(self, count: int) -> list:
+        """Generate many passwords, see Passphrase.generate_password_many.
+
+        Batches bigger than inline_max are generated in the executor.
+
+        """
+        if count <= self._inline_max:
+            return self._passphrase.generate_password_many(count)
+        return await self._run(self._passphrase.generate_password_many, count)
+
+    def stream(self,
+               count: int,
+               kind: str = 'passphrase',
+               uppercase: int = None,
+               chunk_size: int = COUNT_CHUNK_SIZE) -> '_Stream':
+        """Return an asynchronous iterator of passphrases or passwords.
+
+        They are generated in the executor in chunks, and the next chunk is
+        generated while the current one is consumed. An invalid setup raises
+        here, or on the first iteration if checking it requires calculating
+        the wordlist entropy.
+
+        Keyword arguments:
+        count -- Amount of passphrases or passwords, or 0 for unbounded.
+        kind -- What to generate: 'passphrase' or 'password'.
+        uppercase -- As in generate(), for passphrases.
+        chunk_size -- Maximum amount of items generated at once.
+
+        """
+        if kind not in KINDS:
+            raise ValueError('kind must be one of: ' + ', '.join(KINDS))
+        for name, value in (('count', count), ('chunk_size', chunk_size)):
+            if not isinstance(value, int):
+                raise TypeError('{} can only be int'.format(name))
+        if count < 0:
+            raise ValueError('count should be greater than or equal to 0')
+        if chunk_size < 1:
+            raise ValueError('chunk_size should be greater than 0')
+
+        if kind == 'password':
+            generate_batch = self._passphrase.generate_password_many
+            ready = True
+        else:
+            generate_batch = partial(
+                self._passphrase.generate_many,
+                uppercase=uppercase
+            )
+            ready = self._passphrase.wordlist_ready(uppercase)
+        if ready:
+            # Fails early if the configuration is not valid
+            generate_batch(0)
+        return _Stream(self._run, generate_batch, count, chunk_size,
+                       check=not ready)
+
+
+class _Stream:
+    """Asynchronous iterator over chunks generated in an executor."""
+
+    def __init__(self, run, generate_batch, count: int,
+                 chunk_size: int, check: bool = False) -> None:
+        self._run = run
+        # Whether the configuration is still to be checked in the executor
+        self._check = check
+        self._generate_batch = generate_batch
+        # Items still to be requested, or None if unbounded
+        self._remaining = count or None
+        self._chunk_size = chunk_size
+        self._items = deque()
+        self._pending = None
+
+    def _request(self) -> None:
+        size = self._chunk_size
+        if self._remaining is not None:
+            size = min(size, self._remaining)
+            self._remaining -= size
+        if size:
+            self._pending = self._run(self._generate_batch, size)
+
+    def __aiter__(self) -> '_Stream':
+        """Return the iterator itself."""
+        return self
+
+    async def __anext__(self) -> str:
+        """Return the next item."""
+        if self._check:
+            self._check = False
+            await self._run(self._generate_batch, 0)
+        if not self._items:
+            if self._pending is None:
+                self._request()
+                if self._pending is None:
+                    raise StopAsyncIteration
+            pending, self._pending = self._pending, None
+            self._items.extend(await pending)
+            # Generate the next chunk while this one is consumed
+            self._request()
+            if not self._items:
+                raise StopAsyncIteration
+        return self._items.popleft()
+
+    async def aclose(self) -> None:
+        """Stop generating, waiting for the pending chunk if any."""
+        self._remaining = 0
+        self._items.clear()
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            await pending
@@ -20,15 +20,30 @@
 
 """Auxiliar functions."""
 
-from subprocess import Popen, PIPE, DEVNULL
 from os.path import isfile, getsize
 from typing import Union
-from sys import stderr
+import sys
+from time import monotonic
 
 from .secrets import randbelow
 
+try:
+    from os import getrandom as _getrandom, GRND_NONBLOCK as _GRND_NONBLOCK
+except ImportError:     # Python < 3.6 or not Linux
+    _getrandom = None
 
-__version__ = '0.2.3'
+
+__version__ = '0.4.0'
+
+# Kernel interface that reports the entropy count of the random pool.
+SYSTEM_ENTROPY_FILE = '/proc/sys/kernel/random/entropy_avail'
+
+# Seconds during which the system entropy value is reused.
+SYSTEM_ENTROPY_TTL = 1.0
+
+# Entropy reported when the random pool is known to be initialized but the
+# count can't be read: the size of the kernel CSPRNG key.
+SYSTEM_ENTROPY_INITIALIZED = 256
 
 
 class Aux:
@@ -117,9 +132,55 @@ class Aux:
         return string
 
     @staticmethod
-    def make_chars_uppercase(
+    def _make_chars_uppercase_indexed(
             lst: Union[list, tuple, str, set],
             uppercase: int
+    ) -> Union[list, tuple, str, set]:
+        """Make uppercase exactly that many randomly selected characters.
+
+        Every lowercase character position is indexed, then the positions are
+        sampled without replacement with a partial Fisher-Yates shuffle.
+
+        """
+        arr = [lst] if isinstance(lst, str) else list(lst)
+        positions = [
+            (windex, cindex)
+            for windex, element in enumerate(arr) if isinstance(element, str)
+            for cindex, char in enumerate(element) if char.islower()
+        ]
+        lowercase = len(positions)
+        if uppercase == 0 or lowercase == 0:
+            return lst
+
+        if uppercase < lowercase:
+            for i in range(uppercase):
+                j = i + randbelow(lowercase - i)
+                positions[i], positions[j] = positions[j], positions[i]
+            del positions[uppercase:]
+
+        words = {}
+        for windex, cindex in positions:
+            word = words.get(windex)
+            if word is None:
+                word = words[windex] = list(arr[windex])
+            word[cindex] = word[cindex].upper()
+        for windex, word in words.items():
+            arr[windex] = ''.join(word)
+
+        if isinstance(lst, set):
+            return set(arr)
+        elif isinstance(lst, str):
+            return arr[0]
+        elif isinstance(lst, tuple):
+            return tuple(arr)
+
+        return arr
+
+    @staticmethod
+    def make_chars_uppercase(
+            lst: Union[list, tuple, str, set],
+            uppercase: int,
+            indexed: bool = False
     ) -> Union[list, tuple, str, set]:
         """Make uppercase some randomly selected characters.
 
@@ -129,6 +190,9 @@ class Aux:
         lst -- the object to make all chars uppercase, which can be a (mix of)
         list, tuple, string or set.
         uppercase -- Number of characters to be set as uppercase.
+        indexed -- Pick the characters uniformly among every lowercase one,
+        in a single pass with no retries. Only strings and strings directly
+        inside lst are considered.
 
         """
         if not isinstance(lst, (list, tuple, str, set)):
@@ -138,6 +202,9 @@ class Aux:
         if uppercase < 0:
             raise ValueError('uppercase must be bigger than zero')
 
+        if indexed:
+            return Aux._make_chars_uppercase_indexed(lst, uppercase)
+
         lowercase = Aux.lowercase_count(lst)
         if uppercase == 0 or lowercase == 0:
             return lst
@@ -193,12 +260,46 @@ class Aux:
     @staticmethod
     def print_stderr(string: str) -> None:
         """Print the given string to STDERR."""
-        print("{}".format(string), file=stderr)
+        # Looked up on every call, since it might be replaced
+        print("{}".format(string), file=sys.stderr)
 
     @staticmethod
-    def system_entropy():
-        """Return the system's entropy bit count, or -1 if unknown."""
-        arg = ['cat', '/proc/sys/kernel/random/entropy_avail']
-        proc = Popen(arg, stdout=PIPE, stderr=DEVNULL)
-        response = proc.communicate()[0]
-        return int(response) if response else -1
+    def _read_system_entropy() -> int:
+        """Read the system's entropy bit count, or -1 if unknown."""
+        initialized = False
+        if _getrandom is not None:
+            try:
+                _getrandom(1, _GRND_NONBLOCK)
+            except BlockingIOError:
+                # The random pool is not initialized yet
+                return 0
+            except OSError:
+                pass
+            else:
+                initialized = True
+
+        try:
+            with open(SYSTEM_ENTROPY_FILE, mode='rb') as entropy_file:
+                return int(entropy_file.read())
+        except (OSError, ValueError):
+            return SYSTEM_ENTROPY_INITIALIZED if initialized else -1
+
+    _system_entropy_cache = None
+
+    @staticmethod
+    def system_entropy() -> int:
+        """Return the system's entropy bit count, or -1 if unknown.
+
+        If os.getrandom is available, it's used to check whether the random
+        pool is initialized, returning 0 if it isn't. The value is cached for
+        SYSTEM_ENTROPY_TTL seconds.
+
+        """
+        now = monotonic()
+        cached = Aux._system_entropy_cache
+        if cached is not None and now - cached[0] < SYSTEM_ENTROPY_TTL:
+            return cached[1]
+
+        entropy = Aux._read_system_entropy()
+        Aux._system_entropy_cache = (now, entropy)
+        return entropy
@@ -20,21 +20,19 @@
 
 """Auxiliar calculations."""
 
-from typing import Union, List, Tuple
+from typing import Union, Sequence
 from math import ceil, fabs, log10, log2
+from collections import Counter
 
-__version__ = '0.4.8'
+__version__ = '0.5.0'
 
 
 def entropy_bits(
-        lst: Union[
-            List[Union[int, str, float, complex]],
-            Tuple[Union[int, str, float, complex]]
-        ]
+        lst: Sequence[Union[int, str, float, complex]]
 ) -> float:
-    """Calculate the number of entropy bits in a list or tuple of elements."""
+    """Calculate the number of entropy bits in a sequence of elements."""
     # Based on https://stackoverflow.com/a/45091961
-    if not isinstance(lst, (list, tuple)):
+    if not isinstance(lst, Sequence) or isinstance(lst, (str, bytes)):
         raise TypeError('lst must be a list or a tuple')
 
     for num in lst:
@@ -47,16 +45,10 @@ def entropy_bits(
     if n_lst <= 1:
         return 0.0
 
-    # Some NumPy replacements
-    counts = [lst.count(x) for x in lst]
-    probs = [c / n_lst for c in counts]
-
-    # Compute entropy
-    entropy = 0.0
-    for prob in probs:
-        entropy -= prob * log2(prob)
-
-    return entropy
+    # Shannon entropy of picking an element at random, where repeated
+    # elements are more likely: H = log2(n) - sum(c * log2(c)) / n
+    counts = Counter(lst).values()
+    return log2(n_lst) - sum(c * log2(c) for c in counts) / n_lst
 
 
 def entropy_bits_nrange(
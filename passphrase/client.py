@@ -0,0 +1,100 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+"""Client of the generation daemon (see passphrase.daemon).
+
+Each message is a JSON object preceded by its length as a 4-byte big endian
+unsigned integer:
+
+- The client sends a single request: {"argv": [...], "cwd": "..."}.
+- The daemon answers with any amount of {"stdout": "..."} and
+  {"stderr": "..."} messages, as the output is produced, and ends with
+  {"exit": status}.
+
+This module is kept small, so a client starts fast.
+
+"""
+
+import sys
+from json import dumps as json_dumps, loads as json_loads
+from os import open as os_open, dup2, devnull, O_WRONLY
+from socket import socket, AF_UNIX, SOCK_STREAM
+from struct import Struct
+
+__version__ = '0.1.0'
+
+# Every message is sent as its length followed by the JSON object
+FRAME_HEADER = Struct('!I')
+
+
+def write_frame(wfile, message: dict) -> None:
+    """Send a message to a binary file-like object."""
+    payload = json_dumps(message).encode('utf-8')
+    wfile.write(FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def read_frame(rfile, max_size: int = None) -> dict:
+    """Receive a message, or None on EOF or if it's bigger than max_size."""
+    header = rfile.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    size, = FRAME_HEADER.unpack(header)
+    if max_size is not None and size > max_size:
+        return None
+    payload = rfile.read(size)
+    if len(payload) < size:
+        return None
+    return json_loads(payload.decode('utf-8'))
+
+
+def connect(path: str, argv: list, cwd: str) -> int:
+    """Run the CLI in the daemon serving on path, and return its status.
+
+    The output is written to this process' standard output and error.
+
+    Keyword arguments:
+    path -- Path of the Unix socket.
+    argv -- The CLI arguments.
+    cwd -- Directory to which paths in argv are relative.
+
+    """
+    with socket(AF_UNIX, SOCK_STREAM) as sock:
+        sock.connect(path)
+        with sock.makefile('wb') as wfile:
+            write_frame(wfile, {'argv': argv, 'cwd': cwd})
+        with sock.makefile('rb') as rfile:
+            try:
+                while True:
+                    message = read_frame(rfile)
+                    if message is None:
+                        raise ConnectionError('the daemon closed the '
+                                              'connection')
+                    if 'exit' in message:
+                        sys.stdout.flush()
+                        return message['exit']
+                    if 'stdout' in message:
+                        sys.stdout.write(message['stdout'])
+                    elif 'stderr' in message:
+                        sys.stderr.write(message['stderr'])
+            except BrokenPipeError:
+                # Stdout was closed (i.e.: piped to `head`)
+                fd = os_open(devnull, O_WRONLY)
+                dup2(fd, sys.stdout.fileno())
+                return 0
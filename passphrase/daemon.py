@@ -0,0 +1,232 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+"""Local generation daemon over a Unix socket.
+
+The daemon runs the CLI for every client that connects, so clients don't pay
+for loading the wordlist nor for setting up the CLI. See passphrase.client
+for the protocol. The socket is only accessible by the user running the
+daemon. Only POSIX systems are supported.
+
+"""
+
+import sys
+from os import umask, unlink, stat
+from socket import socket, AF_UNIX, SOCK_STREAM
+from socketserver import (
+    ThreadingMixIn,
+    UnixStreamServer,
+    StreamRequestHandler
+)
+from stat import S_ISSOCK
+from threading import local
+
+from .client import read_frame, write_frame
+
+__version__ = '0.1.0'
+
+# Requests bigger than this are rejected
+MAX_REQUEST_SIZE = 65536
+
+
+class ClientGone(Exception):
+    """The client closed the connection."""
+
+
+class _FrameWriter:
+    """File-like object that sends everything written as messages."""
+
+    def __init__(self, wfile, key: str) -> None:
+        self._wfile = wfile
+        self._key = key
+
+    def write(self, string: str) -> int:
+        if string:
+            try:
+                write_frame(self._wfile, {self._key: string})
+            except OSError:
+                raise ClientGone()
+        return len(string)
+
+    def flush(self) -> None:
+        pass
+
+
+class _LocalStream:
+    """Standard stream that can be redirected for the current thread only."""
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+        self._local = local()
+
+    def redirect(self, target) -> None:
+        """Redirect this thread's writes to target, or back if None."""
+        self._local.target = target
+
+    def _target(self):
+        return getattr(self._local, 'target', None) or self._stream
+
+    def write(self, string: str) -> int:
+        return self._target().write(string)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
+
+def _install_streams() -> tuple:
+    streams = []
+    for name in ('stdout', 'stderr'):
+        stream = getattr(sys, name)
+        if not isinstance(stream, _LocalStream):
+            stream = _LocalStream(stream)
+            setattr(sys, name, stream)
+        streams.append(stream)
+    return tuple(streams)
+
+
+def _uninstall_streams() -> None:
+    for name in ('stdout', 'stderr'):
+        stream = getattr(sys, name)
+        if isinstance(stream, _LocalStream):
+            setattr(sys, name, stream._stream)
+
+
+class _RequestHandler(StreamRequestHandler):
+    """Run the CLI for a client."""
+
+    def _run(self, argv: list, cwd: str) -> int:
+        try:
+            return self.server.main(argv, cwd=cwd)
+        except SystemExit as exc:
+            # From argparse: --help or invalid arguments
+            if exc.code is None or isinstance(exc.code, int):
+                return exc.code or 0
+            return 1
+        except ClientGone:
+            raise
+        except Exception as exc:
+            sys.stderr.write('Error: {}\n'.format(exc))
+            return 1
+
+    def handle(self) -> None:
+        """Read the request and answer it."""
+        try:
+            request = read_frame(self.rfile, MAX_REQUEST_SIZE)
+        except ValueError:
+            request = None
+        if (
+                not isinstance(request, dict)
+                or not isinstance(request.get('argv'), list)
+                or not all(isinstance(arg, str) for arg in request['argv'])
+                or not isinstance(request.get('cwd'), str)
+        ):
+            return
+
+        stdout, stderr = self.server.streams
+        stdout.redirect(_FrameWriter(self.wfile, 'stdout'))
+        stderr.redirect(_FrameWriter(self.wfile, 'stderr'))
+        try:
+            status = self._run(request['argv'], request['cwd'])
+            write_frame(self.wfile, {'exit': status})
+        except (ClientGone, OSError):
+            pass
+        finally:
+            stdout.redirect(None)
+            stderr.redirect(None)
+
+
+class PassphraseServer(ThreadingMixIn, UnixStreamServer):
+    """Daemon running the CLI for every client, each in its own thread.
+
+    While the server is open, sys.stdout and sys.stderr are replaced by
+    streams that send what's written from a client's thread to that client.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str, main) -> None:
+        """Create the socket and start listening.
+
+        Keyword arguments:
+        path -- Path of the Unix socket, which must not be in use.
+        main -- Function taking the arguments and the current directory of
+        the client as main(argv, cwd=cwd), returning the exit status.
+
+        """
+        if not isinstance(path, str):
+            raise TypeError('path must be a string')
+        _remove_stale_socket(path)
+
+        self.main = main
+        # Only the user can connect
+        mask = umask(0o177)
+        try:
+            UnixStreamServer.__init__(self, path, _RequestHandler)
+        finally:
+            umask(mask)
+        self.streams = _install_streams()
+
+    def server_close(self) -> None:
+        """Close and remove the socket, and restore the standard streams."""
+        UnixStreamServer.server_close(self)
+        _uninstall_streams()
+        try:
+            unlink(self.server_address)
+        except OSError:
+            pass
+
+
+def _remove_stale_socket(path: str) -> None:
+    # A socket left behind by a daemon that's not running anymore
+    try:
+        if not S_ISSOCK(stat(path).st_mode):
+            return
+    except OSError:
+        return
+    with socket(AF_UNIX, SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except ConnectionRefusedError:
+            unlink(path)
+            return
+        except OSError:
+            return
+    raise OSError('a daemon is already serving on {}'.format(path))
+
+
+def serve(path: str, main) -> None:
+    """Serve on the given Unix socket path until interrupted.
+
+    Keyword arguments:
+    path -- As in PassphraseServer().
+    main -- As in PassphraseServer().
+
+    """
+    server = PassphraseServer(path, main)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
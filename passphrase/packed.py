@@ -0,0 +1,417 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+"""Compact, read-only storage for wordlists.
+
+Words are kept UTF-8 encoded in a single blob, each one followed by a
+newline, instead of as thousands of separate str objects.
+
+Packed wordlists can be written to a binary file and mapped back to memory,
+so only the pages holding the words used are ever read. The file has a
+header, the offsets table and the blob:
+
+    magic (4s) version (H) flags (H) count (I) entropy (d)
+    source mtime (Q) source size (Q) blob SHA-256 (32s) padding
+    offsets: (count + 1) x uint32
+    blob
+
+Numbers are in the byte order of the host that wrote it: files with another
+order are rejected as of an unknown version.
+
+The same layout is used to share a packed wordlist between processes through
+shared memory (Python 3.8+): see share() and attach().
+
+"""
+
+from array import array
+from collections import namedtuple
+from collections.abc import Sequence
+from os import getpid, replace as os_replace, remove as os_remove
+from struct import Struct, error as StructError
+from typing import TYPE_CHECKING, Union, Tuple
+
+if TYPE_CHECKING:   # pragma: no cover
+    from multiprocessing.shared_memory import SharedMemory
+
+__version__ = '0.2.0'
+
+DELIMITER = b'\n'
+
+FILE_MAGIC = b'PPWL'
+FILE_VERSION = 1
+FILE_HEADER = Struct('=4sHHIdQQ32s20x')
+OFFSET = Struct('=I')
+
+# Shared memory created by this process with share()
+_SHARED = set()
+
+# Every word is already lowercase
+FLAG_NORMALIZED = 0x1
+
+WordlistHeader = namedtuple(
+    'WordlistHeader',
+    ('flags', 'count', 'entropy', 'mtime', 'size', 'digest')
+)
+
+
+class PackedWordlist(Sequence):
+    r"""Read-only sequence of words packed in a single blob.
+
+    The blob holds every word followed by a newline. The offsets array holds
+    the position where each word starts plus the blob size, so it has one
+    element more than words are. If offsets are not given, they are
+    calculated on first access. Words are decoded only when indexed.
+
+    >>> words = PackedWordlist(b'abacus\nabdomen\n')
+    >>> len(words), words[1]
+    (2, 'abdomen')
+
+    """
+
+    __slots__ = ('_blob', '_offsets')
+
+    def __init__(self,
+                 blob: Union[bytes, bytearray, memoryview],
+                 offsets: Union[array, memoryview] = None) -> None:
+        """Create a wordlist from a blob and, optionally, its offsets.
+
+        Raises TypeError if blob is not bytes-like, and ValueError if it's
+        not empty and doesn't end with a newline.
+
+        """
+        if not isinstance(blob, (bytes, bytearray, memoryview)):
+            raise TypeError('blob must be bytes, bytearray or memoryview')
+        if len(blob) > 0 and blob[-1:] != DELIMITER:
+            raise ValueError('blob must end with a newline')
+
+        self._blob = blob
+        self._offsets = offsets
+
+    @classmethod
+    def from_words(cls, words: Union[list, tuple]) -> 'PackedWordlist':
+        """Pack the given words.
+
+        Raises TypeError if words is not a list or tuple of strings, and
+        ValueError if any word contains a newline.
+
+        """
+        if not isinstance(words, (list, tuple)):
+            raise TypeError('words must be a list or a tuple')
+
+        offsets = array('I', [0])
+        chunks = []
+        position = 0
+        for word in words:
+            if not isinstance(word, str):
+                raise TypeError('words can only be comprised of str')
+            chunk = word.encode('utf-8') + DELIMITER
+            if chunk.count(DELIMITER) > 1:
+                raise ValueError("words can't contain newlines")
+            chunks.append(chunk)
+            position += len(chunk)
+            offsets.append(position)
+
+        return cls(b''.join(chunks), offsets)
+
+    @property
+    def blob(self) -> Union[bytes, bytearray, memoryview]:
+        """Words, each one followed by a newline."""
+        return self._blob
+
+    @property
+    def offsets(self) -> Union[array, memoryview]:
+        """Start of each word, plus the size of the blob."""
+        if self._offsets is None:
+            blob = self._blob
+            offsets = array('I', [0])
+            find = blob.find if not isinstance(blob, memoryview) else (
+                bytes(blob).find
+            )
+            position = find(DELIMITER)
+            while position >= 0:
+                offsets.append(position + 1)
+                position = find(DELIMITER, position + 1)
+            self._offsets = offsets
+
+        return self._offsets
+
+    def __len__(self) -> int:
+        """Return the amount of words."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, list]:
+        """Return the word at the given index, or a list for a slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        offsets = self.offsets
+        if index < 0:
+            index += len(offsets) - 1
+        if not 0 <= index < len(offsets) - 1:
+            raise IndexError('wordlist index out of range')
+
+        return str(
+            self._blob[offsets[index]:offsets[index + 1] - 1],
+            'utf-8'
+        )
+
+    def __iter__(self):
+        """Iterate over the words."""
+        blob = self._blob
+        offsets = self.offsets
+        for index in range(len(offsets) - 1):
+            yield str(blob[offsets[index]:offsets[index + 1] - 1], 'utf-8')
+
+    def __eq__(self, other: object) -> bool:
+        """Compare word by word with another sequence of words."""
+        if not isinstance(other, (PackedWordlist, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return a short representation of the wordlist."""
+        return '<{} of {} words>'.format(type(self).__name__, len(self))
+
+
+def _prepare(words: PackedWordlist,
+             entropy: float,
+             flags: int,
+             mtime: int,
+             size: int) -> Tuple[WordlistHeader, array]:
+    if not isinstance(words, PackedWordlist):
+        raise TypeError('words must be a PackedWordlist')
+
+    # Imported here so it's not loaded unless needed
+    from hashlib import sha256
+
+    offsets = words.offsets
+    if not isinstance(offsets, array) or offsets.itemsize != 4:
+        offsets = array('I', offsets)
+    header = WordlistHeader(
+        flags,
+        len(offsets) - 1,
+        float(entropy),
+        mtime,
+        size,
+        sha256(words.blob).digest()
+    )
+
+    return header, offsets
+
+
+def dump(words: PackedWordlist,
+         filename: str,
+         entropy: float,
+         flags: int = 0,
+         mtime: int = 0,
+         size: int = 0) -> WordlistHeader:
+    """Write the packed wordlist to a binary file and return its header.
+
+    The file is written to a temporary name and then renamed, so readers
+    never see a partial file.
+
+    Keyword arguments:
+    words -- The packed wordlist.
+    filename -- The path of the file to write.
+    entropy -- The entropy of the wordlist in bits.
+    flags -- FLAG_* values describing the words.
+    mtime, size -- The modification time in ns and size of the source file
+    the wordlist was read from, if any.
+
+    """
+    header, offsets = _prepare(words, entropy, flags, mtime, size)
+
+    tmpfilename = '{}.{}.tmp'.format(filename, getpid())
+    try:
+        with open(tmpfilename, mode='wb') as binfile:
+            binfile.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, *header))
+            binfile.write(offsets.tobytes())
+            binfile.write(words.blob)
+        os_replace(tmpfilename, filename)
+    except BaseException:
+        try:
+            os_remove(tmpfilename)
+        except OSError:
+            pass
+        raise
+
+    return header
+
+
+def read_header(filename: str) -> WordlistHeader:
+    """Read the header of a binary wordlist file.
+
+    Raises ValueError if it's not a valid file, and OSError if it can't be
+    read.
+
+    """
+    with open(filename, mode='rb') as binfile:
+        return _unpack_header(binfile.read(FILE_HEADER.size))
+
+
+def _unpack_header(data: Union[bytes, memoryview]) -> WordlistHeader:
+    try:
+        magic, version, *fields = FILE_HEADER.unpack_from(data)
+    except StructError:
+        raise ValueError('wordlist file is truncated')
+    if magic != FILE_MAGIC:
+        raise ValueError('not a wordlist file')
+    if version != FILE_VERSION:
+        raise ValueError('unsupported wordlist file version')
+
+    return WordlistHeader(*fields)
+
+
+def load(filename: str,
+         verify: bool = False) -> Tuple[PackedWordlist, WordlistHeader]:
+    """Map a binary wordlist file to memory.
+
+    Return the packed wordlist, which reads words straight from the mapping,
+    and the file header.
+
+    Raises ValueError if it's not a valid file, and OSError if it can't be
+    read.
+
+    Keyword arguments:
+    filename -- The path of the file to load.
+    verify -- Check the blob against its SHA-256 digest, which reads it all.
+
+    """
+    # Imported here so it's not loaded unless needed
+    from mmap import mmap, ACCESS_READ
+
+    with open(filename, mode='rb') as binfile:
+        mapped = mmap(binfile.fileno(), 0, access=ACCESS_READ)
+
+    return _unpack(memoryview(mapped), verify)
+
+
+def _unpack(view: memoryview,
+            verify: bool,
+            padded: bool = False) -> Tuple[PackedWordlist, WordlistHeader]:
+    # Everything is checked before taking views of the buffer, so a shared
+    # memory block can be closed right away if it's invalid.
+    header = _unpack_header(view)
+    start = FILE_HEADER.size
+    end = start + (header.count + 1) * 4
+    if len(view) < end:
+        raise ValueError('wordlist file is truncated')
+    first, = OFFSET.unpack_from(view, start)
+    last, = OFFSET.unpack_from(view, end - OFFSET.size)
+    size = len(view) - end
+    if first != 0 or last > size or (last < size and not padded):
+        raise ValueError('wordlist file is truncated')
+
+    offsets = view[start:end].cast('I')
+    blob = view[end:end + last]
+    if verify:
+        from hashlib import sha256
+        if sha256(blob).digest() != header.digest:
+            raise ValueError('wordlist file is corrupted')
+
+    return PackedWordlist(blob, offsets), header
+
+
+def share(words: PackedWordlist,
+          name: str,
+          entropy: float,
+          flags: int = 0) -> Tuple['SharedMemory', WordlistHeader]:
+    """Copy the packed wordlist to a new shared memory block.
+
+    The block has the same layout as a binary wordlist file. Return the
+    SharedMemory object, to be freed with unshare() when no longer needed,
+    and the header.
+
+    Raises FileExistsError if the name is already in use.
+
+    Keyword arguments:
+    words -- The packed wordlist.
+    name -- The name of the shared memory block.
+    entropy -- The entropy of the wordlist in bits.
+    flags -- FLAG_* values describing the words.
+
+    """
+    # Imported here so it's not loaded unless needed (Python 3.8+)
+    from multiprocessing.shared_memory import SharedMemory
+
+    header, offsets = _prepare(words, entropy, flags, 0, 0)
+    offsets = offsets.tobytes()
+    blob = words.blob
+    start = FILE_HEADER.size + len(offsets)
+    end = start + len(blob)
+
+    shm = SharedMemory(name=name, create=True, size=end)
+    try:
+        FILE_HEADER.pack_into(shm.buf, 0, FILE_MAGIC, FILE_VERSION, *header)
+        shm.buf[FILE_HEADER.size:start] = offsets
+        shm.buf[start:end] = blob
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+
+    _SHARED.add(shm.name)
+    return shm, header
+
+
+def unshare(shm: 'SharedMemory') -> None:
+    """Close and free the shared memory created by share()."""
+    _SHARED.discard(shm.name)
+    shm.close()
+    shm.unlink()
+
+
+def attach(
+        name: str
+) -> Tuple[PackedWordlist, WordlistHeader, 'SharedMemory']:
+    """Use a packed wordlist from a shared memory block made by share().
+
+    Return the packed wordlist, which reads words straight from the shared
+    memory, the header, and the SharedMemory object. The latter can't be
+    closed until the wordlist views are released.
+
+    Raises FileNotFoundError if there's no such block, and ValueError if it
+    doesn't hold a wordlist.
+
+    """
+    # Imported here so it's not loaded unless needed (Python 3.8+)
+    from multiprocessing.shared_memory import SharedMemory
+
+    try:
+        shm = SharedMemory(name=name, track=False)
+    except TypeError:   # Python < 3.13
+        shm = SharedMemory(name=name)
+        # Attaching registers the block as if it was created here, so the
+        # resource tracker would unlink it when this process ends.
+        if shm.name not in _SHARED:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, 'shared_memory')
+
+    try:
+        words, header = _unpack(shm.buf, False, padded=True)
+    except BaseException:
+        shm.close()
+        raise
+
+    return words, header, shm
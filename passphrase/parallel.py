@@ -0,0 +1,251 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+"""Bulk generation of passphrases or passwords over many processes.
+
+Worker processes are forked from the current one, so they start with its
+Passphrase already set up, and they take no randomness from it: each worker
+reseeds from the system's randomness source right after the fork. Results
+are sent back in chunks through pipes, and come out in order or as soon as
+they are ready.
+
+Only POSIX systems are supported.
+
+"""
+
+from marshal import dumps as marshal_dumps, loads as marshal_loads
+from os import cpu_count, fork, pipe, read, write, close, waitpid, _exit
+from selectors import DefaultSelector, EVENT_READ
+from struct import Struct
+from typing import Iterator
+
+from .passphrase import Passphrase
+from .random import reseed
+from .settings import COUNT_CHUNK_SIZE
+
+__version__ = '0.1.0'
+
+KINDS = ('passphrase', 'password')
+
+# Every chunk is sent as its length followed by the marshalled list
+FRAME_HEADER = Struct('=I')
+
+# Bytes read from a pipe at once
+READ_SIZE = 65536
+
+
+class _Worker:
+    """A forked worker process, as seen from the parent."""
+
+    __slots__ = ('pid', 'fd', 'chunks', '_buffer')
+
+    def __init__(self, pid: int, fd: int, chunks: int) -> None:
+        self.pid = pid
+        self.fd = fd
+        # Chunks still to be received, or -1 if unbounded
+        self.chunks = chunks
+        self._buffer = bytearray()
+
+    def feed(self) -> bool:
+        """Read what's available from the pipe; return False on EOF."""
+        data = read(self.fd, READ_SIZE)
+        self._buffer += data
+        return bool(data)
+
+    def pop(self) -> list:
+        """Return the next complete chunk, or None if there's none yet."""
+        buffer = self._buffer
+        if len(buffer) < FRAME_HEADER.size:
+            return None
+        size, = FRAME_HEADER.unpack_from(buffer)
+        end = FRAME_HEADER.size + size
+        if len(buffer) < end:
+            return None
+
+        chunk = marshal_loads(bytes(buffer[FRAME_HEADER.size:end]))
+        del buffer[:end]
+        if self.chunks > 0:
+            self.chunks -= 1
+        return chunk
+
+
+def _chunk_sizes(count: int, chunk_size: int, first: int, step: int):
+    # Sizes of the chunks first, first + step, first + 2 * step... of the
+    # whole count (unbounded if 0).
+    index = first
+    while count == 0 or index * chunk_size < count:
+        yield chunk_size if count == 0 else min(
+            chunk_size,
+            count - index * chunk_size
+        )
+        index += step
+
+
+def _generate_batch(passphrase: Passphrase, kind: str, uppercase: int):
+    if kind == 'password':
+        return passphrase.generate_password_many
+    return lambda size: passphrase.generate_many(size, uppercase)
+
+
+def _run_worker(fd: int, generate_batch, sizes) -> None:
+    # Never returns: the worker process ends here
+    status = 0
+    try:
+        reseed()
+        for size in sizes:
+            payload = marshal_dumps(generate_batch(size))
+            frame = memoryview(FRAME_HEADER.pack(len(payload)) + payload)
+            while frame:
+                frame = frame[write(fd, frame):]
+    except (BrokenPipeError, KeyboardInterrupt):
+        # The parent is gone or is stopping
+        pass
+    except BaseException:
+        status = 1
+    finally:
+        _exit(status)
+
+
+def _close_all(workers: list) -> None:
+    for worker in workers:
+        try:
+            close(worker.fd)
+        except OSError:
+            pass
+    for worker in workers:
+        waitpid(worker.pid, 0)
+
+
+def generate(passphrase: Passphrase,
+             count: int,
+             jobs: int = None,
+             kind: str = 'passphrase',
+             uppercase: int = None,
+             chunk_size: int = COUNT_CHUNK_SIZE,
+             ordered: bool = True) -> Iterator[list]:
+    """Generate passphrases or passwords in parallel, yielding chunks.
+
+    Each chunk is a list of at most chunk_size passphrases or passwords as
+    strings, as generate_many() or generate_password_many() return them.
+    The arguments and the configuration are checked right away, and worker
+    processes are forked once the first chunk is requested.
+
+    Keyword arguments:
+    passphrase -- The Passphrase to use, already set up.
+    count -- Amount of passphrases or passwords, or 0 for unbounded.
+    jobs -- Amount of worker processes, by default one per CPU.
+    kind -- What to generate: 'passphrase' or 'password'.
+    uppercase -- Passed to generate_many(), for passphrases.
+    chunk_size -- Maximum amount of results per chunk.
+    ordered -- Yield the chunks in order instead of as soon as ready.
+
+    """
+    if not isinstance(passphrase, Passphrase):
+        raise TypeError('passphrase must be a Passphrase')
+    if kind not in KINDS:
+        raise ValueError('kind must be one of: ' + ', '.join(KINDS))
+    if jobs is None:
+        jobs = cpu_count() or 1
+    for name, value in (('count', count), ('jobs', jobs),
+                        ('chunk_size', chunk_size)):
+        if not isinstance(value, int):
+            raise TypeError('{} can only be int'.format(name))
+    if count < 0:
+        raise ValueError('count should be greater than or equal to 0')
+    if jobs < 1 or chunk_size < 1:
+        raise ValueError('jobs and chunk_size should be greater than 0')
+
+    generate_batch = _generate_batch(passphrase, kind, uppercase)
+    # Fails early, in this process, if the configuration is not valid
+    generate_batch(0)
+
+    if count:
+        jobs = min(jobs, -(-count // chunk_size))
+    return _generate(generate_batch, count, jobs, chunk_size, ordered)
+
+
+def _generate(generate_batch,
+              count: int,
+              jobs: int,
+              chunk_size: int,
+              ordered: bool) -> Iterator[list]:
+    # Workers are forked on the first next(), after every check passed
+    if jobs == 1:
+        for size in _chunk_sizes(count, chunk_size, 0, 1):
+            yield generate_batch(size)
+        return
+
+    workers = []
+    try:
+        for index in range(jobs):
+            rfd, wfd = pipe()
+            pid = fork()
+            if pid == 0:
+                close(rfd)
+                for worker in workers:
+                    close(worker.fd)
+                _run_worker(
+                    wfd,
+                    generate_batch,
+                    _chunk_sizes(count, chunk_size, index, jobs)
+                )
+            close(wfd)
+            chunks = len(range(index, -(-count // chunk_size), jobs))
+            workers.append(_Worker(pid, rfd, chunks if count else -1))
+
+        if ordered:
+            yield from _collect_ordered(workers)
+        else:
+            yield from _collect_unordered(workers)
+    finally:
+        _close_all(workers)
+
+
+def _collect_ordered(workers: list) -> Iterator[list]:
+    # Chunks are distributed round robin, so they are taken the same way
+    while workers[0].chunks:
+        for worker in workers:
+            if not worker.chunks:
+                return
+            chunk = worker.pop()
+            while chunk is None:
+                if not worker.feed():
+                    raise RuntimeError('worker process failed')
+                chunk = worker.pop()
+            yield chunk
+
+
+def _collect_unordered(workers: list) -> Iterator[list]:
+    with DefaultSelector() as selector:
+        for worker in workers:
+            if worker.chunks:
+                selector.register(worker.fd, EVENT_READ, worker)
+        while selector.get_map():
+            for key, _ in selector.select():
+                worker = key.data
+                alive = worker.feed()
+                chunk = worker.pop()
+                while chunk is not None:
+                    yield chunk
+                    chunk = worker.pop()
+                if not worker.chunks:
+                    selector.unregister(worker.fd)
+                elif not alive:
+                    raise RuntimeError('worker process failed')
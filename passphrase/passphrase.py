@@ -26,24 +26,26 @@ characters.
 
 """
 
-from typing import Union, List, Tuple
+from typing import Union, Sequence
+from array import array
 from string import digits, ascii_lowercase, ascii_uppercase, punctuation
 
-from .wordlist import EFF_LONG_WORDLIST, EFF_LONG_WORDLIST_ENTROPY
 from .calc import password_length_needed as calc_password_length_needed
 from .calc import words_amount_needed as calc_words_amount_needed
 from .calc import entropy_bits_nrange as calc_entropy_bits_nrange
 from .calc import passphrase_entropy as calc_passphrase_entropy
 from .calc import password_entropy as calc_password_entropy
 from .calc import entropy_bits as calc_entropy_bits
-from .secrets import randchoice, randhex, randbetween
+from .secrets import randhex, randbetween
 from .settings import MIN_NUM, MAX_NUM
+from .spec import PassphraseSpec, check_randnum_range
+from .metrics import timed
 from .aux import Aux
 
 
 __author__ = 'HacKan'
 __license__ = 'GNU GPL 3.0+'
-__version__ = '0.6.0'
+__version__ = '0.9.0'
 
 
 class Passphrase:
@@ -61,6 +63,7 @@ class Passphrase:
         if entropybits < 0:
             raise ValueError('entropy_bits_req should be greater than 0')
         self._entropy_bits_req = float(entropybits)
+        self._derived.clear()
 
     @property
     def randnum_min(self) -> int:
@@ -74,6 +77,7 @@ class Passphrase:
         if randnum < 0:
             raise ValueError('randnum_min should be greater than 0')
         self._randnum_min = randnum
+        self._derived.clear()
 
     @property
     def randnum_max(self) -> int:
@@ -87,6 +91,7 @@ class Passphrase:
         if randnum < 0:
             raise ValueError('randnum_max should be greater than 0')
         self._randnum_max = randnum
+        self._derived.clear()
 
     @property
     def amount_w(self) -> int:
@@ -100,6 +105,7 @@ class Passphrase:
         if amount < 0:
             raise ValueError('amount_w should be greater than 0')
         self._amount_w = amount
+        self._derived.clear()
 
     @property
     def amount_n(self) -> int:
@@ -113,6 +119,7 @@ class Passphrase:
         if amount < 0:
             raise ValueError('amount_n should be greater than 0')
         self._amount_n = amount
+        self._derived.clear()
 
     @property
     def passwordlen(self) -> int:
@@ -126,6 +133,7 @@ class Passphrase:
         if length < 0:
             raise ValueError('passwordlen should be greater than 0')
         self._passwordlen = length
+        self._derived.clear()
 
     @property
     def separator(self) -> str:
@@ -144,11 +152,12 @@ class Passphrase:
         return self._wordlist
 
     @wordlist.setter
-    def wordlist(self, words: Union[list, tuple]) -> None:
-        if not isinstance(words, (list, tuple)):
+    def wordlist(self, words: Sequence[str]) -> None:
+        if not isinstance(words, Sequence) or isinstance(words, (str, bytes)):
             raise TypeError('wordlist can only be list or tuple')
         self._wordlist = list(words)
         self._wordlist_entropy_bits = None
+        self._set_words(self._normalize_words(self._wordlist))
 
     @property
     def password_use_lowercase(self) -> bool:
@@ -158,6 +167,7 @@ class Passphrase:
     @password_use_lowercase.setter
     def password_use_lowercase(self, use_lowercase: bool) -> None:
         self._password_use_lowercase = bool(use_lowercase)
+        self._derived.clear()
 
     @property
     def password_use_uppercase(self) -> bool:
@@ -167,6 +177,7 @@ class Passphrase:
     @password_use_uppercase.setter
     def password_use_uppercase(self, use_uppercase: bool) -> None:
         self._password_use_uppercase = bool(use_uppercase)
+        self._derived.clear()
 
     @property
     def password_use_digits(self) -> bool:
@@ -176,6 +187,7 @@ class Passphrase:
     @password_use_digits.setter
     def password_use_digits(self, use_digits: bool) -> None:
         self._password_use_digits = bool(use_digits)
+        self._derived.clear()
 
     @property
     def password_use_punctuation(self) -> bool:
@@ -185,18 +197,7 @@ class Passphrase:
     @password_use_punctuation.setter
     def password_use_punctuation(self, use_punctuation: bool) -> None:
         self._password_use_punctuation = bool(use_punctuation)
-
-    @staticmethod
-    def _read_words_from_wordfile(inputfile: str) -> list:
-        return [
-            word.strip() for word in open(inputfile, mode='rt')
-        ]
-
-    @staticmethod
-    def _read_words_from_diceware(inputfile: str) -> list:
-        return [
-            word.split()[1] for word in open(inputfile, mode='rt')
-        ]
+        self._derived.clear()
 
     def _get_password_characters(self, cathegorized=False) -> str:
         group = []
@@ -212,6 +213,86 @@ class Passphrase:
 
         return group if cathegorized else ''.join(group)
 
+    @staticmethod
+    def _normalize_words(words: Union[list, tuple]) -> list:
+        try:
+            return [word.lower() for word in words]
+        except AttributeError:
+            raise TypeError('wordlist can only contain strings')
+
+    def _set_words(self, words: Sequence) -> None:
+        # Normalized (lowercase) words used for generation; the metadata is
+        # computed once per wordlist, when first needed.
+        self._words = words
+        self._words_lowercase = None
+        self._derived.clear()
+
+    def _get_words_lowercase(self) -> array:
+        # Amount of lowercase characters of each normalized word
+        if self._words_lowercase is None:
+            self._words_lowercase = array('I', [
+                sum(1 for char in word if char.islower())
+                for word in self._words
+            ])
+        return self._words_lowercase
+
+    def _get_wordlist_entropy(self) -> float:
+        # The entropy for EFF Large Wordlist is ~12.9, no need to calculate.
+        # For any other wordlist, it's calculated once and kept until the
+        # wordlist changes.
+        if self._wordlist_entropy_bits is None:
+            self._wordlist_entropy_bits = self.entropy_bits(self.wordlist)
+        return self._wordlist_entropy_bits
+
+    def wordlist_ready(self, uppercase: int = None) -> bool:
+        """Return whether the wordlist calculations are already done.
+
+        These are its entropy and, to make characters uppercase (when
+        uppercase is not None), the lowercase count of each word. They are
+        done once per wordlist, by the first call that needs them; until
+        then, that call may take long for a large wordlist.
+
+        """
+        if not self.wordlist:
+            return True
+        return self._wordlist_entropy_bits is not None and (
+            uppercase is None or self._words_lowercase is not None
+        )
+
+    def _get_randnum_entropy(self) -> float:
+        # Same check as when compiling, so a range that can't be generated
+        # has no entropy either
+        check_randnum_range(self.randnum_min, self.randnum_max, self.amount_n)
+        return self.entropy_bits((self.randnum_min, self.randnum_max))
+
+    def _cached(self, calculate) -> Union[int, float]:
+        # Values derived from the settings, kept until a setter clears them
+        name = calculate.__name__
+        try:
+            value = self._derived[name]
+        except KeyError:
+            self._cache_misses += 1
+            value = calculate()
+            self._derived[name] = value
+            return value
+        self._cache_hits += 1
+        return value
+
+    def cache_stats(self) -> dict:
+        """Return the hits and misses of the calculations cache.
+
+        Calculations are words_amount_needed(), password_length_needed(),
+        generated_password_entropy() and generated_passphrase_entropy(),
+        kept until a setting they depend on changes.
+
+        """
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'hit_rate': self._cache_hits / lookups if lookups else 0.0,
+        }
+
     def __init__(self,
                  inputfile: str = None,
                  is_diceware: bool = False) -> None:
@@ -231,6 +312,9 @@ class Passphrase:
         internal).
 
         """
+        self._derived = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._randnum_min = MIN_NUM
         self._randnum_max = MAX_NUM
         self._separator = ' '
@@ -244,13 +328,55 @@ class Passphrase:
         self._entropy_bits_req = None
         self._wordlist = None
         self._wordlist_entropy_bits = None
+        self._words = None
+        self._words_lowercase = None
+        # Last compiled specs along with the settings they were compiled from
+        self._spec = None
+        self._password_spec = None
         self.last_result = None
+        # Shared memory holding the wordlist created here, and the one
+        # attached here along with its wordlist
+        self._shared_memory = None
+        self._attached_memory = None
 
         if inputfile == 'internal':
             self.load_internal_wordlist()
         elif inputfile is not None:
             self.import_words_from_file(inputfile, is_diceware)
 
+    def __copy__(self) -> 'Passphrase':
+        """Return a Passphrase with the same settings and wordlist.
+
+        The copy doesn't share any state that changes with the original, so
+        each one can be set up or used on its own, i.e.: from another
+        thread. A wordlist attached by attach_wordlist() is copied out of
+        the shared memory, and the one published by share_wordlist() is
+        still freed by the original only.
+
+        """
+        other = type(self).__new__(type(self))
+        other.__dict__.update(self.__dict__)
+        other._derived = {}
+        other._shared_memory = None
+        other._attached_memory = None
+        if (
+                self._attached_memory is not None
+                and self._wordlist is self._attached_memory[1]
+        ):
+            # Imported here so it's not loaded unless needed
+            from .packed import PackedWordlist
+
+            attached = self._wordlist
+            words = PackedWordlist(
+                bytes(attached.blob),
+                array('I', attached.offsets)
+            )
+            other._wordlist = words
+            other._spec = None
+            if self._words is attached:
+                other._words = words
+        return other
+
     def __str__(self) -> str:
         """Return elements from the last result separated by the separator."""
         if not self.last_result:
@@ -267,19 +393,16 @@ class Passphrase:
 
     @staticmethod
     def entropy_bits(
-            lst: Union[
-                List[Union[int, str, float, complex]],
-                Tuple[Union[int, str, float, complex]]
-            ]
+            lst: Sequence[Union[int, str, float, complex]]
     ) -> float:
         """Calculate the entropy of a wordlist or a numerical range.
 
         Keyword arguments:
-        lst -- A wordlist as list or tuple, or a numerical range as a list:
-        (minimum, maximum)
+        lst -- A wordlist as a sequence (list, tuple...), or a numerical
+        range as a list: (minimum, maximum)
 
         """
-        if not isinstance(lst, (tuple, list)):
+        if not isinstance(lst, Sequence) or isinstance(lst, (str, bytes)):
             raise TypeError('lst must be a list or a tuple')
 
         size = len(lst)
@@ -292,18 +415,26 @@ class Passphrase:
 
         return calc_entropy_bits(lst)
 
+    @timed('load_internal_wordlist')
     def load_internal_wordlist(self) -> None:
         """Load internal wordlist."""
+        # Imported here so it's not loaded unless needed
+        from .wordlist import EFF_LONG_WORDLIST, EFF_LONG_WORDLIST_ENTROPY
+
         self._wordlist = EFF_LONG_WORDLIST
         self._wordlist_entropy_bits = EFF_LONG_WORDLIST_ENTROPY
+        # It's already normalized
+        self._set_words(EFF_LONG_WORDLIST)
 
+    @timed('import_words_from_file')
     def import_words_from_file(self,
                                inputfile: str,
                                is_diceware: bool) -> None:
         """Import words for the wordlist from a given file.
 
         The file can have a single column with words or be diceware-like
-        (two columns).
+        (two columns). It's compiled to a binary format and cached, to be
+        mapped to memory the next time (see settings.WORDLIST_CACHE).
 
         Keyword arguments:
         inputfile -- A string with the path to the wordlist file to load, or
@@ -315,11 +446,109 @@ class Passphrase:
             raise FileNotFoundError('Input file does not exists, is not valid '
                                     'or is empty: {}'.format(inputfile))
 
-        self._wordlist_entropy_bits = None
-        if is_diceware:
-            self._wordlist = self._read_words_from_diceware(inputfile)
+        # Imported here so it's not loaded unless needed
+        from .wordcache import load_wordlist
+
+        words, entropy, normalized = load_wordlist(inputfile, is_diceware)
+        self._wordlist = words
+        self._wordlist_entropy_bits = entropy
+        self._set_words(words if normalized else self._normalize_words(words))
+
+    def share_wordlist(self, name: str = None) -> str:
+        """Publish the wordlist in shared memory and return its name.
+
+        Other processes can use it by name with attach_wordlist(), so it's
+        kept in memory once no matter how many processes use it. The shared
+        memory is freed by unshare_wordlist() or when this process ends.
+        Requires Python 3.8+.
+
+        Keyword arguments:
+        name -- The name for the shared memory, or None for a random one.
+
+        """
+        if name is None:
+            name = 'passphrase-{}'.format(randhex(16))
+        elif not isinstance(name, str):
+            raise TypeError('name can only be string')
+        if not self.wordlist:
+            raise ValueError("Can't share wordlist: wordlist is empty")
+
+        # Imported here so it's not loaded unless needed
+        from .packed import PackedWordlist, FLAG_NORMALIZED
+        from .packed import share as packed_share
+
+        words = self._words
+        if not isinstance(words, PackedWordlist):
+            words = PackedWordlist.from_words(list(words))
+        shm, _ = packed_share(
+            words,
+            name,
+            self._get_wordlist_entropy(),
+            FLAG_NORMALIZED
+        )
+
+        self.unshare_wordlist()
+        self._shared_memory = shm
+        return name
+
+    def unshare_wordlist(self) -> None:
+        """Free the shared memory created by share_wordlist(), if any.
+
+        Processes already attached keep using it until they detach.
+
+        """
+        if self._shared_memory is not None:
+            # Imported here so it's not loaded unless needed
+            from .packed import unshare as packed_unshare
+
+            packed_unshare(self._shared_memory)
+            self._shared_memory = None
+
+    def attach_wordlist(self, name: str) -> None:
+        """Use a wordlist published by share_wordlist() in another process.
+
+        Words are read straight from the shared memory, and they are already
+        lowercase. Requires Python 3.8+.
+
+        Keyword arguments:
+        name -- The name returned by share_wordlist().
+
+        """
+        if not isinstance(name, str):
+            raise TypeError('name can only be string')
+
+        # Imported here so it's not loaded unless needed
+        from .packed import FLAG_NORMALIZED, attach as packed_attach
+
+        words, header, shm = packed_attach(name)
+        self.detach_wordlist()
+        self._wordlist = words
+        self._wordlist_entropy_bits = header.entropy
+        if header.flags & FLAG_NORMALIZED:
+            self._set_words(words)
         else:
-            self._wordlist = self._read_words_from_wordfile(inputfile)
+            self._set_words(self._normalize_words(words))
+        self._attached_memory = (shm, words)
+
+    def detach_wordlist(self) -> None:
+        """Stop using the wordlist attached by attach_wordlist(), if any.
+
+        The wordlist is emptied if it was the attached one.
+
+        """
+        if self._attached_memory is None:
+            return
+
+        shm, words = self._attached_memory
+        self._attached_memory = None
+        if self._wordlist is words:
+            self._wordlist = None
+            self._wordlist_entropy_bits = None
+            self._set_words(None)
+        # The views must be released before closing
+        words.blob.release()
+        words.offsets.release()
+        shm.close()
 
     def password_length_needed(self) -> int:
         """Calculate the needed password length to satisfy the entropy number.
@@ -327,6 +556,9 @@ class Passphrase:
         This is for the given character set.
 
         """
+        return self._cached(self._calc_password_length_needed)
+
+    def _calc_password_length_needed(self) -> int:
         characters = self._get_password_characters()
         if (
                 self.entropy_bits_req is None
@@ -341,12 +573,16 @@ class Passphrase:
             characters
         )
 
+    @timed('words_amount_needed')
     def words_amount_needed(self) -> int:
         """Calculate the needed amount of words to satisfy the entropy number.
 
         This is for the given wordlist.
 
         """
+        return self._cached(self._calc_words_amount_needed)
+
+    def _calc_words_amount_needed(self) -> int:
         if (
                 self.entropy_bits_req is None
                 or self.amount_n is None
@@ -361,12 +597,9 @@ class Passphrase:
         # I set the minimum entropy bits and calculate the amount of words
         # needed, cosidering the entropy of the wordlist.
         # Then: entropy_w * amount_w + entropy_n * amount_n >= ENTROPY_BITS_MIN
-        entropy_n = self.entropy_bits((self.randnum_min, self.randnum_max))
+        entropy_n = self._get_randnum_entropy()
 
-        # The entropy for EFF Large Wordlist is ~12.9, no need to calculate
-        entropy_w = self._wordlist_entropy_bits \
-            if self._wordlist_entropy_bits \
-            else self.entropy_bits(self.wordlist)
+        entropy_w = self._get_wordlist_entropy()
 
         return calc_words_amount_needed(
             self.entropy_bits_req,
@@ -377,6 +610,9 @@ class Passphrase:
 
     def generated_password_entropy(self) -> float:
         """Calculate the entropy of a password that would be generated."""
+        return self._cached(self._calc_generated_password_entropy)
+
+    def _calc_generated_password_entropy(self) -> float:
         characters = self._get_password_characters()
         if (
                 self.passwordlen is None
@@ -392,6 +628,9 @@ class Passphrase:
 
     def generated_passphrase_entropy(self) -> float:
         """Calculate the entropy of a passphrase that would be generated."""
+        return self._cached(self._calc_generated_passphrase_entropy)
+
+    def _calc_generated_passphrase_entropy(self) -> float:
         if (
                 self.amount_w is None
                 or self.amount_n is None
@@ -404,12 +643,9 @@ class Passphrase:
         if self.amount_n == 0 and self.amount_w == 0:
             return 0.0
 
-        entropy_n = self.entropy_bits((self.randnum_min, self.randnum_max))
+        entropy_n = self._get_randnum_entropy()
 
-        # The entropy for EFF Large Wordlist is ~12.9, no need to calculate
-        entropy_w = self._wordlist_entropy_bits \
-            if self._wordlist_entropy_bits \
-            else self.entropy_bits(self.wordlist)
+        entropy_w = self._get_wordlist_entropy()
 
         return calc_passphrase_entropy(
             self.amount_w,
@@ -418,6 +654,65 @@ class Passphrase:
             self.amount_n
         )
 
+    def compile(self, uppercase: int = None) -> PassphraseSpec:
+        """Compile the current configuration to a PassphraseSpec.
+
+        The spec is not affected by later changes to this object.
+
+        Keyword arguments:
+        uppercase -- As in generate().
+
+        """
+        words = self._words
+        charset = self._get_password_characters()
+        settings = (
+            words,
+            self.amount_w,
+            self.amount_n,
+            uppercase,
+            self.separator,
+            charset,
+            self.passwordlen,
+            self.randnum_min,
+            self.randnum_max,
+        )
+        if self._spec is not None and self._spec_matches(settings):
+            return self._spec[1]
+
+        spec = PassphraseSpec(
+            words=words,
+            amount_w=self.amount_w,
+            amount_n=self.amount_n,
+            uppercase=uppercase,
+            separator=self.separator,
+            charset=charset,
+            passwordlen=self.passwordlen,
+            randnum_min=self.randnum_min,
+            randnum_max=self.randnum_max,
+            words_entropy=self._get_wordlist_entropy() if words else None,
+            words_lowercase=self._get_words_lowercase() if (
+                words and uppercase is not None
+            ) else None
+        )
+        self._spec = (settings, spec)
+        return spec
+
+    def _spec_matches(self, settings: tuple) -> bool:
+        # The wordlist is compared by identity, it's replaced when changed
+        cached = self._spec[0]
+        return cached[0] is settings[0] and cached[1:] == settings[1:]
+
+    def _compile_password(self) -> PassphraseSpec:
+        # The wordlist is not needed for passwords
+        settings = (self._get_password_characters(), self.passwordlen)
+        if self._password_spec is None or self._password_spec[0] != settings:
+            self._password_spec = (
+                settings,
+                PassphraseSpec(charset=settings[0], passwordlen=settings[1])
+            )
+        return self._password_spec[1]
+
+    @timed('generate')
     def generate(self, uppercase: int = None) -> list:
         """Generate a list of words randomly chosen from a wordlist.
 
@@ -428,65 +723,46 @@ class Passphrase:
         them all uppercase, and None for no one.
 
         """
-        if (
-                self.amount_n is None
-                or self.amount_w is None
-                or not self.wordlist
-        ):
-            raise ValueError("Can't generate passphrase: "
-                             "wordlist is empty or amount_n or "
-                             "amount_w isn't set")
-
-        if uppercase is not None and not isinstance(uppercase, int):
-            raise TypeError('uppercase must be an integer number')
-
-        passphrase = []
-        for _ in range(0, self.amount_w):
-            passphrase.append(randchoice(self.wordlist).lower())
-
-        # Handle uppercase
-        lowercase = Aux.lowercase_count(passphrase)
-        if passphrase and uppercase is not None:
-            if (
-                    uppercase < 0
-                    and lowercase > (uppercase * -1)
-            ):
-                uppercase = lowercase + uppercase
-
-            # If it's still negative, then means no uppercase
-            if uppercase == 0 or uppercase > lowercase:
-                # Make it all uppercase
-                passphrase = Aux.make_all_uppercase(passphrase)
-            elif uppercase > 0:
-                passphrase = Aux.make_chars_uppercase(
-                    passphrase,
-                    uppercase
-                )
-
-        # Handle numbers
-        for _ in range(0, self.amount_n):
-            passphrase.append(randbetween(MIN_NUM, MAX_NUM))
+        passphrase = self.compile(uppercase).sample()
 
         self.last_result = passphrase
         return passphrase
 
+    def generate_many(self, count: int, uppercase: int = None) -> list:
+        """Generate a list of passphrases as strings.
+
+        Each passphrase is built as in generate() and joined by the
+        separator. Settings are compiled once for the whole batch, and
+        last_result is not modified.
+
+        Keyword arguments:
+        count -- The amount of passphrases to generate.
+        uppercase -- As in generate().
+
+        """
+        return self.compile(uppercase).generate_many(count)
+
+    @timed('generate_password')
     def generate_password(self) -> list:
         """Generate a list of random characters."""
-        characterset = self._get_password_characters()
-        if (
-                self.passwordlen is None
-                or not characterset
-        ):
-            raise ValueError("Can't generate password: character set is "
-                             "empty or passwordlen isn't set")
-
-        password = []
-        for _ in range(0, self.passwordlen):
-            password.append(randchoice(characterset))
+        password = list(self._compile_password().generate_password())
 
         self.last_result = password
         return password
 
+    def generate_password_many(self, count: int) -> list:
+        """Generate a list of passwords as strings.
+
+        Settings are compiled once for the whole batch, and last_result is
+        not modified.
+
+        Keyword arguments:
+        count -- The amount of passwords to generate.
+
+        """
+        return self._compile_password().generate_password_many(count)
+
+    @timed('generate_uuid4')
     def generate_uuid4(self) -> list:
         """Generate a list of parts of a UUID version 4 string.
 
@@ -0,0 +1,280 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+"""Pool of pre-generated passphrases or passwords.
+
+A background thread keeps the pool filled, so taking an item doesn't wait for
+the system's randomness source nor for the generation itself.
+
+"""
+
+from collections import deque
+from copy import copy
+from os import getpid
+from threading import Condition, Thread
+from timeit import default_timer
+from weakref import WeakSet
+
+from .passphrase import Passphrase
+
+try:
+    from os import register_at_fork
+except ImportError:     # Python < 3.7: rely on checking the pid instead
+    register_at_fork = None
+
+__version__ = '0.1.0'
+
+# Every pool ever created, so they can be emptied after a fork.
+_FORK_RESET = WeakSet()
+
+KINDS = ('passphrase', 'password')
+
+
+class PassphrasePool:
+    """Bounded queue of passphrases or passwords generated in background.
+
+    The configuration of the given Passphrase is frozen when the pool is
+    created: later changes to it don't affect the pool. Items are kept as
+    bytearrays and handed out exactly once; each one is wiped from the pool
+    when taken. If the pool is empty, the item is generated right away.
+
+    A forked child never gets its parent's items: the pool is emptied in the
+    child, and refilled there once it's used, so children that don't use it
+    (i.e.: workers of parallel.generate()) don't run a refill thread.
+
+    >>> passphrase = Passphrase('internal')
+    >>> passphrase.amount_w, passphrase.amount_n = 6, 0
+    >>> with PassphrasePool(passphrase) as pool:  #doctest:+SKIP
+    ...     pool.take()
+    'wrist flail agonize unsaid harbor clarify'
+
+    """
+
+    def __init__(self,
+                 passphrase: Passphrase,
+                 kind: str = 'passphrase',
+                 size: int = 64,
+                 low_water: int = None,
+                 uppercase: int = None) -> None:
+        """Create the pool and start filling it.
+
+        Keyword arguments:
+        passphrase -- The Passphrase whose configuration is used.
+        kind -- What to generate: 'passphrase' or 'password'.
+        size -- Maximum amount of items in the pool.
+        low_water -- Refill when the pool has fewer items than this, by
+        default half its size.
+        uppercase -- Passed to generate(), for passphrases.
+
+        """
+        if not isinstance(passphrase, Passphrase):
+            raise TypeError('passphrase must be a Passphrase')
+        if kind not in KINDS:
+            raise ValueError('kind must be one of: ' + ', '.join(KINDS))
+        if not isinstance(size, int):
+            raise TypeError('size can only be int')
+        if size < 1:
+            raise ValueError('size should be greater than 0')
+        if low_water is None:
+            low_water = (size + 1) // 2
+        elif not isinstance(low_water, int):
+            raise TypeError('low_water can only be int')
+        elif not 0 < low_water <= size:
+            raise ValueError('low_water should be between 1 and size')
+
+        self._passphrase = copy(passphrase)
+        self._passphrase.last_result = None
+        self._kind = kind
+        self._size = size
+        self._low_water = low_water
+        self._uppercase = uppercase
+        # Fails early if the configuration is not valid
+        self._generate(0)
+
+        self._items = deque()
+        self._cond = Condition()
+        self._thread = None
+        self._closed = False
+        self._pid = getpid()
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.refill_time = 0.0
+        self.refill_latency = 0.0
+        self.refill_latency_max = 0.0
+        _FORK_RESET.add(self)
+        self._start()
+
+    def __enter__(self) -> 'PassphrasePool':
+        """Return the pool itself."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the pool."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the amount of items ready in the pool."""
+        return len(self._items)
+
+    @property
+    def size(self) -> int:
+        """Maximum amount of items in the pool."""
+        return self._size
+
+    @property
+    def low_water(self) -> int:
+        """The pool is refilled when it has fewer items than this."""
+        return self._low_water
+
+    @property
+    def closed(self) -> bool:
+        """True if the pool was closed."""
+        return self._closed
+
+    def _generate(self, count: int) -> list:
+        if self._kind == 'password':
+            return self._passphrase.generate_password_many(count)
+        return self._passphrase.generate_many(count, self._uppercase)
+
+    def _start(self) -> None:
+        self._thread = Thread(
+            target=self._refill_loop,
+            name='PassphrasePool refill',
+            daemon=True
+        )
+        self._thread.start()
+
+    def _refill_loop(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while not self._closed and len(self._items) >= self._low_water:
+                    cond.wait()
+                if self._closed:
+                    return
+                missing = self._size - len(self._items)
+
+            start = default_timer()
+            items = [
+                bytearray(item, 'utf-8') for item in self._generate(missing)
+            ]
+            latency = default_timer() - start
+
+            with cond:
+                if self._closed:
+                    _wipe(items)
+                    return
+                self._items.extend(items)
+                self.refills += 1
+                self.refill_time += latency
+                self.refill_latency = latency
+                if latency > self.refill_latency_max:
+                    self.refill_latency_max = latency
+                cond.notify_all()
+
+    def _after_fork(self) -> None:
+        """Empty the pool in a forked child; the refill restarts on use."""
+        # Neither the lock nor the thread survive the fork
+        self._cond = Condition()
+        _wipe(self._items)
+        self._items.clear()
+        self._pid = getpid()
+        self._thread = None
+
+    def _ensure_refill(self) -> None:
+        # Must be called holding the lock
+        if self._thread is None and not self._closed:
+            self._start()
+
+    def take(self) -> str:
+        """Return an item from the pool, or a new one if it's empty."""
+        if register_at_fork is None and self._pid != getpid():
+            self._after_fork()
+
+        with self._cond:
+            if self._closed:
+                raise ValueError('take from a closed pool')
+            self._ensure_refill()
+            item = self._items.popleft() if self._items else None
+            if item is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            if len(self._items) < self._low_water:
+                self._cond.notify_all()
+
+        if item is None:
+            return self._generate(1)[0]
+
+        value = item.decode('utf-8')
+        _wipe((item,))
+        return value
+
+    def wait(self, timeout: float = None) -> bool:
+        """Wait until the pool is full; return False on timeout."""
+        if register_at_fork is None and self._pid != getpid():
+            self._after_fork()
+
+        with self._cond:
+            self._ensure_refill()
+            return self._cond.wait_for(
+                lambda: self._closed or len(self._items) >= self._size,
+                timeout
+            )
+
+    def stats(self) -> dict:
+        """Return the counters of the pool."""
+        with self._cond:
+            return {
+                'size': self._size,
+                'available': len(self._items),
+                'hits': self.hits,
+                'misses': self.misses,
+                'refills': self.refills,
+                'refill_time': self.refill_time,
+                'refill_latency': self.refill_latency,
+                'refill_latency_max': self.refill_latency_max,
+            }
+
+    def close(self) -> None:
+        """Stop refilling and wipe every item left in the pool."""
+        with self._cond:
+            self._closed = True
+            _wipe(self._items)
+            self._items.clear()
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread.ident is not None:
+            thread.join()
+
+
+def _wipe(items) -> None:
+    for item in items:
+        item[:] = bytes(len(item))
+
+
+def _after_fork_in_child() -> None:
+    for pool in list(_FORK_RESET):
+        pool._after_fork()
+
+
+if register_at_fork is not None:
+    register_at_fork(after_in_child=_after_fork_in_child)
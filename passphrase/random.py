@@ -27,9 +27,395 @@ Check Secrets library for higher level functions.
 
 """
 
-from os import urandom as _urandom
+from os import urandom as _urandom, getpid as _getpid
+from threading import Lock as _Lock
+from weakref import WeakSet as _WeakSet
 
-__version__ = '0.1.1'
+__version__ = '0.4.0'
+
+# Amount of bytes fetched from the system on each pool refill.
+POOL_SIZE = 4096
+
+# Minimum amount of bytes a bit reservoir takes from its pool at once.
+RESERVOIR_SIZE = 8
+
+# Every pool and reservoir ever created, so they can be reset after a fork.
+_FORK_RESET = _WeakSet()
+
+
+class RandomStats:
+    """Counters of the randomness consumed by this process.
+
+    Counting is off until enabled, and then costs a lock per count. Bytes
+    requested are asked to pools, by callers or by reservoirs, and bits
+    requested are asked to reservoirs. Bits discarded are random bits read
+    from the system but never used: left in a pool or reservoir when it's
+    refilled or reseeded, or drawn in excess.
+    Bits rejected are random bits used but thrown away by rejection
+    sampling, including every retry of randbelow(), counted per bit length
+    of the bound, so the counters stay few whatever the bounds are.
+
+    """
+
+    def __init__(self) -> None:
+        """Create the counters, disabled."""
+        self.enabled = False
+        self._lock = _Lock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self._urandom_calls = 0
+        self._urandom_bytes = 0
+        self._bytes_requested = 0
+        self._bits_requested = 0
+        self._bits_discarded = 0
+        self._bits_rejected = 0
+        # {method: {bound: [calls, retries]}}
+        self._randbelow = {}
+
+    def reset(self) -> None:
+        """Set every counter to zero."""
+        with self._lock:
+            self._clear()
+
+    def count_urandom(self, nbytes: int) -> None:
+        """Count a read of *nbytes* bytes from the system."""
+        with self._lock:
+            self._urandom_calls += 1
+            self._urandom_bytes += nbytes
+
+    def count_requested(self, nbytes: int = 0, nbits: int = 0) -> None:
+        """Count a request of random bytes or bits."""
+        with self._lock:
+            self._bytes_requested += nbytes
+            self._bits_requested += nbits
+
+    def count_discarded(self, nbits: int) -> None:
+        """Count random bits that were never used."""
+        with self._lock:
+            self._bits_discarded += nbits
+
+    def count_rejected(self, nbits: int) -> None:
+        """Count random bits thrown away by rejection sampling."""
+        with self._lock:
+            self._bits_rejected += nbits
+
+    def count_randbelow(self, method: str, bound: int, retries: int,
+                        nbits: int) -> None:
+        """Count a call of a randbelow method that retried *retries* times.
+
+        Calls are counted by the bit length of *bound*. Each retry rejected
+        *nbits* bits.
+
+        """
+        with self._lock:
+            counts = self._randbelow.setdefault(method, {}).setdefault(
+                bound.bit_length(),
+                [0, 0]
+            )
+            counts[0] += 1
+            counts[1] += retries
+            self._bits_rejected += retries * nbits
+
+    def snapshot(self) -> dict:
+        """Return a copy of the counters."""
+        with self._lock:
+            return {
+                'urandom_calls': self._urandom_calls,
+                'urandom_bytes': self._urandom_bytes,
+                'bytes_requested': self._bytes_requested,
+                'bits_requested': self._bits_requested,
+                'bits_discarded': self._bits_discarded,
+                'bits_rejected': self._bits_rejected,
+                'randbelow': {
+                    method: {
+                        bits: {'calls': calls, 'retries': retries}
+                        for bits, (calls, retries) in bounds.items()
+                    }
+                    for method, bounds in self._randbelow.items()
+                },
+            }
+
+
+# Randomness consumed by every pool and reservoir, see enable_stats().
+STATS = RandomStats()
+
+
+class RandomPool:
+    r"""Buffered source of random bytes from the system's randomness source.
+
+    Bytes are fetched from the system in blocks of *size* bytes and served
+    from the buffer, so many small requests cost a single syscall. Served
+    bytes are wiped from the buffer right away, and the buffer is discarded
+    when the process forks so parent and child never share random data.
+    Requests bigger than *size* bypass the buffer; a pool of size 0 never
+    buffers.
+
+    >>> pool = RandomPool(1024)
+    >>> pool.randbytes(16)  #doctest:+SKIP
+    b'\\xebr\\x17D*t\\xae\\xd4\\xe3S\\xb6\\xe2\\xebP1\\x8b'
+
+    """
+
+    def __init__(self, size: int = POOL_SIZE) -> None:
+        """Create a pool that fetches *size* bytes at a time.
+
+        Raises ValueError if size < 0, and TypeError if it's not an integer.
+
+        """
+        if not isinstance(size, int):
+            raise TypeError('pool size should be an integer')
+        if size < 0:
+            raise ValueError('pool size must be greater than or equal to '
+                             'zero')
+
+        self._size = size
+        self._lock = _Lock()
+        self._buffer = bytearray()
+        self._pos = 0
+        self._pid = _getpid()
+        # Accounting: reads from the system, requests served and their size
+        self.syscalls = 0
+        self.requests = 0
+        self.bytes_served = 0
+        _FORK_RESET.add(self)
+
+    @property
+    def size(self) -> int:
+        """Amount of bytes fetched from the system on each refill."""
+        return self._size
+
+    @property
+    def available(self) -> int:
+        """Amount of buffered bytes not yet served."""
+        return len(self._buffer) - self._pos
+
+    def _discard(self) -> None:
+        """Wipe and drop the buffer (lock must be held)."""
+        if STATS.enabled and self._buffer:
+            STATS.count_discarded((len(self._buffer) - self._pos) * 8)
+        self._buffer[:] = bytes(len(self._buffer))
+        self._buffer = bytearray()
+        self._pos = 0
+
+    def _after_fork(self) -> None:
+        """Reset the pool in a forked child."""
+        self._lock = _Lock()
+        self._discard()
+        self._pid = _getpid()
+
+    def reseed(self) -> None:
+        """Discard buffered bytes so the next request reads from the system."""
+        with self._lock:
+            self._discard()
+
+    def randbytes(self, nbytes: int) -> bytes:
+        """Return a random byte string containing *nbytes* bytes.
+
+        Raises ValueError if nbytes <= 0, and TypeError if it's not an
+        integer.
+
+        """
+        if not isinstance(nbytes, int):
+            raise TypeError('number of bytes shoud be an integer')
+        if nbytes <= 0:
+            raise ValueError('number of bytes must be greater than zero')
+
+        with self._lock:
+            if not _FORK_HOOKS and self._pid != _getpid():
+                self._discard()
+                self._pid = _getpid()
+
+            self.requests += 1
+            self.bytes_served += nbytes
+            stats = STATS.enabled
+            if stats:
+                STATS.count_requested(nbytes=nbytes)
+            if nbytes > self._size:
+                self.syscalls += 1
+                if stats:
+                    STATS.count_urandom(nbytes)
+                return _urandom(nbytes)
+
+            end = self._pos + nbytes
+            if end > len(self._buffer):
+                self._discard()
+                self._buffer = bytearray(_urandom(self._size))
+                self.syscalls += 1
+                if stats:
+                    STATS.count_urandom(self._size)
+                end = nbytes
+
+            data = bytes(self._buffer[self._pos:end])
+            self._buffer[self._pos:end] = bytes(nbytes)   # wipe served bytes
+            self._pos = end
+
+        return data
+
+
+class BitReservoir:
+    """Source of random bits that keeps the unused ones for the next request.
+
+    Bits are taken from a RandomPool, at least RESERVOIR_SIZE bytes at a
+    time, and handed out exactly as requested: asking for 1 bit consumes 1
+    bit, not a whole byte. Remaining bits are discarded when the process
+    forks. If no pool is given, the module's one (see set_pool()) is used.
+
+    """
+
+    def __init__(self, pool: RandomPool = None) -> None:
+        """Create a reservoir that takes bytes from the given pool.
+
+        Raises TypeError if pool is not a RandomPool nor None.
+
+        """
+        if pool is not None and not isinstance(pool, RandomPool):
+            raise TypeError('pool should be a RandomPool')
+
+        self._pool = pool
+        self._lock = _Lock()
+        self._bits = 0
+        self._nbits = 0
+        self._pid = _getpid()
+        # Accounting: requests served and their size
+        self.requests = 0
+        self.bits_served = 0
+        _FORK_RESET.add(self)
+
+    @property
+    def available(self) -> int:
+        """Amount of random bits kept for the next requests."""
+        return self._nbits
+
+    def _discard(self) -> None:
+        """Drop the remaining bits (lock must be held)."""
+        if STATS.enabled and self._nbits:
+            STATS.count_discarded(self._nbits)
+        self._bits = 0
+        self._nbits = 0
+
+    def _after_fork(self) -> None:
+        """Reset the reservoir in a forked child."""
+        self._lock = _Lock()
+        self._discard()
+        self._pid = _getpid()
+
+    def reseed(self) -> None:
+        """Discard the remaining bits."""
+        with self._lock:
+            self._discard()
+
+    def randbits(self, nbits: int) -> int:
+        """Return an int with *nbits* random bits.
+
+        Raises ValueError if nbits <= 0, and TypeError if it's not an
+        integer.
+
+        """
+        if not isinstance(nbits, int):
+            raise TypeError('number of bits should be an integer')
+        if nbits <= 0:
+            raise ValueError('number of bits must be greater than zero')
+
+        with self._lock:
+            if not _FORK_HOOKS and self._pid != _getpid():
+                self._discard()
+                self._pid = _getpid()
+
+            if nbits > self._nbits:
+                pool = self._pool if self._pool is not None else (
+                    _default_pool
+                )
+                nbytes = max((nbits - self._nbits + 7) // 8, RESERVOIR_SIZE)
+                fresh = int.from_bytes(pool.randbytes(nbytes), 'big')
+                self._bits = (self._bits << (nbytes * 8)) | fresh
+                self._nbits += nbytes * 8
+
+            self._nbits -= nbits
+            num = self._bits >> self._nbits
+            self._bits &= (1 << self._nbits) - 1
+            self.requests += 1
+            self.bits_served += nbits
+            if STATS.enabled:
+                STATS.count_requested(nbits=nbits)
+
+        return num
+
+
+def _after_fork_in_child() -> None:
+    for obj in list(_FORK_RESET):
+        obj._after_fork()
+
+
+try:
+    from os import register_at_fork as _register_at_fork
+except ImportError:     # Python < 3.7: rely on checking the pid instead
+    _FORK_HOOKS = False
+else:
+    _register_at_fork(after_in_child=_after_fork_in_child)
+    _FORK_HOOKS = True
+
+_default_pool = RandomPool()
+_default_reservoir = BitReservoir()
+
+
+def get_pool() -> RandomPool:
+    """Return the pool used by this module's functions."""
+    return _default_pool
+
+
+def get_reservoir() -> BitReservoir:
+    """Return the bit reservoir used by this module's functions."""
+    return _default_reservoir
+
+
+def set_pool(pool: RandomPool) -> None:
+    """Set the pool used by this module's functions.
+
+    Bits remaining in the module's reservoir are discarded, so every
+    following request is served from the new pool.
+    Raises TypeError if pool is not a RandomPool.
+
+    """
+    global _default_pool
+
+    if not isinstance(pool, RandomPool):
+        raise TypeError('pool should be a RandomPool')
+
+    _default_pool = pool
+    _default_reservoir.reseed()
+
+
+def enable_stats(enabled: bool = True) -> None:
+    """Start (or stop, if False) counting the randomness consumed.
+
+    Counters keep their values; see stats() and reset_stats().
+
+    """
+    STATS.enabled = bool(enabled)
+
+
+def stats() -> dict:
+    """Return a snapshot of the randomness consumed while counting.
+
+    >>> stats()  #doctest:+SKIP
+    {'urandom_calls': 1, 'urandom_bytes': 4096, 'bytes_requested': 8,
+     'bits_requested': 78, 'bits_discarded': 0, 'bits_rejected': 0,
+     'randbelow': {'lemire': {78: {'calls': 1, 'retries': 0}}}}
+
+    """
+    return STATS.snapshot()
+
+
+def reset_stats() -> None:
+    """Set every randomness counter to zero."""
+    STATS.reset()
+
+
+def reseed() -> None:
+    """Discard buffered random bytes so the next request hits the system."""
+    _default_reservoir.reseed()
+    _default_pool.reseed()
 
 
 def randbytes(nbytes: int) -> bytes:
@@ -41,17 +427,14 @@ def randbytes(nbytes: int) -> bytes:
     b'\\xebr\\x17D*t\\xae\\xd4\\xe3S\\xb6\\xe2\\xebP1\\x8b'
 
     """
-    if not isinstance(nbytes, int):
-        raise TypeError('number of bytes shoud be an integer')
-    if nbytes <= 0:
-        raise ValueError('number of bytes must be greater than zero')
-
-    return _urandom(nbytes)
+    return _default_pool.randbytes(nbytes)
 
 
 def randint(nbits: int) -> int:
     """Generate an int with nbits random bits.
 
+    Bits are taken from a reservoir which keeps the ones not used by
+    previous calls, so no random bit is thrown away.
     Raises ValueError if nbits <= 0, and TypeError if it's not an integer.
 
     >>> randint(16)  #doctest:+SKIP
@@ -63,7 +446,4 @@ def randint(nbits: int) -> int:
     if nbits <= 0:
         raise ValueError('number of bits must be greater than zero')
 
-    # https://github.com/python/cpython/blob/3.6/Lib/random.py#L676
-    nbytes = (nbits + 7) // 8                       # bits / 8 and rounded up
-    num = int.from_bytes(randbytes(nbytes), 'big')
-    return num >> (nbytes * 8 - nbits)              # trim excess bits
+    return _default_reservoir.randbits(nbits)
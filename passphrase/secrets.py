@@ -25,15 +25,27 @@ account authentication, tokens, and similar.
 
 """
 
-from typing import Union
 from math import ceil
 
 from .random import randint as random_randint, randbytes as random_randbytes
+from .random import STATS as random_stats
 
-__version__ = '0.5.5'
+__version__ = '0.8.0'
 
+# typing isn't imported on purpose: loading it takes longer than loading the
+# rest of this module, and this module should be cheap to use on its own.
 
-def randchoice(seq: Union[str, list, tuple, dict, set]) -> any:
+# Extra random bits drawn by randbelow_lemire() over the bound's size: the
+# chance of a retry is lower than 2**-RANDBELOW_LEMIRE_EXTRA_BITS.
+RANDBELOW_LEMIRE_EXTRA_BITS = 32
+
+# Maximum amount of ints drawn at once by randbelow_many(): splitting a
+# single draw costs time quadratic in its size, so larger requests are drawn
+# in chunks of this many ints.
+RANDBELOW_MANY_CHUNK = 64
+
+
+def randchoice(seq) -> any:
     """Return a randomly chosen element from the given sequence.
 
     Raises TypeError if *seq* is not str, list, tuple, dict, set and an
@@ -79,11 +91,87 @@ def randbelow(num: int) -> int:
     # https://github.com/python/cpython/blob/3.6/Lib/random.py#L223
     nbits = num.bit_length()    # don't use (n-1) here because n can be 1
     randnum = random_randint(nbits)    # 0 <= randnum < 2**nbits
+    retries = 0
     while randnum >= num:
         randnum = random_randint(nbits)
+        retries += 1
+    if random_stats.enabled:
+        random_stats.count_randbelow('randbelow', num, retries, nbits)
     return randnum
 
 
+def randbelow_lemire(num: int) -> int:
+    """Return a random int in the range [0,num).
+
+    Uses Lemire's nearly divisionless method: a random int *x* wider than
+    *num* is multiplied by it, and the high part of the product is the
+    result. Unlike randbelow(), which retries up to half of the time for
+    bounds just above a power of two, a retry is almost never needed for any
+    bound, at the cost of drawing RANDBELOW_LEMIRE_EXTRA_BITS more bits.
+    Raises ValueError if num <= 0, and TypeError if it's not an integer.
+
+    >>> randbelow_lemire(7777)  #doctest:+SKIP
+    4210
+
+    """
+    if not isinstance(num, int):
+        raise TypeError('number must be an integer')
+    if num <= 0:
+        raise ValueError('number must be greater than zero')
+    if num == 1:
+        return 0
+
+    # https://arxiv.org/abs/1805.10941
+    nbits = num.bit_length() + RANDBELOW_LEMIRE_EXTRA_BITS
+    mask = (1 << nbits) - 1
+    product = random_randint(nbits) * num
+    retries = 0
+    if (product & mask) < num:
+        threshold = ((1 << nbits) - num) % num
+        while (product & mask) < threshold:
+            product = random_randint(nbits) * num
+            retries += 1
+    if random_stats.enabled:
+        random_stats.count_randbelow('lemire', num, retries, nbits)
+    return product >> nbits
+
+
+def randbelow_many(num: int, amount: int) -> list:
+    """Return a list of *amount* random ints in the range [0,num).
+
+    A single random int in the range [0,num**amount) is drawn, using
+    randbelow_lemire(), and split in *amount* digits in base *num*, which is
+    uniform for each of them and avoids a retry loop per element. Amounts
+    over RANDBELOW_MANY_CHUNK are drawn in chunks of that size.
+    Raises ValueError if num <= 0 or amount < 0, and TypeError if any is not
+    an integer.
+
+    >>> randbelow_many(7776, 6)  #doctest:+SKIP
+    [5081, 1046, 6894, 3021, 7600, 118]
+
+    """
+    if not isinstance(num, int) or not isinstance(amount, int):
+        raise TypeError('number and amount must be integers')
+    if num <= 0:
+        raise ValueError('number must be greater than zero')
+    if amount < 0:
+        raise ValueError('amount must be greater than or equal to zero')
+    if amount == 0:
+        return []
+    if num == 1:
+        return [0] * amount
+
+    indexes = []
+    while amount > 0:
+        chunk = min(amount, RANDBELOW_MANY_CHUNK)
+        amount -= chunk
+        randnum = randbelow_lemire(num ** chunk)
+        for _ in range(chunk):
+            randnum, index = divmod(randnum, num)
+            indexes.append(index)
+    return indexes
+
+
 def randbetween(lower: int, upper: int) -> int:
     """Return a random int in the range [lower, upper].
 
@@ -128,5 +216,101 @@ def randbool() -> bool:
     True
 
     """
-    num = random_randint(8)
-    return num > 127
+    return random_randint(1) == 1
+
+
+class Alphabet:
+    """Compiled set of characters to build random strings from.
+
+    The characters are joined and a translation table is built once, so
+    random strings are built from bulk byte reads: each random byte below
+    the threshold (the biggest multiple of the amount of characters not
+    above 256) is mapped to a character by bytes.translate() and the rest
+    are dropped, which keeps it unbiased for any amount of characters.
+    Alphabets that are not ASCII or have more than 256 characters pick them
+    with randbelow_many() instead.
+
+    >>> Alphabet('abcdef0123456789').randstring(8)  #doctest:+SKIP
+    '3fa09c1e'
+
+    """
+
+    __slots__ = ('_chars', '_size', '_threshold', '_table', '_delete')
+
+    def __init__(self, chars: str) -> None:
+        """Compile the given characters.
+
+        Raises ValueError if chars is empty, and TypeError if it's not a
+        string.
+
+        """
+        if not isinstance(chars, str):
+            raise TypeError('chars must be a string')
+        if not chars:
+            raise ValueError("chars can't be empty")
+
+        self._chars = chars
+        self._size = len(chars)
+        self._threshold = None
+        self._table = None
+        self._delete = None
+        if self._size <= 256 and all(ord(char) < 128 for char in chars):
+            threshold = 256 - 256 % self._size
+            self._threshold = threshold
+            self._table = bytes(
+                ord(chars[byte % self._size]) if byte < threshold else 0
+                for byte in range(256)
+            )
+            self._delete = bytes(range(threshold, 256))
+
+    @property
+    def chars(self) -> str:
+        """Characters of the alphabet, joined."""
+        return self._chars
+
+    @property
+    def threshold(self) -> int:
+        """Random bytes from this value up are discarded (None if unused)."""
+        return self._threshold
+
+    def __len__(self) -> int:
+        """Return the amount of characters."""
+        return self._size
+
+    def randstring(self, length: int) -> str:
+        """Return a random string of *length* characters of the alphabet.
+
+        Raises ValueError if length < 0, and TypeError if it's not an
+        integer.
+
+        """
+        if not isinstance(length, int):
+            raise TypeError('length must be an integer')
+        if length < 0:
+            raise ValueError('length must be greater than or equal to zero')
+        if length == 0:
+            return ''
+
+        if self._table is None:
+            chars = self._chars
+            return ''.join([
+                chars[index] for index in randbelow_many(self._size, length)
+            ])
+
+        randstr = b''
+        rejected = 0
+        while len(randstr) < length:
+            # Read as many bytes as expected to be needed
+            missing = length - len(randstr)
+            nbytes = -(-missing * 256 // self._threshold)
+            chunk = random_randbytes(nbytes).translate(
+                self._table,
+                self._delete
+            )
+            rejected += nbytes - len(chunk)
+            randstr += chunk
+
+        if random_stats.enabled:
+            random_stats.count_rejected(rejected * 8)
+            random_stats.count_discarded((len(randstr) - length) * 8)
+        return randstr[:length].decode('ascii')
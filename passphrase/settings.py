@@ -18,3 +18,22 @@ ENTROPY_BITS_MIN = 77
 # Type: integer
 # Default: 128 (os.urandom might hang if lower than 128)
 SYSTEM_ENTROPY_BITS_MIN = 128
+
+# Amount of results generated and written at once when many are requested.
+# Scope: script
+# Type: integer
+# Default: 1024
+COUNT_CHUNK_SIZE = 1024
+
+# Compile text wordlists to a binary format and cache them, so they are
+# mapped to memory instead of parsed the next time.
+# Scope: all
+# Type: boolean
+# Default: True
+WORDLIST_CACHE = True
+
+# Directory where compiled wordlists are cached.
+# Scope: all
+# Type: string
+# Default: None ($XDG_CACHE_HOME/passphrase or ~/.cache/passphrase)
+WORDLIST_CACHE_DIR = None
@@ -0,0 +1,403 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+"""Precompiled generation policy for passphrases and passwords."""
+
+from array import array
+from math import ceil
+from typing import Sequence
+
+from .calc import entropy_bits as calc_entropy_bits
+from .calc import entropy_bits_nrange as calc_entropy_bits_nrange
+from .calc import words_amount_needed as calc_words_amount_needed
+from .secrets import randbelow_many, Alphabet
+from .settings import MIN_NUM, MAX_NUM
+from .aux import Aux
+
+__version__ = '0.1.0'
+
+# Compiled alphabets, keyed by their characters
+_ALPHABETS = {}
+_ALPHABETS_SIZE = 32
+
+
+def _get_alphabet(charset: str) -> Alphabet:
+    alphabet = _ALPHABETS.get(charset)
+    if alphabet is None:
+        if len(_ALPHABETS) >= _ALPHABETS_SIZE:
+            _ALPHABETS.clear()
+        alphabet = _ALPHABETS[charset] = Alphabet(charset)
+    return alphabet
+
+
+def _make_uppercase(passphrase: list, uppercase: int, lowercase: int) -> list:
+    # lowercase is the amount of lowercase characters in the passphrase
+    if uppercase < 0 and lowercase > (uppercase * -1):
+        uppercase = lowercase + uppercase
+
+    # If it's still negative, then means no uppercase
+    if uppercase == 0 or uppercase > lowercase:
+        # Make it all uppercase
+        return Aux.make_all_uppercase(passphrase)
+    elif uppercase > 0:
+        return Aux.make_chars_uppercase(passphrase, uppercase, indexed=True)
+
+    return passphrase
+
+
+def check_randnum_range(randnum_min: int,
+                        randnum_max: int,
+                        amount_n: int) -> None:
+    """Raise ValueError if the random numbers can't be generated.
+
+    The range is only relevant when numbers are requested (amount_n).
+
+    """
+    if amount_n and randnum_min > randnum_max:
+        raise ValueError('randnum_min should be lower than or equal to '
+                         'randnum_max')
+
+
+class PassphraseSpec:
+    """Immutable generation policy, compiled once from a configuration.
+
+    Every entropy figure, the password alphabet and the per-word lowercase
+    counts are computed when the spec is created, so generating only
+    samples and joins. Either part, passphrases or passwords, can be left
+    unset: generating it raises ValueError.
+
+    The words are not copied, so they must not be modified afterwards.
+
+    >>> spec = PassphraseSpec(  #doctest:+SKIP
+    ...     EFF_LONG_WORDLIST, amount_w=6, amount_n=1,
+    ...     charset=ascii_letters, passwordlen=16)
+    >>> spec.generate()  #doctest:+SKIP
+    'bullhorn reggae stapling outskirts grudging cure 546613'
+    >>> spec.generate_password()  #doctest:+SKIP
+    'pEbKzYuQqRwTcLsa'
+
+    """
+
+    __slots__ = (
+        '_words',
+        '_words_lowercase',
+        '_amount_w',
+        '_amount_n',
+        '_uppercase',
+        '_separator',
+        '_randnum_min',
+        '_randnum_max',
+        '_charset',
+        '_alphabet',
+        '_passwordlen',
+        '_words_entropy',
+        '_numbers_entropy',
+        '_char_entropy',
+        '_passphrase_entropy',
+        '_password_entropy',
+    )
+
+    def __init__(self,
+                 words: Sequence = (),
+                 amount_w: int = None,
+                 amount_n: int = None,
+                 uppercase: int = None,
+                 separator: str = ' ',
+                 charset: str = '',
+                 passwordlen: int = None,
+                 randnum_min: int = MIN_NUM,
+                 randnum_max: int = MAX_NUM,
+                 words_entropy: float = None,
+                 words_lowercase: Sequence = None) -> None:
+        """Compile a generation policy.
+
+        Keyword arguments:
+        words -- Sequence of lowercase words for passphrases.
+        amount_w -- Amount of words for passphrases.
+        amount_n -- Amount of numbers for passphrases.
+        uppercase -- As in Passphrase.generate().
+        separator -- Separator between the words and numbers.
+        charset -- Characters for passwords.
+        passwordlen -- Length of passwords.
+        randnum_min -- Lower bound for passphrases' random numbers.
+        randnum_max -- Upper bound for passphrases' random numbers.
+        words_entropy -- Entropy of the words, if already known.
+        words_lowercase -- Amount of lowercase characters of each word, if
+        already known.
+
+        """
+        for name, value in (('amount_w', amount_w), ('amount_n', amount_n),
+                            ('passwordlen', passwordlen)):
+            if value is None:
+                continue
+            if not isinstance(value, int):
+                raise TypeError('{} can only be int'.format(name))
+            if value < 0:
+                raise ValueError('{} should be greater than 0'.format(name))
+        for name, value in (('randnum_min', randnum_min),
+                            ('randnum_max', randnum_max)):
+            if not isinstance(value, int):
+                raise TypeError('{} can only be int'.format(name))
+            if value < 0:
+                raise ValueError('{} should be greater than 0'.format(name))
+        check_randnum_range(randnum_min, randnum_max, amount_n)
+        if uppercase is not None and not isinstance(uppercase, int):
+            raise TypeError('uppercase must be an integer number')
+        if not isinstance(separator, str):
+            raise TypeError('separator can only be string')
+        if not isinstance(charset, str):
+            raise TypeError('charset can only be string')
+        if words is None:
+            words = ()
+        elif isinstance(words, str) or not isinstance(words, Sequence):
+            raise TypeError('words can only be a sequence of strings')
+        if (
+                words_entropy is not None
+                and not isinstance(words_entropy, (int, float))
+        ):
+            raise TypeError('words_entropy can only be int or float')
+
+        init = object.__setattr__
+        init(self, '_words', words)
+        init(self, '_amount_w', amount_w)
+        init(self, '_amount_n', amount_n)
+        init(self, '_uppercase', uppercase)
+        init(self, '_separator', separator)
+        init(self, '_randnum_min', randnum_min)
+        init(self, '_randnum_max', randnum_max)
+        init(self, '_charset', charset)
+        init(self, '_passwordlen', passwordlen)
+
+        # Passphrases
+        if words and words_entropy is None:
+            words_entropy = calc_entropy_bits(
+                words if isinstance(words, (list, tuple)) else list(words)
+            )
+        if words and uppercase is not None and words_lowercase is None:
+            words_lowercase = array('I', [
+                sum(1 for char in word if char.islower()) for word in words
+            ])
+        numbers_entropy = calc_entropy_bits_nrange(randnum_min, randnum_max)
+        init(self, '_words_entropy', float(words_entropy or 0.0))
+        init(self, '_words_lowercase', words_lowercase)
+        init(self, '_numbers_entropy', numbers_entropy)
+        init(self, '_passphrase_entropy', None if (
+            amount_w is None or amount_n is None or not words
+        ) else float(
+            amount_w * self._words_entropy + amount_n * numbers_entropy
+        ))
+
+        # Passwords
+        init(self, '_alphabet', _get_alphabet(charset) if charset else None)
+        init(self, '_char_entropy', None if not charset else (
+            calc_entropy_bits(list(charset))
+        ))
+        init(self, '_password_entropy', None if (
+            passwordlen is None or not charset
+        ) else float(passwordlen * self._char_entropy))
+
+    def __setattr__(self, name: str, value) -> None:
+        """Refuse to set attributes: a spec is immutable."""
+        raise AttributeError('PassphraseSpec is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        """Refuse to delete attributes: a spec is immutable."""
+        raise AttributeError('PassphraseSpec is immutable')
+
+    def __repr__(self) -> str:
+        """Return a summary of the spec."""
+        return (
+            'PassphraseSpec(words=<{} words>, amount_w={!r}, amount_n={!r}, '
+            'uppercase={!r}, separator={!r}, charset={!r}, '
+            'passwordlen={!r})'.format(
+                len(self._words),
+                self._amount_w,
+                self._amount_n,
+                self._uppercase,
+                self._separator,
+                self._charset,
+                self._passwordlen
+            )
+        )
+
+    @property
+    def words(self) -> Sequence:
+        """Words for passphrases."""
+        return self._words
+
+    @property
+    def amount_w(self) -> int:
+        """Amount of words for passphrases."""
+        return self._amount_w
+
+    @property
+    def amount_n(self) -> int:
+        """Amount of numbers for passphrases."""
+        return self._amount_n
+
+    @property
+    def uppercase(self) -> int:
+        """Uppercase characters wanted, as in Passphrase.generate()."""
+        return self._uppercase
+
+    @property
+    def separator(self) -> str:
+        """Separator between the words and numbers."""
+        return self._separator
+
+    @property
+    def randnum_min(self) -> int:
+        """Lower bound for passphrases' random numbers."""
+        return self._randnum_min
+
+    @property
+    def randnum_max(self) -> int:
+        """Upper bound for passphrases' random numbers."""
+        return self._randnum_max
+
+    @property
+    def charset(self) -> str:
+        """Characters for passwords."""
+        return self._charset
+
+    @property
+    def passwordlen(self) -> int:
+        """Length of passwords."""
+        return self._passwordlen
+
+    @property
+    def words_entropy(self) -> float:
+        """Entropy of a word."""
+        return self._words_entropy
+
+    @property
+    def numbers_entropy(self) -> float:
+        """Entropy of a number."""
+        return self._numbers_entropy
+
+    @property
+    def char_entropy(self) -> float:
+        """Entropy of a password character, or None if there's no charset."""
+        return self._char_entropy
+
+    @property
+    def passphrase_entropy(self) -> float:
+        """Entropy of a passphrase, or None if they can't be generated."""
+        return self._passphrase_entropy
+
+    @property
+    def password_entropy(self) -> float:
+        """Entropy of a password, or None if they can't be generated."""
+        return self._password_entropy
+
+    def words_amount_needed(self, entropybits: float) -> int:
+        """Calculate the amount of words needed for the given entropy."""
+        if self._amount_n is None or not self._words:
+            raise ValueError("Can't calculate the words amount needed: "
+                             "wordlist is empty or amount_n isn't set")
+        return calc_words_amount_needed(
+            entropybits,
+            self._words_entropy,
+            self._numbers_entropy,
+            self._amount_n
+        )
+
+    def password_length_needed(self, entropybits: float) -> int:
+        """Calculate the password length needed for the given entropy."""
+        if not isinstance(entropybits, (int, float)):
+            raise TypeError('entropybits can only be int or float')
+        if entropybits < 0:
+            raise ValueError('entropybits should be greater than 0')
+        if not self._charset:
+            raise ValueError("Can't calculate the password length needed: "
+                             "the character set is empty")
+        return ceil(entropybits / self._char_entropy)
+
+    def _check_passphrase(self) -> None:
+        if self._passphrase_entropy is None:
+            raise ValueError("Can't generate passphrase: "
+                             "wordlist is empty or amount_n or "
+                             "amount_w isn't set")
+
+    def sample(self) -> list:
+        """Generate a list of words and numbers randomly chosen."""
+        self._check_passphrase()
+
+        words = self._words
+        indexes = randbelow_many(len(words), self._amount_w)
+        passphrase = [words[index] for index in indexes]
+
+        uppercase = self._uppercase
+        if passphrase and uppercase is not None:
+            words_lowercase = self._words_lowercase
+            passphrase = _make_uppercase(
+                passphrase,
+                uppercase,
+                sum(words_lowercase[index] for index in indexes)
+            )
+
+        if self._amount_n:
+            randnum_min = self._randnum_min
+            passphrase.extend(
+                randnum_min + num for num in randbelow_many(
+                    self._randnum_max - randnum_min + 1,
+                    self._amount_n
+                )
+            )
+
+        return passphrase
+
+    def generate(self) -> str:
+        """Generate a passphrase joined by the separator."""
+        return self._separator.join(map(str, self.sample()))
+
+    def generate_many(self, count: int) -> list:
+        """Generate a list of passphrases joined by the separator."""
+        if not isinstance(count, int):
+            raise TypeError('count can only be int')
+        if count < 0:
+            raise ValueError('count should be greater than 0')
+        self._check_passphrase()
+
+        sample = self.sample
+        separator = self._separator
+        return [separator.join(map(str, sample())) for _ in range(count)]
+
+    def _check_password(self) -> None:
+        if self._password_entropy is None:
+            raise ValueError("Can't generate password: character set is "
+                             "empty or passwordlen isn't set")
+
+    def generate_password(self) -> str:
+        """Generate a password."""
+        self._check_password()
+        return self._alphabet.randstring(self._passwordlen)
+
+    def generate_password_many(self, count: int) -> list:
+        """Generate a list of passwords."""
+        if not isinstance(count, int):
+            raise TypeError('count can only be int')
+        if count < 0:
+            raise ValueError('count should be greater than 0')
+        self._check_password()
+
+        randstring = self._alphabet.randstring
+        length = self._passwordlen
+        return [randstring(length) for _ in range(count)]
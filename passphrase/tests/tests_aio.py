@@ -0,0 +1,204 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+from asyncio import new_event_loop
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join as os_path_join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+from passphrase.aio import AsyncPassphrase
+from passphrase.passphrase import Passphrase
+import passphrase.tests.constants as constants
+
+
+class _LoopTestCase(TestCase):
+
+    def setUp(self):
+        self.loop = new_event_loop()
+        self.executor = ThreadPoolExecutor(1)
+        # Count what's run in the executor
+        self.submit = mock.patch.object(
+            self.executor,
+            'submit',
+            wraps=self.executor.submit
+        ).start()
+
+    def tearDown(self):
+        mock.patch.stopall()
+        self.executor.shutdown()
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+
+class TestValidInputs(_LoopTestCase):
+
+    def test_generate(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        apassp = AsyncPassphrase(passp, self.executor)
+        self.assertEqual(len(self.run_async(apassp.generate())), 5)
+        self.assertEqual(len(self.run_async(apassp.generate_password())), 12)
+        items = self.run_async(apassp.generate_many(16))
+        self.assertEqual(len(items), 16)
+        self.assertEqual(len(items[0].split()), 5)
+        items = self.run_async(apassp.generate_password_many(16))
+        self.assertEqual([len(item) for item in items], [12] * 16)
+        self.submit.assert_not_called()
+
+        # Bigger batches go to the executor
+        items = self.run_async(apassp.generate_many(17, 0))
+        self.assertEqual(len(items), 17)
+        self.assertEqual(items[0], items[0].upper())
+        self.assertEqual(len(self.run_async(
+            apassp.generate_password_many(100)
+        )), 100)
+        self.assertEqual(self.submit.call_count, 2)
+
+    def test_offload(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        passp.wordlist = list(passp.wordlist)
+        passp.entropy_bits_req = 77
+        apassp = AsyncPassphrase(passp, self.executor, inline_max=0)
+        self.assertEqual(self.run_async(apassp.generate(2)), passp.last_result)
+        self.assertEqual(self.run_async(apassp.words_amount_needed()), 5)
+        self.assertAlmostEqual(
+            self.run_async(apassp.generated_passphrase_entropy()),
+            4 * 12.92 + 19.78,
+            places=1
+        )
+        # Generating computed the wordlist entropy already
+        self.assertEqual(self.submit.call_count, 1)
+        # The wordlist entropy and lowercase counts are kept
+        self.run_async(apassp.generate(2))
+        self.run_async(apassp.words_amount_needed())
+        self.assertEqual(self.submit.call_count, 1)
+
+    def test_load(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = os_path_join(tmpdir, 'words.txt')
+            with open(filename, 'w') as wordfile:
+                wordfile.write('Alpha\nbeta\ngamma\n')
+            with mock.patch('passphrase.wordcache.WORDLIST_CACHE', False):
+                apassp = self.run_async(
+                    AsyncPassphrase.load(filename, executor=self.executor)
+                )
+                self.assertEqual(apassp.passphrase.wordlist,
+                                 ['Alpha', 'beta', 'gamma'])
+                apassp = AsyncPassphrase(executor=self.executor)
+                self.run_async(apassp.import_words_from_file(filename, False))
+                self.assertEqual(len(apassp.passphrase.wordlist), 3)
+        self.assertEqual(self.submit.call_count, 2)
+
+    def test_stream(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        apassp = AsyncPassphrase(passp, self.executor)
+
+        async def collect(stream):
+            items = []
+            async for item in stream:
+                items.append(item)
+            return items
+
+        items = self.run_async(collect(apassp.stream(25, chunk_size=10)))
+        self.assertEqual(len(items), 25)
+        self.assertEqual(len(set(items)), 25)
+        self.assertEqual(len(items[0].split()), 5)
+        self.assertEqual(self.submit.call_count, 3)
+
+        async def take(stream, amount):
+            items = []
+            async for item in stream:
+                items.append(item)
+                if len(items) == amount:
+                    break
+            await stream.aclose()
+            return items, await collect(stream)
+
+        items, rest = self.run_async(take(apassp.stream(0, 'password', 0,
+                                                        chunk_size=3), 7))
+        self.assertEqual([len(item) for item in items], [12] * 7)
+        self.assertEqual(rest, [])
+
+    def test_stream_offload(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        passp.wordlist = list(passp.wordlist)
+        apassp = AsyncPassphrase(passp, self.executor)
+        # The wordlist entropy isn't calculated in the event loop
+        stream = apassp.stream(2)
+        self.submit.assert_not_called()
+        self.assertIsNone(passp._wordlist_entropy_bits)
+
+        async def collect(stream):
+            return [item async for item in stream]
+
+        self.assertEqual(len(self.run_async(collect(stream))), 2)
+        self.assertIsNotNone(passp._wordlist_entropy_bits)
+        self.assertEqual(self.submit.call_count, 2)
+
+
+class TestInvalidInputs(_LoopTestCase):
+
+    def test_init(self):
+        self.assertRaises(TypeError, AsyncPassphrase, 'internal')
+        self.assertRaises(TypeError, AsyncPassphrase, None, 1)
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(
+                TypeError,
+                AsyncPassphrase,
+                inline_max=wrongtype
+            )
+        self.assertRaises(ValueError, AsyncPassphrase, inline_max=-1)
+
+    def test_generate(self):
+        apassp = AsyncPassphrase(executor=self.executor)
+        self.assertRaises(ValueError, self.run_async, apassp.generate())
+        self.assertRaises(ValueError, self.run_async,
+                          apassp.generate_password_many(100))
+        self.assertRaises(ValueError, self.run_async,
+                          apassp.words_amount_needed())
+
+    def test_stream(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        apassp = AsyncPassphrase(passp, self.executor)
+        self.assertRaises(ValueError, apassp.stream, 1, 'uuid4')
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(TypeError, apassp.stream, wrongtype)
+            self.assertRaises(TypeError, apassp.stream, 1,
+                              chunk_size=wrongtype)
+        self.assertRaises(ValueError, apassp.stream, -1)
+        self.assertRaises(ValueError, apassp.stream, 1, chunk_size=0)
+        self.assertRaises(ValueError, AsyncPassphrase().stream, 1)
@@ -19,10 +19,11 @@
 #  ***************************************************************************
 
 from subprocess import run, PIPE
-from unittest import TestCase
+from unittest import TestCase, mock
 from random import randint
 
 from passphrase.aux import Aux
+import passphrase.aux
 import passphrase.tests.constants as constants
 
 
@@ -169,9 +170,84 @@ class TestValidInputs(TestCase):
             constants.SOMEMIXEDLIST_UPPERCASE
         )
 
+    def test_make_chars_uppercase_indexed(self):
+        self.assertEqual(
+            Aux.make_chars_uppercase(constants.SOMESTRING, 0, indexed=True),
+            constants.SOMESTRING
+        )
+        upperstart = Aux.uppercase_count(constants.SOMESTRING)
+        lowercase = Aux.lowercase_count(constants.SOMESTRING)
+        for uppercase in (1, lowercase - 1, lowercase, lowercase * 2):
+            strupper = Aux.make_chars_uppercase(
+                constants.SOMESTRING,
+                uppercase,
+                indexed=True
+            )
+            self.assertIsInstance(strupper, str)
+            self.assertEqual(strupper.lower(), constants.SOMESTRING.lower())
+            self.assertEqual(
+                Aux.uppercase_count(strupper),
+                min(uppercase, lowercase) + upperstart
+            )
+
+        for lst in (['ab', 1, 'cD'], ('ab', 1, 'cD'), {'ab', 'cD'}):
+            lstupper = Aux.make_chars_uppercase(lst, 2, indexed=True)
+            self.assertIsInstance(lstupper, type(lst))
+            self.assertEqual(Aux.uppercase_count(lstupper), 3)
+        self.assertEqual(
+            Aux.make_chars_uppercase(['ab', 1, 'cD'], 3, indexed=True),
+            ['AB', 1, 'CD']
+        )
+        self.assertEqual(
+            Aux.make_chars_uppercase([1, [2]], 1, indexed=True),
+            [1, [2]]
+        )
+
+        # Every lowercase character is equally likely, no matter the word
+        numrep = 40000
+        counts = {}
+        for _ in range(numrep):
+            lstupper = Aux.make_chars_uppercase(
+                ['a', 'bcd', 'ef'],
+                2,
+                indexed=True
+            )
+            for char in Aux.uppercase_chars(lstupper):
+                counts[char] = counts.get(char, 0) + 1
+        self.assertEqual(set(counts), set('ABCDEF'))
+        for count in counts.values():
+            self.assertTrue(0.31 < count / numrep < 0.356)
+
     def test_system_entropy(self):
         self.assertGreater(Aux.system_entropy(), 0)
 
+    def test_system_entropy_cached(self):
+        Aux._system_entropy_cache = None
+        with mock.patch.object(Aux, '_read_system_entropy') as mock_read:
+            mock_read.return_value = 1234
+            self.assertEqual(Aux.system_entropy(), 1234)
+            self.assertEqual(Aux.system_entropy(), 1234)
+            mock_read.assert_called_once_with()
+            with mock.patch('passphrase.aux.SYSTEM_ENTROPY_TTL', 0):
+                Aux.system_entropy()
+            self.assertEqual(mock_read.call_count, 2)
+        Aux._system_entropy_cache = None
+
+    @mock.patch('passphrase.aux.SYSTEM_ENTROPY_FILE', '/inexistent/entropy')
+    def test_read_system_entropy(self):
+        with mock.patch('passphrase.aux._getrandom', None):
+            self.assertEqual(Aux._read_system_entropy(), -1)
+        with mock.patch('passphrase.aux._getrandom') as mock_getrandom:
+            mock_getrandom.return_value = b'\x00'
+            self.assertEqual(
+                Aux._read_system_entropy(),
+                passphrase.aux.SYSTEM_ENTROPY_INITIALIZED
+            )
+            mock_getrandom.side_effect = BlockingIOError()
+            self.assertEqual(Aux._read_system_entropy(), 0)
+            mock_getrandom.side_effect = OSError()
+            self.assertEqual(Aux._read_system_entropy(), -1)
+
     def test_print_stderr(self):
         string = constants.SOMESTRING
         proc = run(
@@ -19,9 +19,9 @@
 #  ***************************************************************************
 
 from os.path import join as os_path_join, isfile as os_path_isfile
-from os import mkdir
+from os import mkdir, environ
 from tempfile import gettempdir
-from unittest import TestCase
+from unittest import TestCase, mock, skipUnless
 from shutil import rmtree, copy
 from random import randint
 import subprocess
@@ -30,6 +30,11 @@ import passphrase.tests.constants as constants
 import passphrase.__main__
 from passphrase.aux import Aux
 
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:     # Python < 3.8
+    SharedMemory = None
+
 
 def _test_setup():
     tmpdir = os_path_join(
@@ -68,8 +73,15 @@ class TestValidInputs(TestCase):
     def setUp(self):
         self.tmpdir, self.bin = _test_setup()
         self.assertTrue(Aux.isfile_notempty(self.bin))
+        # Wordlists are cached here instead of in the user's cache
+        self._cache_env = mock.patch.dict(
+            environ,
+            {'XDG_CACHE_HOME': os_path_join(self.tmpdir, 'cache')}
+        )
+        self._cache_env.start()
 
     def tearDown(self):
+        self._cache_env.stop()
         rmtree(self.tmpdir, ignore_errors=True)
 
     def test_main_defaults(self):
@@ -112,6 +124,27 @@ class TestValidInputs(TestCase):
                 result
             )
 
+    @skipUnless(SharedMemory, 'requires multiprocessing.shared_memory')
+    def test_share_wordlist(self):
+        # The modules are importable from the binary, as the zipapp does
+        cmd = [
+            'python3',
+            '-c',
+            'import sys; sys.path.insert(0, "{}"); '
+            'from passphrase import Passphrase; '
+            'p = Passphrase("internal"); name = p.share_wordlist(); '
+            'o = Passphrase(); o.attach_wordlist(name); '
+            'print(len(o.wordlist)); o.detach_wordlist(); '
+            'p.unshare_wordlist()'.format(self.bin)
+        ]
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        self.assertEqual(result.stderr.decode('utf-8'), '')
+        self.assertEqual(result.stdout.decode('utf-8'), '7776\n')
+
     def test_main_option_insecure(self):
         # How can simulate low system entropy?? (without actually consuming
         # all of it...)
@@ -413,8 +446,15 @@ class TestInvalidInputs(TestCase):
     def setUp(self):
         self.tmpdir, self.bin = _test_setup()
         self.assertTrue(Aux.isfile_notempty(self.bin))
+        # Wordlists are cached here instead of in the user's cache
+        self._cache_env = mock.patch.dict(
+            environ,
+            {'XDG_CACHE_HOME': os_path_join(self.tmpdir, 'cache')}
+        )
+        self._cache_env.start()
 
     def tearDown(self):
+        self._cache_env.stop()
         rmtree(self.tmpdir, ignore_errors=True)
 
     def _test_base(self, cmds, expected):
@@ -34,11 +34,29 @@ class TestValidInputs(TestCase):
             ((), 0.0),
             ([], 0.0),
             ((1, ), 0.0),
+            (('a', 'a', 'b', 'b'), 1.0),
+            (['a', 'a', 'a', 'b'], 0.81),
+            (['a', 'a', 'a', 'a'], 0.0),
         )
         for val in values:
             bits = passphrase.calc.entropy_bits(val[0])
             self.assertAlmostEqual(bits, val[1], places=2)
 
+    def test_entropy_bits_large(self):
+        lst = [str(i) for i in range(2 ** 16)]
+        self.assertAlmostEqual(passphrase.calc.entropy_bits(lst), 16.0)
+        lst.append('0')
+        self.assertAlmostEqual(passphrase.calc.entropy_bits(lst), 16.0, 4)
+        self.assertLess(passphrase.calc.entropy_bits(lst), 16.0)
+
+    def test_entropy_bits_sequence(self):
+        from passphrase.wordlist import EFF_LONG_WORDLIST
+
+        self.assertAlmostEqual(
+            passphrase.calc.entropy_bits(EFF_LONG_WORDLIST),
+            passphrase.calc.entropy_bits(list(EFF_LONG_WORDLIST))
+        )
+
     def test_entropy_bits_nrange(self):
         values = (
             (0, 9, 3.17),
@@ -0,0 +1,180 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+from io import StringIO
+from os import stat
+from os.path import exists, join as os_path_join
+from socket import socket, AF_UNIX, SOCK_STREAM
+from stat import S_IMODE
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase
+import sys
+
+from passphrase.__main__ import main
+from passphrase.client import connect, FRAME_HEADER
+from passphrase.daemon import PassphraseServer
+
+
+class TestValidInputs(TestCase):
+
+    def setUp(self):
+        self._stdout = sys.stdout
+        self._stderr = sys.stderr
+        sys.stdout = StringIO()
+        sys.stderr = StringIO()
+        self._tmpdir = TemporaryDirectory()
+        self.tmpdir = self._tmpdir.name
+        self.path = os_path_join(self.tmpdir, 'passphrase.sock')
+
+    def tearDown(self):
+        sys.stdout = self._stdout
+        sys.stderr = self._stderr
+        self._tmpdir.cleanup()
+
+    def start(self, func=main):
+        server = PassphraseServer(self.path, func)
+        thread = Thread(target=server.serve_forever)
+        thread.start()
+
+        def stop():
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        self.addCleanup(stop)
+        return server
+
+    def test_connect(self):
+        self.start()
+        self.assertEqual(S_IMODE(stat(self.path).st_mode), 0o600)
+        self.assertEqual(connect(self.path, ['-c', '3', '-n', '1'], '/'), 0)
+        result = sys.stdout.getvalue().splitlines()
+        self.assertEqual(len(result), 3)
+        for line in result:
+            self.assertEqual(len(line.split()), 6)
+
+        sys.stdout.seek(0)
+        sys.stdout.truncate()
+        self.assertEqual(connect(self.path, ['-p', '5'], '/'), 0)
+        self.assertEqual(len(sys.stdout.getvalue()), 6)
+        self.assertIn('Warning: insecure password length chosen!',
+                      sys.stderr.getvalue())
+
+        # Paths are relative to the client
+        self.assertEqual(
+            connect(self.path, ['-m', '-o', 'out.txt'], self.tmpdir),
+            0
+        )
+        with open(os_path_join(self.tmpdir, 'out.txt')) as outfile:
+            self.assertEqual(len(outfile.read().split()), 6)
+
+    def test_errors(self):
+        self.start()
+        self.assertEqual(connect(self.path, ['--wrong'], '/'), 2)
+        self.assertIn('unrecognized arguments: --wrong',
+                      sys.stderr.getvalue())
+        self.assertEqual(connect(self.path, ['--serve', self.path], '/'), 1)
+        self.assertIn("Error: a daemon can't be run by another one",
+                      sys.stderr.getvalue())
+        self.assertEqual(connect(self.path, ['-i', 'nonexistent'], '/'), 1)
+        self.assertEqual(connect(self.path, ['--stats'], '/'), 1)
+        self.assertIn("Error: --stats can't be used through a daemon",
+                      sys.stderr.getvalue())
+        self.assertEqual(connect(self.path, ['-c', '9', '-j', '2'], '/'), 1)
+        self.assertIn("Error: -j | --jobs can't be used through a daemon",
+                      sys.stderr.getvalue())
+
+    def test_concurrent(self):
+        def generate(argv, cwd):
+            sys.stdout.write(' '.join(argv))
+            return len(argv)
+
+        self.start(generate)
+        outputs = [StringIO() for _ in range(8)]
+
+        def client(index):
+            sys.stdout.redirect(outputs[index])
+            try:
+                self.assertEqual(connect(self.path, ['x'] * index, '/'),
+                                 index)
+            finally:
+                sys.stdout.redirect(None)
+
+        threads = [Thread(target=client, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for index, output in enumerate(outputs):
+            self.assertEqual(output.getvalue(), ' '.join(['x'] * index))
+
+    def test_close(self):
+        server = self.start()
+        stdout = sys.stdout
+        self.assertIsNot(stdout, self._stdout)
+        server.server_close()
+        self.assertFalse(exists(self.path))
+
+    def test_stale_socket(self):
+        with socket(AF_UNIX, SOCK_STREAM) as sock:
+            sock.bind(self.path)
+        self.start()
+        self.assertEqual(connect(self.path, ['--version'], '/'), 0)
+
+
+class TestInvalidInputs(TestCase):
+
+    def setUp(self):
+        self._tmpdir = TemporaryDirectory()
+        self.path = os_path_join(self._tmpdir.name, 'passphrase.sock')
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_server(self):
+        self.assertRaises(TypeError, PassphraseServer, None, main)
+        server = PassphraseServer(self.path, main)
+        try:
+            self.assertRaises(OSError, PassphraseServer, self.path, main)
+        finally:
+            server.server_close()
+
+    def test_request(self):
+        server = PassphraseServer(self.path, main)
+        thread = Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            for request in (
+                    FRAME_HEADER.pack(2) + b'{}',
+                    FRAME_HEADER.pack(4) + b'[1,2',
+                    FRAME_HEADER.pack(2 ** 20),
+            ):
+                with socket(AF_UNIX, SOCK_STREAM) as sock:
+                    sock.connect(self.path)
+                    sock.sendall(request)
+                    # The connection is closed with no answer
+                    self.assertEqual(sock.recv(1), b'')
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def test_connect(self):
+        self.assertRaises(FileNotFoundError, connect, self.path, [], '/')
@@ -0,0 +1,97 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+from os.path import dirname
+from unittest import TestCase, skipIf
+import subprocess
+import sys
+
+import passphrase
+
+
+def _imported_modules(statement: str) -> set:
+    """Return the modules imported by running statement, using -X importtime.
+
+    It's run in a new interpreter so nothing is imported beforehand.
+
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        cwd=dirname(dirname(passphrase.__file__)),
+        check=True
+    ).stderr.decode('utf-8')
+    modules = set()
+    for line in result.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith('import time:') and line.count('|') == 2:
+            modules.add(line.rsplit('|', 1)[1].strip())
+    return modules
+
+
+@skipIf(sys.version_info < (3, 7), 'requires PEP 562 and -X importtime')
+class TestImportTime(TestCase):
+
+    def test_import_package(self):
+        modules = _imported_modules('import passphrase')
+        self.assertIn('passphrase', modules)
+        for module in (
+                'passphrase.passphrase',
+                'passphrase.aux',
+                'passphrase.secrets',
+                'passphrase.wordlist',
+                'subprocess',
+        ):
+            self.assertNotIn(module, modules)
+
+    def test_import_submodule(self):
+        modules = _imported_modules('from passphrase.secrets import randhex')
+        self.assertIn('passphrase.secrets', modules)
+        for module in (
+                'passphrase.passphrase',
+                'passphrase.calc',
+                'passphrase.spec',
+                'passphrase.wordlist',
+                'subprocess',
+                'typing',
+        ):
+            self.assertNotIn(module, modules)
+
+    def test_cli_version(self):
+        modules = _imported_modules(
+            "from passphrase.__main__ import main; main(['--version'])"
+        )
+        self.assertIn('argparse', modules)
+        self.assertNotIn('passphrase.passphrase', modules)
+
+    def test_lazy_attributes(self):
+        modules = _imported_modules('from passphrase import Passphrase')
+        self.assertIn('passphrase.passphrase', modules)
+        # The embedded wordlist is loaded when used
+        self.assertNotIn('passphrase.wordlist', modules)
+        modules = _imported_modules(
+            "import passphrase; passphrase.Passphrase('internal')"
+        )
+        self.assertIn('passphrase.wordlist', modules)
+
+        self.assertIs(passphrase.Aux, passphrase.aux.Aux)
+        self.assertIn('Passphrase', dir(passphrase))
+        self.assertRaises(AttributeError, getattr, passphrase, 'nonexistent')
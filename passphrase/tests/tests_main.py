@@ -20,11 +20,14 @@
 
 from unittest import TestCase, mock
 from io import StringIO
+from os.path import join as os_path_join
+from tempfile import TemporaryDirectory
 import sys
 
 from passphrase.__main__ import main, __version_string__ as main_version_string
 from passphrase.passphrase import Passphrase
 from passphrase.aux import Aux
+import passphrase.random
 
 
 class TestValidInputs(TestCase):
@@ -32,8 +35,16 @@ class TestValidInputs(TestCase):
     def setUp(self):
         self._stdout = sys.stdout
         sys.stdout = StringIO()
+        self._tmpdir = TemporaryDirectory()
+        self._cache_dir = mock.patch(
+            'passphrase.wordcache.WORDLIST_CACHE_DIR',
+            os_path_join(self._tmpdir.name, 'cache')
+        )
+        self._cache_dir.start()
 
     def tearDown(self):
+        self._cache_dir.stop()
+        self._tmpdir.cleanup()
         sys.stdout = self._stdout
 
     def test_main_defaults(self):
@@ -56,6 +67,27 @@ class TestValidInputs(TestCase):
         result = sys.stdout.getvalue()
         self.assertEqual(result, main_version_string + '\n')
 
+    @mock.patch.object(Aux, 'print_stderr')
+    def test_main_option_stats(self, mock_print_stderr):
+        self.assertEqual(main(['--stats', '-c', '2', '--uuid4']), 0)
+        stats = [
+            call[0][0] for call in mock_print_stderr.call_args_list
+            if call[0][0].startswith('Random')
+        ]
+        self.assertEqual(len(stats), 2)
+        self.assertRegex(
+            stats[0],
+            r'^Randomness: \d+ reads from the system \(\d+ bytes\), \d+ '
+            r'bytes and \d+ bits requested, \d+ bits discarded, \d+ bits '
+            r'rejected$'
+        )
+        self.assertRegex(
+            stats[1],
+            r'^Random numbers below a 3-bit bound \(randbelow\): 2 drawn, '
+            r'\d+ retries$'
+        )
+        self.assertFalse(passphrase.random.STATS.enabled)
+
     @mock.patch.object(Aux, 'print_stderr')
     def test_main_option_verbose(self, mock_print_stderr):
         args = (
@@ -241,6 +273,52 @@ class TestValidInputs(TestCase):
         result = sys.stdout.getvalue()
         self.assertNotEqual(result[-1:], '\n')
 
+    def test_main_option_count(self):
+        args = (
+            (['--count', '5'], r'^([a-z\-]+ ){5}[a-z\-]+$'),
+            (['-c', '5', '-p', '12'], r'^.{12}$'),
+            (['-c', '5', '--uuid4'], r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-'
+                                     r'[89ab][0-9a-f]{3}-[0-9a-f]{12}$'),
+            (['-c', '5', '--coin'], r'^(Heads|Tails)$'),
+        )
+        for arg, regex in args:
+            self.assertEqual(main(arg), 0)
+            result = sys.stdout.getvalue()
+            self.assertEqual(result[-1:], '\n')
+            lines = result[:-1].split('\n')
+            self.assertEqual(len(lines), 5)
+            for line in lines:
+                self.assertRegex(line, regex)
+            sys.stdout = StringIO()  # reset
+
+        arg = ['-c', '3000', '-p', '--no-newline']
+        self.assertEqual(main(arg), 0)
+        result = sys.stdout.getvalue()
+        self.assertNotEqual(result[-1:], '\n')
+        self.assertEqual(len(result.split('\n')), 3000)
+
+    def test_main_option_jobs(self):
+        args = (
+            (['--jobs', '2', '-c', '3000'], r'^([a-z\-]+ ){5}[a-z\-]+$'),
+            (['-j', '0', '-c', '2500', '-p', '12'], r'^.{12}$'),
+            (['-j', '3', '-c', '5', '--coin'], r'^(Heads|Tails)$'),
+        )
+        for arg, regex in args:
+            self.assertEqual(main(arg), 0)
+            result = sys.stdout.getvalue()
+            self.assertEqual(result[-1:], '\n')
+            lines = result[:-1].split('\n')
+            self.assertEqual(len(lines), int(arg[arg.index('-c') + 1]))
+            for line in lines:
+                self.assertRegex(line, regex)
+            sys.stdout = StringIO()  # reset
+
+        arg = ['-j', '2', '-c', '3000', '-p', '--no-newline']
+        self.assertEqual(main(arg), 0)
+        result = sys.stdout.getvalue()
+        self.assertNotEqual(result[-1:], '\n')
+        self.assertEqual(len(set(result.split('\n'))), 3000)
+
     @mock.patch('passphrase.__main__.open')
     @mock.patch('passphrase.__main__.os_path_dirname')
     @mock.patch('passphrase.__main__.os_makedirs')
@@ -261,6 +339,18 @@ class TestValidInputs(TestCase):
 
 class TestInvalidInputs(TestCase):
 
+    def setUp(self):
+        self._tmpdir = TemporaryDirectory()
+        self._cache_dir = mock.patch(
+            'passphrase.wordcache.WORDLIST_CACHE_DIR',
+            os_path_join(self._tmpdir.name, 'cache')
+        )
+        self._cache_dir.start()
+
+    def tearDown(self):
+        self._cache_dir.stop()
+        self._tmpdir.cleanup()
+
     @mock.patch.object(Aux, 'print_stderr')
     @mock.patch('passphrase.__main__.open')
     @mock.patch('passphrase.__main__.os_path_dirname')
@@ -304,3 +394,25 @@ class TestInvalidInputs(TestCase):
                 "Error: input file /somedir/somefile is empty or it can't be "
                 "opened or read"
             )
+
+    @mock.patch.object(Aux, 'print_stderr')
+    def test_main_option_connect(self, mock_print_stderr):
+        args = [
+            ['--connect', '/nonexistent/passphrase.sock', '-c', '2'],
+            ['-w', '8', '--connect=/nonexistent/passphrase.sock']
+        ]
+        for arg in args:
+            self.assertEqual(main(arg), 1)
+            mock_print_stderr.assert_called_with(
+                "Error: can't connect to the daemon on "
+                "/nonexistent/passphrase.sock: [Errno 2] No such file or "
+                "directory"
+            )
+
+    @mock.patch.object(Aux, 'print_stderr')
+    def test_main_option_serve(self, mock_print_stderr):
+        self.assertEqual(main(['--serve', '/nonexistent/p.sock']), 1)
+        mock_print_stderr.assert_called_with(
+            "Error: can't serve on /nonexistent/p.sock: [Errno 2] No such "
+            "file or directory"
+        )
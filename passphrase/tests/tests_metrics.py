@@ -0,0 +1,134 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+from os.path import join as os_path_join, exists
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+import json
+
+from passphrase.metrics import Histogram, Metrics, timed
+from passphrase.passphrase import Passphrase
+import passphrase.metrics
+
+
+class TestValidInputs(TestCase):
+
+    def test_histogram(self):
+        histogram = Histogram((0.001, 0.01, 1))
+        self.assertEqual(histogram.buckets, (0.001, 0.01, 1.0))
+        for seconds in (0.0005, 0.001, 0.002, 0.5, 2):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.snapshot(), {
+            'buckets': [0.001, 0.01, 1.0],
+            'counts': [2, 1, 1, 1],
+            'count': 5,
+            'sum': 2.5035,
+        })
+
+    def test_timed(self):
+        metrics = passphrase.metrics.METRICS
+        calls = []
+        passphrase.metrics.reset()
+        passphrase.metrics.add_timer(lambda *args: calls.append(args))
+        self.addCleanup(passphrase.metrics.reset)
+        self.addCleanup(passphrase.metrics.enable, False)
+        self.addCleanup(setattr, metrics, '_timers', ())
+
+        passp = Passphrase('internal')
+        passp.amount_n = 1
+        passp.amount_w = 6
+        passp.passwordlen = 20
+        passp.entropy_bits_req = 77
+        # Nothing is recorded until enabled
+        passp.generate()
+        self.assertEqual(passphrase.metrics.snapshot(), {})
+        self.assertEqual(calls, [])
+
+        passphrase.metrics.enable()
+        passp.load_internal_wordlist()
+        passp.words_amount_needed()
+        passp.generate()
+        passp.generate(2)
+        passp.generate_password()
+        passp.generate_uuid4()
+        self.assertEqual(
+            [name for name, _ in calls],
+            ['load_internal_wordlist', 'words_amount_needed', 'generate',
+             'generate', 'generate_password', 'generate_uuid4']
+        )
+        snapshot = passphrase.metrics.snapshot()
+        self.assertEqual(snapshot['generate']['count'], 2)
+        self.assertAlmostEqual(snapshot['generate']['sum'],
+                               calls[2][1] + calls[3][1])
+        self.assertEqual(snapshot['generate_uuid4']['count'], 1)
+
+        # Failures are timed too
+        @timed('failure')
+        def failure():
+            raise ValueError()
+        self.assertRaises(ValueError, failure)
+        self.assertEqual(calls[-1][0], 'failure')
+        self.assertEqual(failure.__name__, 'failure')
+
+    def test_dump(self):
+        metrics = Metrics((0.001, 0.1))
+        metrics.enabled = True
+        metrics.observe('generate', 0.0001)
+        metrics.observe('generate', 0.01)
+        metrics.observe('generate', 1)
+        with TemporaryDirectory() as tmpdir:
+            path = os_path_join(tmpdir, 'metrics.json')
+            metrics.dump(path)
+            with open(path) as infile:
+                self.assertEqual(json.load(infile), metrics.snapshot())
+
+            path = os_path_join(tmpdir, 'metrics.prom')
+            metrics.dump(path, 'prometheus')
+            self.assertFalse(exists(path + '.tmp'))
+            with open(path) as infile:
+                lines = infile.read().splitlines()
+        self.assertEqual(lines, [
+            '# HELP passphrase_operation_seconds Latency of Passphrase '
+            'operations.',
+            '# TYPE passphrase_operation_seconds histogram',
+            'passphrase_operation_seconds_bucket{operation="generate",'
+            'le="0.001"} 1',
+            'passphrase_operation_seconds_bucket{operation="generate",'
+            'le="0.1"} 2',
+            'passphrase_operation_seconds_bucket{operation="generate",'
+            'le="+Inf"} 3',
+            'passphrase_operation_seconds_sum{operation="generate"} 1.0101',
+            'passphrase_operation_seconds_count{operation="generate"} 3',
+        ])
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {})
+
+
+class TestInvalidInputs(TestCase):
+
+    def test_histogram(self):
+        self.assertRaises(ValueError, Histogram, (1, 0.1))
+        self.assertRaises(ValueError, Histogram, (1, 1))
+
+    def test_metrics(self):
+        metrics = Metrics()
+        self.assertRaises(ValueError, metrics.remove_timer, print)
+        self.assertRaises(ValueError, metrics.dump, 'metrics.txt', 'txt')
@@ -19,10 +19,10 @@
 #  ***************************************************************************
 
 from os.path import join as os_path_join, isfile as os_path_isfile
-from os import mkdir
+from os import mkdir, environ
 from argparse import ArgumentTypeError
 from tempfile import gettempdir
-from unittest import TestCase
+from unittest import TestCase, mock
 from shutil import rmtree
 from random import randint
 import subprocess
@@ -42,8 +42,15 @@ class TestValidInputs(TestCase):
             mkdir(self.tmpdir, 0o755)
         except FileExistsError:
             pass
+        # Wordlists are cached here instead of in the user's cache
+        self._cache_env = mock.patch.dict(
+            environ,
+            {'XDG_CACHE_HOME': os_path_join(self.tmpdir, 'cache')}
+        )
+        self._cache_env.start()
 
     def tearDown(self):
+        self._cache_env.stop()
         rmtree(self.tmpdir, ignore_errors=True)
 
     def test_main_defaults(self):
@@ -99,6 +106,58 @@ class TestValidInputs(TestCase):
         ).stdout.decode('utf-8')
         self.assertNotEqual(result[-1:], '\n')
 
+    def test_main_option_count(self):
+        cmds = (
+            ['python3', '-m', 'passphrase', '--count', '10'],
+            ['python3', '-m', 'passphrase', '-c', '10'],
+        )
+        for cmd in cmds:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE
+            ).stdout.decode('utf-8')
+            self.assertEqual(len(result.splitlines()), 10)
+
+        # Unbounded until stdout is closed
+        cmd = ['python3', '-m', 'passphrase', '--count', '0', '-p']
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        for _ in range(5000):
+            self.assertEqual(len(proc.stdout.readline()), 13)
+        proc.stdout.close()
+        self.assertEqual(proc.wait(), 0)
+        self.assertEqual(proc.stderr.read(), b'')
+        proc.stderr.close()
+
+    def test_main_option_jobs(self):
+        cmds = (
+            ['python3', '-m', 'passphrase', '--jobs', '2', '-c', '3000'],
+            ['python3', '-m', 'passphrase', '-j', '2', '-c', '3000'],
+        )
+        for cmd in cmds:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE
+            ).stdout.decode('utf-8')
+            self.assertEqual(len(set(result.splitlines())), 3000)
+
+        # Unbounded until stdout is closed
+        cmd = ['python3', '-m', 'passphrase', '-c', '0', '-j', '3', '-p']
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        for _ in range(5000):
+            self.assertEqual(len(proc.stdout.readline()), 13)
+        proc.stdout.close()
+        self.assertEqual(proc.wait(), 0)
+        self.assertEqual(proc.stderr.read(), b'')
+        proc.stderr.close()
+
     def test_main_option_mute(self):
         cmds = (
             ['python3', '-m', 'passphrase', '--mute'],
@@ -396,8 +455,15 @@ class TestInvalidInputs(TestCase):
             mkdir(self.tmpdir, 0o755)
         except FileExistsError:
             pass
+        # Wordlists are cached here instead of in the user's cache
+        self._cache_env = mock.patch.dict(
+            environ,
+            {'XDG_CACHE_HOME': os_path_join(self.tmpdir, 'cache')}
+        )
+        self._cache_env.start()
 
     def tearDown(self):
+        self._cache_env.stop()
         rmtree(self.tmpdir, ignore_errors=True)
 
     def _test_base(self, cmds, expected):
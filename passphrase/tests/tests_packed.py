@@ -0,0 +1,216 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+from hashlib import sha256
+from os.path import join as os_path_join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
+
+from passphrase.packed import PackedWordlist
+import passphrase.packed
+from passphrase.secrets import randhex
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:     # Python < 3.8
+    SharedMemory = None
+from passphrase.wordlist import EFF_LONG_WORDLIST
+import passphrase.tests.constants as constants
+
+
+class TestValidInputs(TestCase):
+
+    def test_from_words(self):
+        words = PackedWordlist.from_words(constants.WORDS)
+        self.assertEqual(len(words), len(constants.WORDS))
+        self.assertEqual(words, constants.WORDS)
+        self.assertEqual(list(words), constants.WORDS)
+        self.assertEqual(
+            words.blob,
+            ('\n'.join(constants.WORDS) + '\n').encode()
+        )
+        self.assertEqual(PackedWordlist.from_words(['ñandú', 'über']),
+                         ['ñandú', 'über'])
+        self.assertEqual(len(PackedWordlist.from_words([])), 0)
+
+    def test_lazy_offsets(self):
+        words = PackedWordlist(b'abacus\nabdomen\n\nzoom\n')
+        self.assertIsNone(words._offsets)
+        self.assertEqual(len(words), 4)
+        self.assertEqual(list(words.offsets), [0, 7, 15, 16, 21])
+        self.assertEqual(words[0], 'abacus')
+        self.assertEqual(words[2], '')
+        self.assertEqual(words[-1], 'zoom')
+        self.assertEqual(words[1:3], ['abdomen', ''])
+        self.assertIn('zoom', words)
+        self.assertEqual(words.index('abdomen'), 1)
+        self.assertEqual(len(PackedWordlist(b'')), 0)
+        self.assertEqual(
+            PackedWordlist(memoryview(b'abacus\nabdomen\n')),
+            ('abacus', 'abdomen')
+        )
+
+    def test_eff_long_wordlist(self):
+        self.assertEqual(len(EFF_LONG_WORDLIST), 7776)
+        self.assertEqual(EFF_LONG_WORDLIST[0], 'abacus')
+        self.assertEqual(EFF_LONG_WORDLIST[7775], 'zoom')
+        self.assertEqual(len(set(EFF_LONG_WORDLIST)), 7776)
+        self.assertTrue(all(word.islower() for word in EFF_LONG_WORDLIST))
+
+    def test_dump_load(self):
+        words = PackedWordlist.from_words(['ñandú', 'über', '', 'zoom'])
+        with TemporaryDirectory() as tmpdir:
+            filename = os_path_join(tmpdir, 'words.ppwl')
+            header = passphrase.packed.dump(
+                words,
+                filename,
+                2.0,
+                flags=passphrase.packed.FLAG_NORMALIZED,
+                mtime=123,
+                size=456
+            )
+            self.assertEqual(header.count, 4)
+            self.assertEqual(passphrase.packed.read_header(filename), header)
+
+            loaded, header = passphrase.packed.load(filename, verify=True)
+            self.assertEqual(loaded, words)
+            self.assertEqual(loaded[1], 'über')
+            self.assertEqual(list(loaded.offsets), list(words.offsets))
+            self.assertEqual(header.entropy, 2.0)
+            self.assertEqual(header.flags, passphrase.packed.FLAG_NORMALIZED)
+            self.assertEqual((header.mtime, header.size), (123, 456))
+
+            # Lazy offsets are dumped too
+            passphrase.packed.dump(PackedWordlist(b'a\nb\n'), filename, 1.0)
+            loaded, header = passphrase.packed.load(filename)
+            self.assertEqual(loaded, ['a', 'b'])
+            self.assertEqual(header.count, 2)
+
+    @skipUnless(SharedMemory, 'requires multiprocessing.shared_memory')
+    def test_share_attach(self):
+        words = PackedWordlist.from_words(['ñandú', 'über', '', 'zoom'])
+        name = 'passphrase-test-{}'.format(randhex(8))
+        shm, header = passphrase.packed.share(words, name, 2.0)
+        try:
+            self.assertEqual(header.count, 4)
+            self.assertRaises(
+                FileExistsError,
+                passphrase.packed.share,
+                words,
+                name,
+                2.0
+            )
+            attached, header, attached_shm = passphrase.packed.attach(name)
+            self.assertEqual(attached, words)
+            self.assertEqual(header.entropy, 2.0)
+            self.assertEqual(header.digest, sha256(words.blob).digest())
+            attached.blob.release()
+            attached.offsets.release()
+            attached_shm.close()
+        finally:
+            passphrase.packed.unshare(shm)
+        self.assertRaises(FileNotFoundError, passphrase.packed.attach, name)
+
+
+class TestInvalidInputs(TestCase):
+
+    def test_dump(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = os_path_join(tmpdir, 'words.ppwl')
+            self.assertRaises(
+                TypeError,
+                passphrase.packed.dump,
+                ['a'],
+                filename,
+                1.0
+            )
+            self.assertRaises(
+                OSError,
+                passphrase.packed.dump,
+                PackedWordlist(b'a\n'),
+                os_path_join(tmpdir, 'inexistent', 'words.ppwl'),
+                1.0
+            )
+
+    def test_load(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = os_path_join(tmpdir, 'words.ppwl')
+            passphrase.packed.dump(PackedWordlist(b'a\nb\n'), filename, 1.0)
+            with open(filename, mode='rb') as binfile:
+                data = binfile.read()
+
+            for invalid in (
+                    b'',
+                    b'XXXX' + data[4:],
+                    data[:4] + b'\xff\xff' + data[6:],
+                    data[:-1],
+                    data[:passphrase.packed.FILE_HEADER.size + 2],
+            ):
+                with open(filename, mode='wb') as binfile:
+                    binfile.write(invalid)
+                self.assertRaises(
+                    ValueError,
+                    passphrase.packed.load,
+                    filename
+                )
+
+            with open(filename, mode='wb') as binfile:
+                binfile.write(data[:-2] + b'c\n')
+            passphrase.packed.load(filename)
+            self.assertRaises(
+                ValueError,
+                passphrase.packed.load,
+                filename,
+                verify=True
+            )
+            self.assertRaises(
+                OSError,
+                passphrase.packed.load,
+                os_path_join(tmpdir, 'inexistent')
+            )
+
+    @skipUnless(SharedMemory, 'requires multiprocessing.shared_memory')
+    def test_attach(self):
+        name = 'passphrase-test-{}'.format(randhex(8))
+        self.assertRaises(FileNotFoundError, passphrase.packed.attach, name)
+        shm, _ = passphrase.packed.share(PackedWordlist(b'a\n'), name, 0.0)
+        try:
+            shm.buf[:4] = b'XXXX'
+            self.assertRaises(ValueError, passphrase.packed.attach, name)
+        finally:
+            passphrase.packed.unshare(shm)
+
+    def test_init(self):
+        for wrongtype in constants.WRONGTYPES_STR:
+            self.assertRaises(TypeError, PackedWordlist, wrongtype)
+        self.assertRaises(TypeError, PackedWordlist, 'abacus\n')
+        self.assertRaises(ValueError, PackedWordlist, b'abacus')
+
+    def test_from_words(self):
+        for wrongtype in constants.WRONGTYPES_LIST_TUPLE:
+            self.assertRaises(TypeError, PackedWordlist.from_words, wrongtype)
+        self.assertRaises(TypeError, PackedWordlist.from_words, [1, 2])
+        self.assertRaises(ValueError, PackedWordlist.from_words, ['a\nb'])
+
+    def test_getitem(self):
+        words = PackedWordlist(b'abacus\n')
+        self.assertRaises(IndexError, words.__getitem__, 1)
+        self.assertRaises(IndexError, words.__getitem__, -2)
+        self.assertNotEqual(words, 'abacus')
@@ -0,0 +1,132 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+from unittest import TestCase, mock
+
+from passphrase.passphrase import Passphrase
+import passphrase.parallel
+import passphrase.tests.constants as constants
+
+
+class TestValidInputs(TestCase):
+
+    def test_generate(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 16
+        for ordered in (True, False):
+            for jobs, count in ((1, 25), (3, 1), (3, 25), (4, 40), (8, 20)):
+                chunks = list(passphrase.parallel.generate(
+                    passp,
+                    count,
+                    jobs=jobs,
+                    kind='password',
+                    chunk_size=10,
+                    ordered=ordered
+                ))
+                results = [result for chunk in chunks for result in chunk]
+                self.assertEqual(len(results), count)
+                # Workers never share their random state
+                self.assertEqual(len(set(results)), count)
+                for result in results:
+                    self.assertEqual(len(result), 16)
+                sizes = [len(chunk) for chunk in chunks]
+                self.assertLessEqual(max(sizes), 10)
+                if ordered:
+                    self.assertEqual(sizes, sorted(sizes, reverse=True))
+
+        chunks = passphrase.parallel.generate(passp, 30, jobs=2, uppercase=0,
+                                              chunk_size=7)
+        for chunk in chunks:
+            for result in chunk:
+                self.assertEqual(len(result.split()), 5)
+                self.assertEqual(result, result.upper())
+        self.assertIsNone(passp.last_result)
+
+    def test_generate_unbounded(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 16
+        for ordered in (True, False):
+            chunks = passphrase.parallel.generate(
+                passp,
+                0,
+                jobs=3,
+                chunk_size=5,
+                ordered=ordered
+            )
+            results = []
+            for chunk in chunks:
+                self.assertEqual(len(chunk), 5)
+                results.extend(chunk)
+                if len(results) >= 100:
+                    break
+            chunks.close()
+            self.assertEqual(len(set(results)), len(results))
+
+    def test_generate_worker_failure(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 16
+
+        def generate_password_many(count):
+            if count:
+                raise OSError()
+            return []
+
+        with mock.patch.object(passp, 'generate_password_many',
+                               generate_password_many):
+            for ordered in (True, False):
+                chunks = passphrase.parallel.generate(
+                    passp,
+                    20,
+                    jobs=2,
+                    kind='password',
+                    chunk_size=5,
+                    ordered=ordered
+                )
+                self.assertRaises(RuntimeError, list, chunks)
+
+
+class TestInvalidInputs(TestCase):
+
+    def test_generate(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 16
+
+        # Checked when called, without consuming the chunks
+        generate = passphrase.parallel.generate
+
+        self.assertRaises(TypeError, generate, None, 1)
+        self.assertRaises(ValueError, generate, passp, 1, kind='uuid4')
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(TypeError, generate, passp, wrongtype)
+            self.assertRaises(TypeError, generate, passp, 1, jobs=wrongtype)
+            self.assertRaises(TypeError, generate, passp, 1,
+                              chunk_size=wrongtype)
+        self.assertRaises(ValueError, generate, passp, -1)
+        self.assertRaises(ValueError, generate, passp, 1, jobs=0)
+        self.assertRaises(ValueError, generate, passp, 1, chunk_size=0)
+        self.assertRaises(ValueError, generate, Passphrase(), 1, jobs=2)
@@ -18,18 +18,26 @@
 #
 #  ***************************************************************************
 
+from copy import copy
 from os.path import join as os_path_join
 from tempfile import gettempdir
-from unittest import TestCase
+from unittest import TestCase, mock, skipUnless
 from random import randint
 from shutil import rmtree
+from subprocess import run, PIPE
 from uuid import UUID
 from os import mkdir
 
 from passphrase.passphrase import Passphrase
+from passphrase.packed import PackedWordlist
 from passphrase.aux import Aux
 import passphrase.tests.constants as constants
 
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:     # Python < 3.8
+    SharedMemory = None
+
 
 class TestValidInputs(TestCase):
 
@@ -50,7 +58,14 @@ class TestValidInputs(TestCase):
         with open(self.words_file, mode='wt', encoding='utf-8') as wordfile:
             wordfile.write('\n'.join(constants.WORDS))
 
+        self._cache_dir = mock.patch(
+            'passphrase.wordcache.WORDLIST_CACHE_DIR',
+            os_path_join(self.tmpdir, 'cache')
+        )
+        self._cache_dir.start()
+
     def tearDown(self):
+        self._cache_dir.stop()
         rmtree(self.tmpdir, ignore_errors=True)
 
     def test_init(self):
@@ -130,6 +145,42 @@ class TestValidInputs(TestCase):
         self.assertIsInstance(passphrase, list)
         self.assertEqual(len(passphrase), length)
 
+    def test_generate_many(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.separator = ' '
+        self.assertEqual(passp.generate_many(0), [])
+        passphrases = passp.generate_many(50)
+        self.assertIsInstance(passphrases, list)
+        self.assertEqual(len(passphrases), 50)
+        self.assertIsNone(passp.last_result)
+        for passphrase in passphrases:
+            self.assertIsInstance(passphrase, str)
+            parts = passphrase.split(' ')
+            self.assertEqual(len(parts), 5)
+            for word in parts[:4]:
+                self.assertIn(word, passp.wordlist)
+            self.assertTrue(parts[4].isdigit())
+        for passphrase in passp.generate_many(10, 3):
+            self.assertEqual(Aux.uppercase_count(passphrase), 3)
+        for passphrase in passp.generate_many(10, 0):
+            self.assertEqual(Aux.lowercase_count(passphrase), 0)
+
+    def test_generate_password_many(self):
+        passp = Passphrase()
+        passp.passwordlen = 16
+        passp.password_use_punctuation = False
+        self.assertEqual(passp.generate_password_many(0), [])
+        passwords = passp.generate_password_many(50)
+        self.assertEqual(len(passwords), 50)
+        self.assertEqual(len(set(passwords)), 50)
+        self.assertIsNone(passp.last_result)
+        for password in passwords:
+            self.assertIsInstance(password, str)
+            self.assertEqual(len(password), 16)
+            self.assertTrue(password.isalnum())
+
     def test_generate_uuid4(self):
         passp = Passphrase()
         passphrase = passp.generate_uuid4()
@@ -149,6 +200,109 @@ class TestValidInputs(TestCase):
             [word.split()[1] for word in constants.WORDSD]
         )
 
+        # Loaded again, it's mapped from the cache
+        passp.import_words_from_file(self.words_file, False)
+        self.assertIsInstance(passp.wordlist, PackedWordlist)
+        self.assertEqual(passp.wordlist, constants.WORDS)
+        self.assertAlmostEqual(
+            passp._get_wordlist_entropy(),
+            constants.WORDS_ENTROPY,
+            places=2
+        )
+        passp.amount_n = 0
+        passp.amount_w = 4
+        for word in passp.generate():
+            self.assertIn(word, constants.WORDS)
+
+    @skipUnless(SharedMemory, 'requires multiprocessing.shared_memory')
+    def test_share_wordlist(self):
+        passp = Passphrase()
+        passp.wordlist = ['ONE', 'Two', 'three']
+        name = passp.share_wordlist()
+        try:
+            self.assertTrue(name.startswith('passphrase-'))
+            proc = run(
+                [
+                    'python',
+                    '-c',
+                    'from passphrase import Passphrase; p = Passphrase(); '
+                    'p.attach_wordlist("{}"); print(list(p.wordlist), '
+                    'p.entropy_bits_req)'.format(name)
+                ],
+                stdout=PIPE,
+                stderr=PIPE,
+            )
+            self.assertEqual(proc.stderr.decode('utf-8'), '')
+            self.assertEqual(
+                proc.stdout.decode('utf-8'),
+                "['one', 'two', 'three'] None\n"
+            )
+
+            other = Passphrase()
+            other.attach_wordlist(name)
+            self.assertIsInstance(other.wordlist, PackedWordlist)
+            self.assertEqual(other.wordlist, ['one', 'two', 'three'])
+            self.assertAlmostEqual(
+                other._get_wordlist_entropy(),
+                passp._get_wordlist_entropy()
+            )
+            other.amount_n = 1
+            other.amount_w = 4
+            passphrase = other.generate(2)
+            for word in passphrase[:4]:
+                self.assertIn(word.lower(), ('one', 'two', 'three'))
+            self.assertEqual(Aux.uppercase_count(passphrase), 2)
+            other.detach_wordlist()
+            self.assertIsNone(other.wordlist)
+            other.detach_wordlist()
+        finally:
+            passp.unshare_wordlist()
+        passp.unshare_wordlist()
+        self.assertRaises(FileNotFoundError, other.attach_wordlist, name)
+
+        passp.load_internal_wordlist()
+        self.assertEqual(passp.share_wordlist(name), name)
+        other.attach_wordlist(name)
+        self.assertEqual(other.wordlist, passp.wordlist)
+        passp.unshare_wordlist()
+        # Still usable until detached
+        self.assertEqual(len(other.wordlist), 7776)
+        other.wordlist = constants.WORDS
+        other.detach_wordlist()
+        self.assertEqual(other.wordlist, constants.WORDS)
+
+    def test_copy(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 0
+        passp.generated_passphrase_entropy()
+        other = copy(passp)
+        self.assertIsNot(other._derived, passp._derived)
+        other.amount_w = 2
+        self.assertEqual(len(passp.generate()), 4)
+        self.assertEqual(len(other.generate()), 2)
+
+    @skipUnless(SharedMemory, 'requires multiprocessing.shared_memory')
+    def test_copy_attached(self):
+        passp = Passphrase('internal')
+        name = passp.share_wordlist()
+        try:
+            other = Passphrase()
+            other.attach_wordlist(name)
+            other.amount_w = 4
+            other.amount_n = 0
+            other.generate()
+            other_copy = copy(other)
+            self.assertIsNone(other_copy._attached_memory)
+            self.assertIsNone(other_copy._shared_memory)
+            # The copy keeps its wordlist when the original detaches
+            other.detach_wordlist()
+            self.assertEqual(len(other_copy.wordlist), 7776)
+            self.assertEqual(len(other_copy.generate()), 4)
+            self.assertIsNone(copy(passp)._shared_memory)
+        finally:
+            passp.unshare_wordlist()
+
     def test_password_length_needed(self):
         passp = Passphrase()
         passp.entropy_bits_req = 128
@@ -167,6 +321,21 @@ class TestValidInputs(TestCase):
         amount_w = passp.words_amount_needed()
         self.assertEqual(amount_w, 30)
 
+        # The result is kept until the settings change
+        with mock.patch.object(Passphrase, 'entropy_bits') as mock_entropy:
+            mock_entropy.return_value = 19.78
+            amount_w = passp.words_amount_needed()
+            self.assertEqual(amount_w, 30)
+            mock_entropy.assert_not_called()
+            # The wordlist entropy is calculated only once
+            passp.amount_n = 0
+            self.assertEqual(passp.words_amount_needed(), 30)
+            mock_entropy.assert_called_once_with(
+                (passp.randnum_min, passp.randnum_max)
+            )
+        passp.wordlist = constants.WORDS * 2
+        self.assertEqual(passp.words_amount_needed(), 30)
+
     def test_entropy_bits_req(self):
         passp = Passphrase()
         passp.entropy_bits_req = 1
@@ -202,6 +371,45 @@ class TestValidInputs(TestCase):
         passp.wordlist = constants.WORDS
         self.assertEqual(passp.wordlist, list(constants.WORDS))
 
+    def test_wordlist_internal_roundtrip(self):
+        passp = Passphrase('internal')
+        words = list(passp.wordlist)
+        passp.wordlist = passp.wordlist
+        self.assertEqual(passp.wordlist, words)
+
+    def test_entropy_bits_internal_wordlist(self):
+        passp = Passphrase('internal')
+        self.assertAlmostEqual(
+            Passphrase.entropy_bits(passp.wordlist),
+            Passphrase.entropy_bits(list(passp.wordlist)),
+            places=6
+        )
+
+    def test_wordlist_normalized(self):
+        passp = Passphrase()
+        passp.wordlist = ['ONE', 'Two', 'thrEE-4']
+        self.assertEqual(passp.wordlist, ['ONE', 'Two', 'thrEE-4'])
+        passp.amount_n = 0
+        passp.amount_w = 20
+        for word in passp.generate():
+            self.assertIn(word, ('one', 'two', 'three-4'))
+
+        # Lowercase counts are computed once per wordlist
+        with mock.patch.object(
+                Passphrase,
+                '_normalize_words',
+                wraps=Passphrase._normalize_words
+        ) as mock_normalize:
+            passp.wordlist = ['ONE', 'Two', 'thrEE-4']
+            mock_normalize.assert_called_once_with(['ONE', 'Two', 'thrEE-4'])
+        self.assertIsNone(passp._words_lowercase)
+        passp.generate(2)
+        self.assertEqual(list(passp._words_lowercase), [3, 3, 5])
+        words_lowercase = passp._words_lowercase
+        passphrase = passp.generate(2)
+        self.assertIs(passp._words_lowercase, words_lowercase)
+        self.assertEqual(Aux.uppercase_count(passphrase), 2)
+
     def test_to_string(self):
         passp = Passphrase()
         passp.load_internal_wordlist()
@@ -240,6 +448,61 @@ class TestValidInputs(TestCase):
             places=2
         )
 
+    def test_wordlist_ready(self):
+        passp = Passphrase()
+        self.assertTrue(passp.wordlist_ready(2))
+        passp.load_internal_wordlist()
+        self.assertTrue(passp.wordlist_ready())
+        passp.wordlist = constants.WORDS
+        self.assertFalse(passp.wordlist_ready())
+        passp.amount_n = 0
+        passp.amount_w = 2
+        passp.generate()
+        self.assertTrue(passp.wordlist_ready())
+        self.assertFalse(passp.wordlist_ready(1))
+        passp.generate(1)
+        self.assertTrue(passp.wordlist_ready(1))
+
+    def test_cache_stats(self):
+        passp = Passphrase('internal')
+        self.assertEqual(passp.cache_stats(),
+                         {'hits': 0, 'misses': 0, 'hit_rate': 0.0})
+        passp.amount_n = 1
+        passp.amount_w = 1
+        passp.passwordlen = 1
+        passp.entropy_bits_req = 77
+        for _ in range(3):
+            passp.generated_passphrase_entropy()
+            passp.generated_password_entropy()
+            passp.words_amount_needed()
+            passp.password_length_needed()
+        self.assertEqual(passp.cache_stats(),
+                         {'hits': 8, 'misses': 4, 'hit_rate': 8 / 12})
+
+        # Settings clear the cache
+        passp.amount_w = 2
+        self.assertAlmostEqual(passp.generated_passphrase_entropy(), 45.63,
+                               places=2)
+        passp.password_use_punctuation = False
+        self.assertAlmostEqual(passp.generated_password_entropy(), 5.95,
+                               places=2)
+        passp.entropy_bits_req = 100
+        self.assertEqual(passp.password_length_needed(), 17)
+        passp.randnum_min = 1
+        passp.randnum_max = 100000
+        self.assertEqual(passp.words_amount_needed(), 7)
+        passp.wordlist = constants.WORDS
+        self.assertEqual(passp.words_amount_needed(), 33)
+        self.assertEqual(passp.cache_stats()['misses'], 9)
+        # Errors are not cached
+        passp.passwordlen = 0
+        passp.password_use_lowercase = False
+        passp.password_use_uppercase = False
+        passp.password_use_digits = False
+        self.assertRaises(ValueError, passp.generated_password_entropy)
+        self.assertRaises(ValueError, passp.generated_password_entropy)
+        self.assertEqual(passp.cache_stats()['misses'], 11)
+
     def test_separator(self):
         passp = Passphrase('internal')
         passp.amount_w = 1
@@ -349,6 +612,15 @@ class TestInvalidInputs(TestCase):
             True
         )
 
+    @skipUnless(SharedMemory, 'requires multiprocessing.shared_memory')
+    def test_share_wordlist(self):
+        passp = Passphrase()
+        self.assertRaises(ValueError, passp.share_wordlist)
+        passp.load_internal_wordlist()
+        for wrongtype in constants.WRONGTYPES_STR:
+            self.assertRaises(TypeError, passp.share_wordlist, wrongtype)
+            self.assertRaises(TypeError, passp.attach_wordlist, wrongtype)
+
     def test_password_length_needed(self):
         passp = Passphrase()
         for wrongtype in constants.WRONGTYPES_INT_FLOAT:
@@ -482,6 +754,12 @@ class TestInvalidInputs(TestCase):
                 'wordlist can only be list or tuple',
                 str(context.exception)
             )
+        with self.assertRaises(TypeError) as context:
+            passp.wordlist = ['word', 1]
+        self.assertIn(
+            'wordlist can only contain strings',
+            str(context.exception)
+        )
 
     def test_generate(self):
         passp = Passphrase()
@@ -507,6 +785,29 @@ class TestInvalidInputs(TestCase):
         passp.passwordlen = 77
         self.assertRaises(ValueError, passp.generate_password)
 
+    def test_generate_many(self):
+        passp = Passphrase()
+        self.assertRaises(ValueError, passp.generate_many, 1)
+        passp.load_internal_wordlist()
+        passp.amount_n = 0
+        passp.amount_w = 1
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(TypeError, passp.generate_many, wrongtype)
+            self.assertRaises(TypeError, passp.generate_many, 1, wrongtype)
+        self.assertRaises(ValueError, passp.generate_many, -1)
+
+    def test_generate_password_many(self):
+        passp = Passphrase()
+        self.assertRaises(ValueError, passp.generate_password_many, 1)
+        passp.passwordlen = 8
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(
+                TypeError,
+                passp.generate_password_many,
+                wrongtype
+            )
+        self.assertRaises(ValueError, passp.generate_password_many, -1)
+
     def test_separator(self):
         passp = Passphrase()
         for wrongtype in constants.WRONGTYPES_STR:
@@ -527,6 +828,30 @@ class TestInvalidInputs(TestCase):
         passp.load_internal_wordlist()
         self.assertEqual(passp.words_amount_needed(), 5)
 
+    def test_randnum_range(self):
+        passp = Passphrase('internal')
+        passp.entropy_bits_req = 77
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.randnum_min = 10
+        passp.randnum_max = 9
+        for method in (
+                passp.words_amount_needed,
+                passp.generated_passphrase_entropy,
+                passp.generate,
+        ):
+            with self.assertRaises(ValueError) as context:
+                method()
+            self.assertIn(
+                'randnum_min should be lower than or equal to randnum_max',
+                str(context.exception)
+            )
+        # Not relevant without numbers
+        passp.amount_n = 0
+        passp.words_amount_needed()
+        passp.generated_passphrase_entropy()
+        passp.generate()
+
     def test_generated_password_entropy(self):
         passp = Passphrase()
         self.assertRaises(ValueError, passp.generated_password_entropy)
@@ -0,0 +1,175 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+from os import fork, pipe, read, write, close, waitpid, _exit
+from unittest import TestCase, mock
+
+from passphrase.passphrase import Passphrase
+from passphrase.prefetch import PassphrasePool
+import passphrase.tests.constants as constants
+
+
+class TestValidInputs(TestCase):
+
+    def test_passphrase_pool(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        with PassphrasePool(passp, size=8, low_water=4) as pool:
+            self.assertEqual(pool.size, 8)
+            self.assertEqual(pool.low_water, 4)
+            self.assertTrue(pool.wait(5))
+            self.assertEqual(len(pool), 8)
+            # Configuration is frozen
+            self.assertIsNot(pool._passphrase._derived, passp._derived)
+            passp.amount_w = 1
+            items = [pool.take() for _ in range(50)]
+            for item in items:
+                self.assertIsInstance(item, str)
+                self.assertEqual(len(item.split()), 5)
+            self.assertEqual(len(set(items)), 50)
+            stats = pool.stats()
+            self.assertEqual(stats['hits'] + stats['misses'], 50)
+            self.assertGreaterEqual(stats['hits'], 8)
+            self.assertGreaterEqual(stats['refills'], 1)
+            self.assertGreater(stats['refill_latency'], 0)
+            self.assertGreaterEqual(stats['refill_latency_max'],
+                                    stats['refill_latency'])
+            self.assertGreaterEqual(stats['refill_time'],
+                                    stats['refill_latency_max'])
+        self.assertTrue(pool.closed)
+        self.assertEqual(len(pool), 0)
+        self.assertIsNone(passp.last_result)
+
+    def test_password_pool(self):
+        passp = Passphrase()
+        passp.passwordlen = 12
+        with PassphrasePool(passp, 'password', size=4) as pool:
+            pool.wait(5)
+            for _ in range(10):
+                self.assertEqual(len(pool.take()), 12)
+
+    def test_uppercase(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        with PassphrasePool(passp, size=2, uppercase=0) as pool:
+            for _ in range(4):
+                item = pool.take()
+                self.assertEqual(item, item.upper())
+
+    def test_take_wipes(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        with PassphrasePool(passp, size=4) as pool:
+            pool.wait(5)
+            queued = pool._items[0]
+            item = pool.take()
+            self.assertEqual(queued, bytearray(len(queued)))
+            self.assertEqual(len(item.encode('utf-8')), len(queued))
+            queued = list(pool._items)
+        for item in queued:
+            self.assertEqual(item, bytearray(len(item)))
+
+    def test_miss(self):
+        with mock.patch.object(PassphrasePool, '_start'):
+            passp = Passphrase('internal')
+            passp.amount_w = 4
+            passp.amount_n = 1
+            passp.passwordlen = 12
+            pool = PassphrasePool(passp, size=4)
+        self.assertEqual(len(pool.take().split()), 5)
+        self.assertEqual((pool.hits, pool.misses), (0, 1))
+        pool.close()
+
+    def test_fork(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        with PassphrasePool(passp, size=4) as pool:
+            pool.wait(5)
+            parent = [bytes(item) for item in pool._items]
+            rfd, wfd = pipe()
+            pid = fork()
+            if pid == 0:
+                # Child: nothing from the parent is handed out, and the
+                # refill only restarts once the pool is used
+                try:
+                    close(rfd)
+                    idle = pool._thread is None
+                    items = {pool.take().encode('utf-8') for _ in range(8)}
+                    write(wfd, b'1' if (
+                        idle
+                        and pool._thread is not None
+                        and items.isdisjoint(parent)
+                    ) else b'0')
+                finally:
+                    _exit(0)
+            close(wfd)
+            result = read(rfd, 1)
+            close(rfd)
+            waitpid(pid, 0)
+            self.assertEqual(result, b'1')
+            self.assertEqual([bytes(item) for item in pool._items], parent)
+
+
+class TestInvalidInputs(TestCase):
+
+    def test_init(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        self.assertRaises(TypeError, PassphrasePool, None)
+        self.assertRaises(ValueError, PassphrasePool, passp, 'uuid4')
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(
+                TypeError,
+                PassphrasePool,
+                passp,
+                size=wrongtype
+            )
+            self.assertRaises(
+                TypeError,
+                PassphrasePool,
+                passp,
+                low_water=wrongtype
+            )
+        self.assertRaises(ValueError, PassphrasePool, passp, size=0)
+        self.assertRaises(ValueError, PassphrasePool, passp, low_water=0)
+        self.assertRaises(ValueError, PassphrasePool, passp, size=2,
+                          low_water=3)
+        self.assertRaises(ValueError, PassphrasePool, Passphrase())
+        self.assertRaises(ValueError, PassphrasePool, Passphrase(),
+                          'password')
+
+    def test_take(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        pool = PassphrasePool(passp, size=2)
+        pool.close()
+        self.assertRaises(ValueError, pool.take)
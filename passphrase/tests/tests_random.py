@@ -22,6 +22,7 @@ from unittest import TestCase
 from random import randrange
 from test.support.script_helper import assert_python_ok
 from os.path import dirname, realpath, join as os_path_join
+from os import fork, pipe, read, write, close, waitpid, _exit
 
 import passphrase.random
 import passphrase.tests.constants as constants
@@ -74,6 +75,157 @@ class TestValidInputs(TestCase):
         data2 = self.get_randbytes_subprocess(16)
         self.assertNotEqual(data1, data2)
 
+    def test_randompool(self):
+        pool = passphrase.random.RandomPool(64)
+        self.assertEqual(pool.size, 64)
+        self.assertEqual(pool.available, 0)
+        data1 = pool.randbytes(16)
+        self.assertIsInstance(data1, bytes)
+        self.assertEqual(len(data1), 16)
+        self.assertEqual(pool.syscalls, 1)
+        self.assertEqual(pool.available, 48)
+        # served bytes are wiped from the buffer
+        self.assertEqual(pool._buffer[:16], bytes(16))
+        data2 = pool.randbytes(48)
+        self.assertNotEqual(data1, data2[:16])
+        self.assertEqual(pool.syscalls, 1)
+        pool.randbytes(1)
+        self.assertEqual(pool.syscalls, 2)
+        # bigger than the pool size bypasses the buffer
+        self.assertEqual(len(pool.randbytes(100)), 100)
+        self.assertEqual(pool.syscalls, 3)
+        self.assertEqual(pool.requests, 4)
+        self.assertEqual(pool.bytes_served, 16 + 48 + 1 + 100)
+        pool.reseed()
+        self.assertEqual(pool.available, 0)
+
+        pool = passphrase.random.RandomPool(0)
+        pool.randbytes(1)
+        pool.randbytes(1)
+        self.assertEqual(pool.syscalls, 2)
+
+    def test_randompool_fork(self):
+        pool = passphrase.random.get_pool()
+        pool.randbytes(1)
+        rfd, wfd = pipe()
+        pid = fork()
+        if pid == 0:  # pragma: no cover
+            close(rfd)
+            write(wfd, passphrase.random.randbytes(16))
+            _exit(0)
+        close(wfd)
+        child = read(rfd, 16)
+        close(rfd)
+        waitpid(pid, 0)
+        self.assertEqual(len(child), 16)
+        self.assertNotEqual(child, passphrase.random.randbytes(16))
+
+    def test_bitreservoir(self):
+        pool = passphrase.random.RandomPool(64)
+        reservoir = passphrase.random.BitReservoir(pool)
+        self.assertEqual(reservoir.available, 0)
+        for _ in range(64):
+            self.assertIn(reservoir.randbits(1), (0, 1))
+        self.assertEqual(pool.bytes_served, passphrase.random.RESERVOIR_SIZE)
+        self.assertEqual(reservoir.available, 0)
+        rand = reservoir.randbits(3)
+        self.assertTrue(0 <= rand < 8)
+        self.assertEqual(reservoir.available, 61)
+        rand = reservoir.randbits(100)
+        self.assertTrue(0 <= rand < 2 ** 100)
+        self.assertEqual(reservoir.available, 25)
+        self.assertEqual(reservoir.requests, 66)
+        self.assertEqual(reservoir.bits_served, 64 + 3 + 100)
+        # no bit is wasted
+        self.assertEqual(
+            pool.bytes_served * 8,
+            reservoir.bits_served + reservoir.available
+        )
+        reservoir.reseed()
+        self.assertEqual(reservoir.available, 0)
+
+        # the module's reservoir follows the module's pool
+        reservoir = passphrase.random.BitReservoir()
+        previous = passphrase.random.get_pool()
+        passphrase.random.set_pool(pool)
+        try:
+            reservoir.randbits(8)
+        finally:
+            passphrase.random.set_pool(previous)
+        self.assertEqual(
+            pool.bytes_served,
+            passphrase.random.RESERVOIR_SIZE * 4
+        )
+
+    def test_bitreservoir_fork(self):
+        passphrase.random.randint(1)
+        self.assertGreater(passphrase.random.get_reservoir().available, 0)
+        rfd, wfd = pipe()
+        pid = fork()
+        if pid == 0:  # pragma: no cover
+            close(rfd)
+            available = passphrase.random.get_reservoir().available
+            write(wfd, bytes((available, )))
+            _exit(0)
+        close(wfd)
+        child = read(rfd, 1)
+        close(rfd)
+        waitpid(pid, 0)
+        self.assertEqual(child, b'\x00')
+
+    def test_set_pool(self):
+        previous = passphrase.random.get_pool()
+        pool = passphrase.random.RandomPool(32)
+        passphrase.random.set_pool(pool)
+        try:
+            passphrase.random.randint(8)
+            self.assertEqual(
+                pool.bytes_served,
+                passphrase.random.RESERVOIR_SIZE
+            )
+        finally:
+            passphrase.random.set_pool(previous)
+        self.assertIs(passphrase.random.get_pool(), previous)
+
+    def test_stats(self):
+        previous = passphrase.random.get_pool()
+        pool = passphrase.random.RandomPool(32)
+        passphrase.random.set_pool(pool)
+        passphrase.random.reset_stats()
+        try:
+            # Not counted until enabled
+            passphrase.random.randbytes(4)
+            self.assertEqual(passphrase.random.stats()['bytes_requested'], 0)
+
+            passphrase.random.enable_stats()
+            passphrase.random.randbytes(4)
+            passphrase.random.randbytes(64)
+            passphrase.random.randint(10)
+            passphrase.random.reseed()
+            stats = passphrase.random.stats()
+            # The pool was filled before, only the bigger request reads
+            self.assertEqual(stats['urandom_calls'], 1)
+            self.assertEqual(stats['urandom_bytes'], 64)
+            self.assertEqual(
+                stats['bytes_requested'],
+                4 + 64 + passphrase.random.RESERVOIR_SIZE
+            )
+            self.assertEqual(stats['bits_requested'], 10)
+            # What's left in the reservoir and in the pool
+            self.assertEqual(
+                stats['bits_discarded'],
+                passphrase.random.RESERVOIR_SIZE * 8 - 10
+                + (32 - 4 - 4 - passphrase.random.RESERVOIR_SIZE) * 8
+            )
+            self.assertEqual(stats['bits_rejected'], 0)
+
+            passphrase.random.reset_stats()
+            self.assertEqual(passphrase.random.stats()['urandom_calls'], 0)
+        finally:
+            passphrase.random.enable_stats(False)
+            passphrase.random.reset_stats()
+            passphrase.random.set_pool(previous)
+
 
 class TestInvalidInputs(TestCase):
 
@@ -91,3 +243,33 @@ class TestInvalidInputs(TestCase):
                 wrongtype)
         self.assertRaises(ValueError, passphrase.random.randbytes, 0)
         self.assertRaises(ValueError, passphrase.random.randbytes, -1)
+
+    def test_randompool(self):
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(
+                TypeError,
+                passphrase.random.RandomPool,
+                wrongtype)
+        self.assertRaises(ValueError, passphrase.random.RandomPool, -1)
+        pool = passphrase.random.RandomPool()
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(TypeError, pool.randbytes, wrongtype)
+        self.assertRaises(ValueError, pool.randbytes, 0)
+
+    def test_set_pool(self):
+        for wrongtype in constants.WRONGTYPES_INT + (None, ):
+            self.assertRaises(
+                TypeError,
+                passphrase.random.set_pool,
+                wrongtype)
+
+    def test_bitreservoir(self):
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(
+                TypeError,
+                passphrase.random.BitReservoir,
+                wrongtype)
+        reservoir = passphrase.random.BitReservoir()
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(TypeError, reservoir.randbits, wrongtype)
+        self.assertRaises(ValueError, reservoir.randbits, 0)
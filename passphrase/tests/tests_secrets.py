@@ -18,9 +18,10 @@
 #
 #  ***************************************************************************
 
-from unittest import TestCase
+from unittest import TestCase, mock
 from string import hexdigits
 
+import passphrase.random
 import passphrase.secrets
 import passphrase.tests.constants as constants
 
@@ -53,6 +54,129 @@ class TestValidInputs(TestCase):
             )
             prev = rand
 
+    def test_stats(self):
+        passphrase.random.reset_stats()
+        passphrase.random.enable_stats()
+        try:
+            with mock.patch.object(passphrase.secrets, 'random_randint',
+                                   side_effect=(7, 6, 1, 3)):
+                self.assertEqual(passphrase.secrets.randbelow(5), 1)
+                self.assertEqual(passphrase.secrets.randbelow(5), 3)
+            alphabet = passphrase.secrets.Alphabet('abc')
+            with mock.patch.object(passphrase.secrets, 'random_randbytes',
+                                   side_effect=(bytes((255, 0, 1)),
+                                                bytes((0, 1, 2)))):
+                self.assertEqual(alphabet.randstring(2), 'ab')
+                self.assertEqual(alphabet.randstring(2), 'ab')
+            stats = passphrase.random.stats()
+        finally:
+            passphrase.random.enable_stats(False)
+            passphrase.random.reset_stats()
+        self.assertEqual(stats['randbelow'], {
+            'randbelow': {3: {'calls': 2, 'retries': 2}},
+        })
+        # The retries and the byte over the threshold, then the byte that
+        # wasn't needed
+        self.assertEqual(stats['bits_rejected'], 2 * 3 + 8)
+        self.assertEqual(stats['bits_discarded'], 8)
+
+    def test_randbelow_lemire(self):
+        self.assertEqual(passphrase.secrets.randbelow_lemire(1), 0)
+        for i in (2, 10, 7777, 900000, 2 ** 64 + 1, 7776 ** 6):
+            rand = passphrase.secrets.randbelow_lemire(i)
+            self.assertIsInstance(rand, int)
+            self.assertIn(rand, range(i))
+
+        numrep = 30000
+        counts = [0] * 5
+        for _ in range(numrep):
+            counts[passphrase.secrets.randbelow_lemire(5)] += 1
+        for count in counts:
+            self.assertTrue(0.18 < count / numrep < 0.22)
+
+        # The rejection path: for 3, the threshold is 2**(2 + extra) % 3 == 1
+        # for an even amount of extra bits
+        extra = passphrase.secrets.RANDBELOW_LEMIRE_EXTRA_BITS
+        with mock.patch('passphrase.secrets.random_randint') as mock_randint:
+            mock_randint.side_effect = (0, 2 ** (extra + 1))
+            self.assertEqual(passphrase.secrets.randbelow_lemire(3), 1)
+            self.assertEqual(mock_randint.call_count, 2)
+
+    def test_randbelow_many(self):
+        self.assertEqual(passphrase.secrets.randbelow_many(10, 0), [])
+        self.assertEqual(passphrase.secrets.randbelow_many(1, 3), [0, 0, 0])
+        for num, amount in ((2, 1), (10, 5), (7776, 6), (94, 100)):
+            rand = passphrase.secrets.randbelow_many(num, amount)
+            self.assertIsInstance(rand, list)
+            self.assertEqual(len(rand), amount)
+            for index in rand:
+                self.assertIn(index, range(num))
+
+        # Large amounts are drawn in chunks
+        chunk = passphrase.secrets.RANDBELOW_MANY_CHUNK
+        with mock.patch(
+                'passphrase.secrets.randbelow_lemire',
+                wraps=passphrase.secrets.randbelow_lemire
+        ) as mock_lemire:
+            rand = passphrase.secrets.randbelow_many(7776, chunk * 2 + 1)
+            self.assertEqual(len(rand), chunk * 2 + 1)
+            self.assertEqual(
+                [call[0][0] for call in mock_lemire.call_args_list],
+                [7776 ** chunk, 7776 ** chunk, 7776]
+            )
+            mock_lemire.reset_mock()
+            passphrase.secrets.randbelow_many(7776, 6)
+            mock_lemire.assert_called_once_with(7776 ** 6)
+
+        # Each position is uniformly distributed
+        numrep = 30000
+        counts = [[0] * 3 for _ in range(4)]
+        for _ in range(numrep):
+            for position, index in enumerate(
+                    passphrase.secrets.randbelow_many(3, 4)
+            ):
+                counts[position][index] += 1
+        for position in counts:
+            for count in position:
+                self.assertTrue(0.3 < count / numrep < 0.367)
+
+    def test_alphabet(self):
+        chars = (
+            'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+            '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~'
+        )
+        alphabet = passphrase.secrets.Alphabet(chars)
+        self.assertEqual(alphabet.chars, chars)
+        self.assertEqual(len(alphabet), 94)
+        self.assertEqual(alphabet.threshold, 188)
+        self.assertEqual(alphabet.randstring(0), '')
+        for length in (1, 12, 300):
+            rand = alphabet.randstring(length)
+            self.assertIsInstance(rand, str)
+            self.assertEqual(len(rand), length)
+            self.assertTrue(set(rand) <= set(chars))
+
+        # Bytes from the threshold up are discarded
+        with mock.patch('passphrase.secrets.random_randbytes') as mock_bytes:
+            mock_bytes.side_effect = (bytes((188, 255, 0)), bytes((95, 93)))
+            self.assertEqual(alphabet.randstring(3), 'ab~')
+            self.assertEqual(mock_bytes.call_count, 2)
+
+        # Every character is equally likely
+        numrep = 94 * 2000
+        counts = dict.fromkeys(chars, 0)
+        for char in alphabet.randstring(numrep):
+            counts[char] += 1
+        for count in counts.values():
+            self.assertTrue(0.85 < count / 2000 < 1.15)
+
+        # Not ASCII
+        alphabet = passphrase.secrets.Alphabet('ñandú')
+        self.assertIsNone(alphabet.threshold)
+        rand = alphabet.randstring(20)
+        self.assertEqual(len(rand), 20)
+        self.assertTrue(set(rand) <= set('ñandú'))
+
     def test_randbetween(self):
         lower = 2
         for upper in (10, 100, 10000):
@@ -106,6 +230,33 @@ class TestInvalidInputs(TestCase):
         self.assertRaises(ValueError, passphrase.secrets.randbelow, 0)
         self.assertRaises(ValueError, passphrase.secrets.randbelow, -1)
 
+    def test_randbelow_lemire(self):
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(
+                TypeError,
+                passphrase.secrets.randbelow_lemire,
+                wrongtype
+            )
+        self.assertRaises(ValueError, passphrase.secrets.randbelow_lemire, 0)
+        self.assertRaises(ValueError, passphrase.secrets.randbelow_lemire, -1)
+
+    def test_randbelow_many(self):
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(
+                TypeError,
+                passphrase.secrets.randbelow_many,
+                wrongtype,
+                1
+            )
+            self.assertRaises(
+                TypeError,
+                passphrase.secrets.randbelow_many,
+                1,
+                wrongtype
+            )
+        self.assertRaises(ValueError, passphrase.secrets.randbelow_many, 0, 1)
+        self.assertRaises(ValueError, passphrase.secrets.randbelow_many, 1, -1)
+
     def test_randbetween(self):
         for wrongtype in constants.WRONGTYPES_INT:
             self.assertRaises(
@@ -125,3 +276,16 @@ class TestInvalidInputs(TestCase):
                 wrongtype)
         self.assertRaises(ValueError, passphrase.secrets.randhex, 0)
         self.assertRaises(ValueError, passphrase.secrets.randhex, -1)
+
+    def test_alphabet(self):
+        for wrongtype in constants.WRONGTYPES_STR:
+            self.assertRaises(
+                TypeError,
+                passphrase.secrets.Alphabet,
+                wrongtype
+            )
+        self.assertRaises(ValueError, passphrase.secrets.Alphabet, '')
+        alphabet = passphrase.secrets.Alphabet('ab')
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(TypeError, alphabet.randstring, wrongtype)
+        self.assertRaises(ValueError, alphabet.randstring, -1)
@@ -0,0 +1,144 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+from string import ascii_lowercase, digits
+from unittest import TestCase
+
+from passphrase.passphrase import Passphrase
+from passphrase.spec import PassphraseSpec
+import passphrase.tests.constants as constants
+
+
+class TestValidInputs(TestCase):
+
+    def test_compile(self):
+        passp = Passphrase('internal')
+        passp.amount_w = 4
+        passp.amount_n = 1
+        passp.passwordlen = 12
+        passp.entropy_bits_req = 77
+        spec = passp.compile()
+        self.assertEqual(spec.amount_w, 4)
+        self.assertEqual(spec.amount_n, 1)
+        self.assertAlmostEqual(spec.passphrase_entropy,
+                               passp.generated_passphrase_entropy())
+        self.assertAlmostEqual(spec.password_entropy,
+                               passp.generated_password_entropy())
+        self.assertEqual(spec.words_amount_needed(77),
+                         passp.words_amount_needed())
+        self.assertEqual(spec.password_length_needed(77),
+                         passp.password_length_needed())
+
+        # Compiled again only when the settings change
+        self.assertIs(passp.compile(), spec)
+        passp.amount_w = 1
+        passp.passwordlen = 3
+        self.assertIsNot(passp.compile(), spec)
+        self.assertEqual(passp.compile().amount_w, 1)
+        # Later changes don't affect the spec
+        self.assertEqual(len(spec.sample()), 5)
+        self.assertEqual(len(spec.generate().split()), 5)
+        self.assertEqual(len(spec.generate_password()), 12)
+
+    def test_generate(self):
+        spec = PassphraseSpec(constants.WORDS, amount_w=3, amount_n=2,
+                              separator='-', randnum_min=5, randnum_max=7)
+        items = spec.generate_many(50)
+        self.assertEqual(len(items), 50)
+        for item in items:
+            parts = item.split('-')
+            self.assertEqual(len(parts), 5)
+            for word in parts[:3]:
+                self.assertIn(word, constants.WORDS)
+            for number in parts[3:]:
+                self.assertIn(int(number), (5, 6, 7))
+        self.assertEqual(spec.generate_many(0), [])
+
+        spec = PassphraseSpec(constants.WORDS, amount_w=3, amount_n=0,
+                              uppercase=0)
+        self.assertAlmostEqual(spec.passphrase_entropy,
+                               3 * spec.words_entropy)
+        for word in spec.sample():
+            self.assertEqual(word, word.upper())
+
+    def test_generate_password(self):
+        spec = PassphraseSpec(charset=digits, passwordlen=20)
+        items = spec.generate_password_many(20)
+        self.assertEqual(len(items), 20)
+        for item in items:
+            self.assertEqual(len(item), 20)
+            self.assertTrue(item.isdigit())
+        self.assertEqual(len(spec.generate_password()), 20)
+        self.assertAlmostEqual(spec.char_entropy, 3.32, places=2)
+        self.assertEqual(spec.password_length_needed(64), 20)
+
+    def test_immutable(self):
+        spec = PassphraseSpec(charset=ascii_lowercase, passwordlen=8)
+        with self.assertRaises(AttributeError):
+            spec.passwordlen = 9
+        with self.assertRaises(AttributeError):
+            spec._passwordlen = 9
+        with self.assertRaises(AttributeError):
+            del spec.charset
+        with self.assertRaises(AttributeError):
+            spec.newattr = 1
+        self.assertIn('passwordlen=8', repr(spec))
+
+
+class TestInvalidInputs(TestCase):
+
+    def test_init(self):
+        for wrongtype in constants.WRONGTYPES_INT:
+            if wrongtype is None:
+                continue
+            for name in ('amount_w', 'amount_n', 'passwordlen', 'uppercase'):
+                self.assertRaises(TypeError, PassphraseSpec,
+                                  **{name: wrongtype})
+        for wrongtype in constants.WRONGTYPES_STR:
+            self.assertRaises(TypeError, PassphraseSpec, separator=wrongtype)
+            self.assertRaises(TypeError, PassphraseSpec, charset=wrongtype)
+        self.assertRaises(TypeError, PassphraseSpec, 'words')
+        self.assertRaises(TypeError, PassphraseSpec, {'a', 'b'})
+        self.assertRaises(ValueError, PassphraseSpec, amount_w=-1)
+        self.assertRaises(ValueError, PassphraseSpec, amount_n=1,
+                          randnum_min=10, randnum_max=1)
+
+    def test_generate(self):
+        spec = PassphraseSpec()
+        self.assertRaises(ValueError, spec.sample)
+        self.assertRaises(ValueError, spec.generate)
+        self.assertRaises(ValueError, spec.generate_many, 0)
+        self.assertRaises(ValueError, spec.generate_password)
+        self.assertRaises(ValueError, spec.generate_password_many, 0)
+        self.assertRaises(ValueError, spec.words_amount_needed, 77)
+        self.assertRaises(ValueError, spec.password_length_needed, 77)
+        self.assertRaises(ValueError, PassphraseSpec(amount_w=2).generate)
+
+        spec = PassphraseSpec(constants.WORDS, amount_w=2,
+                              charset=digits, passwordlen=2)
+        for wrongtype in constants.WRONGTYPES_INT:
+            self.assertRaises(TypeError, spec.generate_many, wrongtype)
+            self.assertRaises(TypeError, spec.generate_password_many,
+                              wrongtype)
+        self.assertRaises(ValueError, spec.generate_many, -1)
+        self.assertRaises(ValueError, spec.generate_password_many, -1)
+        for wrongtype in constants.WRONGTYPES_INT_FLOAT:
+            self.assertRaises(TypeError, spec.password_length_needed,
+                              wrongtype)
@@ -0,0 +1,164 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+from os import utime, stat, listdir
+from os.path import join as os_path_join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+from passphrase.packed import PackedWordlist
+import passphrase.wordcache
+import passphrase.tests.constants as constants
+
+
+class TestValidInputs(TestCase):
+
+    def setUp(self):
+        self._tmpdir = TemporaryDirectory()
+        self.tmpdir = self._tmpdir.name
+        self.cachedir = os_path_join(self.tmpdir, 'cache')
+        self._cache_dir = mock.patch(
+            'passphrase.wordcache.WORDLIST_CACHE_DIR',
+            self.cachedir
+        )
+        self._cache_dir.start()
+
+        self.words_file = os_path_join(self.tmpdir, 'words.list')
+        with open(self.words_file, mode='wt', encoding='utf-8') as wordfile:
+            wordfile.write('\n'.join(constants.WORDS))
+        self.wordsd_file = os_path_join(self.tmpdir, 'wordsd.list')
+        with open(self.wordsd_file, mode='wt', encoding='utf-8') as wordfile:
+            wordfile.write('\n'.join(constants.WORDSD))
+
+    def tearDown(self):
+        self._cache_dir.stop()
+        self._tmpdir.cleanup()
+
+    def test_read_words(self):
+        self.assertEqual(
+            passphrase.wordcache.read_words(self.words_file, False),
+            constants.WORDS
+        )
+        self.assertEqual(
+            passphrase.wordcache.read_words(self.wordsd_file, True),
+            [word.split()[1] for word in constants.WORDSD]
+        )
+
+    def test_cache_dir(self):
+        self.assertEqual(passphrase.wordcache.cache_dir(), self.cachedir)
+        with mock.patch('passphrase.wordcache.WORDLIST_CACHE_DIR', None):
+            with mock.patch.dict(
+                    'passphrase.wordcache.environ',
+                    {'XDG_CACHE_HOME': '/somedir'}
+            ):
+                self.assertEqual(
+                    passphrase.wordcache.cache_dir(),
+                    '/somedir/passphrase'
+                )
+
+    def test_cache_filename(self):
+        filename = passphrase.wordcache.cache_filename(self.words_file, False)
+        self.assertTrue(filename.startswith(self.cachedir))
+        self.assertTrue(filename.endswith(passphrase.wordcache.CACHE_SUFFIX))
+        self.assertNotEqual(
+            filename,
+            passphrase.wordcache.cache_filename(self.words_file, True)
+        )
+        self.assertEqual(
+            filename,
+            passphrase.wordcache.cache_filename(
+                os_path_join(self.tmpdir, '.', 'words.list'),
+                False
+            )
+        )
+
+    def test_load_wordlist(self):
+        load_wordlist = passphrase.wordcache.load_wordlist
+        words, entropy, normalized = load_wordlist(self.words_file, False)
+        self.assertIsInstance(words, PackedWordlist)
+        self.assertEqual(words, constants.WORDS)
+        self.assertAlmostEqual(entropy, constants.WORDS_ENTROPY, places=2)
+        self.assertTrue(normalized)
+        self.assertEqual(len(listdir(self.cachedir)), 1)
+
+        with mock.patch('passphrase.wordcache.read_words') as mock_read:
+            words, entropy, normalized = load_wordlist(self.words_file, False)
+            mock_read.assert_not_called()
+        self.assertIsInstance(words, PackedWordlist)
+        self.assertEqual(words, constants.WORDS)
+        self.assertAlmostEqual(entropy, constants.WORDS_ENTROPY, places=2)
+        self.assertTrue(normalized)
+
+        # Changed files are compiled again
+        with open(self.words_file, mode='at', encoding='utf-8') as wordfile:
+            wordfile.write('\nNew')
+        words, entropy, normalized = load_wordlist(self.words_file, False)
+        self.assertEqual(words, constants.WORDS + ['New'])
+        self.assertFalse(normalized)
+        filestat = stat(self.words_file)
+        utime(
+            self.words_file,
+            ns=(filestat.st_atime_ns, filestat.st_mtime_ns + 1000)
+        )
+        with mock.patch(
+                'passphrase.wordcache.read_words',
+                wraps=passphrase.wordcache.read_words
+        ) as mock_read:
+            load_wordlist(self.words_file, False)
+            words, _, normalized = load_wordlist(self.words_file, False)
+            mock_read.assert_called_once_with(self.words_file, False)
+        self.assertIsInstance(words, PackedWordlist)
+        self.assertEqual(words, constants.WORDS + ['New'])
+        self.assertFalse(normalized)
+        self.assertEqual(len(listdir(self.cachedir)), 1)
+
+    def test_load_wordlist_no_cache(self):
+        with mock.patch('passphrase.wordcache.WORDLIST_CACHE', False):
+            words, entropy, normalized = passphrase.wordcache.load_wordlist(
+                self.wordsd_file,
+                True
+            )
+        self.assertEqual(words, [word.split()[1] for word in constants.WORDSD])
+        self.assertIsNone(entropy)
+        self.assertFalse(normalized)
+
+        # A cache that can't be written is ignored
+        with mock.patch(
+                'passphrase.wordcache.WORDLIST_CACHE_DIR',
+                os_path_join(self.words_file, 'cache')
+        ):
+            words, _, _ = passphrase.wordcache.load_wordlist(
+                self.words_file,
+                False
+            )
+        self.assertIsInstance(words, PackedWordlist)
+        self.assertEqual(words, constants.WORDS)
+
+
+class TestInvalidInputs(TestCase):
+
+    def test_load_wordlist(self):
+        with TemporaryDirectory() as tmpdir:
+            self.assertRaises(
+                FileNotFoundError,
+                passphrase.wordcache.load_wordlist,
+                os_path_join(tmpdir, 'inexistent.list'),
+                False
+            )
@@ -0,0 +1,136 @@
+#  ***************************************************************************
+#  This file is part of Passphrase:
+#  A cryptographically secure passphrase and password generator
+#  Copyright (C) <2017>  <Ivan Ariel Barrera Oro>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  ***************************************************************************
+
+"""Cache of compiled wordlists.
+
+Text and diceware wordlists are compiled to the binary wordlist format (see
+packed) the first time they are loaded, and mapped from the cache from then
+on. Each wordlist has a cache file named after its path and format, which is
+valid while the wordlist keeps its modification time and size.
+
+"""
+
+from hashlib import sha256
+from os import environ, makedirs, stat
+from os.path import expanduser, join as os_path_join, realpath
+from typing import Tuple, Union
+
+from .calc import entropy_bits as calc_entropy_bits
+from .packed import PackedWordlist, FLAG_NORMALIZED
+from .packed import dump as packed_dump, load as packed_load
+from .settings import WORDLIST_CACHE, WORDLIST_CACHE_DIR
+
+__version__ = '0.1.0'
+
+CACHE_SUFFIX = '.ppwl'
+
+
+def read_words(inputfile: str, is_diceware: bool) -> list:
+    """Read the words from a text wordlist file.
+
+    Keyword arguments:
+    inputfile -- A string with the path to the wordlist file.
+    is_diceware -- True if the file is diceware-like (two columns).
+
+    """
+    with open(inputfile, mode='rt') as wordfile:
+        if is_diceware:
+            return [word.split()[1] for word in wordfile]
+        return [word.strip() for word in wordfile]
+
+
+def cache_dir() -> str:
+    """Return the directory where compiled wordlists are kept."""
+    if WORDLIST_CACHE_DIR:
+        return WORDLIST_CACHE_DIR
+
+    return os_path_join(
+        environ.get('XDG_CACHE_HOME') or expanduser('~/.cache'),
+        'passphrase'
+    )
+
+
+def cache_filename(inputfile: str, is_diceware: bool) -> str:
+    """Return the path of the compiled wordlist for the given file."""
+    key = '{}\0{}'.format(realpath(inputfile), int(bool(is_diceware)))
+    return os_path_join(
+        cache_dir(),
+        sha256(key.encode('utf-8', 'surrogateescape')).hexdigest()
+        + CACHE_SUFFIX
+    )
+
+
+def load_wordlist(
+        inputfile: str,
+        is_diceware: bool
+) -> Tuple[Union[PackedWordlist, list], Union[float, None], bool]:
+    """Load a text wordlist file, through the cache if enabled.
+
+    Return the words, their entropy in bits (None if unknown) and whether
+    they are all lowercase already. With the cache enabled the words are
+    always a PackedWordlist, whether they came from the cache or not (unless
+    they can't be packed). A cache that can't be read or written is ignored.
+
+    Keyword arguments:
+    inputfile -- A string with the path to the wordlist file.
+    is_diceware -- True if the file is diceware-like (two columns).
+
+    """
+    if not WORDLIST_CACHE:
+        return read_words(inputfile, is_diceware), None, False
+
+    filestat = stat(inputfile)
+    filename = cache_filename(inputfile, is_diceware)
+    try:
+        words, header = packed_load(filename)
+    except (OSError, ValueError):
+        pass
+    else:
+        if (
+                header.mtime == filestat.st_mtime_ns
+                and header.size == filestat.st_size
+        ):
+            return words, header.entropy, bool(header.flags & FLAG_NORMALIZED)
+
+    wordlist = read_words(inputfile, is_diceware)
+    entropy = calc_entropy_bits(wordlist)
+    normalized = all(word == word.lower() for word in wordlist)
+    try:
+        words = PackedWordlist.from_words(wordlist)
+    except ValueError:
+        # Can't be packed (i.e.: words with newlines)
+        return wordlist, entropy, normalized
+
+    try:
+        makedirs(cache_dir(), mode=0o700, exist_ok=True)
+        packed_dump(
+            words,
+            filename,
+            entropy,
+            flags=FLAG_NORMALIZED if normalized else 0,
+            mtime=filestat.st_mtime_ns,
+            size=filestat.st_size
+        )
+    except (OSError, ValueError):
+        # Can't be cached, but it's returned packed anyway so the result
+        # doesn't depend on the state of the cache
+        pass
+
+    return words, entropy, normalized
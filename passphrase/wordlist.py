@@ -1,7786 +1,1042 @@
 """Internal wordlist for Passphrase.
 
-Currently, it only holds the EFF long wordlist.
+Currently, it only holds the EFF long wordlist, packed in a single blob: see
+PackedWordlist.
 
 """
 
+from .packed import PackedWordlist
+
 # https://www.eff.org/es/document/passphrase-wordlists
 EFF_LONG_WORDLIST_ENTROPY = 12.92481
-EFF_LONG_WORDLIST = (
-    'abacus',
-    'abdomen',
-    'abdominal',
-    'abide',
-    'abiding',
-    'ability',
-    'ablaze',
-    'able',
-    'abnormal',
-    'abrasion',
-    'abrasive',
-    'abreast',
-    'abridge',
-    'abroad',
-    'abruptly',
-    'absence',
-    'absentee',
-    'absently',
-    'absinthe',
-    'absolute',
-    'absolve',
-    'abstain',
-    'abstract',
-    'absurd',
-    'accent',
-    'acclaim',
-    'acclimate',
-    'accompany',
-    'account',
-    'accuracy',
-    'accurate',
-    'accustom',
-    'acetone',
-    'achiness',
-    'aching',
-    'acid',
-    'acorn',
-    'acquaint',
-    'acquire',
-    'acre',
-    'acrobat',
-    'acronym',
-    'acting',
-    'action',
-    'activate',
-    'activator',
-    'active',
-    'activism',
-    'activist',
-    'activity',
-    'actress',
-    'acts',
-    'acutely',
-    'acuteness',
-    'aeration',
-    'aerobics',
-    'aerosol',
-    'aerospace',
-    'afar',
-    'affair',
-    'affected',
-    'affecting',
-    'affection',
-    'affidavit',
-    'affiliate',
-    'affirm',
-    'affix',
-    'afflicted',
-    'affluent',
-    'afford',
-    'affront',
-    'aflame',
-    'afloat',
-    'aflutter',
-    'afoot',
-    'afraid',
-    'afterglow',
-    'afterlife',
-    'aftermath',
-    'aftermost',
-    'afternoon',
-    'aged',
-    'ageless',
-    'agency',
-    'agenda',
-    'agent',
-    'aggregate',
-    'aghast',
-    'agile',
-    'agility',
-    'aging',
-    'agnostic',
-    'agonize',
-    'agonizing',
-    'agony',
-    'agreeable',
-    'agreeably',
-    'agreed',
-    'agreeing',
-    'agreement',
-    'aground',
-    'ahead',
-    'ahoy',
-    'aide',
-    'aids',
-    'aim',
-    'ajar',
-    'alabaster',
-    'alarm',
-    'albatross',
-    'album',
-    'alfalfa',
-    'algebra',
-    'algorithm',
-    'alias',
-    'alibi',
-    'alienable',
-    'alienate',
-    'aliens',
-    'alike',
-    'alive',
-    'alkaline',
-    'alkalize',
-    'almanac',
-    'almighty',
-    'almost',
-    'aloe',
-    'aloft',
-    'aloha',
-    'alone',
-    'alongside',
-    'aloof',
-    'alphabet',
-    'alright',
-    'although',
-    'altitude',
-    'alto',
-    'aluminum',
-    'alumni',
-    'always',
-    'amaretto',
-    'amaze',
-    'amazingly',
-    'amber',
-    'ambiance',
-    'ambiguity',
-    'ambiguous',
-    'ambition',
-    'ambitious',
-    'ambulance',
-    'ambush',
-    'amendable',
-    'amendment',
-    'amends',
-    'amenity',
-    'amiable',
-    'amicably',
-    'amid',
-    'amigo',
-    'amino',
-    'amiss',
-    'ammonia',
-    'ammonium',
-    'amnesty',
-    'amniotic',
-    'among',
-    'amount',
-    'amperage',
-    'ample',
-    'amplifier',
-    'amplify',
-    'amply',
-    'amuck',
-    'amulet',
-    'amusable',
-    'amused',
-    'amusement',
-    'amuser',
-    'amusing',
-    'anaconda',
-    'anaerobic',
-    'anagram',
-    'anatomist',
-    'anatomy',
-    'anchor',
-    'anchovy',
-    'ancient',
-    'android',
-    'anemia',
-    'anemic',
-    'aneurism',
-    'anew',
-    'angelfish',
-    'angelic',
-    'anger',
-    'angled',
-    'angler',
-    'angles',
-    'angling',
-    'angrily',
-    'angriness',
-    'anguished',
-    'angular',
-    'animal',
-    'animate',
-    'animating',
-    'animation',
-    'animator',
-    'anime',
-    'animosity',
-    'ankle',
-    'annex',
-    'annotate',
-    'announcer',
-    'annoying',
-    'annually',
-    'annuity',
-    'anointer',
-    'another',
-    'answering',
-    'antacid',
-    'antarctic',
-    'anteater',
-    'antelope',
-    'antennae',
-    'anthem',
-    'anthill',
-    'anthology',
-    'antibody',
-    'antics',
-    'antidote',
-    'antihero',
-    'antiquely',
-    'antiques',
-    'antiquity',
-    'antirust',
-    'antitoxic',
-    'antitrust',
-    'antiviral',
-    'antivirus',
-    'antler',
-    'antonym',
-    'antsy',
-    'anvil',
-    'anybody',
-    'anyhow',
-    'anymore',
-    'anyone',
-    'anyplace',
-    'anything',
-    'anytime',
-    'anyway',
-    'anywhere',
-    'aorta',
-    'apache',
-    'apostle',
-    'appealing',
-    'appear',
-    'appease',
-    'appeasing',
-    'appendage',
-    'appendix',
-    'appetite',
-    'appetizer',
-    'applaud',
-    'applause',
-    'apple',
-    'appliance',
-    'applicant',
-    'applied',
-    'apply',
-    'appointee',
-    'appraisal',
-    'appraiser',
-    'apprehend',
-    'approach',
-    'approval',
-    'approve',
-    'apricot',
-    'april',
-    'apron',
-    'aptitude',
-    'aptly',
-    'aqua',
-    'aqueduct',
-    'arbitrary',
-    'arbitrate',
-    'ardently',
-    'area',
-    'arena',
-    'arguable',
-    'arguably',
-    'argue',
-    'arise',
-    'armadillo',
-    'armband',
-    'armchair',
-    'armed',
-    'armful',
-    'armhole',
-    'arming',
-    'armless',
-    'armoire',
-    'armored',
-    'armory',
-    'armrest',
-    'army',
-    'aroma',
-    'arose',
-    'around',
-    'arousal',
-    'arrange',
-    'array',
-    'arrest',
-    'arrival',
-    'arrive',
-    'arrogance',
-    'arrogant',
-    'arson',
-    'art',
-    'ascend',
-    'ascension',
-    'ascent',
-    'ascertain',
-    'ashamed',
-    'ashen',
-    'ashes',
-    'ashy',
-    'aside',
-    'askew',
-    'asleep',
-    'asparagus',
-    'aspect',
-    'aspirate',
-    'aspire',
-    'aspirin',
-    'astonish',
-    'astound',
-    'astride',
-    'astrology',
-    'astronaut',
-    'astronomy',
-    'astute',
-    'atlantic',
-    'atlas',
-    'atom',
-    'atonable',
-    'atop',
-    'atrium',
-    'atrocious',
-    'atrophy',
-    'attach',
-    'attain',
-    'attempt',
-    'attendant',
-    'attendee',
-    'attention',
-    'attentive',
-    'attest',
-    'attic',
-    'attire',
-    'attitude',
-    'attractor',
-    'attribute',
-    'atypical',
-    'auction',
-    'audacious',
-    'audacity',
-    'audible',
-    'audibly',
-    'audience',
-    'audio',
-    'audition',
-    'augmented',
-    'august',
-    'authentic',
-    'author',
-    'autism',
-    'autistic',
-    'autograph',
-    'automaker',
-    'automated',
-    'automatic',
-    'autopilot',
-    'available',
-    'avalanche',
-    'avatar',
-    'avenge',
-    'avenging',
-    'avenue',
-    'average',
-    'aversion',
-    'avert',
-    'aviation',
-    'aviator',
-    'avid',
-    'avoid',
-    'await',
-    'awaken',
-    'award',
-    'aware',
-    'awhile',
-    'awkward',
-    'awning',
-    'awoke',
-    'awry',
-    'axis',
-    'babble',
-    'babbling',
-    'babied',
-    'baboon',
-    'backache',
-    'backboard',
-    'backboned',
-    'backdrop',
-    'backed',
-    'backer',
-    'backfield',
-    'backfire',
-    'backhand',
-    'backing',
-    'backlands',
-    'backlash',
-    'backless',
-    'backlight',
-    'backlit',
-    'backlog',
-    'backpack',
-    'backpedal',
-    'backrest',
-    'backroom',
-    'backshift',
-    'backside',
-    'backslid',
-    'backspace',
-    'backspin',
-    'backstab',
-    'backstage',
-    'backtalk',
-    'backtrack',
-    'backup',
-    'backward',
-    'backwash',
-    'backwater',
-    'backyard',
-    'bacon',
-    'bacteria',
-    'bacterium',
-    'badass',
-    'badge',
-    'badland',
-    'badly',
-    'badness',
-    'baffle',
-    'baffling',
-    'bagel',
-    'bagful',
-    'baggage',
-    'bagged',
-    'baggie',
-    'bagginess',
-    'bagging',
-    'baggy',
-    'bagpipe',
-    'baguette',
-    'baked',
-    'bakery',
-    'bakeshop',
-    'baking',
-    'balance',
-    'balancing',
-    'balcony',
-    'balmy',
-    'balsamic',
-    'bamboo',
-    'banana',
-    'banish',
-    'banister',
-    'banjo',
-    'bankable',
-    'bankbook',
-    'banked',
-    'banker',
-    'banking',
-    'banknote',
-    'bankroll',
-    'banner',
-    'bannister',
-    'banshee',
-    'banter',
-    'barbecue',
-    'barbed',
-    'barbell',
-    'barber',
-    'barcode',
-    'barge',
-    'bargraph',
-    'barista',
-    'baritone',
-    'barley',
-    'barmaid',
-    'barman',
-    'barn',
-    'barometer',
-    'barrack',
-    'barracuda',
-    'barrel',
-    'barrette',
-    'barricade',
-    'barrier',
-    'barstool',
-    'bartender',
-    'barterer',
-    'bash',
-    'basically',
-    'basics',
-    'basil',
-    'basin',
-    'basis',
-    'basket',
-    'batboy',
-    'batch',
-    'bath',
-    'baton',
-    'bats',
-    'battalion',
-    'battered',
-    'battering',
-    'battery',
-    'batting',
-    'battle',
-    'bauble',
-    'bazooka',
-    'blabber',
-    'bladder',
-    'blade',
-    'blah',
-    'blame',
-    'blaming',
-    'blanching',
-    'blandness',
-    'blank',
-    'blaspheme',
-    'blasphemy',
-    'blast',
-    'blatancy',
-    'blatantly',
-    'blazer',
-    'blazing',
-    'bleach',
-    'bleak',
-    'bleep',
-    'blemish',
-    'blend',
-    'bless',
-    'blighted',
-    'blimp',
-    'bling',
-    'blinked',
-    'blinker',
-    'blinking',
-    'blinks',
-    'blip',
-    'blissful',
-    'blitz',
-    'blizzard',
-    'bloated',
-    'bloating',
-    'blob',
-    'blog',
-    'bloomers',
-    'blooming',
-    'blooper',
-    'blot',
-    'blouse',
-    'blubber',
-    'bluff',
-    'bluish',
-    'blunderer',
-    'blunt',
-    'blurb',
-    'blurred',
-    'blurry',
-    'blurt',
-    'blush',
-    'blustery',
-    'boaster',
-    'boastful',
-    'boasting',
-    'boat',
-    'bobbed',
-    'bobbing',
-    'bobble',
-    'bobcat',
-    'bobsled',
-    'bobtail',
-    'bodacious',
-    'body',
-    'bogged',
-    'boggle',
-    'bogus',
-    'boil',
-    'bok',
-    'bolster',
-    'bolt',
-    'bonanza',
-    'bonded',
-    'bonding',
-    'bondless',
-    'boned',
-    'bonehead',
-    'boneless',
-    'bonelike',
-    'boney',
-    'bonfire',
-    'bonnet',
-    'bonsai',
-    'bonus',
-    'bony',
-    'boogeyman',
-    'boogieman',
-    'book',
-    'boondocks',
-    'booted',
-    'booth',
-    'bootie',
-    'booting',
-    'bootlace',
-    'bootleg',
-    'boots',
-    'boozy',
-    'borax',
-    'boring',
-    'borough',
-    'borrower',
-    'borrowing',
-    'boss',
-    'botanical',
-    'botanist',
-    'botany',
-    'botch',
-    'both',
-    'bottle',
-    'bottling',
-    'bottom',
-    'bounce',
-    'bouncing',
-    'bouncy',
-    'bounding',
-    'boundless',
-    'bountiful',
-    'bovine',
-    'boxcar',
-    'boxer',
-    'boxing',
-    'boxlike',
-    'boxy',
-    'breach',
-    'breath',
-    'breeches',
-    'breeching',
-    'breeder',
-    'breeding',
-    'breeze',
-    'breezy',
-    'brethren',
-    'brewery',
-    'brewing',
-    'briar',
-    'bribe',
-    'brick',
-    'bride',
-    'bridged',
-    'brigade',
-    'bright',
-    'brilliant',
-    'brim',
-    'bring',
-    'brink',
-    'brisket',
-    'briskly',
-    'briskness',
-    'bristle',
-    'brittle',
-    'broadband',
-    'broadcast',
-    'broaden',
-    'broadly',
-    'broadness',
-    'broadside',
-    'broadways',
-    'broiler',
-    'broiling',
-    'broken',
-    'broker',
-    'bronchial',
-    'bronco',
-    'bronze',
-    'bronzing',
-    'brook',
-    'broom',
-    'brought',
-    'browbeat',
-    'brownnose',
-    'browse',
-    'browsing',
-    'bruising',
-    'brunch',
-    'brunette',
-    'brunt',
-    'brush',
-    'brussels',
-    'brute',
-    'brutishly',
-    'bubble',
-    'bubbling',
-    'bubbly',
-    'buccaneer',
-    'bucked',
-    'bucket',
-    'buckle',
-    'buckshot',
-    'buckskin',
-    'bucktooth',
-    'buckwheat',
-    'buddhism',
-    'buddhist',
-    'budding',
-    'buddy',
-    'budget',
-    'buffalo',
-    'buffed',
-    'buffer',
-    'buffing',
-    'buffoon',
-    'buggy',
-    'bulb',
-    'bulge',
-    'bulginess',
-    'bulgur',
-    'bulk',
-    'bulldog',
-    'bulldozer',
-    'bullfight',
-    'bullfrog',
-    'bullhorn',
-    'bullion',
-    'bullish',
-    'bullpen',
-    'bullring',
-    'bullseye',
-    'bullwhip',
-    'bully',
-    'bunch',
-    'bundle',
-    'bungee',
-    'bunion',
-    'bunkbed',
-    'bunkhouse',
-    'bunkmate',
-    'bunny',
-    'bunt',
-    'busboy',
-    'bush',
-    'busily',
-    'busload',
-    'bust',
-    'busybody',
-    'buzz',
-    'cabana',
-    'cabbage',
-    'cabbie',
-    'cabdriver',
-    'cable',
-    'caboose',
-    'cache',
-    'cackle',
-    'cacti',
-    'cactus',
-    'caddie',
-    'caddy',
-    'cadet',
-    'cadillac',
-    'cadmium',
-    'cage',
-    'cahoots',
-    'cake',
-    'calamari',
-    'calamity',
-    'calcium',
-    'calculate',
-    'calculus',
-    'caliber',
-    'calibrate',
-    'calm',
-    'caloric',
-    'calorie',
-    'calzone',
-    'camcorder',
-    'cameo',
-    'camera',
-    'camisole',
-    'camper',
-    'campfire',
-    'camping',
-    'campsite',
-    'campus',
-    'canal',
-    'canary',
-    'cancel',
-    'candied',
-    'candle',
-    'candy',
-    'cane',
-    'canine',
-    'canister',
-    'cannabis',
-    'canned',
-    'canning',
-    'cannon',
-    'cannot',
-    'canola',
-    'canon',
-    'canopener',
-    'canopy',
-    'canteen',
-    'canyon',
-    'capable',
-    'capably',
-    'capacity',
-    'cape',
-    'capillary',
-    'capital',
-    'capitol',
-    'capped',
-    'capricorn',
-    'capsize',
-    'capsule',
-    'caption',
-    'captivate',
-    'captive',
-    'captivity',
-    'capture',
-    'caramel',
-    'carat',
-    'caravan',
-    'carbon',
-    'cardboard',
-    'carded',
-    'cardiac',
-    'cardigan',
-    'cardinal',
-    'cardstock',
-    'carefully',
-    'caregiver',
-    'careless',
-    'caress',
-    'caretaker',
-    'cargo',
-    'caring',
-    'carless',
-    'carload',
-    'carmaker',
-    'carnage',
-    'carnation',
-    'carnival',
-    'carnivore',
-    'carol',
-    'carpenter',
-    'carpentry',
-    'carpool',
-    'carport',
-    'carried',
-    'carrot',
-    'carrousel',
-    'carry',
-    'cartel',
-    'cartload',
-    'carton',
-    'cartoon',
-    'cartridge',
-    'cartwheel',
-    'carve',
-    'carving',
-    'carwash',
-    'cascade',
-    'case',
-    'cash',
-    'casing',
-    'casino',
-    'casket',
-    'cassette',
-    'casually',
-    'casualty',
-    'catacomb',
-    'catalog',
-    'catalyst',
-    'catalyze',
-    'catapult',
-    'cataract',
-    'catatonic',
-    'catcall',
-    'catchable',
-    'catcher',
-    'catching',
-    'catchy',
-    'caterer',
-    'catering',
-    'catfight',
-    'catfish',
-    'cathedral',
-    'cathouse',
-    'catlike',
-    'catnap',
-    'catnip',
-    'catsup',
-    'cattail',
-    'cattishly',
-    'cattle',
-    'catty',
-    'catwalk',
-    'caucasian',
-    'caucus',
-    'causal',
-    'causation',
-    'cause',
-    'causing',
-    'cauterize',
-    'caution',
-    'cautious',
-    'cavalier',
-    'cavalry',
-    'caviar',
-    'cavity',
-    'cedar',
-    'celery',
-    'celestial',
-    'celibacy',
-    'celibate',
-    'celtic',
-    'cement',
-    'census',
-    'ceramics',
-    'ceremony',
-    'certainly',
-    'certainty',
-    'certified',
-    'certify',
-    'cesarean',
-    'cesspool',
-    'chafe',
-    'chaffing',
-    'chain',
-    'chair',
-    'chalice',
-    'challenge',
-    'chamber',
-    'chamomile',
-    'champion',
-    'chance',
-    'change',
-    'channel',
-    'chant',
-    'chaos',
-    'chaperone',
-    'chaplain',
-    'chapped',
-    'chaps',
-    'chapter',
-    'character',
-    'charbroil',
-    'charcoal',
-    'charger',
-    'charging',
-    'chariot',
-    'charity',
-    'charm',
-    'charred',
-    'charter',
-    'charting',
-    'chase',
-    'chasing',
-    'chaste',
-    'chastise',
-    'chastity',
-    'chatroom',
-    'chatter',
-    'chatting',
-    'chatty',
-    'cheating',
-    'cheddar',
-    'cheek',
-    'cheer',
-    'cheese',
-    'cheesy',
-    'chef',
-    'chemicals',
-    'chemist',
-    'chemo',
-    'cherisher',
-    'cherub',
-    'chess',
-    'chest',
-    'chevron',
-    'chevy',
-    'chewable',
-    'chewer',
-    'chewing',
-    'chewy',
-    'chief',
-    'chihuahua',
-    'childcare',
-    'childhood',
-    'childish',
-    'childless',
-    'childlike',
-    'chili',
-    'chill',
-    'chimp',
-    'chip',
-    'chirping',
-    'chirpy',
-    'chitchat',
-    'chivalry',
-    'chive',
-    'chloride',
-    'chlorine',
-    'choice',
-    'chokehold',
-    'choking',
-    'chomp',
-    'chooser',
-    'choosing',
-    'choosy',
-    'chop',
-    'chosen',
-    'chowder',
-    'chowtime',
-    'chrome',
-    'chubby',
-    'chuck',
-    'chug',
-    'chummy',
-    'chump',
-    'chunk',
-    'churn',
-    'chute',
-    'cider',
-    'cilantro',
-    'cinch',
-    'cinema',
-    'cinnamon',
-    'circle',
-    'circling',
-    'circular',
-    'circulate',
-    'circus',
-    'citable',
-    'citadel',
-    'citation',
-    'citizen',
-    'citric',
-    'citrus',
-    'city',
-    'civic',
-    'civil',
-    'clad',
-    'claim',
-    'clambake',
-    'clammy',
-    'clamor',
-    'clamp',
-    'clamshell',
-    'clang',
-    'clanking',
-    'clapped',
-    'clapper',
-    'clapping',
-    'clarify',
-    'clarinet',
-    'clarity',
-    'clash',
-    'clasp',
-    'class',
-    'clatter',
-    'clause',
-    'clavicle',
-    'claw',
-    'clay',
-    'clean',
-    'clear',
-    'cleat',
-    'cleaver',
-    'cleft',
-    'clench',
-    'clergyman',
-    'clerical',
-    'clerk',
-    'clever',
-    'clicker',
-    'client',
-    'climate',
-    'climatic',
-    'cling',
-    'clinic',
-    'clinking',
-    'clip',
-    'clique',
-    'cloak',
-    'clobber',
-    'clock',
-    'clone',
-    'cloning',
-    'closable',
-    'closure',
-    'clothes',
-    'clothing',
-    'cloud',
-    'clover',
-    'clubbed',
-    'clubbing',
-    'clubhouse',
-    'clump',
-    'clumsily',
-    'clumsy',
-    'clunky',
-    'clustered',
-    'clutch',
-    'clutter',
-    'coach',
-    'coagulant',
-    'coastal',
-    'coaster',
-    'coasting',
-    'coastland',
-    'coastline',
-    'coat',
-    'coauthor',
-    'cobalt',
-    'cobbler',
-    'cobweb',
-    'cocoa',
-    'coconut',
-    'cod',
-    'coeditor',
-    'coerce',
-    'coexist',
-    'coffee',
-    'cofounder',
-    'cognition',
-    'cognitive',
-    'cogwheel',
-    'coherence',
-    'coherent',
-    'cohesive',
-    'coil',
-    'coke',
-    'cola',
-    'cold',
-    'coleslaw',
-    'coliseum',
-    'collage',
-    'collapse',
-    'collar',
-    'collected',
-    'collector',
-    'collide',
-    'collie',
-    'collision',
-    'colonial',
-    'colonist',
-    'colonize',
-    'colony',
-    'colossal',
-    'colt',
-    'coma',
-    'come',
-    'comfort',
-    'comfy',
-    'comic',
-    'coming',
-    'comma',
-    'commence',
-    'commend',
-    'comment',
-    'commerce',
-    'commode',
-    'commodity',
-    'commodore',
-    'common',
-    'commotion',
-    'commute',
-    'commuting',
-    'compacted',
-    'compacter',
-    'compactly',
-    'compactor',
-    'companion',
-    'company',
-    'compare',
-    'compel',
-    'compile',
-    'comply',
-    'component',
-    'composed',
-    'composer',
-    'composite',
-    'compost',
-    'composure',
-    'compound',
-    'compress',
-    'comprised',
-    'computer',
-    'computing',
-    'comrade',
-    'concave',
-    'conceal',
-    'conceded',
-    'concept',
-    'concerned',
-    'concert',
-    'conch',
-    'concierge',
-    'concise',
-    'conclude',
-    'concrete',
-    'concur',
-    'condense',
-    'condiment',
-    'condition',
-    'condone',
-    'conducive',
-    'conductor',
-    'conduit',
-    'cone',
-    'confess',
-    'confetti',
-    'confidant',
-    'confident',
-    'confider',
-    'confiding',
-    'configure',
-    'confined',
-    'confining',
-    'confirm',
-    'conflict',
-    'conform',
-    'confound',
-    'confront',
-    'confused',
-    'confusing',
-    'confusion',
-    'congenial',
-    'congested',
-    'congrats',
-    'congress',
-    'conical',
-    'conjoined',
-    'conjure',
-    'conjuror',
-    'connected',
-    'connector',
-    'consensus',
-    'consent',
-    'console',
-    'consoling',
-    'consonant',
-    'constable',
-    'constant',
-    'constrain',
-    'constrict',
-    'construct',
-    'consult',
-    'consumer',
-    'consuming',
-    'contact',
-    'container',
-    'contempt',
-    'contend',
-    'contented',
-    'contently',
-    'contents',
-    'contest',
-    'context',
-    'contort',
-    'contour',
-    'contrite',
-    'control',
-    'contusion',
-    'convene',
-    'convent',
-    'copartner',
-    'cope',
-    'copied',
-    'copier',
-    'copilot',
-    'coping',
-    'copious',
-    'copper',
-    'copy',
-    'coral',
-    'cork',
-    'cornball',
-    'cornbread',
-    'corncob',
-    'cornea',
-    'corned',
-    'corner',
-    'cornfield',
-    'cornflake',
-    'cornhusk',
-    'cornmeal',
-    'cornstalk',
-    'corny',
-    'coronary',
-    'coroner',
-    'corporal',
-    'corporate',
-    'corral',
-    'correct',
-    'corridor',
-    'corrode',
-    'corroding',
-    'corrosive',
-    'corsage',
-    'corset',
-    'cortex',
-    'cosigner',
-    'cosmetics',
-    'cosmic',
-    'cosmos',
-    'cosponsor',
-    'cost',
-    'cottage',
-    'cotton',
-    'couch',
-    'cough',
-    'could',
-    'countable',
-    'countdown',
-    'counting',
-    'countless',
-    'country',
-    'county',
-    'courier',
-    'covenant',
-    'cover',
-    'coveted',
-    'coveting',
-    'coyness',
-    'cozily',
-    'coziness',
-    'cozy',
-    'crabbing',
-    'crabgrass',
-    'crablike',
-    'crabmeat',
-    'cradle',
-    'cradling',
-    'crafter',
-    'craftily',
-    'craftsman',
-    'craftwork',
-    'crafty',
-    'cramp',
-    'cranberry',
-    'crane',
-    'cranial',
-    'cranium',
-    'crank',
-    'crate',
-    'crave',
-    'craving',
-    'crawfish',
-    'crawlers',
-    'crawling',
-    'crayfish',
-    'crayon',
-    'crazed',
-    'crazily',
-    'craziness',
-    'crazy',
-    'creamed',
-    'creamer',
-    'creamlike',
-    'crease',
-    'creasing',
-    'creatable',
-    'create',
-    'creation',
-    'creative',
-    'creature',
-    'credible',
-    'credibly',
-    'credit',
-    'creed',
-    'creme',
-    'creole',
-    'crepe',
-    'crept',
-    'crescent',
-    'crested',
-    'cresting',
-    'crestless',
-    'crevice',
-    'crewless',
-    'crewman',
-    'crewmate',
-    'crib',
-    'cricket',
-    'cried',
-    'crier',
-    'crimp',
-    'crimson',
-    'cringe',
-    'cringing',
-    'crinkle',
-    'crinkly',
-    'crisped',
-    'crisping',
-    'crisply',
-    'crispness',
-    'crispy',
-    'criteria',
-    'critter',
-    'croak',
-    'crock',
-    'crook',
-    'croon',
-    'crop',
-    'cross',
-    'crouch',
-    'crouton',
-    'crowbar',
-    'crowd',
-    'crown',
-    'crucial',
-    'crudely',
-    'crudeness',
-    'cruelly',
-    'cruelness',
-    'cruelty',
-    'crumb',
-    'crummiest',
-    'crummy',
-    'crumpet',
-    'crumpled',
-    'cruncher',
-    'crunching',
-    'crunchy',
-    'crusader',
-    'crushable',
-    'crushed',
-    'crusher',
-    'crushing',
-    'crust',
-    'crux',
-    'crying',
-    'cryptic',
-    'crystal',
-    'cubbyhole',
-    'cube',
-    'cubical',
-    'cubicle',
-    'cucumber',
-    'cuddle',
-    'cuddly',
-    'cufflink',
-    'culinary',
-    'culminate',
-    'culpable',
-    'culprit',
-    'cultivate',
-    'cultural',
-    'culture',
-    'cupbearer',
-    'cupcake',
-    'cupid',
-    'cupped',
-    'cupping',
-    'curable',
-    'curator',
-    'curdle',
-    'cure',
-    'curfew',
-    'curing',
-    'curled',
-    'curler',
-    'curliness',
-    'curling',
-    'curly',
-    'curry',
-    'curse',
-    'cursive',
-    'cursor',
-    'curtain',
-    'curtly',
-    'curtsy',
-    'curvature',
-    'curve',
-    'curvy',
-    'cushy',
-    'cusp',
-    'cussed',
-    'custard',
-    'custodian',
-    'custody',
-    'customary',
-    'customer',
-    'customize',
-    'customs',
-    'cut',
-    'cycle',
-    'cyclic',
-    'cycling',
-    'cyclist',
-    'cylinder',
-    'cymbal',
-    'cytoplasm',
-    'cytoplast',
-    'dab',
-    'dad',
-    'daffodil',
-    'dagger',
-    'daily',
-    'daintily',
-    'dainty',
-    'dairy',
-    'daisy',
-    'dallying',
-    'dance',
-    'dancing',
-    'dandelion',
-    'dander',
-    'dandruff',
-    'dandy',
-    'danger',
-    'dangle',
-    'dangling',
-    'daredevil',
-    'dares',
-    'daringly',
-    'darkened',
-    'darkening',
-    'darkish',
-    'darkness',
-    'darkroom',
-    'darling',
-    'darn',
-    'dart',
-    'darwinism',
-    'dash',
-    'dastardly',
-    'data',
-    'datebook',
-    'dating',
-    'daughter',
-    'daunting',
-    'dawdler',
-    'dawn',
-    'daybed',
-    'daybreak',
-    'daycare',
-    'daydream',
-    'daylight',
-    'daylong',
-    'dayroom',
-    'daytime',
-    'dazzler',
-    'dazzling',
-    'deacon',
-    'deafening',
-    'deafness',
-    'dealer',
-    'dealing',
-    'dealmaker',
-    'dealt',
-    'dean',
-    'debatable',
-    'debate',
-    'debating',
-    'debit',
-    'debrief',
-    'debtless',
-    'debtor',
-    'debug',
-    'debunk',
-    'decade',
-    'decaf',
-    'decal',
-    'decathlon',
-    'decay',
-    'deceased',
-    'deceit',
-    'deceiver',
-    'deceiving',
-    'december',
-    'decency',
-    'decent',
-    'deception',
-    'deceptive',
-    'decibel',
-    'decidable',
-    'decimal',
-    'decimeter',
-    'decipher',
-    'deck',
-    'declared',
-    'decline',
-    'decode',
-    'decompose',
-    'decorated',
-    'decorator',
-    'decoy',
-    'decrease',
-    'decree',
-    'dedicate',
-    'dedicator',
-    'deduce',
-    'deduct',
-    'deed',
-    'deem',
-    'deepen',
-    'deeply',
-    'deepness',
-    'deface',
-    'defacing',
-    'defame',
-    'default',
-    'defeat',
-    'defection',
-    'defective',
-    'defendant',
-    'defender',
-    'defense',
-    'defensive',
-    'deferral',
-    'deferred',
-    'defiance',
-    'defiant',
-    'defile',
-    'defiling',
-    'define',
-    'definite',
-    'deflate',
-    'deflation',
-    'deflator',
-    'deflected',
-    'deflector',
-    'defog',
-    'deforest',
-    'defraud',
-    'defrost',
-    'deftly',
-    'defuse',
-    'defy',
-    'degraded',
-    'degrading',
-    'degrease',
-    'degree',
-    'dehydrate',
-    'deity',
-    'dejected',
-    'delay',
-    'delegate',
-    'delegator',
-    'delete',
-    'deletion',
-    'delicacy',
-    'delicate',
-    'delicious',
-    'delighted',
-    'delirious',
-    'delirium',
-    'deliverer',
-    'delivery',
-    'delouse',
-    'delta',
-    'deluge',
-    'delusion',
-    'deluxe',
-    'demanding',
-    'demeaning',
-    'demeanor',
-    'demise',
-    'democracy',
-    'democrat',
-    'demote',
-    'demotion',
-    'demystify',
-    'denatured',
-    'deniable',
-    'denial',
-    'denim',
-    'denote',
-    'dense',
-    'density',
-    'dental',
-    'dentist',
-    'denture',
-    'deny',
-    'deodorant',
-    'deodorize',
-    'departed',
-    'departure',
-    'depict',
-    'deplete',
-    'depletion',
-    'deplored',
-    'deploy',
-    'deport',
-    'depose',
-    'depraved',
-    'depravity',
-    'deprecate',
-    'depress',
-    'deprive',
-    'depth',
-    'deputize',
-    'deputy',
-    'derail',
-    'deranged',
-    'derby',
-    'derived',
-    'desecrate',
-    'deserve',
-    'deserving',
-    'designate',
-    'designed',
-    'designer',
-    'designing',
-    'deskbound',
-    'desktop',
-    'deskwork',
-    'desolate',
-    'despair',
-    'despise',
-    'despite',
-    'destiny',
-    'destitute',
-    'destruct',
-    'detached',
-    'detail',
-    'detection',
-    'detective',
-    'detector',
-    'detention',
-    'detergent',
-    'detest',
-    'detonate',
-    'detonator',
-    'detoxify',
-    'detract',
-    'deuce',
-    'devalue',
-    'deviancy',
-    'deviant',
-    'deviate',
-    'deviation',
-    'deviator',
-    'device',
-    'devious',
-    'devotedly',
-    'devotee',
-    'devotion',
-    'devourer',
-    'devouring',
-    'devoutly',
-    'dexterity',
-    'dexterous',
-    'diabetes',
-    'diabetic',
-    'diabolic',
-    'diagnoses',
-    'diagnosis',
-    'diagram',
-    'dial',
-    'diameter',
-    'diaper',
-    'diaphragm',
-    'diary',
-    'dice',
-    'dicing',
-    'dictate',
-    'dictation',
-    'dictator',
-    'difficult',
-    'diffused',
-    'diffuser',
-    'diffusion',
-    'diffusive',
-    'dig',
-    'dilation',
-    'diligence',
-    'diligent',
-    'dill',
-    'dilute',
-    'dime',
-    'diminish',
-    'dimly',
-    'dimmed',
-    'dimmer',
-    'dimness',
-    'dimple',
-    'diner',
-    'dingbat',
-    'dinghy',
-    'dinginess',
-    'dingo',
-    'dingy',
-    'dining',
-    'dinner',
-    'diocese',
-    'dioxide',
-    'diploma',
-    'dipped',
-    'dipper',
-    'dipping',
-    'directed',
-    'direction',
-    'directive',
-    'directly',
-    'directory',
-    'direness',
-    'dirtiness',
-    'disabled',
-    'disagree',
-    'disallow',
-    'disarm',
-    'disarray',
-    'disaster',
-    'disband',
-    'disbelief',
-    'disburse',
-    'discard',
-    'discern',
-    'discharge',
-    'disclose',
-    'discolor',
-    'discount',
-    'discourse',
-    'discover',
-    'discuss',
-    'disdain',
-    'disengage',
-    'disfigure',
-    'disgrace',
-    'dish',
-    'disinfect',
-    'disjoin',
-    'disk',
-    'dislike',
-    'disliking',
-    'dislocate',
-    'dislodge',
-    'disloyal',
-    'dismantle',
-    'dismay',
-    'dismiss',
-    'dismount',
-    'disobey',
-    'disorder',
-    'disown',
-    'disparate',
-    'disparity',
-    'dispatch',
-    'dispense',
-    'dispersal',
-    'dispersed',
-    'disperser',
-    'displace',
-    'display',
-    'displease',
-    'disposal',
-    'dispose',
-    'disprove',
-    'dispute',
-    'disregard',
-    'disrupt',
-    'dissuade',
-    'distance',
-    'distant',
-    'distaste',
-    'distill',
-    'distinct',
-    'distort',
-    'distract',
-    'distress',
-    'district',
-    'distrust',
-    'ditch',
-    'ditto',
-    'ditzy',
-    'dividable',
-    'divided',
-    'dividend',
-    'dividers',
-    'dividing',
-    'divinely',
-    'diving',
-    'divinity',
-    'divisible',
-    'divisibly',
-    'division',
-    'divisive',
-    'divorcee',
-    'dizziness',
-    'dizzy',
-    'doable',
-    'docile',
-    'dock',
-    'doctrine',
-    'document',
-    'dodge',
-    'dodgy',
-    'doily',
-    'doing',
-    'dole',
-    'dollar',
-    'dollhouse',
-    'dollop',
-    'dolly',
-    'dolphin',
-    'domain',
-    'domelike',
-    'domestic',
-    'dominion',
-    'dominoes',
-    'donated',
-    'donation',
-    'donator',
-    'donor',
-    'donut',
-    'doodle',
-    'doorbell',
-    'doorframe',
-    'doorknob',
-    'doorman',
-    'doormat',
-    'doornail',
-    'doorpost',
-    'doorstep',
-    'doorstop',
-    'doorway',
-    'doozy',
-    'dork',
-    'dormitory',
-    'dorsal',
-    'dosage',
-    'dose',
-    'dotted',
-    'doubling',
-    'douche',
-    'dove',
-    'down',
-    'dowry',
-    'doze',
-    'drab',
-    'dragging',
-    'dragonfly',
-    'dragonish',
-    'dragster',
-    'drainable',
-    'drainage',
-    'drained',
-    'drainer',
-    'drainpipe',
-    'dramatic',
-    'dramatize',
-    'drank',
-    'drapery',
-    'drastic',
-    'draw',
-    'dreaded',
-    'dreadful',
-    'dreadlock',
-    'dreamboat',
-    'dreamily',
-    'dreamland',
-    'dreamless',
-    'dreamlike',
-    'dreamt',
-    'dreamy',
-    'drearily',
-    'dreary',
-    'drench',
-    'dress',
-    'drew',
-    'dribble',
-    'dried',
-    'drier',
-    'drift',
-    'driller',
-    'drilling',
-    'drinkable',
-    'drinking',
-    'dripping',
-    'drippy',
-    'drivable',
-    'driven',
-    'driver',
-    'driveway',
-    'driving',
-    'drizzle',
-    'drizzly',
-    'drone',
-    'drool',
-    'droop',
-    'drop-down',
-    'dropbox',
-    'dropkick',
-    'droplet',
-    'dropout',
-    'dropper',
-    'drove',
-    'drown',
-    'drowsily',
-    'drudge',
-    'drum',
-    'dry',
-    'dubbed',
-    'dubiously',
-    'duchess',
-    'duckbill',
-    'ducking',
-    'duckling',
-    'ducktail',
-    'ducky',
-    'duct',
-    'dude',
-    'duffel',
-    'dugout',
-    'duh',
-    'duke',
-    'duller',
-    'dullness',
-    'duly',
-    'dumping',
-    'dumpling',
-    'dumpster',
-    'duo',
-    'dupe',
-    'duplex',
-    'duplicate',
-    'duplicity',
-    'durable',
-    'durably',
-    'duration',
-    'duress',
-    'during',
-    'dusk',
-    'dust',
-    'dutiful',
-    'duty',
-    'duvet',
-    'dwarf',
-    'dweeb',
-    'dwelled',
-    'dweller',
-    'dwelling',
-    'dwindle',
-    'dwindling',
-    'dynamic',
-    'dynamite',
-    'dynasty',
-    'dyslexia',
-    'dyslexic',
-    'each',
-    'eagle',
-    'earache',
-    'eardrum',
-    'earflap',
-    'earful',
-    'earlobe',
-    'early',
-    'earmark',
-    'earmuff',
-    'earphone',
-    'earpiece',
-    'earplugs',
-    'earring',
-    'earshot',
-    'earthen',
-    'earthlike',
-    'earthling',
-    'earthly',
-    'earthworm',
-    'earthy',
-    'earwig',
-    'easeful',
-    'easel',
-    'easiest',
-    'easily',
-    'easiness',
-    'easing',
-    'eastbound',
-    'eastcoast',
-    'easter',
-    'eastward',
-    'eatable',
-    'eaten',
-    'eatery',
-    'eating',
-    'eats',
-    'ebay',
-    'ebony',
-    'ebook',
-    'ecard',
-    'eccentric',
-    'echo',
-    'eclair',
-    'eclipse',
-    'ecologist',
-    'ecology',
-    'economic',
-    'economist',
-    'economy',
-    'ecosphere',
-    'ecosystem',
-    'edge',
-    'edginess',
-    'edging',
-    'edgy',
-    'edition',
-    'editor',
-    'educated',
-    'education',
-    'educator',
-    'eel',
-    'effective',
-    'effects',
-    'efficient',
-    'effort',
-    'eggbeater',
-    'egging',
-    'eggnog',
-    'eggplant',
-    'eggshell',
-    'egomaniac',
-    'egotism',
-    'egotistic',
-    'either',
-    'eject',
-    'elaborate',
-    'elastic',
-    'elated',
-    'elbow',
-    'eldercare',
-    'elderly',
-    'eldest',
-    'electable',
-    'election',
-    'elective',
-    'elephant',
-    'elevate',
-    'elevating',
-    'elevation',
-    'elevator',
-    'eleven',
-    'elf',
-    'eligible',
-    'eligibly',
-    'eliminate',
-    'elite',
-    'elitism',
-    'elixir',
-    'elk',
-    'ellipse',
-    'elliptic',
-    'elm',
-    'elongated',
-    'elope',
-    'eloquence',
-    'eloquent',
-    'elsewhere',
-    'elude',
-    'elusive',
-    'elves',
-    'email',
-    'embargo',
-    'embark',
-    'embassy',
-    'embattled',
-    'embellish',
-    'ember',
-    'embezzle',
-    'emblaze',
-    'emblem',
-    'embody',
-    'embolism',
-    'emboss',
-    'embroider',
-    'emcee',
-    'emerald',
-    'emergency',
-    'emission',
-    'emit',
-    'emote',
-    'emoticon',
-    'emotion',
-    'empathic',
-    'empathy',
-    'emperor',
-    'emphases',
-    'emphasis',
-    'emphasize',
-    'emphatic',
-    'empirical',
-    'employed',
-    'employee',
-    'employer',
-    'emporium',
-    'empower',
-    'emptier',
-    'emptiness',
-    'empty',
-    'emu',
-    'enable',
-    'enactment',
-    'enamel',
-    'enchanted',
-    'enchilada',
-    'encircle',
-    'enclose',
-    'enclosure',
-    'encode',
-    'encore',
-    'encounter',
-    'encourage',
-    'encroach',
-    'encrust',
-    'encrypt',
-    'endanger',
-    'endeared',
-    'endearing',
-    'ended',
-    'ending',
-    'endless',
-    'endnote',
-    'endocrine',
-    'endorphin',
-    'endorse',
-    'endowment',
-    'endpoint',
-    'endurable',
-    'endurance',
-    'enduring',
-    'energetic',
-    'energize',
-    'energy',
-    'enforced',
-    'enforcer',
-    'engaged',
-    'engaging',
-    'engine',
-    'engorge',
-    'engraved',
-    'engraver',
-    'engraving',
-    'engross',
-    'engulf',
-    'enhance',
-    'enigmatic',
-    'enjoyable',
-    'enjoyably',
-    'enjoyer',
-    'enjoying',
-    'enjoyment',
-    'enlarged',
-    'enlarging',
-    'enlighten',
-    'enlisted',
-    'enquirer',
-    'enrage',
-    'enrich',
-    'enroll',
-    'enslave',
-    'ensnare',
-    'ensure',
-    'entail',
-    'entangled',
-    'entering',
-    'entertain',
-    'enticing',
-    'entire',
-    'entitle',
-    'entity',
-    'entomb',
-    'entourage',
-    'entrap',
-    'entree',
-    'entrench',
-    'entrust',
-    'entryway',
-    'entwine',
-    'enunciate',
-    'envelope',
-    'enviable',
-    'enviably',
-    'envious',
-    'envision',
-    'envoy',
-    'envy',
-    'enzyme',
-    'epic',
-    'epidemic',
-    'epidermal',
-    'epidermis',
-    'epidural',
-    'epilepsy',
-    'epileptic',
-    'epilogue',
-    'epiphany',
-    'episode',
-    'equal',
-    'equate',
-    'equation',
-    'equator',
-    'equinox',
-    'equipment',
-    'equity',
-    'equivocal',
-    'eradicate',
-    'erasable',
-    'erased',
-    'eraser',
-    'erasure',
-    'ergonomic',
-    'errand',
-    'errant',
-    'erratic',
-    'error',
-    'erupt',
-    'escalate',
-    'escalator',
-    'escapable',
-    'escapade',
-    'escapist',
-    'escargot',
-    'eskimo',
-    'esophagus',
-    'espionage',
-    'espresso',
-    'esquire',
-    'essay',
-    'essence',
-    'essential',
-    'establish',
-    'estate',
-    'esteemed',
-    'estimate',
-    'estimator',
-    'estranged',
-    'estrogen',
-    'etching',
-    'eternal',
-    'eternity',
-    'ethanol',
-    'ether',
-    'ethically',
-    'ethics',
-    'euphemism',
-    'evacuate',
-    'evacuee',
-    'evade',
-    'evaluate',
-    'evaluator',
-    'evaporate',
-    'evasion',
-    'evasive',
-    'even',
-    'everglade',
-    'evergreen',
-    'everybody',
-    'everyday',
-    'everyone',
-    'evict',
-    'evidence',
-    'evident',
-    'evil',
-    'evoke',
-    'evolution',
-    'evolve',
-    'exact',
-    'exalted',
-    'example',
-    'excavate',
-    'excavator',
-    'exceeding',
-    'exception',
-    'excess',
-    'exchange',
-    'excitable',
-    'exciting',
-    'exclaim',
-    'exclude',
-    'excluding',
-    'exclusion',
-    'exclusive',
-    'excretion',
-    'excretory',
-    'excursion',
-    'excusable',
-    'excusably',
-    'excuse',
-    'exemplary',
-    'exemplify',
-    'exemption',
-    'exerciser',
-    'exert',
-    'exes',
-    'exfoliate',
-    'exhale',
-    'exhaust',
-    'exhume',
-    'exile',
-    'existing',
-    'exit',
-    'exodus',
-    'exonerate',
-    'exorcism',
-    'exorcist',
-    'expand',
-    'expanse',
-    'expansion',
-    'expansive',
-    'expectant',
-    'expedited',
-    'expediter',
-    'expel',
-    'expend',
-    'expenses',
-    'expensive',
-    'expert',
-    'expire',
-    'expiring',
-    'explain',
-    'expletive',
-    'explicit',
-    'explode',
-    'exploit',
-    'explore',
-    'exploring',
-    'exponent',
-    'exporter',
-    'exposable',
-    'expose',
-    'exposure',
-    'express',
-    'expulsion',
-    'exquisite',
-    'extended',
-    'extending',
-    'extent',
-    'extenuate',
-    'exterior',
-    'external',
-    'extinct',
-    'extortion',
-    'extradite',
-    'extras',
-    'extrovert',
-    'extrude',
-    'extruding',
-    'exuberant',
-    'fable',
-    'fabric',
-    'fabulous',
-    'facebook',
-    'facecloth',
-    'facedown',
-    'faceless',
-    'facelift',
-    'faceplate',
-    'faceted',
-    'facial',
-    'facility',
-    'facing',
-    'facsimile',
-    'faction',
-    'factoid',
-    'factor',
-    'factsheet',
-    'factual',
-    'faculty',
-    'fade',
-    'fading',
-    'failing',
-    'falcon',
-    'fall',
-    'false',
-    'falsify',
-    'fame',
-    'familiar',
-    'family',
-    'famine',
-    'famished',
-    'fanatic',
-    'fancied',
-    'fanciness',
-    'fancy',
-    'fanfare',
-    'fang',
-    'fanning',
-    'fantasize',
-    'fantastic',
-    'fantasy',
-    'fascism',
-    'fastball',
-    'faster',
-    'fasting',
-    'fastness',
-    'faucet',
-    'favorable',
-    'favorably',
-    'favored',
-    'favoring',
-    'favorite',
-    'fax',
-    'feast',
-    'federal',
-    'fedora',
-    'feeble',
-    'feed',
-    'feel',
-    'feisty',
-    'feline',
-    'felt-tip',
-    'feminine',
-    'feminism',
-    'feminist',
-    'feminize',
-    'femur',
-    'fence',
-    'fencing',
-    'fender',
-    'ferment',
-    'fernlike',
-    'ferocious',
-    'ferocity',
-    'ferret',
-    'ferris',
-    'ferry',
-    'fervor',
-    'fester',
-    'festival',
-    'festive',
-    'festivity',
-    'fetal',
-    'fetch',
-    'fever',
-    'fiber',
-    'fiction',
-    'fiddle',
-    'fiddling',
-    'fidelity',
-    'fidgeting',
-    'fidgety',
-    'fifteen',
-    'fifth',
-    'fiftieth',
-    'fifty',
-    'figment',
-    'figure',
-    'figurine',
-    'filing',
-    'filled',
-    'filler',
-    'filling',
-    'film',
-    'filter',
-    'filth',
-    'filtrate',
-    'finale',
-    'finalist',
-    'finalize',
-    'finally',
-    'finance',
-    'financial',
-    'finch',
-    'fineness',
-    'finer',
-    'finicky',
-    'finished',
-    'finisher',
-    'finishing',
-    'finite',
-    'finless',
-    'finlike',
-    'fiscally',
-    'fit',
-    'five',
-    'flaccid',
-    'flagman',
-    'flagpole',
-    'flagship',
-    'flagstick',
-    'flagstone',
-    'flail',
-    'flakily',
-    'flaky',
-    'flame',
-    'flammable',
-    'flanked',
-    'flanking',
-    'flannels',
-    'flap',
-    'flaring',
-    'flashback',
-    'flashbulb',
-    'flashcard',
-    'flashily',
-    'flashing',
-    'flashy',
-    'flask',
-    'flatbed',
-    'flatfoot',
-    'flatly',
-    'flatness',
-    'flatten',
-    'flattered',
-    'flatterer',
-    'flattery',
-    'flattop',
-    'flatware',
-    'flatworm',
-    'flavored',
-    'flavorful',
-    'flavoring',
-    'flaxseed',
-    'fled',
-    'fleshed',
-    'fleshy',
-    'flick',
-    'flier',
-    'flight',
-    'flinch',
-    'fling',
-    'flint',
-    'flip',
-    'flirt',
-    'float',
-    'flock',
-    'flogging',
-    'flop',
-    'floral',
-    'florist',
-    'floss',
-    'flounder',
-    'flyable',
-    'flyaway',
-    'flyer',
-    'flying',
-    'flyover',
-    'flypaper',
-    'foam',
-    'foe',
-    'fog',
-    'foil',
-    'folic',
-    'folk',
-    'follicle',
-    'follow',
-    'fondling',
-    'fondly',
-    'fondness',
-    'fondue',
-    'font',
-    'food',
-    'fool',
-    'footage',
-    'football',
-    'footbath',
-    'footboard',
-    'footer',
-    'footgear',
-    'foothill',
-    'foothold',
-    'footing',
-    'footless',
-    'footman',
-    'footnote',
-    'footpad',
-    'footpath',
-    'footprint',
-    'footrest',
-    'footsie',
-    'footsore',
-    'footwear',
-    'footwork',
-    'fossil',
-    'foster',
-    'founder',
-    'founding',
-    'fountain',
-    'fox',
-    'foyer',
-    'fraction',
-    'fracture',
-    'fragile',
-    'fragility',
-    'fragment',
-    'fragrance',
-    'fragrant',
-    'frail',
-    'frame',
-    'framing',
-    'frantic',
-    'fraternal',
-    'frayed',
-    'fraying',
-    'frays',
-    'freckled',
-    'freckles',
-    'freebase',
-    'freebee',
-    'freebie',
-    'freedom',
-    'freefall',
-    'freehand',
-    'freeing',
-    'freeload',
-    'freely',
-    'freemason',
-    'freeness',
-    'freestyle',
-    'freeware',
-    'freeway',
-    'freewill',
-    'freezable',
-    'freezing',
-    'freight',
-    'french',
-    'frenzied',
-    'frenzy',
-    'frequency',
-    'frequent',
-    'fresh',
-    'fretful',
-    'fretted',
-    'friction',
-    'friday',
-    'fridge',
-    'fried',
-    'friend',
-    'frighten',
-    'frightful',
-    'frigidity',
-    'frigidly',
-    'frill',
-    'fringe',
-    'frisbee',
-    'frisk',
-    'fritter',
-    'frivolous',
-    'frolic',
-    'from',
-    'front',
-    'frostbite',
-    'frosted',
-    'frostily',
-    'frosting',
-    'frostlike',
-    'frosty',
-    'froth',
-    'frown',
-    'frozen',
-    'fructose',
-    'frugality',
-    'frugally',
-    'fruit',
-    'frustrate',
-    'frying',
-    'gab',
-    'gaffe',
-    'gag',
-    'gainfully',
-    'gaining',
-    'gains',
-    'gala',
-    'gallantly',
-    'galleria',
-    'gallery',
-    'galley',
-    'gallon',
-    'gallows',
-    'gallstone',
-    'galore',
-    'galvanize',
-    'gambling',
-    'game',
-    'gaming',
-    'gamma',
-    'gander',
-    'gangly',
-    'gangrene',
-    'gangway',
-    'gap',
-    'garage',
-    'garbage',
-    'garden',
-    'gargle',
-    'garland',
-    'garlic',
-    'garment',
-    'garnet',
-    'garnish',
-    'garter',
-    'gas',
-    'gatherer',
-    'gathering',
-    'gating',
-    'gauging',
-    'gauntlet',
-    'gauze',
-    'gave',
-    'gawk',
-    'gazing',
-    'gear',
-    'gecko',
-    'geek',
-    'geiger',
-    'gem',
-    'gender',
-    'generic',
-    'generous',
-    'genetics',
-    'genre',
-    'gentile',
-    'gentleman',
-    'gently',
-    'gents',
-    'geography',
-    'geologic',
-    'geologist',
-    'geology',
-    'geometric',
-    'geometry',
-    'geranium',
-    'gerbil',
-    'geriatric',
-    'germicide',
-    'germinate',
-    'germless',
-    'germproof',
-    'gestate',
-    'gestation',
-    'gesture',
-    'getaway',
-    'getting',
-    'getup',
-    'giant',
-    'gibberish',
-    'giblet',
-    'giddily',
-    'giddiness',
-    'giddy',
-    'gift',
-    'gigabyte',
-    'gigahertz',
-    'gigantic',
-    'giggle',
-    'giggling',
-    'giggly',
-    'gigolo',
-    'gilled',
-    'gills',
-    'gimmick',
-    'girdle',
-    'giveaway',
-    'given',
-    'giver',
-    'giving',
-    'gizmo',
-    'gizzard',
-    'glacial',
-    'glacier',
-    'glade',
-    'gladiator',
-    'gladly',
-    'glamorous',
-    'glamour',
-    'glance',
-    'glancing',
-    'glandular',
-    'glare',
-    'glaring',
-    'glass',
-    'glaucoma',
-    'glazing',
-    'gleaming',
-    'gleeful',
-    'glider',
-    'gliding',
-    'glimmer',
-    'glimpse',
-    'glisten',
-    'glitch',
-    'glitter',
-    'glitzy',
-    'gloater',
-    'gloating',
-    'gloomily',
-    'gloomy',
-    'glorified',
-    'glorifier',
-    'glorify',
-    'glorious',
-    'glory',
-    'gloss',
-    'glove',
-    'glowing',
-    'glowworm',
-    'glucose',
-    'glue',
-    'gluten',
-    'glutinous',
-    'glutton',
-    'gnarly',
-    'gnat',
-    'goal',
-    'goatskin',
-    'goes',
-    'goggles',
-    'going',
-    'goldfish',
-    'goldmine',
-    'goldsmith',
-    'golf',
-    'goliath',
-    'gonad',
-    'gondola',
-    'gone',
-    'gong',
-    'good',
-    'gooey',
-    'goofball',
-    'goofiness',
-    'goofy',
-    'google',
-    'goon',
-    'gopher',
-    'gore',
-    'gorged',
-    'gorgeous',
-    'gory',
-    'gosling',
-    'gossip',
-    'gothic',
-    'gotten',
-    'gout',
-    'gown',
-    'grab',
-    'graceful',
-    'graceless',
-    'gracious',
-    'gradation',
-    'graded',
-    'grader',
-    'gradient',
-    'grading',
-    'gradually',
-    'graduate',
-    'graffiti',
-    'grafted',
-    'grafting',
-    'grain',
-    'granddad',
-    'grandkid',
-    'grandly',
-    'grandma',
-    'grandpa',
-    'grandson',
-    'granite',
-    'granny',
-    'granola',
-    'grant',
-    'granular',
-    'grape',
-    'graph',
-    'grapple',
-    'grappling',
-    'grasp',
-    'grass',
-    'gratified',
-    'gratify',
-    'grating',
-    'gratitude',
-    'gratuity',
-    'gravel',
-    'graveness',
-    'graves',
-    'graveyard',
-    'gravitate',
-    'gravity',
-    'gravy',
-    'gray',
-    'grazing',
-    'greasily',
-    'greedily',
-    'greedless',
-    'greedy',
-    'green',
-    'greeter',
-    'greeting',
-    'grew',
-    'greyhound',
-    'grid',
-    'grief',
-    'grievance',
-    'grieving',
-    'grievous',
-    'grill',
-    'grimace',
-    'grimacing',
-    'grime',
-    'griminess',
-    'grimy',
-    'grinch',
-    'grinning',
-    'grip',
-    'gristle',
-    'grit',
-    'groggily',
-    'groggy',
-    'groin',
-    'groom',
-    'groove',
-    'grooving',
-    'groovy',
-    'grope',
-    'ground',
-    'grouped',
-    'grout',
-    'grove',
-    'grower',
-    'growing',
-    'growl',
-    'grub',
-    'grudge',
-    'grudging',
-    'grueling',
-    'gruffly',
-    'grumble',
-    'grumbling',
-    'grumbly',
-    'grumpily',
-    'grunge',
-    'grunt',
-    'guacamole',
-    'guidable',
-    'guidance',
-    'guide',
-    'guiding',
-    'guileless',
-    'guise',
-    'gulf',
-    'gullible',
-    'gully',
-    'gulp',
-    'gumball',
-    'gumdrop',
-    'gumminess',
-    'gumming',
-    'gummy',
-    'gurgle',
-    'gurgling',
-    'guru',
-    'gush',
-    'gusto',
-    'gusty',
-    'gutless',
-    'guts',
-    'gutter',
-    'guy',
-    'guzzler',
-    'gyration',
-    'habitable',
-    'habitant',
-    'habitat',
-    'habitual',
-    'hacked',
-    'hacker',
-    'hacking',
-    'hacksaw',
-    'had',
-    'haggler',
-    'haiku',
-    'half',
-    'halogen',
-    'halt',
-    'halved',
-    'halves',
-    'hamburger',
-    'hamlet',
-    'hammock',
-    'hamper',
-    'hamster',
-    'hamstring',
-    'handbag',
-    'handball',
-    'handbook',
-    'handbrake',
-    'handcart',
-    'handclap',
-    'handclasp',
-    'handcraft',
-    'handcuff',
-    'handed',
-    'handful',
-    'handgrip',
-    'handgun',
-    'handheld',
-    'handiness',
-    'handiwork',
-    'handlebar',
-    'handled',
-    'handler',
-    'handling',
-    'handmade',
-    'handoff',
-    'handpick',
-    'handprint',
-    'handrail',
-    'handsaw',
-    'handset',
-    'handsfree',
-    'handshake',
-    'handstand',
-    'handwash',
-    'handwork',
-    'handwoven',
-    'handwrite',
-    'handyman',
-    'hangnail',
-    'hangout',
-    'hangover',
-    'hangup',
-    'hankering',
-    'hankie',
-    'hanky',
-    'haphazard',
-    'happening',
-    'happier',
-    'happiest',
-    'happily',
-    'happiness',
-    'happy',
-    'harbor',
-    'hardcopy',
-    'hardcore',
-    'hardcover',
-    'harddisk',
-    'hardened',
-    'hardener',
-    'hardening',
-    'hardhat',
-    'hardhead',
-    'hardiness',
-    'hardly',
-    'hardness',
-    'hardship',
-    'hardware',
-    'hardwired',
-    'hardwood',
-    'hardy',
-    'harmful',
-    'harmless',
-    'harmonica',
-    'harmonics',
-    'harmonize',
-    'harmony',
-    'harness',
-    'harpist',
-    'harsh',
-    'harvest',
-    'hash',
-    'hassle',
-    'haste',
-    'hastily',
-    'hastiness',
-    'hasty',
-    'hatbox',
-    'hatchback',
-    'hatchery',
-    'hatchet',
-    'hatching',
-    'hatchling',
-    'hate',
-    'hatless',
-    'hatred',
-    'haunt',
-    'haven',
-    'hazard',
-    'hazelnut',
-    'hazily',
-    'haziness',
-    'hazing',
-    'hazy',
-    'headache',
-    'headband',
-    'headboard',
-    'headcount',
-    'headdress',
-    'headed',
-    'header',
-    'headfirst',
-    'headgear',
-    'heading',
-    'headlamp',
-    'headless',
-    'headlock',
-    'headphone',
-    'headpiece',
-    'headrest',
-    'headroom',
-    'headscarf',
-    'headset',
-    'headsman',
-    'headstand',
-    'headstone',
-    'headway',
-    'headwear',
-    'heap',
-    'heat',
-    'heave',
-    'heavily',
-    'heaviness',
-    'heaving',
-    'hedge',
-    'hedging',
-    'heftiness',
-    'hefty',
-    'helium',
-    'helmet',
-    'helper',
-    'helpful',
-    'helping',
-    'helpless',
-    'helpline',
-    'hemlock',
-    'hemstitch',
-    'hence',
-    'henchman',
-    'henna',
-    'herald',
-    'herbal',
-    'herbicide',
-    'herbs',
-    'heritage',
-    'hermit',
-    'heroics',
-    'heroism',
-    'herring',
-    'herself',
-    'hertz',
-    'hesitancy',
-    'hesitant',
-    'hesitate',
-    'hexagon',
-    'hexagram',
-    'hubcap',
-    'huddle',
-    'huddling',
-    'huff',
-    'hug',
-    'hula',
-    'hulk',
-    'hull',
-    'human',
-    'humble',
-    'humbling',
-    'humbly',
-    'humid',
-    'humiliate',
-    'humility',
-    'humming',
-    'hummus',
-    'humongous',
-    'humorist',
-    'humorless',
-    'humorous',
-    'humpback',
-    'humped',
-    'humvee',
-    'hunchback',
-    'hundredth',
-    'hunger',
-    'hungrily',
-    'hungry',
-    'hunk',
-    'hunter',
-    'hunting',
-    'huntress',
-    'huntsman',
-    'hurdle',
-    'hurled',
-    'hurler',
-    'hurling',
-    'hurray',
-    'hurricane',
-    'hurried',
-    'hurry',
-    'hurt',
-    'husband',
-    'hush',
-    'husked',
-    'huskiness',
-    'hut',
-    'hybrid',
-    'hydrant',
-    'hydrated',
-    'hydration',
-    'hydrogen',
-    'hydroxide',
-    'hyperlink',
-    'hypertext',
-    'hyphen',
-    'hypnoses',
-    'hypnosis',
-    'hypnotic',
-    'hypnotism',
-    'hypnotist',
-    'hypnotize',
-    'hypocrisy',
-    'hypocrite',
-    'ibuprofen',
-    'ice',
-    'iciness',
-    'icing',
-    'icky',
-    'icon',
-    'icy',
-    'idealism',
-    'idealist',
-    'idealize',
-    'ideally',
-    'idealness',
-    'identical',
-    'identify',
-    'identity',
-    'ideology',
-    'idiocy',
-    'idiom',
-    'idly',
-    'igloo',
-    'ignition',
-    'ignore',
-    'iguana',
-    'illicitly',
-    'illusion',
-    'illusive',
-    'image',
-    'imaginary',
-    'imagines',
-    'imaging',
-    'imbecile',
-    'imitate',
-    'imitation',
-    'immature',
-    'immerse',
-    'immersion',
-    'imminent',
-    'immobile',
-    'immodest',
-    'immorally',
-    'immortal',
-    'immovable',
-    'immovably',
-    'immunity',
-    'immunize',
-    'impaired',
-    'impale',
-    'impart',
-    'impatient',
-    'impeach',
-    'impeding',
-    'impending',
-    'imperfect',
-    'imperial',
-    'impish',
-    'implant',
-    'implement',
-    'implicate',
-    'implicit',
-    'implode',
-    'implosion',
-    'implosive',
-    'imply',
-    'impolite',
-    'important',
-    'importer',
-    'impose',
-    'imposing',
-    'impotence',
-    'impotency',
-    'impotent',
-    'impound',
-    'imprecise',
-    'imprint',
-    'imprison',
-    'impromptu',
-    'improper',
-    'improve',
-    'improving',
-    'improvise',
-    'imprudent',
-    'impulse',
-    'impulsive',
-    'impure',
-    'impurity',
-    'iodine',
-    'iodize',
-    'ion',
-    'ipad',
-    'iphone',
-    'ipod',
-    'irate',
-    'irk',
-    'iron',
-    'irregular',
-    'irrigate',
-    'irritable',
-    'irritably',
-    'irritant',
-    'irritate',
-    'islamic',
-    'islamist',
-    'isolated',
-    'isolating',
-    'isolation',
-    'isotope',
-    'issue',
-    'issuing',
-    'italicize',
-    'italics',
-    'item',
-    'itinerary',
-    'itunes',
-    'ivory',
-    'ivy',
-    'jab',
-    'jackal',
-    'jacket',
-    'jackknife',
-    'jackpot',
-    'jailbird',
-    'jailbreak',
-    'jailer',
-    'jailhouse',
-    'jalapeno',
-    'jam',
-    'janitor',
-    'january',
-    'jargon',
-    'jarring',
-    'jasmine',
-    'jaundice',
-    'jaunt',
-    'java',
-    'jawed',
-    'jawless',
-    'jawline',
-    'jaws',
-    'jaybird',
-    'jaywalker',
-    'jazz',
-    'jeep',
-    'jeeringly',
-    'jellied',
-    'jelly',
-    'jersey',
-    'jester',
-    'jet',
-    'jiffy',
-    'jigsaw',
-    'jimmy',
-    'jingle',
-    'jingling',
-    'jinx',
-    'jitters',
-    'jittery',
-    'job',
-    'jockey',
-    'jockstrap',
-    'jogger',
-    'jogging',
-    'john',
-    'joining',
-    'jokester',
-    'jokingly',
-    'jolliness',
-    'jolly',
-    'jolt',
-    'jot',
-    'jovial',
-    'joyfully',
-    'joylessly',
-    'joyous',
-    'joyride',
-    'joystick',
-    'jubilance',
-    'jubilant',
-    'judge',
-    'judgingly',
-    'judicial',
-    'judiciary',
-    'judo',
-    'juggle',
-    'juggling',
-    'jugular',
-    'juice',
-    'juiciness',
-    'juicy',
-    'jujitsu',
-    'jukebox',
-    'july',
-    'jumble',
-    'jumbo',
-    'jump',
-    'junction',
-    'juncture',
-    'june',
-    'junior',
-    'juniper',
-    'junkie',
-    'junkman',
-    'junkyard',
-    'jurist',
-    'juror',
-    'jury',
-    'justice',
-    'justifier',
-    'justify',
-    'justly',
-    'justness',
-    'juvenile',
-    'kabob',
-    'kangaroo',
-    'karaoke',
-    'karate',
-    'karma',
-    'kebab',
-    'keenly',
-    'keenness',
-    'keep',
-    'keg',
-    'kelp',
-    'kennel',
-    'kept',
-    'kerchief',
-    'kerosene',
-    'kettle',
-    'kick',
-    'kiln',
-    'kilobyte',
-    'kilogram',
-    'kilometer',
-    'kilowatt',
-    'kilt',
-    'kimono',
-    'kindle',
-    'kindling',
-    'kindly',
-    'kindness',
-    'kindred',
-    'kinetic',
-    'kinfolk',
-    'king',
-    'kinship',
-    'kinsman',
-    'kinswoman',
-    'kissable',
-    'kisser',
-    'kissing',
-    'kitchen',
-    'kite',
-    'kitten',
-    'kitty',
-    'kiwi',
-    'kleenex',
-    'knapsack',
-    'knee',
-    'knelt',
-    'knickers',
-    'knoll',
-    'koala',
-    'kooky',
-    'kosher',
-    'krypton',
-    'kudos',
-    'kung',
-    'labored',
-    'laborer',
-    'laboring',
-    'laborious',
-    'labrador',
-    'ladder',
-    'ladies',
-    'ladle',
-    'ladybug',
-    'ladylike',
-    'lagged',
-    'lagging',
-    'lagoon',
-    'lair',
-    'lake',
-    'lance',
-    'landed',
-    'landfall',
-    'landfill',
-    'landing',
-    'landlady',
-    'landless',
-    'landline',
-    'landlord',
-    'landmark',
-    'landmass',
-    'landmine',
-    'landowner',
-    'landscape',
-    'landside',
-    'landslide',
-    'language',
-    'lankiness',
-    'lanky',
-    'lantern',
-    'lapdog',
-    'lapel',
-    'lapped',
-    'lapping',
-    'laptop',
-    'lard',
-    'large',
-    'lark',
-    'lash',
-    'lasso',
-    'last',
-    'latch',
-    'late',
-    'lather',
-    'latitude',
-    'latrine',
-    'latter',
-    'latticed',
-    'launch',
-    'launder',
-    'laundry',
-    'laurel',
-    'lavender',
-    'lavish',
-    'laxative',
-    'lazily',
-    'laziness',
-    'lazy',
-    'lecturer',
-    'left',
-    'legacy',
-    'legal',
-    'legend',
-    'legged',
-    'leggings',
-    'legible',
-    'legibly',
-    'legislate',
-    'lego',
-    'legroom',
-    'legume',
-    'legwarmer',
-    'legwork',
-    'lemon',
-    'lend',
-    'length',
-    'lens',
-    'lent',
-    'leotard',
-    'lesser',
-    'letdown',
-    'lethargic',
-    'lethargy',
-    'letter',
-    'lettuce',
-    'level',
-    'leverage',
-    'levers',
-    'levitate',
-    'levitator',
-    'liability',
-    'liable',
-    'liberty',
-    'librarian',
-    'library',
-    'licking',
-    'licorice',
-    'lid',
-    'life',
-    'lifter',
-    'lifting',
-    'liftoff',
-    'ligament',
-    'likely',
-    'likeness',
-    'likewise',
-    'liking',
-    'lilac',
-    'lilly',
-    'lily',
-    'limb',
-    'limeade',
-    'limelight',
-    'limes',
-    'limit',
-    'limping',
-    'limpness',
-    'line',
-    'lingo',
-    'linguini',
-    'linguist',
-    'lining',
-    'linked',
-    'linoleum',
-    'linseed',
-    'lint',
-    'lion',
-    'lip',
-    'liquefy',
-    'liqueur',
-    'liquid',
-    'lisp',
-    'list',
-    'litigate',
-    'litigator',
-    'litmus',
-    'litter',
-    'little',
-    'livable',
-    'lived',
-    'lively',
-    'liver',
-    'livestock',
-    'lividly',
-    'living',
-    'lizard',
-    'lubricant',
-    'lubricate',
-    'lucid',
-    'luckily',
-    'luckiness',
-    'luckless',
-    'lucrative',
-    'ludicrous',
-    'lugged',
-    'lukewarm',
-    'lullaby',
-    'lumber',
-    'luminance',
-    'luminous',
-    'lumpiness',
-    'lumping',
-    'lumpish',
-    'lunacy',
-    'lunar',
-    'lunchbox',
-    'luncheon',
-    'lunchroom',
-    'lunchtime',
-    'lung',
-    'lurch',
-    'lure',
-    'luridness',
-    'lurk',
-    'lushly',
-    'lushness',
-    'luster',
-    'lustfully',
-    'lustily',
-    'lustiness',
-    'lustrous',
-    'lusty',
-    'luxurious',
-    'luxury',
-    'lying',
-    'lyrically',
-    'lyricism',
-    'lyricist',
-    'lyrics',
-    'macarena',
-    'macaroni',
-    'macaw',
-    'mace',
-    'machine',
-    'machinist',
-    'magazine',
-    'magenta',
-    'maggot',
-    'magical',
-    'magician',
-    'magma',
-    'magnesium',
-    'magnetic',
-    'magnetism',
-    'magnetize',
-    'magnifier',
-    'magnify',
-    'magnitude',
-    'magnolia',
-    'mahogany',
-    'maimed',
-    'majestic',
-    'majesty',
-    'majorette',
-    'majority',
-    'makeover',
-    'maker',
-    'makeshift',
-    'making',
-    'malformed',
-    'malt',
-    'mama',
-    'mammal',
-    'mammary',
-    'mammogram',
-    'manager',
-    'managing',
-    'manatee',
-    'mandarin',
-    'mandate',
-    'mandatory',
-    'mandolin',
-    'manger',
-    'mangle',
-    'mango',
-    'mangy',
-    'manhandle',
-    'manhole',
-    'manhood',
-    'manhunt',
-    'manicotti',
-    'manicure',
-    'manifesto',
-    'manila',
-    'mankind',
-    'manlike',
-    'manliness',
-    'manly',
-    'manmade',
-    'manned',
-    'mannish',
-    'manor',
-    'manpower',
-    'mantis',
-    'mantra',
-    'manual',
-    'many',
-    'map',
-    'marathon',
-    'marauding',
-    'marbled',
-    'marbles',
-    'marbling',
-    'march',
-    'mardi',
-    'margarine',
-    'margarita',
-    'margin',
-    'marigold',
-    'marina',
-    'marine',
-    'marital',
-    'maritime',
-    'marlin',
-    'marmalade',
-    'maroon',
-    'married',
-    'marrow',
-    'marry',
-    'marshland',
-    'marshy',
-    'marsupial',
-    'marvelous',
-    'marxism',
-    'mascot',
-    'masculine',
-    'mashed',
-    'mashing',
-    'massager',
-    'masses',
-    'massive',
-    'mastiff',
-    'matador',
-    'matchbook',
-    'matchbox',
-    'matcher',
-    'matching',
-    'matchless',
-    'material',
-    'maternal',
-    'maternity',
-    'math',
-    'mating',
-    'matriarch',
-    'matrimony',
-    'matrix',
-    'matron',
-    'matted',
-    'matter',
-    'maturely',
-    'maturing',
-    'maturity',
-    'mauve',
-    'maverick',
-    'maximize',
-    'maximum',
-    'maybe',
-    'mayday',
-    'mayflower',
-    'moaner',
-    'moaning',
-    'mobile',
-    'mobility',
-    'mobilize',
-    'mobster',
-    'mocha',
-    'mocker',
-    'mockup',
-    'modified',
-    'modify',
-    'modular',
-    'modulator',
-    'module',
-    'moisten',
-    'moistness',
-    'moisture',
-    'molar',
-    'molasses',
-    'mold',
-    'molecular',
-    'molecule',
-    'molehill',
-    'mollusk',
-    'mom',
-    'monastery',
-    'monday',
-    'monetary',
-    'monetize',
-    'moneybags',
-    'moneyless',
-    'moneywise',
-    'mongoose',
-    'mongrel',
-    'monitor',
-    'monkhood',
-    'monogamy',
-    'monogram',
-    'monologue',
-    'monopoly',
-    'monorail',
-    'monotone',
-    'monotype',
-    'monoxide',
-    'monsieur',
-    'monsoon',
-    'monstrous',
-    'monthly',
-    'monument',
-    'moocher',
-    'moodiness',
-    'moody',
-    'mooing',
-    'moonbeam',
-    'mooned',
-    'moonlight',
-    'moonlike',
-    'moonlit',
-    'moonrise',
-    'moonscape',
-    'moonshine',
-    'moonstone',
-    'moonwalk',
-    'mop',
-    'morale',
-    'morality',
-    'morally',
-    'morbidity',
-    'morbidly',
-    'morphine',
-    'morphing',
-    'morse',
-    'mortality',
-    'mortally',
-    'mortician',
-    'mortified',
-    'mortify',
-    'mortuary',
-    'mosaic',
-    'mossy',
-    'most',
-    'mothball',
-    'mothproof',
-    'motion',
-    'motivate',
-    'motivator',
-    'motive',
-    'motocross',
-    'motor',
-    'motto',
-    'mountable',
-    'mountain',
-    'mounted',
-    'mounting',
-    'mourner',
-    'mournful',
-    'mouse',
-    'mousiness',
-    'moustache',
-    'mousy',
-    'mouth',
-    'movable',
-    'move',
-    'movie',
-    'moving',
-    'mower',
-    'mowing',
-    'much',
-    'muck',
-    'mud',
-    'mug',
-    'mulberry',
-    'mulch',
-    'mule',
-    'mulled',
-    'mullets',
-    'multiple',
-    'multiply',
-    'multitask',
-    'multitude',
-    'mumble',
-    'mumbling',
-    'mumbo',
-    'mummified',
-    'mummify',
-    'mummy',
-    'mumps',
-    'munchkin',
-    'mundane',
-    'municipal',
-    'muppet',
-    'mural',
-    'murkiness',
-    'murky',
-    'murmuring',
-    'muscular',
-    'museum',
-    'mushily',
-    'mushiness',
-    'mushroom',
-    'mushy',
-    'music',
-    'musket',
-    'muskiness',
-    'musky',
-    'mustang',
-    'mustard',
-    'muster',
-    'mustiness',
-    'musty',
-    'mutable',
-    'mutate',
-    'mutation',
-    'mute',
-    'mutilated',
-    'mutilator',
-    'mutiny',
-    'mutt',
-    'mutual',
-    'muzzle',
-    'myself',
-    'myspace',
-    'mystified',
-    'mystify',
-    'myth',
-    'nacho',
-    'nag',
-    'nail',
-    'name',
-    'naming',
-    'nanny',
-    'nanometer',
-    'nape',
-    'napkin',
-    'napped',
-    'napping',
-    'nappy',
-    'narrow',
-    'nastily',
-    'nastiness',
-    'national',
-    'native',
-    'nativity',
-    'natural',
-    'nature',
-    'naturist',
-    'nautical',
-    'navigate',
-    'navigator',
-    'navy',
-    'nearby',
-    'nearest',
-    'nearly',
-    'nearness',
-    'neatly',
-    'neatness',
-    'nebula',
-    'nebulizer',
-    'nectar',
-    'negate',
-    'negation',
-    'negative',
-    'neglector',
-    'negligee',
-    'negligent',
-    'negotiate',
-    'nemeses',
-    'nemesis',
-    'neon',
-    'nephew',
-    'nerd',
-    'nervous',
-    'nervy',
-    'nest',
-    'net',
-    'neurology',
-    'neuron',
-    'neurosis',
-    'neurotic',
-    'neuter',
-    'neutron',
-    'never',
-    'next',
-    'nibble',
-    'nickname',
-    'nicotine',
-    'niece',
-    'nifty',
-    'nimble',
-    'nimbly',
-    'nineteen',
-    'ninetieth',
-    'ninja',
-    'nintendo',
-    'ninth',
-    'nuclear',
-    'nuclei',
-    'nucleus',
-    'nugget',
-    'nullify',
-    'number',
-    'numbing',
-    'numbly',
-    'numbness',
-    'numeral',
-    'numerate',
-    'numerator',
-    'numeric',
-    'numerous',
-    'nuptials',
-    'nursery',
-    'nursing',
-    'nurture',
-    'nutcase',
-    'nutlike',
-    'nutmeg',
-    'nutrient',
-    'nutshell',
-    'nuttiness',
-    'nutty',
-    'nuzzle',
-    'nylon',
-    'oaf',
-    'oak',
-    'oasis',
-    'oat',
-    'obedience',
-    'obedient',
-    'obituary',
-    'object',
-    'obligate',
-    'obliged',
-    'oblivion',
-    'oblivious',
-    'oblong',
-    'obnoxious',
-    'oboe',
-    'obscure',
-    'obscurity',
-    'observant',
-    'observer',
-    'observing',
-    'obsessed',
-    'obsession',
-    'obsessive',
-    'obsolete',
-    'obstacle',
-    'obstinate',
-    'obstruct',
-    'obtain',
-    'obtrusive',
-    'obtuse',
-    'obvious',
-    'occultist',
-    'occupancy',
-    'occupant',
-    'occupier',
-    'occupy',
-    'ocean',
-    'ocelot',
-    'octagon',
-    'octane',
-    'october',
-    'octopus',
-    'ogle',
-    'oil',
-    'oink',
-    'ointment',
-    'okay',
-    'old',
-    'olive',
-    'olympics',
-    'omega',
-    'omen',
-    'ominous',
-    'omission',
-    'omit',
-    'omnivore',
-    'onboard',
-    'oncoming',
-    'ongoing',
-    'onion',
-    'online',
-    'onlooker',
-    'only',
-    'onscreen',
-    'onset',
-    'onshore',
-    'onslaught',
-    'onstage',
-    'onto',
-    'onward',
-    'onyx',
-    'oops',
-    'ooze',
-    'oozy',
-    'opacity',
-    'opal',
-    'open',
-    'operable',
-    'operate',
-    'operating',
-    'operation',
-    'operative',
-    'operator',
-    'opium',
-    'opossum',
-    'opponent',
-    'oppose',
-    'opposing',
-    'opposite',
-    'oppressed',
-    'oppressor',
-    'opt',
-    'opulently',
-    'osmosis',
-    'other',
-    'otter',
-    'ouch',
-    'ought',
-    'ounce',
-    'outage',
-    'outback',
-    'outbid',
-    'outboard',
-    'outbound',
-    'outbreak',
-    'outburst',
-    'outcast',
-    'outclass',
-    'outcome',
-    'outdated',
-    'outdoors',
-    'outer',
-    'outfield',
-    'outfit',
-    'outflank',
-    'outgoing',
-    'outgrow',
-    'outhouse',
-    'outing',
-    'outlast',
-    'outlet',
-    'outline',
-    'outlook',
-    'outlying',
-    'outmatch',
-    'outmost',
-    'outnumber',
-    'outplayed',
-    'outpost',
-    'outpour',
-    'output',
-    'outrage',
-    'outrank',
-    'outreach',
-    'outright',
-    'outscore',
-    'outsell',
-    'outshine',
-    'outshoot',
-    'outsider',
-    'outskirts',
-    'outsmart',
-    'outsource',
-    'outspoken',
-    'outtakes',
-    'outthink',
-    'outward',
-    'outweigh',
-    'outwit',
-    'oval',
-    'ovary',
-    'oven',
-    'overact',
-    'overall',
-    'overarch',
-    'overbid',
-    'overbill',
-    'overbite',
-    'overblown',
-    'overboard',
-    'overbook',
-    'overbuilt',
-    'overcast',
-    'overcoat',
-    'overcome',
-    'overcook',
-    'overcrowd',
-    'overdraft',
-    'overdrawn',
-    'overdress',
-    'overdrive',
-    'overdue',
-    'overeager',
-    'overeater',
-    'overexert',
-    'overfed',
-    'overfeed',
-    'overfill',
-    'overflow',
-    'overfull',
-    'overgrown',
-    'overhand',
-    'overhang',
-    'overhaul',
-    'overhead',
-    'overhear',
-    'overheat',
-    'overhung',
-    'overjoyed',
-    'overkill',
-    'overlabor',
-    'overlaid',
-    'overlap',
-    'overlay',
-    'overload',
-    'overlook',
-    'overlord',
-    'overlying',
-    'overnight',
-    'overpass',
-    'overpay',
-    'overplant',
-    'overplay',
-    'overpower',
-    'overprice',
-    'overrate',
-    'overreach',
-    'overreact',
-    'override',
-    'overripe',
-    'overrule',
-    'overrun',
-    'overshoot',
-    'overshot',
-    'oversight',
-    'oversized',
-    'oversleep',
-    'oversold',
-    'overspend',
-    'overstate',
-    'overstay',
-    'overstep',
-    'overstock',
-    'overstuff',
-    'oversweet',
-    'overtake',
-    'overthrow',
-    'overtime',
-    'overtly',
-    'overtone',
-    'overture',
-    'overturn',
-    'overuse',
-    'overvalue',
-    'overview',
-    'overwrite',
-    'owl',
-    'oxford',
-    'oxidant',
-    'oxidation',
-    'oxidize',
-    'oxidizing',
-    'oxygen',
-    'oxymoron',
-    'oyster',
-    'ozone',
-    'paced',
-    'pacemaker',
-    'pacific',
-    'pacifier',
-    'pacifism',
-    'pacifist',
-    'pacify',
-    'padded',
-    'padding',
-    'paddle',
-    'paddling',
-    'padlock',
-    'pagan',
-    'pager',
-    'paging',
-    'pajamas',
-    'palace',
-    'palatable',
-    'palm',
-    'palpable',
-    'palpitate',
-    'paltry',
-    'pampered',
-    'pamperer',
-    'pampers',
-    'pamphlet',
-    'panama',
-    'pancake',
-    'pancreas',
-    'panda',
-    'pandemic',
-    'pang',
-    'panhandle',
-    'panic',
-    'panning',
-    'panorama',
-    'panoramic',
-    'panther',
-    'pantomime',
-    'pantry',
-    'pants',
-    'pantyhose',
-    'paparazzi',
-    'papaya',
-    'paper',
-    'paprika',
-    'papyrus',
-    'parabola',
-    'parachute',
-    'parade',
-    'paradox',
-    'paragraph',
-    'parakeet',
-    'paralegal',
-    'paralyses',
-    'paralysis',
-    'paralyze',
-    'paramedic',
-    'parameter',
-    'paramount',
-    'parasail',
-    'parasite',
-    'parasitic',
-    'parcel',
-    'parched',
-    'parchment',
-    'pardon',
-    'parish',
-    'parka',
-    'parking',
-    'parkway',
-    'parlor',
-    'parmesan',
-    'parole',
-    'parrot',
-    'parsley',
-    'parsnip',
-    'partake',
-    'parted',
-    'parting',
-    'partition',
-    'partly',
-    'partner',
-    'partridge',
-    'party',
-    'passable',
-    'passably',
-    'passage',
-    'passcode',
-    'passenger',
-    'passerby',
-    'passing',
-    'passion',
-    'passive',
-    'passivism',
-    'passover',
-    'passport',
-    'password',
-    'pasta',
-    'pasted',
-    'pastel',
-    'pastime',
-    'pastor',
-    'pastrami',
-    'pasture',
-    'pasty',
-    'patchwork',
-    'patchy',
-    'paternal',
-    'paternity',
-    'path',
-    'patience',
-    'patient',
-    'patio',
-    'patriarch',
-    'patriot',
-    'patrol',
-    'patronage',
-    'patronize',
-    'pauper',
-    'pavement',
-    'paver',
-    'pavestone',
-    'pavilion',
-    'paving',
-    'pawing',
-    'payable',
-    'payback',
-    'paycheck',
-    'payday',
-    'payee',
-    'payer',
-    'paying',
-    'payment',
-    'payphone',
-    'payroll',
-    'pebble',
-    'pebbly',
-    'pecan',
-    'pectin',
-    'peculiar',
-    'peddling',
-    'pediatric',
-    'pedicure',
-    'pedigree',
-    'pedometer',
-    'pegboard',
-    'pelican',
-    'pellet',
-    'pelt',
-    'pelvis',
-    'penalize',
-    'penalty',
-    'pencil',
-    'pendant',
-    'pending',
-    'penholder',
-    'penknife',
-    'pennant',
-    'penniless',
-    'penny',
-    'penpal',
-    'pension',
-    'pentagon',
-    'pentagram',
-    'pep',
-    'perceive',
-    'percent',
-    'perch',
-    'percolate',
-    'perennial',
-    'perfected',
-    'perfectly',
-    'perfume',
-    'periscope',
-    'perish',
-    'perjurer',
-    'perjury',
-    'perkiness',
-    'perky',
-    'perm',
-    'peroxide',
-    'perpetual',
-    'perplexed',
-    'persecute',
-    'persevere',
-    'persuaded',
-    'persuader',
-    'pesky',
-    'peso',
-    'pessimism',
-    'pessimist',
-    'pester',
-    'pesticide',
-    'petal',
-    'petite',
-    'petition',
-    'petri',
-    'petroleum',
-    'petted',
-    'petticoat',
-    'pettiness',
-    'petty',
-    'petunia',
-    'phantom',
-    'phobia',
-    'phoenix',
-    'phonebook',
-    'phoney',
-    'phonics',
-    'phoniness',
-    'phony',
-    'phosphate',
-    'photo',
-    'phrase',
-    'phrasing',
-    'placard',
-    'placate',
-    'placidly',
-    'plank',
-    'planner',
-    'plant',
-    'plasma',
-    'plaster',
-    'plastic',
-    'plated',
-    'platform',
-    'plating',
-    'platinum',
-    'platonic',
-    'platter',
-    'platypus',
-    'plausible',
-    'plausibly',
-    'playable',
-    'playback',
-    'player',
-    'playful',
-    'playgroup',
-    'playhouse',
-    'playing',
-    'playlist',
-    'playmaker',
-    'playmate',
-    'playoff',
-    'playpen',
-    'playroom',
-    'playset',
-    'plaything',
-    'playtime',
-    'plaza',
-    'pleading',
-    'pleat',
-    'pledge',
-    'plentiful',
-    'plenty',
-    'plethora',
-    'plexiglas',
-    'pliable',
-    'plod',
-    'plop',
-    'plot',
-    'plow',
-    'ploy',
-    'pluck',
-    'plug',
-    'plunder',
-    'plunging',
-    'plural',
-    'plus',
-    'plutonium',
-    'plywood',
-    'poach',
-    'pod',
-    'poem',
-    'poet',
-    'pogo',
-    'pointed',
-    'pointer',
-    'pointing',
-    'pointless',
-    'pointy',
-    'poise',
-    'poison',
-    'poker',
-    'poking',
-    'polar',
-    'police',
-    'policy',
-    'polio',
-    'polish',
-    'politely',
-    'polka',
-    'polo',
-    'polyester',
-    'polygon',
-    'polygraph',
-    'polymer',
-    'poncho',
-    'pond',
-    'pony',
-    'popcorn',
-    'pope',
-    'poplar',
-    'popper',
-    'poppy',
-    'popsicle',
-    'populace',
-    'popular',
-    'populate',
-    'porcupine',
-    'pork',
-    'porous',
-    'porridge',
-    'portable',
-    'portal',
-    'portfolio',
-    'porthole',
-    'portion',
-    'portly',
-    'portside',
-    'poser',
-    'posh',
-    'posing',
-    'possible',
-    'possibly',
-    'possum',
-    'postage',
-    'postal',
-    'postbox',
-    'postcard',
-    'posted',
-    'poster',
-    'posting',
-    'postnasal',
-    'posture',
-    'postwar',
-    'pouch',
-    'pounce',
-    'pouncing',
-    'pound',
-    'pouring',
-    'pout',
-    'powdered',
-    'powdering',
-    'powdery',
-    'power',
-    'powwow',
-    'pox',
-    'praising',
-    'prance',
-    'prancing',
-    'pranker',
-    'prankish',
-    'prankster',
-    'prayer',
-    'praying',
-    'preacher',
-    'preaching',
-    'preachy',
-    'preamble',
-    'precinct',
-    'precise',
-    'precision',
-    'precook',
-    'precut',
-    'predator',
-    'predefine',
-    'predict',
-    'preface',
-    'prefix',
-    'preflight',
-    'preformed',
-    'pregame',
-    'pregnancy',
-    'pregnant',
-    'preheated',
-    'prelaunch',
-    'prelaw',
-    'prelude',
-    'premiere',
-    'premises',
-    'premium',
-    'prenatal',
-    'preoccupy',
-    'preorder',
-    'prepaid',
-    'prepay',
-    'preplan',
-    'preppy',
-    'preschool',
-    'prescribe',
-    'preseason',
-    'preset',
-    'preshow',
-    'president',
-    'presoak',
-    'press',
-    'presume',
-    'presuming',
-    'preteen',
-    'pretended',
-    'pretender',
-    'pretense',
-    'pretext',
-    'pretty',
-    'pretzel',
-    'prevail',
-    'prevalent',
-    'prevent',
-    'preview',
-    'previous',
-    'prewar',
-    'prewashed',
-    'prideful',
-    'pried',
-    'primal',
-    'primarily',
-    'primary',
-    'primate',
-    'primer',
-    'primp',
-    'princess',
-    'print',
-    'prior',
-    'prism',
-    'prison',
-    'prissy',
-    'pristine',
-    'privacy',
-    'private',
-    'privatize',
-    'prize',
-    'proactive',
-    'probable',
-    'probably',
-    'probation',
-    'probe',
-    'probing',
-    'probiotic',
-    'problem',
-    'procedure',
-    'process',
-    'proclaim',
-    'procreate',
-    'procurer',
-    'prodigal',
-    'prodigy',
-    'produce',
-    'product',
-    'profane',
-    'profanity',
-    'professed',
-    'professor',
-    'profile',
-    'profound',
-    'profusely',
-    'progeny',
-    'prognosis',
-    'program',
-    'progress',
-    'projector',
-    'prologue',
-    'prolonged',
-    'promenade',
-    'prominent',
-    'promoter',
-    'promotion',
-    'prompter',
-    'promptly',
-    'prone',
-    'prong',
-    'pronounce',
-    'pronto',
-    'proofing',
-    'proofread',
-    'proofs',
-    'propeller',
-    'properly',
-    'property',
-    'proponent',
-    'proposal',
-    'propose',
-    'props',
-    'prorate',
-    'protector',
-    'protegee',
-    'proton',
-    'prototype',
-    'protozoan',
-    'protract',
-    'protrude',
-    'proud',
-    'provable',
-    'proved',
-    'proven',
-    'provided',
-    'provider',
-    'providing',
-    'province',
-    'proving',
-    'provoke',
-    'provoking',
-    'provolone',
-    'prowess',
-    'prowler',
-    'prowling',
-    'proximity',
-    'proxy',
-    'prozac',
-    'prude',
-    'prudishly',
-    'prune',
-    'pruning',
-    'pry',
-    'psychic',
-    'public',
-    'publisher',
-    'pucker',
-    'pueblo',
-    'pug',
-    'pull',
-    'pulmonary',
-    'pulp',
-    'pulsate',
-    'pulse',
-    'pulverize',
-    'puma',
-    'pumice',
-    'pummel',
-    'punch',
-    'punctual',
-    'punctuate',
-    'punctured',
-    'pungent',
-    'punisher',
-    'punk',
-    'pupil',
-    'puppet',
-    'puppy',
-    'purchase',
-    'pureblood',
-    'purebred',
-    'purely',
-    'pureness',
-    'purgatory',
-    'purge',
-    'purging',
-    'purifier',
-    'purify',
-    'purist',
-    'puritan',
-    'purity',
-    'purple',
-    'purplish',
-    'purposely',
-    'purr',
-    'purse',
-    'pursuable',
-    'pursuant',
-    'pursuit',
-    'purveyor',
-    'pushcart',
-    'pushchair',
-    'pusher',
-    'pushiness',
-    'pushing',
-    'pushover',
-    'pushpin',
-    'pushup',
-    'pushy',
-    'putdown',
-    'putt',
-    'puzzle',
-    'puzzling',
-    'pyramid',
-    'pyromania',
-    'python',
-    'quack',
-    'quadrant',
-    'quail',
-    'quaintly',
-    'quake',
-    'quaking',
-    'qualified',
-    'qualifier',
-    'qualify',
-    'quality',
-    'qualm',
-    'quantum',
-    'quarrel',
-    'quarry',
-    'quartered',
-    'quarterly',
-    'quarters',
-    'quartet',
-    'quench',
-    'query',
-    'quicken',
-    'quickly',
-    'quickness',
-    'quicksand',
-    'quickstep',
-    'quiet',
-    'quill',
-    'quilt',
-    'quintet',
-    'quintuple',
-    'quirk',
-    'quit',
-    'quiver',
-    'quizzical',
-    'quotable',
-    'quotation',
-    'quote',
-    'rabid',
-    'race',
-    'racing',
-    'racism',
-    'rack',
-    'racoon',
-    'radar',
-    'radial',
-    'radiance',
-    'radiantly',
-    'radiated',
-    'radiation',
-    'radiator',
-    'radio',
-    'radish',
-    'raffle',
-    'raft',
-    'rage',
-    'ragged',
-    'raging',
-    'ragweed',
-    'raider',
-    'railcar',
-    'railing',
-    'railroad',
-    'railway',
-    'raisin',
-    'rake',
-    'raking',
-    'rally',
-    'ramble',
-    'rambling',
-    'ramp',
-    'ramrod',
-    'ranch',
-    'rancidity',
-    'random',
-    'ranged',
-    'ranger',
-    'ranging',
-    'ranked',
-    'ranking',
-    'ransack',
-    'ranting',
-    'rants',
-    'rare',
-    'rarity',
-    'rascal',
-    'rash',
-    'rasping',
-    'ravage',
-    'raven',
-    'ravine',
-    'raving',
-    'ravioli',
-    'ravishing',
-    'reabsorb',
-    'reach',
-    'reacquire',
-    'reaction',
-    'reactive',
-    'reactor',
-    'reaffirm',
-    'ream',
-    'reanalyze',
-    'reappear',
-    'reapply',
-    'reappoint',
-    'reapprove',
-    'rearrange',
-    'rearview',
-    'reason',
-    'reassign',
-    'reassure',
-    'reattach',
-    'reawake',
-    'rebalance',
-    'rebate',
-    'rebel',
-    'rebirth',
-    'reboot',
-    'reborn',
-    'rebound',
-    'rebuff',
-    'rebuild',
-    'rebuilt',
-    'reburial',
-    'rebuttal',
-    'recall',
-    'recant',
-    'recapture',
-    'recast',
-    'recede',
-    'recent',
-    'recess',
-    'recharger',
-    'recipient',
-    'recital',
-    'recite',
-    'reckless',
-    'reclaim',
-    'recliner',
-    'reclining',
-    'recluse',
-    'reclusive',
-    'recognize',
-    'recoil',
-    'recollect',
-    'recolor',
-    'reconcile',
-    'reconfirm',
-    'reconvene',
-    'recopy',
-    'record',
-    'recount',
-    'recoup',
-    'recovery',
-    'recreate',
-    'rectal',
-    'rectangle',
-    'rectified',
-    'rectify',
-    'recycled',
-    'recycler',
-    'recycling',
-    'reemerge',
-    'reenact',
-    'reenter',
-    'reentry',
-    'reexamine',
-    'referable',
-    'referee',
-    'reference',
-    'refill',
-    'refinance',
-    'refined',
-    'refinery',
-    'refining',
-    'refinish',
-    'reflected',
-    'reflector',
-    'reflex',
-    'reflux',
-    'refocus',
-    'refold',
-    'reforest',
-    'reformat',
-    'reformed',
-    'reformer',
-    'reformist',
-    'refract',
-    'refrain',
-    'refreeze',
-    'refresh',
-    'refried',
-    'refueling',
-    'refund',
-    'refurbish',
-    'refurnish',
-    'refusal',
-    'refuse',
-    'refusing',
-    'refutable',
-    'refute',
-    'regain',
-    'regalia',
-    'regally',
-    'reggae',
-    'regime',
-    'region',
-    'register',
-    'registrar',
-    'registry',
-    'regress',
-    'regretful',
-    'regroup',
-    'regular',
-    'regulate',
-    'regulator',
-    'rehab',
-    'reheat',
-    'rehire',
-    'rehydrate',
-    'reimburse',
-    'reissue',
-    'reiterate',
-    'rejoice',
-    'rejoicing',
-    'rejoin',
-    'rekindle',
-    'relapse',
-    'relapsing',
-    'relatable',
-    'related',
-    'relation',
-    'relative',
-    'relax',
-    'relay',
-    'relearn',
-    'release',
-    'relenting',
-    'reliable',
-    'reliably',
-    'reliance',
-    'reliant',
-    'relic',
-    'relieve',
-    'relieving',
-    'relight',
-    'relish',
-    'relive',
-    'reload',
-    'relocate',
-    'relock',
-    'reluctant',
-    'rely',
-    'remake',
-    'remark',
-    'remarry',
-    'rematch',
-    'remedial',
-    'remedy',
-    'remember',
-    'reminder',
-    'remindful',
-    'remission',
-    'remix',
-    'remnant',
-    'remodeler',
-    'remold',
-    'remorse',
-    'remote',
-    'removable',
-    'removal',
-    'removed',
-    'remover',
-    'removing',
-    'rename',
-    'renderer',
-    'rendering',
-    'rendition',
-    'renegade',
-    'renewable',
-    'renewably',
-    'renewal',
-    'renewed',
-    'renounce',
-    'renovate',
-    'renovator',
-    'rentable',
-    'rental',
-    'rented',
-    'renter',
-    'reoccupy',
-    'reoccur',
-    'reopen',
-    'reorder',
-    'repackage',
-    'repacking',
-    'repaint',
-    'repair',
-    'repave',
-    'repaying',
-    'repayment',
-    'repeal',
-    'repeated',
-    'repeater',
-    'repent',
-    'rephrase',
-    'replace',
-    'replay',
-    'replica',
-    'reply',
-    'reporter',
-    'repose',
-    'repossess',
-    'repost',
-    'repressed',
-    'reprimand',
-    'reprint',
-    'reprise',
-    'reproach',
-    'reprocess',
-    'reproduce',
-    'reprogram',
-    'reps',
-    'reptile',
-    'reptilian',
-    'repugnant',
-    'repulsion',
-    'repulsive',
-    'repurpose',
-    'reputable',
-    'reputably',
-    'request',
-    'require',
-    'requisite',
-    'reroute',
-    'rerun',
-    'resale',
-    'resample',
-    'rescuer',
-    'reseal',
-    'research',
-    'reselect',
-    'reseller',
-    'resemble',
-    'resend',
-    'resent',
-    'reset',
-    'reshape',
-    'reshoot',
-    'reshuffle',
-    'residence',
-    'residency',
-    'resident',
-    'residual',
-    'residue',
-    'resigned',
-    'resilient',
-    'resistant',
-    'resisting',
-    'resize',
-    'resolute',
-    'resolved',
-    'resonant',
-    'resonate',
-    'resort',
-    'resource',
-    'respect',
-    'resubmit',
-    'result',
-    'resume',
-    'resupply',
-    'resurface',
-    'resurrect',
-    'retail',
-    'retainer',
-    'retaining',
-    'retake',
-    'retaliate',
-    'retention',
-    'rethink',
-    'retinal',
-    'retired',
-    'retiree',
-    'retiring',
-    'retold',
-    'retool',
-    'retorted',
-    'retouch',
-    'retrace',
-    'retract',
-    'retrain',
-    'retread',
-    'retreat',
-    'retrial',
-    'retrieval',
-    'retriever',
-    'retry',
-    'return',
-    'retying',
-    'retype',
-    'reunion',
-    'reunite',
-    'reusable',
-    'reuse',
-    'reveal',
-    'reveler',
-    'revenge',
-    'revenue',
-    'reverb',
-    'revered',
-    'reverence',
-    'reverend',
-    'reversal',
-    'reverse',
-    'reversing',
-    'reversion',
-    'revert',
-    'revisable',
-    'revise',
-    'revision',
-    'revisit',
-    'revivable',
-    'revival',
-    'reviver',
-    'reviving',
-    'revocable',
-    'revoke',
-    'revolt',
-    'revolver',
-    'revolving',
-    'reward',
-    'rewash',
-    'rewind',
-    'rewire',
-    'reword',
-    'rework',
-    'rewrap',
-    'rewrite',
-    'rhyme',
-    'ribbon',
-    'ribcage',
-    'rice',
-    'riches',
-    'richly',
-    'richness',
-    'rickety',
-    'ricotta',
-    'riddance',
-    'ridden',
-    'ride',
-    'riding',
-    'rifling',
-    'rift',
-    'rigging',
-    'rigid',
-    'rigor',
-    'rimless',
-    'rimmed',
-    'rind',
-    'rink',
-    'rinse',
-    'rinsing',
-    'riot',
-    'ripcord',
-    'ripeness',
-    'ripening',
-    'ripping',
-    'ripple',
-    'rippling',
-    'riptide',
-    'rise',
-    'rising',
-    'risk',
-    'risotto',
-    'ritalin',
-    'ritzy',
-    'rival',
-    'riverbank',
-    'riverbed',
-    'riverboat',
-    'riverside',
-    'riveter',
-    'riveting',
-    'roamer',
-    'roaming',
-    'roast',
-    'robbing',
-    'robe',
-    'robin',
-    'robotics',
-    'robust',
-    'rockband',
-    'rocker',
-    'rocket',
-    'rockfish',
-    'rockiness',
-    'rocking',
-    'rocklike',
-    'rockslide',
-    'rockstar',
-    'rocky',
-    'rogue',
-    'roman',
-    'romp',
-    'rope',
-    'roping',
-    'roster',
-    'rosy',
-    'rotten',
-    'rotting',
-    'rotunda',
-    'roulette',
-    'rounding',
-    'roundish',
-    'roundness',
-    'roundup',
-    'roundworm',
-    'routine',
-    'routing',
-    'rover',
-    'roving',
-    'royal',
-    'rubbed',
-    'rubber',
-    'rubbing',
-    'rubble',
-    'rubdown',
-    'ruby',
-    'ruckus',
-    'rudder',
-    'rug',
-    'ruined',
-    'rule',
-    'rumble',
-    'rumbling',
-    'rummage',
-    'rumor',
-    'runaround',
-    'rundown',
-    'runner',
-    'running',
-    'runny',
-    'runt',
-    'runway',
-    'rupture',
-    'rural',
-    'ruse',
-    'rush',
-    'rust',
-    'rut',
-    'sabbath',
-    'sabotage',
-    'sacrament',
-    'sacred',
-    'sacrifice',
-    'sadden',
-    'saddlebag',
-    'saddled',
-    'saddling',
-    'sadly',
-    'sadness',
-    'safari',
-    'safeguard',
-    'safehouse',
-    'safely',
-    'safeness',
-    'saffron',
-    'saga',
-    'sage',
-    'sagging',
-    'saggy',
-    'said',
-    'saint',
-    'sake',
-    'salad',
-    'salami',
-    'salaried',
-    'salary',
-    'saline',
-    'salon',
-    'saloon',
-    'salsa',
-    'salt',
-    'salutary',
-    'salute',
-    'salvage',
-    'salvaging',
-    'salvation',
-    'same',
-    'sample',
-    'sampling',
-    'sanction',
-    'sanctity',
-    'sanctuary',
-    'sandal',
-    'sandbag',
-    'sandbank',
-    'sandbar',
-    'sandblast',
-    'sandbox',
-    'sanded',
-    'sandfish',
-    'sanding',
-    'sandlot',
-    'sandpaper',
-    'sandpit',
-    'sandstone',
-    'sandstorm',
-    'sandworm',
-    'sandy',
-    'sanitary',
-    'sanitizer',
-    'sank',
-    'santa',
-    'sapling',
-    'sappiness',
-    'sappy',
-    'sarcasm',
-    'sarcastic',
-    'sardine',
-    'sash',
-    'sasquatch',
-    'sassy',
-    'satchel',
-    'satiable',
-    'satin',
-    'satirical',
-    'satisfied',
-    'satisfy',
-    'saturate',
-    'saturday',
-    'sauciness',
-    'saucy',
-    'sauna',
-    'savage',
-    'savanna',
-    'saved',
-    'savings',
-    'savior',
-    'savor',
-    'saxophone',
-    'say',
-    'scabbed',
-    'scabby',
-    'scalded',
-    'scalding',
-    'scale',
-    'scaling',
-    'scallion',
-    'scallop',
-    'scalping',
-    'scam',
-    'scandal',
-    'scanner',
-    'scanning',
-    'scant',
-    'scapegoat',
-    'scarce',
-    'scarcity',
-    'scarecrow',
-    'scared',
-    'scarf',
-    'scarily',
-    'scariness',
-    'scarring',
-    'scary',
-    'scavenger',
-    'scenic',
-    'schedule',
-    'schematic',
-    'scheme',
-    'scheming',
-    'schilling',
-    'schnapps',
-    'scholar',
-    'science',
-    'scientist',
-    'scion',
-    'scoff',
-    'scolding',
-    'scone',
-    'scoop',
-    'scooter',
-    'scope',
-    'scorch',
-    'scorebook',
-    'scorecard',
-    'scored',
-    'scoreless',
-    'scorer',
-    'scoring',
-    'scorn',
-    'scorpion',
-    'scotch',
-    'scoundrel',
-    'scoured',
-    'scouring',
-    'scouting',
-    'scouts',
-    'scowling',
-    'scrabble',
-    'scraggly',
-    'scrambled',
-    'scrambler',
-    'scrap',
-    'scratch',
-    'scrawny',
-    'screen',
-    'scribble',
-    'scribe',
-    'scribing',
-    'scrimmage',
-    'script',
-    'scroll',
-    'scrooge',
-    'scrounger',
-    'scrubbed',
-    'scrubber',
-    'scruffy',
-    'scrunch',
-    'scrutiny',
-    'scuba',
-    'scuff',
-    'sculptor',
-    'sculpture',
-    'scurvy',
-    'scuttle',
-    'secluded',
-    'secluding',
-    'seclusion',
-    'second',
-    'secrecy',
-    'secret',
-    'sectional',
-    'sector',
-    'secular',
-    'securely',
-    'security',
-    'sedan',
-    'sedate',
-    'sedation',
-    'sedative',
-    'sediment',
-    'seduce',
-    'seducing',
-    'segment',
-    'seismic',
-    'seizing',
-    'seldom',
-    'selected',
-    'selection',
-    'selective',
-    'selector',
-    'self',
-    'seltzer',
-    'semantic',
-    'semester',
-    'semicolon',
-    'semifinal',
-    'seminar',
-    'semisoft',
-    'semisweet',
-    'senate',
-    'senator',
-    'send',
-    'senior',
-    'senorita',
-    'sensation',
-    'sensitive',
-    'sensitize',
-    'sensually',
-    'sensuous',
-    'sepia',
-    'september',
-    'septic',
-    'septum',
-    'sequel',
-    'sequence',
-    'sequester',
-    'series',
-    'sermon',
-    'serotonin',
-    'serpent',
-    'serrated',
-    'serve',
-    'service',
-    'serving',
-    'sesame',
-    'sessions',
-    'setback',
-    'setting',
-    'settle',
-    'settling',
-    'setup',
-    'sevenfold',
-    'seventeen',
-    'seventh',
-    'seventy',
-    'severity',
-    'shabby',
-    'shack',
-    'shaded',
-    'shadily',
-    'shadiness',
-    'shading',
-    'shadow',
-    'shady',
-    'shaft',
-    'shakable',
-    'shakily',
-    'shakiness',
-    'shaking',
-    'shaky',
-    'shale',
-    'shallot',
-    'shallow',
-    'shame',
-    'shampoo',
-    'shamrock',
-    'shank',
-    'shanty',
-    'shape',
-    'shaping',
-    'share',
-    'sharpener',
-    'sharper',
-    'sharpie',
-    'sharply',
-    'sharpness',
-    'shawl',
-    'sheath',
-    'shed',
-    'sheep',
-    'sheet',
-    'shelf',
-    'shell',
-    'shelter',
-    'shelve',
-    'shelving',
-    'sherry',
-    'shield',
-    'shifter',
-    'shifting',
-    'shiftless',
-    'shifty',
-    'shimmer',
-    'shimmy',
-    'shindig',
-    'shine',
-    'shingle',
-    'shininess',
-    'shining',
-    'shiny',
-    'ship',
-    'shirt',
-    'shivering',
-    'shock',
-    'shone',
-    'shoplift',
-    'shopper',
-    'shopping',
-    'shoptalk',
-    'shore',
-    'shortage',
-    'shortcake',
-    'shortcut',
-    'shorten',
-    'shorter',
-    'shorthand',
-    'shortlist',
-    'shortly',
-    'shortness',
-    'shorts',
-    'shortwave',
-    'shorty',
-    'shout',
-    'shove',
-    'showbiz',
-    'showcase',
-    'showdown',
-    'shower',
-    'showgirl',
-    'showing',
-    'showman',
-    'shown',
-    'showoff',
-    'showpiece',
-    'showplace',
-    'showroom',
-    'showy',
-    'shrank',
-    'shrapnel',
-    'shredder',
-    'shredding',
-    'shrewdly',
-    'shriek',
-    'shrill',
-    'shrimp',
-    'shrine',
-    'shrink',
-    'shrivel',
-    'shrouded',
-    'shrubbery',
-    'shrubs',
-    'shrug',
-    'shrunk',
-    'shucking',
-    'shudder',
-    'shuffle',
-    'shuffling',
-    'shun',
-    'shush',
-    'shut',
-    'shy',
-    'siamese',
-    'siberian',
-    'sibling',
-    'siding',
-    'sierra',
-    'siesta',
-    'sift',
-    'sighing',
-    'silenced',
-    'silencer',
-    'silent',
-    'silica',
-    'silicon',
-    'silk',
-    'silliness',
-    'silly',
-    'silo',
-    'silt',
-    'silver',
-    'similarly',
-    'simile',
-    'simmering',
-    'simple',
-    'simplify',
-    'simply',
-    'sincere',
-    'sincerity',
-    'singer',
-    'singing',
-    'single',
-    'singular',
-    'sinister',
-    'sinless',
-    'sinner',
-    'sinuous',
-    'sip',
-    'siren',
-    'sister',
-    'sitcom',
-    'sitter',
-    'sitting',
-    'situated',
-    'situation',
-    'sixfold',
-    'sixteen',
-    'sixth',
-    'sixties',
-    'sixtieth',
-    'sixtyfold',
-    'sizable',
-    'sizably',
-    'size',
-    'sizing',
-    'sizzle',
-    'sizzling',
-    'skater',
-    'skating',
-    'skedaddle',
-    'skeletal',
-    'skeleton',
-    'skeptic',
-    'sketch',
-    'skewed',
-    'skewer',
-    'skid',
-    'skied',
-    'skier',
-    'skies',
-    'skiing',
-    'skilled',
-    'skillet',
-    'skillful',
-    'skimmed',
-    'skimmer',
-    'skimming',
-    'skimpily',
-    'skincare',
-    'skinhead',
-    'skinless',
-    'skinning',
-    'skinny',
-    'skintight',
-    'skipper',
-    'skipping',
-    'skirmish',
-    'skirt',
-    'skittle',
-    'skydiver',
-    'skylight',
-    'skyline',
-    'skype',
-    'skyrocket',
-    'skyward',
-    'slab',
-    'slacked',
-    'slacker',
-    'slacking',
-    'slackness',
-    'slacks',
-    'slain',
-    'slam',
-    'slander',
-    'slang',
-    'slapping',
-    'slapstick',
-    'slashed',
-    'slashing',
-    'slate',
-    'slather',
-    'slaw',
-    'sled',
-    'sleek',
-    'sleep',
-    'sleet',
-    'sleeve',
-    'slept',
-    'sliceable',
-    'sliced',
-    'slicer',
-    'slicing',
-    'slick',
-    'slider',
-    'slideshow',
-    'sliding',
-    'slighted',
-    'slighting',
-    'slightly',
-    'slimness',
-    'slimy',
-    'slinging',
-    'slingshot',
-    'slinky',
-    'slip',
-    'slit',
-    'sliver',
-    'slobbery',
-    'slogan',
-    'sloped',
-    'sloping',
-    'sloppily',
-    'sloppy',
-    'slot',
-    'slouching',
-    'slouchy',
-    'sludge',
-    'slug',
-    'slum',
-    'slurp',
-    'slush',
-    'sly',
-    'small',
-    'smartly',
-    'smartness',
-    'smasher',
-    'smashing',
-    'smashup',
-    'smell',
-    'smelting',
-    'smile',
-    'smilingly',
-    'smirk',
-    'smite',
-    'smith',
-    'smitten',
-    'smock',
-    'smog',
-    'smoked',
-    'smokeless',
-    'smokiness',
-    'smoking',
-    'smoky',
-    'smolder',
-    'smooth',
-    'smother',
-    'smudge',
-    'smudgy',
-    'smuggler',
-    'smuggling',
-    'smugly',
-    'smugness',
-    'snack',
-    'snagged',
-    'snaking',
-    'snap',
-    'snare',
-    'snarl',
-    'snazzy',
-    'sneak',
-    'sneer',
-    'sneeze',
-    'sneezing',
-    'snide',
-    'sniff',
-    'snippet',
-    'snipping',
-    'snitch',
-    'snooper',
-    'snooze',
-    'snore',
-    'snoring',
-    'snorkel',
-    'snort',
-    'snout',
-    'snowbird',
-    'snowboard',
-    'snowbound',
-    'snowcap',
-    'snowdrift',
-    'snowdrop',
-    'snowfall',
-    'snowfield',
-    'snowflake',
-    'snowiness',
-    'snowless',
-    'snowman',
-    'snowplow',
-    'snowshoe',
-    'snowstorm',
-    'snowsuit',
-    'snowy',
-    'snub',
-    'snuff',
-    'snuggle',
-    'snugly',
-    'snugness',
-    'speak',
-    'spearfish',
-    'spearhead',
-    'spearman',
-    'spearmint',
-    'species',
-    'specimen',
-    'specked',
-    'speckled',
-    'specks',
-    'spectacle',
-    'spectator',
-    'spectrum',
-    'speculate',
-    'speech',
-    'speed',
-    'spellbind',
-    'speller',
-    'spelling',
-    'spendable',
-    'spender',
-    'spending',
-    'spent',
-    'spew',
-    'sphere',
-    'spherical',
-    'sphinx',
-    'spider',
-    'spied',
-    'spiffy',
-    'spill',
-    'spilt',
-    'spinach',
-    'spinal',
-    'spindle',
-    'spinner',
-    'spinning',
-    'spinout',
-    'spinster',
-    'spiny',
-    'spiral',
-    'spirited',
-    'spiritism',
-    'spirits',
-    'spiritual',
-    'splashed',
-    'splashing',
-    'splashy',
-    'splatter',
-    'spleen',
-    'splendid',
-    'splendor',
-    'splice',
-    'splicing',
-    'splinter',
-    'splotchy',
-    'splurge',
-    'spoilage',
-    'spoiled',
-    'spoiler',
-    'spoiling',
-    'spoils',
-    'spoken',
-    'spokesman',
-    'sponge',
-    'spongy',
-    'sponsor',
-    'spoof',
-    'spookily',
-    'spooky',
-    'spool',
-    'spoon',
-    'spore',
-    'sporting',
-    'sports',
-    'sporty',
-    'spotless',
-    'spotlight',
-    'spotted',
-    'spotter',
-    'spotting',
-    'spotty',
-    'spousal',
-    'spouse',
-    'spout',
-    'sprain',
-    'sprang',
-    'sprawl',
-    'spray',
-    'spree',
-    'sprig',
-    'spring',
-    'sprinkled',
-    'sprinkler',
-    'sprint',
-    'sprite',
-    'sprout',
-    'spruce',
-    'sprung',
-    'spry',
-    'spud',
-    'spur',
-    'sputter',
-    'spyglass',
-    'squabble',
-    'squad',
-    'squall',
-    'squander',
-    'squash',
-    'squatted',
-    'squatter',
-    'squatting',
-    'squeak',
-    'squealer',
-    'squealing',
-    'squeamish',
-    'squeegee',
-    'squeeze',
-    'squeezing',
-    'squid',
-    'squiggle',
-    'squiggly',
-    'squint',
-    'squire',
-    'squirt',
-    'squishier',
-    'squishy',
-    'stability',
-    'stabilize',
-    'stable',
-    'stack',
-    'stadium',
-    'staff',
-    'stage',
-    'staging',
-    'stagnant',
-    'stagnate',
-    'stainable',
-    'stained',
-    'staining',
-    'stainless',
-    'stalemate',
-    'staleness',
-    'stalling',
-    'stallion',
-    'stamina',
-    'stammer',
-    'stamp',
-    'stand',
-    'stank',
-    'staple',
-    'stapling',
-    'starboard',
-    'starch',
-    'stardom',
-    'stardust',
-    'starfish',
-    'stargazer',
-    'staring',
-    'stark',
-    'starless',
-    'starlet',
-    'starlight',
-    'starlit',
-    'starring',
-    'starry',
-    'starship',
-    'starter',
-    'starting',
-    'startle',
-    'startling',
-    'startup',
-    'starved',
-    'starving',
-    'stash',
-    'state',
-    'static',
-    'statistic',
-    'statue',
-    'stature',
-    'status',
-    'statute',
-    'statutory',
-    'staunch',
-    'stays',
-    'steadfast',
-    'steadier',
-    'steadily',
-    'steadying',
-    'steam',
-    'steed',
-    'steep',
-    'steerable',
-    'steering',
-    'steersman',
-    'stegosaur',
-    'stellar',
-    'stem',
-    'stench',
-    'stencil',
-    'step',
-    'stereo',
-    'sterile',
-    'sterility',
-    'sterilize',
-    'sterling',
-    'sternness',
-    'sternum',
-    'stew',
-    'stick',
-    'stiffen',
-    'stiffly',
-    'stiffness',
-    'stifle',
-    'stifling',
-    'stillness',
-    'stilt',
-    'stimulant',
-    'stimulate',
-    'stimuli',
-    'stimulus',
-    'stinger',
-    'stingily',
-    'stinging',
-    'stingray',
-    'stingy',
-    'stinking',
-    'stinky',
-    'stipend',
-    'stipulate',
-    'stir',
-    'stitch',
-    'stock',
-    'stoic',
-    'stoke',
-    'stole',
-    'stomp',
-    'stonewall',
-    'stoneware',
-    'stonework',
-    'stoning',
-    'stony',
-    'stood',
-    'stooge',
-    'stool',
-    'stoop',
-    'stoplight',
-    'stoppable',
-    'stoppage',
-    'stopped',
-    'stopper',
-    'stopping',
-    'stopwatch',
-    'storable',
-    'storage',
-    'storeroom',
-    'storewide',
-    'storm',
-    'stout',
-    'stove',
-    'stowaway',
-    'stowing',
-    'straddle',
-    'straggler',
-    'strained',
-    'strainer',
-    'straining',
-    'strangely',
-    'stranger',
-    'strangle',
-    'strategic',
-    'strategy',
-    'stratus',
-    'straw',
-    'stray',
-    'streak',
-    'stream',
-    'street',
-    'strength',
-    'strenuous',
-    'strep',
-    'stress',
-    'stretch',
-    'strewn',
-    'stricken',
-    'strict',
-    'stride',
-    'strife',
-    'strike',
-    'striking',
-    'strive',
-    'striving',
-    'strobe',
-    'strode',
-    'stroller',
-    'strongbox',
-    'strongly',
-    'strongman',
-    'struck',
-    'structure',
-    'strudel',
-    'struggle',
-    'strum',
-    'strung',
-    'strut',
-    'stubbed',
-    'stubble',
-    'stubbly',
-    'stubborn',
-    'stucco',
-    'stuck',
-    'student',
-    'studied',
-    'studio',
-    'study',
-    'stuffed',
-    'stuffing',
-    'stuffy',
-    'stumble',
-    'stumbling',
-    'stump',
-    'stung',
-    'stunned',
-    'stunner',
-    'stunning',
-    'stunt',
-    'stupor',
-    'sturdily',
-    'sturdy',
-    'styling',
-    'stylishly',
-    'stylist',
-    'stylized',
-    'stylus',
-    'suave',
-    'subarctic',
-    'subatomic',
-    'subdivide',
-    'subdued',
-    'subduing',
-    'subfloor',
-    'subgroup',
-    'subheader',
-    'subject',
-    'sublease',
-    'sublet',
-    'sublevel',
-    'sublime',
-    'submarine',
-    'submerge',
-    'submersed',
-    'submitter',
-    'subpanel',
-    'subpar',
-    'subplot',
-    'subprime',
-    'subscribe',
-    'subscript',
-    'subsector',
-    'subside',
-    'subsiding',
-    'subsidize',
-    'subsidy',
-    'subsoil',
-    'subsonic',
-    'substance',
-    'subsystem',
-    'subtext',
-    'subtitle',
-    'subtly',
-    'subtotal',
-    'subtract',
-    'subtype',
-    'suburb',
-    'subway',
-    'subwoofer',
-    'subzero',
-    'succulent',
-    'such',
-    'suction',
-    'sudden',
-    'sudoku',
-    'suds',
-    'sufferer',
-    'suffering',
-    'suffice',
-    'suffix',
-    'suffocate',
-    'suffrage',
-    'sugar',
-    'suggest',
-    'suing',
-    'suitable',
-    'suitably',
-    'suitcase',
-    'suitor',
-    'sulfate',
-    'sulfide',
-    'sulfite',
-    'sulfur',
-    'sulk',
-    'sullen',
-    'sulphate',
-    'sulphuric',
-    'sultry',
-    'superbowl',
-    'superglue',
-    'superhero',
-    'superior',
-    'superjet',
-    'superman',
-    'supermom',
-    'supernova',
-    'supervise',
-    'supper',
-    'supplier',
-    'supply',
-    'support',
-    'supremacy',
-    'supreme',
-    'surcharge',
-    'surely',
-    'sureness',
-    'surface',
-    'surfacing',
-    'surfboard',
-    'surfer',
-    'surgery',
-    'surgical',
-    'surging',
-    'surname',
-    'surpass',
-    'surplus',
-    'surprise',
-    'surreal',
-    'surrender',
-    'surrogate',
-    'surround',
-    'survey',
-    'survival',
-    'survive',
-    'surviving',
-    'survivor',
-    'sushi',
-    'suspect',
-    'suspend',
-    'suspense',
-    'sustained',
-    'sustainer',
-    'swab',
-    'swaddling',
-    'swagger',
-    'swampland',
-    'swan',
-    'swapping',
-    'swarm',
-    'sway',
-    'swear',
-    'sweat',
-    'sweep',
-    'swell',
-    'swept',
-    'swerve',
-    'swifter',
-    'swiftly',
-    'swiftness',
-    'swimmable',
-    'swimmer',
-    'swimming',
-    'swimsuit',
-    'swimwear',
-    'swinger',
-    'swinging',
-    'swipe',
-    'swirl',
-    'switch',
-    'swivel',
-    'swizzle',
-    'swooned',
-    'swoop',
-    'swoosh',
-    'swore',
-    'sworn',
-    'swung',
-    'sycamore',
-    'sympathy',
-    'symphonic',
-    'symphony',
-    'symptom',
-    'synapse',
-    'syndrome',
-    'synergy',
-    'synopses',
-    'synopsis',
-    'synthesis',
-    'synthetic',
-    'syrup',
-    'system',
-    't-shirt',
-    'tabasco',
-    'tabby',
-    'tableful',
-    'tables',
-    'tablet',
-    'tableware',
-    'tabloid',
-    'tackiness',
-    'tacking',
-    'tackle',
-    'tackling',
-    'tacky',
-    'taco',
-    'tactful',
-    'tactical',
-    'tactics',
-    'tactile',
-    'tactless',
-    'tadpole',
-    'taekwondo',
-    'tag',
-    'tainted',
-    'take',
-    'taking',
-    'talcum',
-    'talisman',
-    'tall',
-    'talon',
-    'tamale',
-    'tameness',
-    'tamer',
-    'tamper',
-    'tank',
-    'tanned',
-    'tannery',
-    'tanning',
-    'tantrum',
-    'tapeless',
-    'tapered',
-    'tapering',
-    'tapestry',
-    'tapioca',
-    'tapping',
-    'taps',
-    'tarantula',
-    'target',
-    'tarmac',
-    'tarnish',
-    'tarot',
-    'tartar',
-    'tartly',
-    'tartness',
-    'task',
-    'tassel',
-    'taste',
-    'tastiness',
-    'tasting',
-    'tasty',
-    'tattered',
-    'tattle',
-    'tattling',
-    'tattoo',
-    'taunt',
-    'tavern',
-    'thank',
-    'that',
-    'thaw',
-    'theater',
-    'theatrics',
-    'thee',
-    'theft',
-    'theme',
-    'theology',
-    'theorize',
-    'thermal',
-    'thermos',
-    'thesaurus',
-    'these',
-    'thesis',
-    'thespian',
-    'thicken',
-    'thicket',
-    'thickness',
-    'thieving',
-    'thievish',
-    'thigh',
-    'thimble',
-    'thing',
-    'think',
-    'thinly',
-    'thinner',
-    'thinness',
-    'thinning',
-    'thirstily',
-    'thirsting',
-    'thirsty',
-    'thirteen',
-    'thirty',
-    'thong',
-    'thorn',
-    'those',
-    'thousand',
-    'thrash',
-    'thread',
-    'threaten',
-    'threefold',
-    'thrift',
-    'thrill',
-    'thrive',
-    'thriving',
-    'throat',
-    'throbbing',
-    'throng',
-    'throttle',
-    'throwaway',
-    'throwback',
-    'thrower',
-    'throwing',
-    'thud',
-    'thumb',
-    'thumping',
-    'thursday',
-    'thus',
-    'thwarting',
-    'thyself',
-    'tiara',
-    'tibia',
-    'tidal',
-    'tidbit',
-    'tidiness',
-    'tidings',
-    'tidy',
-    'tiger',
-    'tighten',
-    'tightly',
-    'tightness',
-    'tightrope',
-    'tightwad',
-    'tigress',
-    'tile',
-    'tiling',
-    'till',
-    'tilt',
-    'timid',
-    'timing',
-    'timothy',
-    'tinderbox',
-    'tinfoil',
-    'tingle',
-    'tingling',
-    'tingly',
-    'tinker',
-    'tinkling',
-    'tinsel',
-    'tinsmith',
-    'tint',
-    'tinwork',
-    'tiny',
-    'tipoff',
-    'tipped',
-    'tipper',
-    'tipping',
-    'tiptoeing',
-    'tiptop',
-    'tiring',
-    'tissue',
-    'trace',
-    'tracing',
-    'track',
-    'traction',
-    'tractor',
-    'trade',
-    'trading',
-    'tradition',
-    'traffic',
-    'tragedy',
-    'trailing',
-    'trailside',
-    'train',
-    'traitor',
-    'trance',
-    'tranquil',
-    'transfer',
-    'transform',
-    'translate',
-    'transpire',
-    'transport',
-    'transpose',
-    'trapdoor',
-    'trapeze',
-    'trapezoid',
-    'trapped',
-    'trapper',
-    'trapping',
-    'traps',
-    'trash',
-    'travel',
-    'traverse',
-    'travesty',
-    'tray',
-    'treachery',
-    'treading',
-    'treadmill',
-    'treason',
-    'treat',
-    'treble',
-    'tree',
-    'trekker',
-    'tremble',
-    'trembling',
-    'tremor',
-    'trench',
-    'trend',
-    'trespass',
-    'triage',
-    'trial',
-    'triangle',
-    'tribesman',
-    'tribunal',
-    'tribune',
-    'tributary',
-    'tribute',
-    'triceps',
-    'trickery',
-    'trickily',
-    'tricking',
-    'trickle',
-    'trickster',
-    'tricky',
-    'tricolor',
-    'tricycle',
-    'trident',
-    'tried',
-    'trifle',
-    'trifocals',
-    'trillion',
-    'trilogy',
-    'trimester',
-    'trimmer',
-    'trimming',
-    'trimness',
-    'trinity',
-    'trio',
-    'tripod',
-    'tripping',
-    'triumph',
-    'trivial',
-    'trodden',
-    'trolling',
-    'trombone',
-    'trophy',
-    'tropical',
-    'tropics',
-    'trouble',
-    'troubling',
-    'trough',
-    'trousers',
-    'trout',
-    'trowel',
-    'truce',
-    'truck',
-    'truffle',
-    'trump',
-    'trunks',
-    'trustable',
-    'trustee',
-    'trustful',
-    'trusting',
-    'trustless',
-    'truth',
-    'try',
-    'tubby',
-    'tubeless',
-    'tubular',
-    'tucking',
-    'tuesday',
-    'tug',
-    'tuition',
-    'tulip',
-    'tumble',
-    'tumbling',
-    'tummy',
-    'turban',
-    'turbine',
-    'turbofan',
-    'turbojet',
-    'turbulent',
-    'turf',
-    'turkey',
-    'turmoil',
-    'turret',
-    'turtle',
-    'tusk',
-    'tutor',
-    'tutu',
-    'tux',
-    'tweak',
-    'tweed',
-    'tweet',
-    'tweezers',
-    'twelve',
-    'twentieth',
-    'twenty',
-    'twerp',
-    'twice',
-    'twiddle',
-    'twiddling',
-    'twig',
-    'twilight',
-    'twine',
-    'twins',
-    'twirl',
-    'twistable',
-    'twisted',
-    'twister',
-    'twisting',
-    'twisty',
-    'twitch',
-    'twitter',
-    'tycoon',
-    'tying',
-    'tyke',
-    'udder',
-    'ultimate',
-    'ultimatum',
-    'ultra',
-    'umbilical',
-    'umbrella',
-    'umpire',
-    'unabashed',
-    'unable',
-    'unadorned',
-    'unadvised',
-    'unafraid',
-    'unaired',
-    'unaligned',
-    'unaltered',
-    'unarmored',
-    'unashamed',
-    'unaudited',
-    'unawake',
-    'unaware',
-    'unbaked',
-    'unbalance',
-    'unbeaten',
-    'unbend',
-    'unbent',
-    'unbiased',
-    'unbitten',
-    'unblended',
-    'unblessed',
-    'unblock',
-    'unbolted',
-    'unbounded',
-    'unboxed',
-    'unbraided',
-    'unbridle',
-    'unbroken',
-    'unbuckled',
-    'unbundle',
-    'unburned',
-    'unbutton',
-    'uncanny',
-    'uncapped',
-    'uncaring',
-    'uncertain',
-    'unchain',
-    'unchanged',
-    'uncharted',
-    'uncheck',
-    'uncivil',
-    'unclad',
-    'unclaimed',
-    'unclamped',
-    'unclasp',
-    'uncle',
-    'unclip',
-    'uncloak',
-    'unclog',
-    'unclothed',
-    'uncoated',
-    'uncoiled',
-    'uncolored',
-    'uncombed',
-    'uncommon',
-    'uncooked',
-    'uncork',
-    'uncorrupt',
-    'uncounted',
-    'uncouple',
-    'uncouth',
-    'uncover',
-    'uncross',
-    'uncrown',
-    'uncrushed',
-    'uncured',
-    'uncurious',
-    'uncurled',
-    'uncut',
-    'undamaged',
-    'undated',
-    'undaunted',
-    'undead',
-    'undecided',
-    'undefined',
-    'underage',
-    'underarm',
-    'undercoat',
-    'undercook',
-    'undercut',
-    'underdog',
-    'underdone',
-    'underfed',
-    'underfeed',
-    'underfoot',
-    'undergo',
-    'undergrad',
-    'underhand',
-    'underline',
-    'underling',
-    'undermine',
-    'undermost',
-    'underpaid',
-    'underpass',
-    'underpay',
-    'underrate',
-    'undertake',
-    'undertone',
-    'undertook',
-    'undertow',
-    'underuse',
-    'underwear',
-    'underwent',
-    'underwire',
-    'undesired',
-    'undiluted',
-    'undivided',
-    'undocked',
-    'undoing',
-    'undone',
-    'undrafted',
-    'undress',
-    'undrilled',
-    'undusted',
-    'undying',
-    'unearned',
-    'unearth',
-    'unease',
-    'uneasily',
-    'uneasy',
-    'uneatable',
-    'uneaten',
-    'unedited',
-    'unelected',
-    'unending',
-    'unengaged',
-    'unenvied',
-    'unequal',
-    'unethical',
-    'uneven',
-    'unexpired',
-    'unexposed',
-    'unfailing',
-    'unfair',
-    'unfasten',
-    'unfazed',
-    'unfeeling',
-    'unfiled',
-    'unfilled',
-    'unfitted',
-    'unfitting',
-    'unfixable',
-    'unfixed',
-    'unflawed',
-    'unfocused',
-    'unfold',
-    'unfounded',
-    'unframed',
-    'unfreeze',
-    'unfrosted',
-    'unfrozen',
-    'unfunded',
-    'unglazed',
-    'ungloved',
-    'unglue',
-    'ungodly',
-    'ungraded',
-    'ungreased',
-    'unguarded',
-    'unguided',
-    'unhappily',
-    'unhappy',
-    'unharmed',
-    'unhealthy',
-    'unheard',
-    'unhearing',
-    'unheated',
-    'unhelpful',
-    'unhidden',
-    'unhinge',
-    'unhitched',
-    'unholy',
-    'unhook',
-    'unicorn',
-    'unicycle',
-    'unified',
-    'unifier',
-    'uniformed',
-    'uniformly',
-    'unify',
-    'unimpeded',
-    'uninjured',
-    'uninstall',
-    'uninsured',
-    'uninvited',
-    'union',
-    'uniquely',
-    'unisexual',
-    'unison',
-    'unissued',
-    'unit',
-    'universal',
-    'universe',
-    'unjustly',
-    'unkempt',
-    'unkind',
-    'unknotted',
-    'unknowing',
-    'unknown',
-    'unlaced',
-    'unlatch',
-    'unlawful',
-    'unleaded',
-    'unlearned',
-    'unleash',
-    'unless',
-    'unleveled',
-    'unlighted',
-    'unlikable',
-    'unlimited',
-    'unlined',
-    'unlinked',
-    'unlisted',
-    'unlit',
-    'unlivable',
-    'unloaded',
-    'unloader',
-    'unlocked',
-    'unlocking',
-    'unlovable',
-    'unloved',
-    'unlovely',
-    'unloving',
-    'unluckily',
-    'unlucky',
-    'unmade',
-    'unmanaged',
-    'unmanned',
-    'unmapped',
-    'unmarked',
-    'unmasked',
-    'unmasking',
-    'unmatched',
-    'unmindful',
-    'unmixable',
-    'unmixed',
-    'unmolded',
-    'unmoral',
-    'unmovable',
-    'unmoved',
-    'unmoving',
-    'unnamable',
-    'unnamed',
-    'unnatural',
-    'unneeded',
-    'unnerve',
-    'unnerving',
-    'unnoticed',
-    'unopened',
-    'unopposed',
-    'unpack',
-    'unpadded',
-    'unpaid',
-    'unpainted',
-    'unpaired',
-    'unpaved',
-    'unpeeled',
-    'unpicked',
-    'unpiloted',
-    'unpinned',
-    'unplanned',
-    'unplanted',
-    'unpleased',
-    'unpledged',
-    'unplowed',
-    'unplug',
-    'unpopular',
-    'unproven',
-    'unquote',
-    'unranked',
-    'unrated',
-    'unraveled',
-    'unreached',
-    'unread',
-    'unreal',
-    'unreeling',
-    'unrefined',
-    'unrelated',
-    'unrented',
-    'unrest',
-    'unretired',
-    'unrevised',
-    'unrigged',
-    'unripe',
-    'unrivaled',
-    'unroasted',
-    'unrobed',
-    'unroll',
-    'unruffled',
-    'unruly',
-    'unrushed',
-    'unsaddle',
-    'unsafe',
-    'unsaid',
-    'unsalted',
-    'unsaved',
-    'unsavory',
-    'unscathed',
-    'unscented',
-    'unscrew',
-    'unsealed',
-    'unseated',
-    'unsecured',
-    'unseeing',
-    'unseemly',
-    'unseen',
-    'unselect',
-    'unselfish',
-    'unsent',
-    'unsettled',
-    'unshackle',
-    'unshaken',
-    'unshaved',
-    'unshaven',
-    'unsheathe',
-    'unshipped',
-    'unsightly',
-    'unsigned',
-    'unskilled',
-    'unsliced',
-    'unsmooth',
-    'unsnap',
-    'unsocial',
-    'unsoiled',
-    'unsold',
-    'unsolved',
-    'unsorted',
-    'unspoiled',
-    'unspoken',
-    'unstable',
-    'unstaffed',
-    'unstamped',
-    'unsteady',
-    'unsterile',
-    'unstirred',
-    'unstitch',
-    'unstopped',
-    'unstuck',
-    'unstuffed',
-    'unstylish',
-    'unsubtle',
-    'unsubtly',
-    'unsuited',
-    'unsure',
-    'unsworn',
-    'untagged',
-    'untainted',
-    'untaken',
-    'untamed',
-    'untangled',
-    'untapped',
-    'untaxed',
-    'unthawed',
-    'unthread',
-    'untidy',
-    'untie',
-    'until',
-    'untimed',
-    'untimely',
-    'untitled',
-    'untoasted',
-    'untold',
-    'untouched',
-    'untracked',
-    'untrained',
-    'untreated',
-    'untried',
-    'untrimmed',
-    'untrue',
-    'untruth',
-    'unturned',
-    'untwist',
-    'untying',
-    'unusable',
-    'unused',
-    'unusual',
-    'unvalued',
-    'unvaried',
-    'unvarying',
-    'unveiled',
-    'unveiling',
-    'unvented',
-    'unviable',
-    'unvisited',
-    'unvocal',
-    'unwanted',
-    'unwarlike',
-    'unwary',
-    'unwashed',
-    'unwatched',
-    'unweave',
-    'unwed',
-    'unwelcome',
-    'unwell',
-    'unwieldy',
-    'unwilling',
-    'unwind',
-    'unwired',
-    'unwitting',
-    'unwomanly',
-    'unworldly',
-    'unworn',
-    'unworried',
-    'unworthy',
-    'unwound',
-    'unwoven',
-    'unwrapped',
-    'unwritten',
-    'unzip',
-    'upbeat',
-    'upchuck',
-    'upcoming',
-    'upcountry',
-    'update',
-    'upfront',
-    'upgrade',
-    'upheaval',
-    'upheld',
-    'uphill',
-    'uphold',
-    'uplifted',
-    'uplifting',
-    'upload',
-    'upon',
-    'upper',
-    'upright',
-    'uprising',
-    'upriver',
-    'uproar',
-    'uproot',
-    'upscale',
-    'upside',
-    'upstage',
-    'upstairs',
-    'upstart',
-    'upstate',
-    'upstream',
-    'upstroke',
-    'upswing',
-    'uptake',
-    'uptight',
-    'uptown',
-    'upturned',
-    'upward',
-    'upwind',
-    'uranium',
-    'urban',
-    'urchin',
-    'urethane',
-    'urgency',
-    'urgent',
-    'urging',
-    'urologist',
-    'urology',
-    'usable',
-    'usage',
-    'useable',
-    'used',
-    'uselessly',
-    'user',
-    'usher',
-    'usual',
-    'utensil',
-    'utility',
-    'utilize',
-    'utmost',
-    'utopia',
-    'utter',
-    'vacancy',
-    'vacant',
-    'vacate',
-    'vacation',
-    'vagabond',
-    'vagrancy',
-    'vagrantly',
-    'vaguely',
-    'vagueness',
-    'valiant',
-    'valid',
-    'valium',
-    'valley',
-    'valuables',
-    'value',
-    'vanilla',
-    'vanish',
-    'vanity',
-    'vanquish',
-    'vantage',
-    'vaporizer',
-    'variable',
-    'variably',
-    'varied',
-    'variety',
-    'various',
-    'varmint',
-    'varnish',
-    'varsity',
-    'varying',
-    'vascular',
-    'vaseline',
-    'vastly',
-    'vastness',
-    'veal',
-    'vegan',
-    'veggie',
-    'vehicular',
-    'velcro',
-    'velocity',
-    'velvet',
-    'vendetta',
-    'vending',
-    'vendor',
-    'veneering',
-    'vengeful',
-    'venomous',
-    'ventricle',
-    'venture',
-    'venue',
-    'venus',
-    'verbalize',
-    'verbally',
-    'verbose',
-    'verdict',
-    'verify',
-    'verse',
-    'version',
-    'versus',
-    'vertebrae',
-    'vertical',
-    'vertigo',
-    'very',
-    'vessel',
-    'vest',
-    'veteran',
-    'veto',
-    'vexingly',
-    'viability',
-    'viable',
-    'vibes',
-    'vice',
-    'vicinity',
-    'victory',
-    'video',
-    'viewable',
-    'viewer',
-    'viewing',
-    'viewless',
-    'viewpoint',
-    'vigorous',
-    'village',
-    'villain',
-    'vindicate',
-    'vineyard',
-    'vintage',
-    'violate',
-    'violation',
-    'violator',
-    'violet',
-    'violin',
-    'viper',
-    'viral',
-    'virtual',
-    'virtuous',
-    'virus',
-    'visa',
-    'viscosity',
-    'viscous',
-    'viselike',
-    'visible',
-    'visibly',
-    'vision',
-    'visiting',
-    'visitor',
-    'visor',
-    'vista',
-    'vitality',
-    'vitalize',
-    'vitally',
-    'vitamins',
-    'vivacious',
-    'vividly',
-    'vividness',
-    'vixen',
-    'vocalist',
-    'vocalize',
-    'vocally',
-    'vocation',
-    'voice',
-    'voicing',
-    'void',
-    'volatile',
-    'volley',
-    'voltage',
-    'volumes',
-    'voter',
-    'voting',
-    'voucher',
-    'vowed',
-    'vowel',
-    'voyage',
-    'wackiness',
-    'wad',
-    'wafer',
-    'waffle',
-    'waged',
-    'wager',
-    'wages',
-    'waggle',
-    'wagon',
-    'wake',
-    'waking',
-    'walk',
-    'walmart',
-    'walnut',
-    'walrus',
-    'waltz',
-    'wand',
-    'wannabe',
-    'wanted',
-    'wanting',
-    'wasabi',
-    'washable',
-    'washbasin',
-    'washboard',
-    'washbowl',
-    'washcloth',
-    'washday',
-    'washed',
-    'washer',
-    'washhouse',
-    'washing',
-    'washout',
-    'washroom',
-    'washstand',
-    'washtub',
-    'wasp',
-    'wasting',
-    'watch',
-    'water',
-    'waviness',
-    'waving',
-    'wavy',
-    'whacking',
-    'whacky',
-    'wham',
-    'wharf',
-    'wheat',
-    'whenever',
-    'whiff',
-    'whimsical',
-    'whinny',
-    'whiny',
-    'whisking',
-    'whoever',
-    'whole',
-    'whomever',
-    'whoopee',
-    'whooping',
-    'whoops',
-    'why',
-    'wick',
-    'widely',
-    'widen',
-    'widget',
-    'widow',
-    'width',
-    'wieldable',
-    'wielder',
-    'wife',
-    'wifi',
-    'wikipedia',
-    'wildcard',
-    'wildcat',
-    'wilder',
-    'wildfire',
-    'wildfowl',
-    'wildland',
-    'wildlife',
-    'wildly',
-    'wildness',
-    'willed',
-    'willfully',
-    'willing',
-    'willow',
-    'willpower',
-    'wilt',
-    'wimp',
-    'wince',
-    'wincing',
-    'wind',
-    'wing',
-    'winking',
-    'winner',
-    'winnings',
-    'winter',
-    'wipe',
-    'wired',
-    'wireless',
-    'wiring',
-    'wiry',
-    'wisdom',
-    'wise',
-    'wish',
-    'wisplike',
-    'wispy',
-    'wistful',
-    'wizard',
-    'wobble',
-    'wobbling',
-    'wobbly',
-    'wok',
-    'wolf',
-    'wolverine',
-    'womanhood',
-    'womankind',
-    'womanless',
-    'womanlike',
-    'womanly',
-    'womb',
-    'woof',
-    'wooing',
-    'wool',
-    'woozy',
-    'word',
-    'work',
-    'worried',
-    'worrier',
-    'worrisome',
-    'worry',
-    'worsening',
-    'worshiper',
-    'worst',
-    'wound',
-    'woven',
-    'wow',
-    'wrangle',
-    'wrath',
-    'wreath',
-    'wreckage',
-    'wrecker',
-    'wrecking',
-    'wrench',
-    'wriggle',
-    'wriggly',
-    'wrinkle',
-    'wrinkly',
-    'wrist',
-    'writing',
-    'written',
-    'wrongdoer',
-    'wronged',
-    'wrongful',
-    'wrongly',
-    'wrongness',
-    'wrought',
-    'xbox',
-    'xerox',
-    'yahoo',
-    'yam',
-    'yanking',
-    'yapping',
-    'yard',
-    'yarn',
-    'yeah',
-    'yearbook',
-    'yearling',
-    'yearly',
-    'yearning',
-    'yeast',
-    'yelling',
-    'yelp',
-    'yen',
-    'yesterday',
-    'yiddish',
-    'yield',
-    'yin',
-    'yippee',
-    'yo-yo',
-    'yodel',
-    'yoga',
-    'yogurt',
-    'yonder',
-    'yoyo',
-    'yummy',
-    'zap',
-    'zealous',
-    'zebra',
-    'zen',
-    'zeppelin',
-    'zero',
-    'zestfully',
-    'zesty',
-    'zigzagged',
-    'zipfile',
-    'zipping',
-    'zippy',
-    'zips',
-    'zit',
-    'zodiac',
-    'zombie',
-    'zone',
-    'zoning',
-    'zookeeper',
-    'zoologist',
-    'zoology',
-    'zoom'
+EFF_LONG_WORDLIST = PackedWordlist(
+    b'abacus\nabdomen\nabdominal\nabide\nabiding\nability\nablaze\nable\n'
+    b'abnormal\nabrasion\nabrasive\nabreast\nabridge\nabroad\nabruptly\n'
+    b'absence\nabsentee\nabsently\nabsinthe\nabsolute\nabsolve\nabstain\n'
+    b'abstract\nabsurd\naccent\nacclaim\nacclimate\naccompany\naccount\n'
+    b'accuracy\naccurate\naccustom\nacetone\nachiness\naching\nacid\nacorn\n'
+    b'acquaint\nacquire\nacre\nacrobat\nacronym\nacting\naction\nactivate\n'
+    b'activator\nactive\nactivism\nactivist\nactivity\nactress\nacts\n'
+    b'acutely\nacuteness\naeration\naerobics\naerosol\naerospace\nafar\n'
+    b'affair\naffected\naffecting\naffection\naffidavit\naffiliate\naffirm\n'
+    b'affix\nafflicted\naffluent\nafford\naffront\naflame\nafloat\naflutter\n'
+    b'afoot\nafraid\nafterglow\nafterlife\naftermath\naftermost\nafternoon\n'
+    b'aged\nageless\nagency\nagenda\nagent\naggregate\naghast\nagile\n'
+    b'agility\naging\nagnostic\nagonize\nagonizing\nagony\nagreeable\n'
+    b'agreeably\nagreed\nagreeing\nagreement\naground\nahead\nahoy\naide\n'
+    b'aids\naim\najar\nalabaster\nalarm\nalbatross\nalbum\nalfalfa\nalgebra\n'
+    b'algorithm\nalias\nalibi\nalienable\nalienate\naliens\nalike\nalive\n'
+    b'alkaline\nalkalize\nalmanac\nalmighty\nalmost\naloe\naloft\naloha\n'
+    b'alone\nalongside\naloof\nalphabet\nalright\nalthough\naltitude\nalto\n'
+    b'aluminum\nalumni\nalways\namaretto\namaze\namazingly\namber\nambiance\n'
+    b'ambiguity\nambiguous\nambition\nambitious\nambulance\nambush\n'
+    b'amendable\namendment\namends\namenity\namiable\namicably\namid\namigo\n'
+    b'amino\namiss\nammonia\nammonium\namnesty\namniotic\namong\namount\n'
+    b'amperage\nample\namplifier\namplify\namply\namuck\namulet\namusable\n'
+    b'amused\namusement\namuser\namusing\nanaconda\nanaerobic\nanagram\n'
+    b'anatomist\nanatomy\nanchor\nanchovy\nancient\nandroid\nanemia\nanemic\n'
+    b'aneurism\nanew\nangelfish\nangelic\nanger\nangled\nangler\nangles\n'
+    b'angling\nangrily\nangriness\nanguished\nangular\nanimal\nanimate\n'
+    b'animating\nanimation\nanimator\nanime\nanimosity\nankle\nannex\n'
+    b'annotate\nannouncer\nannoying\nannually\nannuity\nanointer\nanother\n'
+    b'answering\nantacid\nantarctic\nanteater\nantelope\nantennae\nanthem\n'
+    b'anthill\nanthology\nantibody\nantics\nantidote\nantihero\nantiquely\n'
+    b'antiques\nantiquity\nantirust\nantitoxic\nantitrust\nantiviral\n'
+    b'antivirus\nantler\nantonym\nantsy\nanvil\nanybody\nanyhow\nanymore\n'
+    b'anyone\nanyplace\nanything\nanytime\nanyway\nanywhere\naorta\napache\n'
+    b'apostle\nappealing\nappear\nappease\nappeasing\nappendage\nappendix\n'
+    b'appetite\nappetizer\napplaud\napplause\napple\nappliance\napplicant\n'
+    b'applied\napply\nappointee\nappraisal\nappraiser\napprehend\napproach\n'
+    b'approval\napprove\napricot\napril\napron\naptitude\naptly\naqua\n'
+    b'aqueduct\narbitrary\narbitrate\nardently\narea\narena\narguable\n'
+    b'arguably\nargue\narise\narmadillo\narmband\narmchair\narmed\narmful\n'
+    b'armhole\narming\narmless\narmoire\narmored\narmory\narmrest\narmy\n'
+    b'aroma\narose\naround\narousal\narrange\narray\narrest\narrival\narrive\n'
+    b'arrogance\narrogant\narson\nart\nascend\nascension\nascent\nascertain\n'
+    b'ashamed\nashen\nashes\nashy\naside\naskew\nasleep\nasparagus\naspect\n'
+    b'aspirate\naspire\naspirin\nastonish\nastound\nastride\nastrology\n'
+    b'astronaut\nastronomy\nastute\natlantic\natlas\natom\natonable\natop\n'
+    b'atrium\natrocious\natrophy\nattach\nattain\nattempt\nattendant\n'
+    b'attendee\nattention\nattentive\nattest\nattic\nattire\nattitude\n'
+    b'attractor\nattribute\natypical\nauction\naudacious\naudacity\naudible\n'
+    b'audibly\naudience\naudio\naudition\naugmented\naugust\nauthentic\n'
+    b'author\nautism\nautistic\nautograph\nautomaker\nautomated\nautomatic\n'
+    b'autopilot\navailable\navalanche\navatar\navenge\navenging\navenue\n'
+    b'average\naversion\navert\naviation\naviator\navid\navoid\nawait\n'
+    b'awaken\naward\naware\nawhile\nawkward\nawning\nawoke\nawry\naxis\n'
+    b'babble\nbabbling\nbabied\nbaboon\nbackache\nbackboard\nbackboned\n'
+    b'backdrop\nbacked\nbacker\nbackfield\nbackfire\nbackhand\nbacking\n'
+    b'backlands\nbacklash\nbackless\nbacklight\nbacklit\nbacklog\nbackpack\n'
+    b'backpedal\nbackrest\nbackroom\nbackshift\nbackside\nbackslid\n'
+    b'backspace\nbackspin\nbackstab\nbackstage\nbacktalk\nbacktrack\nbackup\n'
+    b'backward\nbackwash\nbackwater\nbackyard\nbacon\nbacteria\nbacterium\n'
+    b'badass\nbadge\nbadland\nbadly\nbadness\nbaffle\nbaffling\nbagel\n'
+    b'bagful\nbaggage\nbagged\nbaggie\nbagginess\nbagging\nbaggy\nbagpipe\n'
+    b'baguette\nbaked\nbakery\nbakeshop\nbaking\nbalance\nbalancing\nbalcony\n'
+    b'balmy\nbalsamic\nbamboo\nbanana\nbanish\nbanister\nbanjo\nbankable\n'
+    b'bankbook\nbanked\nbanker\nbanking\nbanknote\nbankroll\nbanner\n'
+    b'bannister\nbanshee\nbanter\nbarbecue\nbarbed\nbarbell\nbarber\nbarcode\n'
+    b'barge\nbargraph\nbarista\nbaritone\nbarley\nbarmaid\nbarman\nbarn\n'
+    b'barometer\nbarrack\nbarracuda\nbarrel\nbarrette\nbarricade\nbarrier\n'
+    b'barstool\nbartender\nbarterer\nbash\nbasically\nbasics\nbasil\nbasin\n'
+    b'basis\nbasket\nbatboy\nbatch\nbath\nbaton\nbats\nbattalion\nbattered\n'
+    b'battering\nbattery\nbatting\nbattle\nbauble\nbazooka\nblabber\nbladder\n'
+    b'blade\nblah\nblame\nblaming\nblanching\nblandness\nblank\nblaspheme\n'
+    b'blasphemy\nblast\nblatancy\nblatantly\nblazer\nblazing\nbleach\nbleak\n'
+    b'bleep\nblemish\nblend\nbless\nblighted\nblimp\nbling\nblinked\nblinker\n'
+    b'blinking\nblinks\nblip\nblissful\nblitz\nblizzard\nbloated\nbloating\n'
+    b'blob\nblog\nbloomers\nblooming\nblooper\nblot\nblouse\nblubber\nbluff\n'
+    b'bluish\nblunderer\nblunt\nblurb\nblurred\nblurry\nblurt\nblush\n'
+    b'blustery\nboaster\nboastful\nboasting\nboat\nbobbed\nbobbing\nbobble\n'
+    b'bobcat\nbobsled\nbobtail\nbodacious\nbody\nbogged\nboggle\nbogus\nboil\n'
+    b'bok\nbolster\nbolt\nbonanza\nbonded\nbonding\nbondless\nboned\n'
+    b'bonehead\nboneless\nbonelike\nboney\nbonfire\nbonnet\nbonsai\nbonus\n'
+    b'bony\nboogeyman\nboogieman\nbook\nboondocks\nbooted\nbooth\nbootie\n'
+    b'booting\nbootlace\nbootleg\nboots\nboozy\nborax\nboring\nborough\n'
+    b'borrower\nborrowing\nboss\nbotanical\nbotanist\nbotany\nbotch\nboth\n'
+    b'bottle\nbottling\nbottom\nbounce\nbouncing\nbouncy\nbounding\n'
+    b'boundless\nbountiful\nbovine\nboxcar\nboxer\nboxing\nboxlike\nboxy\n'
+    b'breach\nbreath\nbreeches\nbreeching\nbreeder\nbreeding\nbreeze\nbreezy\n'
+    b'brethren\nbrewery\nbrewing\nbriar\nbribe\nbrick\nbride\nbridged\n'
+    b'brigade\nbright\nbrilliant\nbrim\nbring\nbrink\nbrisket\nbriskly\n'
+    b'briskness\nbristle\nbrittle\nbroadband\nbroadcast\nbroaden\nbroadly\n'
+    b'broadness\nbroadside\nbroadways\nbroiler\nbroiling\nbroken\nbroker\n'
+    b'bronchial\nbronco\nbronze\nbronzing\nbrook\nbroom\nbrought\nbrowbeat\n'
+    b'brownnose\nbrowse\nbrowsing\nbruising\nbrunch\nbrunette\nbrunt\nbrush\n'
+    b'brussels\nbrute\nbrutishly\nbubble\nbubbling\nbubbly\nbuccaneer\n'
+    b'bucked\nbucket\nbuckle\nbuckshot\nbuckskin\nbucktooth\nbuckwheat\n'
+    b'buddhism\nbuddhist\nbudding\nbuddy\nbudget\nbuffalo\nbuffed\nbuffer\n'
+    b'buffing\nbuffoon\nbuggy\nbulb\nbulge\nbulginess\nbulgur\nbulk\nbulldog\n'
+    b'bulldozer\nbullfight\nbullfrog\nbullhorn\nbullion\nbullish\nbullpen\n'
+    b'bullring\nbullseye\nbullwhip\nbully\nbunch\nbundle\nbungee\nbunion\n'
+    b'bunkbed\nbunkhouse\nbunkmate\nbunny\nbunt\nbusboy\nbush\nbusily\n'
+    b'busload\nbust\nbusybody\nbuzz\ncabana\ncabbage\ncabbie\ncabdriver\n'
+    b'cable\ncaboose\ncache\ncackle\ncacti\ncactus\ncaddie\ncaddy\ncadet\n'
+    b'cadillac\ncadmium\ncage\ncahoots\ncake\ncalamari\ncalamity\ncalcium\n'
+    b'calculate\ncalculus\ncaliber\ncalibrate\ncalm\ncaloric\ncalorie\n'
+    b'calzone\ncamcorder\ncameo\ncamera\ncamisole\ncamper\ncampfire\ncamping\n'
+    b'campsite\ncampus\ncanal\ncanary\ncancel\ncandied\ncandle\ncandy\ncane\n'
+    b'canine\ncanister\ncannabis\ncanned\ncanning\ncannon\ncannot\ncanola\n'
+    b'canon\ncanopener\ncanopy\ncanteen\ncanyon\ncapable\ncapably\ncapacity\n'
+    b'cape\ncapillary\ncapital\ncapitol\ncapped\ncapricorn\ncapsize\ncapsule\n'
+    b'caption\ncaptivate\ncaptive\ncaptivity\ncapture\ncaramel\ncarat\n'
+    b'caravan\ncarbon\ncardboard\ncarded\ncardiac\ncardigan\ncardinal\n'
+    b'cardstock\ncarefully\ncaregiver\ncareless\ncaress\ncaretaker\ncargo\n'
+    b'caring\ncarless\ncarload\ncarmaker\ncarnage\ncarnation\ncarnival\n'
+    b'carnivore\ncarol\ncarpenter\ncarpentry\ncarpool\ncarport\ncarried\n'
+    b'carrot\ncarrousel\ncarry\ncartel\ncartload\ncarton\ncartoon\ncartridge\n'
+    b'cartwheel\ncarve\ncarving\ncarwash\ncascade\ncase\ncash\ncasing\n'
+    b'casino\ncasket\ncassette\ncasually\ncasualty\ncatacomb\ncatalog\n'
+    b'catalyst\ncatalyze\ncatapult\ncataract\ncatatonic\ncatcall\ncatchable\n'
+    b'catcher\ncatching\ncatchy\ncaterer\ncatering\ncatfight\ncatfish\n'
+    b'cathedral\ncathouse\ncatlike\ncatnap\ncatnip\ncatsup\ncattail\n'
+    b'cattishly\ncattle\ncatty\ncatwalk\ncaucasian\ncaucus\ncausal\n'
+    b'causation\ncause\ncausing\ncauterize\ncaution\ncautious\ncavalier\n'
+    b'cavalry\ncaviar\ncavity\ncedar\ncelery\ncelestial\ncelibacy\ncelibate\n'
+    b'celtic\ncement\ncensus\nceramics\nceremony\ncertainly\ncertainty\n'
+    b'certified\ncertify\ncesarean\ncesspool\nchafe\nchaffing\nchain\nchair\n'
+    b'chalice\nchallenge\nchamber\nchamomile\nchampion\nchance\nchange\n'
+    b'channel\nchant\nchaos\nchaperone\nchaplain\nchapped\nchaps\nchapter\n'
+    b'character\ncharbroil\ncharcoal\ncharger\ncharging\nchariot\ncharity\n'
+    b'charm\ncharred\ncharter\ncharting\nchase\nchasing\nchaste\nchastise\n'
+    b'chastity\nchatroom\nchatter\nchatting\nchatty\ncheating\ncheddar\n'
+    b'cheek\ncheer\ncheese\ncheesy\nchef\nchemicals\nchemist\nchemo\n'
+    b'cherisher\ncherub\nchess\nchest\nchevron\nchevy\nchewable\nchewer\n'
+    b'chewing\nchewy\nchief\nchihuahua\nchildcare\nchildhood\nchildish\n'
+    b'childless\nchildlike\nchili\nchill\nchimp\nchip\nchirping\nchirpy\n'
+    b'chitchat\nchivalry\nchive\nchloride\nchlorine\nchoice\nchokehold\n'
+    b'choking\nchomp\nchooser\nchoosing\nchoosy\nchop\nchosen\nchowder\n'
+    b'chowtime\nchrome\nchubby\nchuck\nchug\nchummy\nchump\nchunk\nchurn\n'
+    b'chute\ncider\ncilantro\ncinch\ncinema\ncinnamon\ncircle\ncircling\n'
+    b'circular\ncirculate\ncircus\ncitable\ncitadel\ncitation\ncitizen\n'
+    b'citric\ncitrus\ncity\ncivic\ncivil\nclad\nclaim\nclambake\nclammy\n'
+    b'clamor\nclamp\nclamshell\nclang\nclanking\nclapped\nclapper\nclapping\n'
+    b'clarify\nclarinet\nclarity\nclash\nclasp\nclass\nclatter\nclause\n'
+    b'clavicle\nclaw\nclay\nclean\nclear\ncleat\ncleaver\ncleft\nclench\n'
+    b'clergyman\nclerical\nclerk\nclever\nclicker\nclient\nclimate\nclimatic\n'
+    b'cling\nclinic\nclinking\nclip\nclique\ncloak\nclobber\nclock\nclone\n'
+    b'cloning\nclosable\nclosure\nclothes\nclothing\ncloud\nclover\nclubbed\n'
+    b'clubbing\nclubhouse\nclump\nclumsily\nclumsy\nclunky\nclustered\n'
+    b'clutch\nclutter\ncoach\ncoagulant\ncoastal\ncoaster\ncoasting\n'
+    b'coastland\ncoastline\ncoat\ncoauthor\ncobalt\ncobbler\ncobweb\ncocoa\n'
+    b'coconut\ncod\ncoeditor\ncoerce\ncoexist\ncoffee\ncofounder\ncognition\n'
+    b'cognitive\ncogwheel\ncoherence\ncoherent\ncohesive\ncoil\ncoke\ncola\n'
+    b'cold\ncoleslaw\ncoliseum\ncollage\ncollapse\ncollar\ncollected\n'
+    b'collector\ncollide\ncollie\ncollision\ncolonial\ncolonist\ncolonize\n'
+    b'colony\ncolossal\ncolt\ncoma\ncome\ncomfort\ncomfy\ncomic\ncoming\n'
+    b'comma\ncommence\ncommend\ncomment\ncommerce\ncommode\ncommodity\n'
+    b'commodore\ncommon\ncommotion\ncommute\ncommuting\ncompacted\ncompacter\n'
+    b'compactly\ncompactor\ncompanion\ncompany\ncompare\ncompel\ncompile\n'
+    b'comply\ncomponent\ncomposed\ncomposer\ncomposite\ncompost\ncomposure\n'
+    b'compound\ncompress\ncomprised\ncomputer\ncomputing\ncomrade\nconcave\n'
+    b'conceal\nconceded\nconcept\nconcerned\nconcert\nconch\nconcierge\n'
+    b'concise\nconclude\nconcrete\nconcur\ncondense\ncondiment\ncondition\n'
+    b'condone\nconducive\nconductor\nconduit\ncone\nconfess\nconfetti\n'
+    b'confidant\nconfident\nconfider\nconfiding\nconfigure\nconfined\n'
+    b'confining\nconfirm\nconflict\nconform\nconfound\nconfront\nconfused\n'
+    b'confusing\nconfusion\ncongenial\ncongested\ncongrats\ncongress\n'
+    b'conical\nconjoined\nconjure\nconjuror\nconnected\nconnector\nconsensus\n'
+    b'consent\nconsole\nconsoling\nconsonant\nconstable\nconstant\nconstrain\n'
+    b'constrict\nconstruct\nconsult\nconsumer\nconsuming\ncontact\ncontainer\n'
+    b'contempt\ncontend\ncontented\ncontently\ncontents\ncontest\ncontext\n'
+    b'contort\ncontour\ncontrite\ncontrol\ncontusion\nconvene\nconvent\n'
+    b'copartner\ncope\ncopied\ncopier\ncopilot\ncoping\ncopious\ncopper\n'
+    b'copy\ncoral\ncork\ncornball\ncornbread\ncorncob\ncornea\ncorned\n'
+    b'corner\ncornfield\ncornflake\ncornhusk\ncornmeal\ncornstalk\ncorny\n'
+    b'coronary\ncoroner\ncorporal\ncorporate\ncorral\ncorrect\ncorridor\n'
+    b'corrode\ncorroding\ncorrosive\ncorsage\ncorset\ncortex\ncosigner\n'
+    b'cosmetics\ncosmic\ncosmos\ncosponsor\ncost\ncottage\ncotton\ncouch\n'
+    b'cough\ncould\ncountable\ncountdown\ncounting\ncountless\ncountry\n'
+    b'county\ncourier\ncovenant\ncover\ncoveted\ncoveting\ncoyness\ncozily\n'
+    b'coziness\ncozy\ncrabbing\ncrabgrass\ncrablike\ncrabmeat\ncradle\n'
+    b'cradling\ncrafter\ncraftily\ncraftsman\ncraftwork\ncrafty\ncramp\n'
+    b'cranberry\ncrane\ncranial\ncranium\ncrank\ncrate\ncrave\ncraving\n'
+    b'crawfish\ncrawlers\ncrawling\ncrayfish\ncrayon\ncrazed\ncrazily\n'
+    b'craziness\ncrazy\ncreamed\ncreamer\ncreamlike\ncrease\ncreasing\n'
+    b'creatable\ncreate\ncreation\ncreative\ncreature\ncredible\ncredibly\n'
+    b'credit\ncreed\ncreme\ncreole\ncrepe\ncrept\ncrescent\ncrested\n'
+    b'cresting\ncrestless\ncrevice\ncrewless\ncrewman\ncrewmate\ncrib\n'
+    b'cricket\ncried\ncrier\ncrimp\ncrimson\ncringe\ncringing\ncrinkle\n'
+    b'crinkly\ncrisped\ncrisping\ncrisply\ncrispness\ncrispy\ncriteria\n'
+    b'critter\ncroak\ncrock\ncrook\ncroon\ncrop\ncross\ncrouch\ncrouton\n'
+    b'crowbar\ncrowd\ncrown\ncrucial\ncrudely\ncrudeness\ncruelly\ncruelness\n'
+    b'cruelty\ncrumb\ncrummiest\ncrummy\ncrumpet\ncrumpled\ncruncher\n'
+    b'crunching\ncrunchy\ncrusader\ncrushable\ncrushed\ncrusher\ncrushing\n'
+    b'crust\ncrux\ncrying\ncryptic\ncrystal\ncubbyhole\ncube\ncubical\n'
+    b'cubicle\ncucumber\ncuddle\ncuddly\ncufflink\nculinary\nculminate\n'
+    b'culpable\nculprit\ncultivate\ncultural\nculture\ncupbearer\ncupcake\n'
+    b'cupid\ncupped\ncupping\ncurable\ncurator\ncurdle\ncure\ncurfew\ncuring\n'
+    b'curled\ncurler\ncurliness\ncurling\ncurly\ncurry\ncurse\ncursive\n'
+    b'cursor\ncurtain\ncurtly\ncurtsy\ncurvature\ncurve\ncurvy\ncushy\ncusp\n'
+    b'cussed\ncustard\ncustodian\ncustody\ncustomary\ncustomer\ncustomize\n'
+    b'customs\ncut\ncycle\ncyclic\ncycling\ncyclist\ncylinder\ncymbal\n'
+    b'cytoplasm\ncytoplast\ndab\ndad\ndaffodil\ndagger\ndaily\ndaintily\n'
+    b'dainty\ndairy\ndaisy\ndallying\ndance\ndancing\ndandelion\ndander\n'
+    b'dandruff\ndandy\ndanger\ndangle\ndangling\ndaredevil\ndares\ndaringly\n'
+    b'darkened\ndarkening\ndarkish\ndarkness\ndarkroom\ndarling\ndarn\ndart\n'
+    b'darwinism\ndash\ndastardly\ndata\ndatebook\ndating\ndaughter\ndaunting\n'
+    b'dawdler\ndawn\ndaybed\ndaybreak\ndaycare\ndaydream\ndaylight\ndaylong\n'
+    b'dayroom\ndaytime\ndazzler\ndazzling\ndeacon\ndeafening\ndeafness\n'
+    b'dealer\ndealing\ndealmaker\ndealt\ndean\ndebatable\ndebate\ndebating\n'
+    b'debit\ndebrief\ndebtless\ndebtor\ndebug\ndebunk\ndecade\ndecaf\ndecal\n'
+    b'decathlon\ndecay\ndeceased\ndeceit\ndeceiver\ndeceiving\ndecember\n'
+    b'decency\ndecent\ndeception\ndeceptive\ndecibel\ndecidable\ndecimal\n'
+    b'decimeter\ndecipher\ndeck\ndeclared\ndecline\ndecode\ndecompose\n'
+    b'decorated\ndecorator\ndecoy\ndecrease\ndecree\ndedicate\ndedicator\n'
+    b'deduce\ndeduct\ndeed\ndeem\ndeepen\ndeeply\ndeepness\ndeface\ndefacing\n'
+    b'defame\ndefault\ndefeat\ndefection\ndefective\ndefendant\ndefender\n'
+    b'defense\ndefensive\ndeferral\ndeferred\ndefiance\ndefiant\ndefile\n'
+    b'defiling\ndefine\ndefinite\ndeflate\ndeflation\ndeflator\ndeflected\n'
+    b'deflector\ndefog\ndeforest\ndefraud\ndefrost\ndeftly\ndefuse\ndefy\n'
+    b'degraded\ndegrading\ndegrease\ndegree\ndehydrate\ndeity\ndejected\n'
+    b'delay\ndelegate\ndelegator\ndelete\ndeletion\ndelicacy\ndelicate\n'
+    b'delicious\ndelighted\ndelirious\ndelirium\ndeliverer\ndelivery\n'
+    b'delouse\ndelta\ndeluge\ndelusion\ndeluxe\ndemanding\ndemeaning\n'
+    b'demeanor\ndemise\ndemocracy\ndemocrat\ndemote\ndemotion\ndemystify\n'
+    b'denatured\ndeniable\ndenial\ndenim\ndenote\ndense\ndensity\ndental\n'
+    b'dentist\ndenture\ndeny\ndeodorant\ndeodorize\ndeparted\ndeparture\n'
+    b'depict\ndeplete\ndepletion\ndeplored\ndeploy\ndeport\ndepose\ndepraved\n'
+    b'depravity\ndeprecate\ndepress\ndeprive\ndepth\ndeputize\ndeputy\n'
+    b'derail\nderanged\nderby\nderived\ndesecrate\ndeserve\ndeserving\n'
+    b'designate\ndesigned\ndesigner\ndesigning\ndeskbound\ndesktop\ndeskwork\n'
+    b'desolate\ndespair\ndespise\ndespite\ndestiny\ndestitute\ndestruct\n'
+    b'detached\ndetail\ndetection\ndetective\ndetector\ndetention\ndetergent\n'
+    b'detest\ndetonate\ndetonator\ndetoxify\ndetract\ndeuce\ndevalue\n'
+    b'deviancy\ndeviant\ndeviate\ndeviation\ndeviator\ndevice\ndevious\n'
+    b'devotedly\ndevotee\ndevotion\ndevourer\ndevouring\ndevoutly\ndexterity\n'
+    b'dexterous\ndiabetes\ndiabetic\ndiabolic\ndiagnoses\ndiagnosis\ndiagram\n'
+    b'dial\ndiameter\ndiaper\ndiaphragm\ndiary\ndice\ndicing\ndictate\n'
+    b'dictation\ndictator\ndifficult\ndiffused\ndiffuser\ndiffusion\n'
+    b'diffusive\ndig\ndilation\ndiligence\ndiligent\ndill\ndilute\ndime\n'
+    b'diminish\ndimly\ndimmed\ndimmer\ndimness\ndimple\ndiner\ndingbat\n'
+    b'dinghy\ndinginess\ndingo\ndingy\ndining\ndinner\ndiocese\ndioxide\n'
+    b'diploma\ndipped\ndipper\ndipping\ndirected\ndirection\ndirective\n'
+    b'directly\ndirectory\ndireness\ndirtiness\ndisabled\ndisagree\ndisallow\n'
+    b'disarm\ndisarray\ndisaster\ndisband\ndisbelief\ndisburse\ndiscard\n'
+    b'discern\ndischarge\ndisclose\ndiscolor\ndiscount\ndiscourse\ndiscover\n'
+    b'discuss\ndisdain\ndisengage\ndisfigure\ndisgrace\ndish\ndisinfect\n'
+    b'disjoin\ndisk\ndislike\ndisliking\ndislocate\ndislodge\ndisloyal\n'
+    b'dismantle\ndismay\ndismiss\ndismount\ndisobey\ndisorder\ndisown\n'
+    b'disparate\ndisparity\ndispatch\ndispense\ndispersal\ndispersed\n'
+    b'disperser\ndisplace\ndisplay\ndisplease\ndisposal\ndispose\ndisprove\n'
+    b'dispute\ndisregard\ndisrupt\ndissuade\ndistance\ndistant\ndistaste\n'
+    b'distill\ndistinct\ndistort\ndistract\ndistress\ndistrict\ndistrust\n'
+    b'ditch\nditto\nditzy\ndividable\ndivided\ndividend\ndividers\ndividing\n'
+    b'divinely\ndiving\ndivinity\ndivisible\ndivisibly\ndivision\ndivisive\n'
+    b'divorcee\ndizziness\ndizzy\ndoable\ndocile\ndock\ndoctrine\ndocument\n'
+    b'dodge\ndodgy\ndoily\ndoing\ndole\ndollar\ndollhouse\ndollop\ndolly\n'
+    b'dolphin\ndomain\ndomelike\ndomestic\ndominion\ndominoes\ndonated\n'
+    b'donation\ndonator\ndonor\ndonut\ndoodle\ndoorbell\ndoorframe\ndoorknob\n'
+    b'doorman\ndoormat\ndoornail\ndoorpost\ndoorstep\ndoorstop\ndoorway\n'
+    b'doozy\ndork\ndormitory\ndorsal\ndosage\ndose\ndotted\ndoubling\ndouche\n'
+    b'dove\ndown\ndowry\ndoze\ndrab\ndragging\ndragonfly\ndragonish\n'
+    b'dragster\ndrainable\ndrainage\ndrained\ndrainer\ndrainpipe\ndramatic\n'
+    b'dramatize\ndrank\ndrapery\ndrastic\ndraw\ndreaded\ndreadful\ndreadlock\n'
+    b'dreamboat\ndreamily\ndreamland\ndreamless\ndreamlike\ndreamt\ndreamy\n'
+    b'drearily\ndreary\ndrench\ndress\ndrew\ndribble\ndried\ndrier\ndrift\n'
+    b'driller\ndrilling\ndrinkable\ndrinking\ndripping\ndrippy\ndrivable\n'
+    b'driven\ndriver\ndriveway\ndriving\ndrizzle\ndrizzly\ndrone\ndrool\n'
+    b'droop\ndrop-down\ndropbox\ndropkick\ndroplet\ndropout\ndropper\ndrove\n'
+    b'drown\ndrowsily\ndrudge\ndrum\ndry\ndubbed\ndubiously\nduchess\n'
+    b'duckbill\nducking\nduckling\nducktail\nducky\nduct\ndude\nduffel\n'
+    b'dugout\nduh\nduke\nduller\ndullness\nduly\ndumping\ndumpling\ndumpster\n'
+    b'duo\ndupe\nduplex\nduplicate\nduplicity\ndurable\ndurably\nduration\n'
+    b'duress\nduring\ndusk\ndust\ndutiful\nduty\nduvet\ndwarf\ndweeb\n'
+    b'dwelled\ndweller\ndwelling\ndwindle\ndwindling\ndynamic\ndynamite\n'
+    b'dynasty\ndyslexia\ndyslexic\neach\neagle\nearache\neardrum\nearflap\n'
+    b'earful\nearlobe\nearly\nearmark\nearmuff\nearphone\nearpiece\nearplugs\n'
+    b'earring\nearshot\nearthen\nearthlike\nearthling\nearthly\nearthworm\n'
+    b'earthy\nearwig\neaseful\neasel\neasiest\neasily\neasiness\neasing\n'
+    b'eastbound\neastcoast\neaster\neastward\neatable\neaten\neatery\neating\n'
+    b'eats\nebay\nebony\nebook\necard\neccentric\necho\neclair\neclipse\n'
+    b'ecologist\necology\neconomic\neconomist\neconomy\necosphere\necosystem\n'
+    b'edge\nedginess\nedging\nedgy\nedition\neditor\neducated\neducation\n'
+    b'educator\neel\neffective\neffects\nefficient\neffort\neggbeater\n'
+    b'egging\neggnog\neggplant\neggshell\negomaniac\negotism\negotistic\n'
+    b'either\neject\nelaborate\nelastic\nelated\nelbow\neldercare\nelderly\n'
+    b'eldest\nelectable\nelection\nelective\nelephant\nelevate\nelevating\n'
+    b'elevation\nelevator\neleven\nelf\neligible\neligibly\neliminate\nelite\n'
+    b'elitism\nelixir\nelk\nellipse\nelliptic\nelm\nelongated\nelope\n'
+    b'eloquence\neloquent\nelsewhere\nelude\nelusive\nelves\nemail\nembargo\n'
+    b'embark\nembassy\nembattled\nembellish\nember\nembezzle\nemblaze\n'
+    b'emblem\nembody\nembolism\nemboss\nembroider\nemcee\nemerald\nemergency\n'
+    b'emission\nemit\nemote\nemoticon\nemotion\nempathic\nempathy\nemperor\n'
+    b'emphases\nemphasis\nemphasize\nemphatic\nempirical\nemployed\nemployee\n'
+    b'employer\nemporium\nempower\nemptier\nemptiness\nempty\nemu\nenable\n'
+    b'enactment\nenamel\nenchanted\nenchilada\nencircle\nenclose\nenclosure\n'
+    b'encode\nencore\nencounter\nencourage\nencroach\nencrust\nencrypt\n'
+    b'endanger\nendeared\nendearing\nended\nending\nendless\nendnote\n'
+    b'endocrine\nendorphin\nendorse\nendowment\nendpoint\nendurable\n'
+    b'endurance\nenduring\nenergetic\nenergize\nenergy\nenforced\nenforcer\n'
+    b'engaged\nengaging\nengine\nengorge\nengraved\nengraver\nengraving\n'
+    b'engross\nengulf\nenhance\nenigmatic\nenjoyable\nenjoyably\nenjoyer\n'
+    b'enjoying\nenjoyment\nenlarged\nenlarging\nenlighten\nenlisted\n'
+    b'enquirer\nenrage\nenrich\nenroll\nenslave\nensnare\nensure\nentail\n'
+    b'entangled\nentering\nentertain\nenticing\nentire\nentitle\nentity\n'
+    b'entomb\nentourage\nentrap\nentree\nentrench\nentrust\nentryway\n'
+    b'entwine\nenunciate\nenvelope\nenviable\nenviably\nenvious\nenvision\n'
+    b'envoy\nenvy\nenzyme\nepic\nepidemic\nepidermal\nepidermis\nepidural\n'
+    b'epilepsy\nepileptic\nepilogue\nepiphany\nepisode\nequal\nequate\n'
+    b'equation\nequator\nequinox\nequipment\nequity\nequivocal\neradicate\n'
+    b'erasable\nerased\neraser\nerasure\nergonomic\nerrand\nerrant\nerratic\n'
+    b'error\nerupt\nescalate\nescalator\nescapable\nescapade\nescapist\n'
+    b'escargot\neskimo\nesophagus\nespionage\nespresso\nesquire\nessay\n'
+    b'essence\nessential\nestablish\nestate\nesteemed\nestimate\nestimator\n'
+    b'estranged\nestrogen\netching\neternal\neternity\nethanol\nether\n'
+    b'ethically\nethics\neuphemism\nevacuate\nevacuee\nevade\nevaluate\n'
+    b'evaluator\nevaporate\nevasion\nevasive\neven\neverglade\nevergreen\n'
+    b'everybody\neveryday\neveryone\nevict\nevidence\nevident\nevil\nevoke\n'
+    b'evolution\nevolve\nexact\nexalted\nexample\nexcavate\nexcavator\n'
+    b'exceeding\nexception\nexcess\nexchange\nexcitable\nexciting\nexclaim\n'
+    b'exclude\nexcluding\nexclusion\nexclusive\nexcretion\nexcretory\n'
+    b'excursion\nexcusable\nexcusably\nexcuse\nexemplary\nexemplify\n'
+    b'exemption\nexerciser\nexert\nexes\nexfoliate\nexhale\nexhaust\nexhume\n'
+    b'exile\nexisting\nexit\nexodus\nexonerate\nexorcism\nexorcist\nexpand\n'
+    b'expanse\nexpansion\nexpansive\nexpectant\nexpedited\nexpediter\nexpel\n'
+    b'expend\nexpenses\nexpensive\nexpert\nexpire\nexpiring\nexplain\n'
+    b'expletive\nexplicit\nexplode\nexploit\nexplore\nexploring\nexponent\n'
+    b'exporter\nexposable\nexpose\nexposure\nexpress\nexpulsion\nexquisite\n'
+    b'extended\nextending\nextent\nextenuate\nexterior\nexternal\nextinct\n'
+    b'extortion\nextradite\nextras\nextrovert\nextrude\nextruding\nexuberant\n'
+    b'fable\nfabric\nfabulous\nfacebook\nfacecloth\nfacedown\nfaceless\n'
+    b'facelift\nfaceplate\nfaceted\nfacial\nfacility\nfacing\nfacsimile\n'
+    b'faction\nfactoid\nfactor\nfactsheet\nfactual\nfaculty\nfade\nfading\n'
+    b'failing\nfalcon\nfall\nfalse\nfalsify\nfame\nfamiliar\nfamily\nfamine\n'
+    b'famished\nfanatic\nfancied\nfanciness\nfancy\nfanfare\nfang\nfanning\n'
+    b'fantasize\nfantastic\nfantasy\nfascism\nfastball\nfaster\nfasting\n'
+    b'fastness\nfaucet\nfavorable\nfavorably\nfavored\nfavoring\nfavorite\n'
+    b'fax\nfeast\nfederal\nfedora\nfeeble\nfeed\nfeel\nfeisty\nfeline\n'
+    b'felt-tip\nfeminine\nfeminism\nfeminist\nfeminize\nfemur\nfence\n'
+    b'fencing\nfender\nferment\nfernlike\nferocious\nferocity\nferret\n'
+    b'ferris\nferry\nfervor\nfester\nfestival\nfestive\nfestivity\nfetal\n'
+    b'fetch\nfever\nfiber\nfiction\nfiddle\nfiddling\nfidelity\nfidgeting\n'
+    b'fidgety\nfifteen\nfifth\nfiftieth\nfifty\nfigment\nfigure\nfigurine\n'
+    b'filing\nfilled\nfiller\nfilling\nfilm\nfilter\nfilth\nfiltrate\nfinale\n'
+    b'finalist\nfinalize\nfinally\nfinance\nfinancial\nfinch\nfineness\n'
+    b'finer\nfinicky\nfinished\nfinisher\nfinishing\nfinite\nfinless\n'
+    b'finlike\nfiscally\nfit\nfive\nflaccid\nflagman\nflagpole\nflagship\n'
+    b'flagstick\nflagstone\nflail\nflakily\nflaky\nflame\nflammable\nflanked\n'
+    b'flanking\nflannels\nflap\nflaring\nflashback\nflashbulb\nflashcard\n'
+    b'flashily\nflashing\nflashy\nflask\nflatbed\nflatfoot\nflatly\nflatness\n'
+    b'flatten\nflattered\nflatterer\nflattery\nflattop\nflatware\nflatworm\n'
+    b'flavored\nflavorful\nflavoring\nflaxseed\nfled\nfleshed\nfleshy\nflick\n'
+    b'flier\nflight\nflinch\nfling\nflint\nflip\nflirt\nfloat\nflock\n'
+    b'flogging\nflop\nfloral\nflorist\nfloss\nflounder\nflyable\nflyaway\n'
+    b'flyer\nflying\nflyover\nflypaper\nfoam\nfoe\nfog\nfoil\nfolic\nfolk\n'
+    b'follicle\nfollow\nfondling\nfondly\nfondness\nfondue\nfont\nfood\nfool\n'
+    b'footage\nfootball\nfootbath\nfootboard\nfooter\nfootgear\nfoothill\n'
+    b'foothold\nfooting\nfootless\nfootman\nfootnote\nfootpad\nfootpath\n'
+    b'footprint\nfootrest\nfootsie\nfootsore\nfootwear\nfootwork\nfossil\n'
+    b'foster\nfounder\nfounding\nfountain\nfox\nfoyer\nfraction\nfracture\n'
+    b'fragile\nfragility\nfragment\nfragrance\nfragrant\nfrail\nframe\n'
+    b'framing\nfrantic\nfraternal\nfrayed\nfraying\nfrays\nfreckled\n'
+    b'freckles\nfreebase\nfreebee\nfreebie\nfreedom\nfreefall\nfreehand\n'
+    b'freeing\nfreeload\nfreely\nfreemason\nfreeness\nfreestyle\nfreeware\n'
+    b'freeway\nfreewill\nfreezable\nfreezing\nfreight\nfrench\nfrenzied\n'
+    b'frenzy\nfrequency\nfrequent\nfresh\nfretful\nfretted\nfriction\nfriday\n'
+    b'fridge\nfried\nfriend\nfrighten\nfrightful\nfrigidity\nfrigidly\nfrill\n'
+    b'fringe\nfrisbee\nfrisk\nfritter\nfrivolous\nfrolic\nfrom\nfront\n'
+    b'frostbite\nfrosted\nfrostily\nfrosting\nfrostlike\nfrosty\nfroth\n'
+    b'frown\nfrozen\nfructose\nfrugality\nfrugally\nfruit\nfrustrate\nfrying\n'
+    b'gab\ngaffe\ngag\ngainfully\ngaining\ngains\ngala\ngallantly\ngalleria\n'
+    b'gallery\ngalley\ngallon\ngallows\ngallstone\ngalore\ngalvanize\n'
+    b'gambling\ngame\ngaming\ngamma\ngander\ngangly\ngangrene\ngangway\ngap\n'
+    b'garage\ngarbage\ngarden\ngargle\ngarland\ngarlic\ngarment\ngarnet\n'
+    b'garnish\ngarter\ngas\ngatherer\ngathering\ngating\ngauging\ngauntlet\n'
+    b'gauze\ngave\ngawk\ngazing\ngear\ngecko\ngeek\ngeiger\ngem\ngender\n'
+    b'generic\ngenerous\ngenetics\ngenre\ngentile\ngentleman\ngently\ngents\n'
+    b'geography\ngeologic\ngeologist\ngeology\ngeometric\ngeometry\ngeranium\n'
+    b'gerbil\ngeriatric\ngermicide\ngerminate\ngermless\ngermproof\ngestate\n'
+    b'gestation\ngesture\ngetaway\ngetting\ngetup\ngiant\ngibberish\ngiblet\n'
+    b'giddily\ngiddiness\ngiddy\ngift\ngigabyte\ngigahertz\ngigantic\ngiggle\n'
+    b'giggling\ngiggly\ngigolo\ngilled\ngills\ngimmick\ngirdle\ngiveaway\n'
+    b'given\ngiver\ngiving\ngizmo\ngizzard\nglacial\nglacier\nglade\n'
+    b'gladiator\ngladly\nglamorous\nglamour\nglance\nglancing\nglandular\n'
+    b'glare\nglaring\nglass\nglaucoma\nglazing\ngleaming\ngleeful\nglider\n'
+    b'gliding\nglimmer\nglimpse\nglisten\nglitch\nglitter\nglitzy\ngloater\n'
+    b'gloating\ngloomily\ngloomy\nglorified\nglorifier\nglorify\nglorious\n'
+    b'glory\ngloss\nglove\nglowing\nglowworm\nglucose\nglue\ngluten\n'
+    b'glutinous\nglutton\ngnarly\ngnat\ngoal\ngoatskin\ngoes\ngoggles\ngoing\n'
+    b'goldfish\ngoldmine\ngoldsmith\ngolf\ngoliath\ngonad\ngondola\ngone\n'
+    b'gong\ngood\ngooey\ngoofball\ngoofiness\ngoofy\ngoogle\ngoon\ngopher\n'
+    b'gore\ngorged\ngorgeous\ngory\ngosling\ngossip\ngothic\ngotten\ngout\n'
+    b'gown\ngrab\ngraceful\ngraceless\ngracious\ngradation\ngraded\ngrader\n'
+    b'gradient\ngrading\ngradually\ngraduate\ngraffiti\ngrafted\ngrafting\n'
+    b'grain\ngranddad\ngrandkid\ngrandly\ngrandma\ngrandpa\ngrandson\n'
+    b'granite\ngranny\ngranola\ngrant\ngranular\ngrape\ngraph\ngrapple\n'
+    b'grappling\ngrasp\ngrass\ngratified\ngratify\ngrating\ngratitude\n'
+    b'gratuity\ngravel\ngraveness\ngraves\ngraveyard\ngravitate\ngravity\n'
+    b'gravy\ngray\ngrazing\ngreasily\ngreedily\ngreedless\ngreedy\ngreen\n'
+    b'greeter\ngreeting\ngrew\ngreyhound\ngrid\ngrief\ngrievance\ngrieving\n'
+    b'grievous\ngrill\ngrimace\ngrimacing\ngrime\ngriminess\ngrimy\ngrinch\n'
+    b'grinning\ngrip\ngristle\ngrit\ngroggily\ngroggy\ngroin\ngroom\ngroove\n'
+    b'grooving\ngroovy\ngrope\nground\ngrouped\ngrout\ngrove\ngrower\n'
+    b'growing\ngrowl\ngrub\ngrudge\ngrudging\ngrueling\ngruffly\ngrumble\n'
+    b'grumbling\ngrumbly\ngrumpily\ngrunge\ngrunt\nguacamole\nguidable\n'
+    b'guidance\nguide\nguiding\nguileless\nguise\ngulf\ngullible\ngully\n'
+    b'gulp\ngumball\ngumdrop\ngumminess\ngumming\ngummy\ngurgle\ngurgling\n'
+    b'guru\ngush\ngusto\ngusty\ngutless\nguts\ngutter\nguy\nguzzler\n'
+    b'gyration\nhabitable\nhabitant\nhabitat\nhabitual\nhacked\nhacker\n'
+    b'hacking\nhacksaw\nhad\nhaggler\nhaiku\nhalf\nhalogen\nhalt\nhalved\n'
+    b'halves\nhamburger\nhamlet\nhammock\nhamper\nhamster\nhamstring\n'
+    b'handbag\nhandball\nhandbook\nhandbrake\nhandcart\nhandclap\nhandclasp\n'
+    b'handcraft\nhandcuff\nhanded\nhandful\nhandgrip\nhandgun\nhandheld\n'
+    b'handiness\nhandiwork\nhandlebar\nhandled\nhandler\nhandling\nhandmade\n'
+    b'handoff\nhandpick\nhandprint\nhandrail\nhandsaw\nhandset\nhandsfree\n'
+    b'handshake\nhandstand\nhandwash\nhandwork\nhandwoven\nhandwrite\n'
+    b'handyman\nhangnail\nhangout\nhangover\nhangup\nhankering\nhankie\n'
+    b'hanky\nhaphazard\nhappening\nhappier\nhappiest\nhappily\nhappiness\n'
+    b'happy\nharbor\nhardcopy\nhardcore\nhardcover\nharddisk\nhardened\n'
+    b'hardener\nhardening\nhardhat\nhardhead\nhardiness\nhardly\nhardness\n'
+    b'hardship\nhardware\nhardwired\nhardwood\nhardy\nharmful\nharmless\n'
+    b'harmonica\nharmonics\nharmonize\nharmony\nharness\nharpist\nharsh\n'
+    b'harvest\nhash\nhassle\nhaste\nhastily\nhastiness\nhasty\nhatbox\n'
+    b'hatchback\nhatchery\nhatchet\nhatching\nhatchling\nhate\nhatless\n'
+    b'hatred\nhaunt\nhaven\nhazard\nhazelnut\nhazily\nhaziness\nhazing\nhazy\n'
+    b'headache\nheadband\nheadboard\nheadcount\nheaddress\nheaded\nheader\n'
+    b'headfirst\nheadgear\nheading\nheadlamp\nheadless\nheadlock\nheadphone\n'
+    b'headpiece\nheadrest\nheadroom\nheadscarf\nheadset\nheadsman\nheadstand\n'
+    b'headstone\nheadway\nheadwear\nheap\nheat\nheave\nheavily\nheaviness\n'
+    b'heaving\nhedge\nhedging\nheftiness\nhefty\nhelium\nhelmet\nhelper\n'
+    b'helpful\nhelping\nhelpless\nhelpline\nhemlock\nhemstitch\nhence\n'
+    b'henchman\nhenna\nherald\nherbal\nherbicide\nherbs\nheritage\nhermit\n'
+    b'heroics\nheroism\nherring\nherself\nhertz\nhesitancy\nhesitant\n'
+    b'hesitate\nhexagon\nhexagram\nhubcap\nhuddle\nhuddling\nhuff\nhug\nhula\n'
+    b'hulk\nhull\nhuman\nhumble\nhumbling\nhumbly\nhumid\nhumiliate\n'
+    b'humility\nhumming\nhummus\nhumongous\nhumorist\nhumorless\nhumorous\n'
+    b'humpback\nhumped\nhumvee\nhunchback\nhundredth\nhunger\nhungrily\n'
+    b'hungry\nhunk\nhunter\nhunting\nhuntress\nhuntsman\nhurdle\nhurled\n'
+    b'hurler\nhurling\nhurray\nhurricane\nhurried\nhurry\nhurt\nhusband\n'
+    b'hush\nhusked\nhuskiness\nhut\nhybrid\nhydrant\nhydrated\nhydration\n'
+    b'hydrogen\nhydroxide\nhyperlink\nhypertext\nhyphen\nhypnoses\nhypnosis\n'
+    b'hypnotic\nhypnotism\nhypnotist\nhypnotize\nhypocrisy\nhypocrite\n'
+    b'ibuprofen\nice\niciness\nicing\nicky\nicon\nicy\nidealism\nidealist\n'
+    b'idealize\nideally\nidealness\nidentical\nidentify\nidentity\nideology\n'
+    b'idiocy\nidiom\nidly\nigloo\nignition\nignore\niguana\nillicitly\n'
+    b'illusion\nillusive\nimage\nimaginary\nimagines\nimaging\nimbecile\n'
+    b'imitate\nimitation\nimmature\nimmerse\nimmersion\nimminent\nimmobile\n'
+    b'immodest\nimmorally\nimmortal\nimmovable\nimmovably\nimmunity\n'
+    b'immunize\nimpaired\nimpale\nimpart\nimpatient\nimpeach\nimpeding\n'
+    b'impending\nimperfect\nimperial\nimpish\nimplant\nimplement\nimplicate\n'
+    b'implicit\nimplode\nimplosion\nimplosive\nimply\nimpolite\nimportant\n'
+    b'importer\nimpose\nimposing\nimpotence\nimpotency\nimpotent\nimpound\n'
+    b'imprecise\nimprint\nimprison\nimpromptu\nimproper\nimprove\nimproving\n'
+    b'improvise\nimprudent\nimpulse\nimpulsive\nimpure\nimpurity\niodine\n'
+    b'iodize\nion\nipad\niphone\nipod\nirate\nirk\niron\nirregular\nirrigate\n'
+    b'irritable\nirritably\nirritant\nirritate\nislamic\nislamist\nisolated\n'
+    b'isolating\nisolation\nisotope\nissue\nissuing\nitalicize\nitalics\n'
+    b'item\nitinerary\nitunes\nivory\nivy\njab\njackal\njacket\njackknife\n'
+    b'jackpot\njailbird\njailbreak\njailer\njailhouse\njalapeno\njam\n'
+    b'janitor\njanuary\njargon\njarring\njasmine\njaundice\njaunt\njava\n'
+    b'jawed\njawless\njawline\njaws\njaybird\njaywalker\njazz\njeep\n'
+    b'jeeringly\njellied\njelly\njersey\njester\njet\njiffy\njigsaw\njimmy\n'
+    b'jingle\njingling\njinx\njitters\njittery\njob\njockey\njockstrap\n'
+    b'jogger\njogging\njohn\njoining\njokester\njokingly\njolliness\njolly\n'
+    b'jolt\njot\njovial\njoyfully\njoylessly\njoyous\njoyride\njoystick\n'
+    b'jubilance\njubilant\njudge\njudgingly\njudicial\njudiciary\njudo\n'
+    b'juggle\njuggling\njugular\njuice\njuiciness\njuicy\njujitsu\njukebox\n'
+    b'july\njumble\njumbo\njump\njunction\njuncture\njune\njunior\njuniper\n'
+    b'junkie\njunkman\njunkyard\njurist\njuror\njury\njustice\njustifier\n'
+    b'justify\njustly\njustness\njuvenile\nkabob\nkangaroo\nkaraoke\nkarate\n'
+    b'karma\nkebab\nkeenly\nkeenness\nkeep\nkeg\nkelp\nkennel\nkept\n'
+    b'kerchief\nkerosene\nkettle\nkick\nkiln\nkilobyte\nkilogram\nkilometer\n'
+    b'kilowatt\nkilt\nkimono\nkindle\nkindling\nkindly\nkindness\nkindred\n'
+    b'kinetic\nkinfolk\nking\nkinship\nkinsman\nkinswoman\nkissable\nkisser\n'
+    b'kissing\nkitchen\nkite\nkitten\nkitty\nkiwi\nkleenex\nknapsack\nknee\n'
+    b'knelt\nknickers\nknoll\nkoala\nkooky\nkosher\nkrypton\nkudos\nkung\n'
+    b'labored\nlaborer\nlaboring\nlaborious\nlabrador\nladder\nladies\nladle\n'
+    b'ladybug\nladylike\nlagged\nlagging\nlagoon\nlair\nlake\nlance\nlanded\n'
+    b'landfall\nlandfill\nlanding\nlandlady\nlandless\nlandline\nlandlord\n'
+    b'landmark\nlandmass\nlandmine\nlandowner\nlandscape\nlandside\n'
+    b'landslide\nlanguage\nlankiness\nlanky\nlantern\nlapdog\nlapel\nlapped\n'
+    b'lapping\nlaptop\nlard\nlarge\nlark\nlash\nlasso\nlast\nlatch\nlate\n'
+    b'lather\nlatitude\nlatrine\nlatter\nlatticed\nlaunch\nlaunder\nlaundry\n'
+    b'laurel\nlavender\nlavish\nlaxative\nlazily\nlaziness\nlazy\nlecturer\n'
+    b'left\nlegacy\nlegal\nlegend\nlegged\nleggings\nlegible\nlegibly\n'
+    b'legislate\nlego\nlegroom\nlegume\nlegwarmer\nlegwork\nlemon\nlend\n'
+    b'length\nlens\nlent\nleotard\nlesser\nletdown\nlethargic\nlethargy\n'
+    b'letter\nlettuce\nlevel\nleverage\nlevers\nlevitate\nlevitator\n'
+    b'liability\nliable\nliberty\nlibrarian\nlibrary\nlicking\nlicorice\nlid\n'
+    b'life\nlifter\nlifting\nliftoff\nligament\nlikely\nlikeness\nlikewise\n'
+    b'liking\nlilac\nlilly\nlily\nlimb\nlimeade\nlimelight\nlimes\nlimit\n'
+    b'limping\nlimpness\nline\nlingo\nlinguini\nlinguist\nlining\nlinked\n'
+    b'linoleum\nlinseed\nlint\nlion\nlip\nliquefy\nliqueur\nliquid\nlisp\n'
+    b'list\nlitigate\nlitigator\nlitmus\nlitter\nlittle\nlivable\nlived\n'
+    b'lively\nliver\nlivestock\nlividly\nliving\nlizard\nlubricant\n'
+    b'lubricate\nlucid\nluckily\nluckiness\nluckless\nlucrative\nludicrous\n'
+    b'lugged\nlukewarm\nlullaby\nlumber\nluminance\nluminous\nlumpiness\n'
+    b'lumping\nlumpish\nlunacy\nlunar\nlunchbox\nluncheon\nlunchroom\n'
+    b'lunchtime\nlung\nlurch\nlure\nluridness\nlurk\nlushly\nlushness\n'
+    b'luster\nlustfully\nlustily\nlustiness\nlustrous\nlusty\nluxurious\n'
+    b'luxury\nlying\nlyrically\nlyricism\nlyricist\nlyrics\nmacarena\n'
+    b'macaroni\nmacaw\nmace\nmachine\nmachinist\nmagazine\nmagenta\nmaggot\n'
+    b'magical\nmagician\nmagma\nmagnesium\nmagnetic\nmagnetism\nmagnetize\n'
+    b'magnifier\nmagnify\nmagnitude\nmagnolia\nmahogany\nmaimed\nmajestic\n'
+    b'majesty\nmajorette\nmajority\nmakeover\nmaker\nmakeshift\nmaking\n'
+    b'malformed\nmalt\nmama\nmammal\nmammary\nmammogram\nmanager\nmanaging\n'
+    b'manatee\nmandarin\nmandate\nmandatory\nmandolin\nmanger\nmangle\nmango\n'
+    b'mangy\nmanhandle\nmanhole\nmanhood\nmanhunt\nmanicotti\nmanicure\n'
+    b'manifesto\nmanila\nmankind\nmanlike\nmanliness\nmanly\nmanmade\nmanned\n'
+    b'mannish\nmanor\nmanpower\nmantis\nmantra\nmanual\nmany\nmap\nmarathon\n'
+    b'marauding\nmarbled\nmarbles\nmarbling\nmarch\nmardi\nmargarine\n'
+    b'margarita\nmargin\nmarigold\nmarina\nmarine\nmarital\nmaritime\nmarlin\n'
+    b'marmalade\nmaroon\nmarried\nmarrow\nmarry\nmarshland\nmarshy\n'
+    b'marsupial\nmarvelous\nmarxism\nmascot\nmasculine\nmashed\nmashing\n'
+    b'massager\nmasses\nmassive\nmastiff\nmatador\nmatchbook\nmatchbox\n'
+    b'matcher\nmatching\nmatchless\nmaterial\nmaternal\nmaternity\nmath\n'
+    b'mating\nmatriarch\nmatrimony\nmatrix\nmatron\nmatted\nmatter\nmaturely\n'
+    b'maturing\nmaturity\nmauve\nmaverick\nmaximize\nmaximum\nmaybe\nmayday\n'
+    b'mayflower\nmoaner\nmoaning\nmobile\nmobility\nmobilize\nmobster\nmocha\n'
+    b'mocker\nmockup\nmodified\nmodify\nmodular\nmodulator\nmodule\nmoisten\n'
+    b'moistness\nmoisture\nmolar\nmolasses\nmold\nmolecular\nmolecule\n'
+    b'molehill\nmollusk\nmom\nmonastery\nmonday\nmonetary\nmonetize\n'
+    b'moneybags\nmoneyless\nmoneywise\nmongoose\nmongrel\nmonitor\nmonkhood\n'
+    b'monogamy\nmonogram\nmonologue\nmonopoly\nmonorail\nmonotone\nmonotype\n'
+    b'monoxide\nmonsieur\nmonsoon\nmonstrous\nmonthly\nmonument\nmoocher\n'
+    b'moodiness\nmoody\nmooing\nmoonbeam\nmooned\nmoonlight\nmoonlike\n'
+    b'moonlit\nmoonrise\nmoonscape\nmoonshine\nmoonstone\nmoonwalk\nmop\n'
+    b'morale\nmorality\nmorally\nmorbidity\nmorbidly\nmorphine\nmorphing\n'
+    b'morse\nmortality\nmortally\nmortician\nmortified\nmortify\nmortuary\n'
+    b'mosaic\nmossy\nmost\nmothball\nmothproof\nmotion\nmotivate\nmotivator\n'
+    b'motive\nmotocross\nmotor\nmotto\nmountable\nmountain\nmounted\n'
+    b'mounting\nmourner\nmournful\nmouse\nmousiness\nmoustache\nmousy\nmouth\n'
+    b'movable\nmove\nmovie\nmoving\nmower\nmowing\nmuch\nmuck\nmud\nmug\n'
+    b'mulberry\nmulch\nmule\nmulled\nmullets\nmultiple\nmultiply\nmultitask\n'
+    b'multitude\nmumble\nmumbling\nmumbo\nmummified\nmummify\nmummy\nmumps\n'
+    b'munchkin\nmundane\nmunicipal\nmuppet\nmural\nmurkiness\nmurky\n'
+    b'murmuring\nmuscular\nmuseum\nmushily\nmushiness\nmushroom\nmushy\n'
+    b'music\nmusket\nmuskiness\nmusky\nmustang\nmustard\nmuster\nmustiness\n'
+    b'musty\nmutable\nmutate\nmutation\nmute\nmutilated\nmutilator\nmutiny\n'
+    b'mutt\nmutual\nmuzzle\nmyself\nmyspace\nmystified\nmystify\nmyth\nnacho\n'
+    b'nag\nnail\nname\nnaming\nnanny\nnanometer\nnape\nnapkin\nnapped\n'
+    b'napping\nnappy\nnarrow\nnastily\nnastiness\nnational\nnative\nnativity\n'
+    b'natural\nnature\nnaturist\nnautical\nnavigate\nnavigator\nnavy\nnearby\n'
+    b'nearest\nnearly\nnearness\nneatly\nneatness\nnebula\nnebulizer\nnectar\n'
+    b'negate\nnegation\nnegative\nneglector\nnegligee\nnegligent\nnegotiate\n'
+    b'nemeses\nnemesis\nneon\nnephew\nnerd\nnervous\nnervy\nnest\nnet\n'
+    b'neurology\nneuron\nneurosis\nneurotic\nneuter\nneutron\nnever\nnext\n'
+    b'nibble\nnickname\nnicotine\nniece\nnifty\nnimble\nnimbly\nnineteen\n'
+    b'ninetieth\nninja\nnintendo\nninth\nnuclear\nnuclei\nnucleus\nnugget\n'
+    b'nullify\nnumber\nnumbing\nnumbly\nnumbness\nnumeral\nnumerate\n'
+    b'numerator\nnumeric\nnumerous\nnuptials\nnursery\nnursing\nnurture\n'
+    b'nutcase\nnutlike\nnutmeg\nnutrient\nnutshell\nnuttiness\nnutty\nnuzzle\n'
+    b'nylon\noaf\noak\noasis\noat\nobedience\nobedient\nobituary\nobject\n'
+    b'obligate\nobliged\noblivion\noblivious\noblong\nobnoxious\noboe\n'
+    b'obscure\nobscurity\nobservant\nobserver\nobserving\nobsessed\n'
+    b'obsession\nobsessive\nobsolete\nobstacle\nobstinate\nobstruct\nobtain\n'
+    b'obtrusive\nobtuse\nobvious\noccultist\noccupancy\noccupant\noccupier\n'
+    b'occupy\nocean\nocelot\noctagon\noctane\noctober\noctopus\nogle\noil\n'
+    b'oink\nointment\nokay\nold\nolive\nolympics\nomega\nomen\nominous\n'
+    b'omission\nomit\nomnivore\nonboard\noncoming\nongoing\nonion\nonline\n'
+    b'onlooker\nonly\nonscreen\nonset\nonshore\nonslaught\nonstage\nonto\n'
+    b'onward\nonyx\noops\nooze\noozy\nopacity\nopal\nopen\noperable\noperate\n'
+    b'operating\noperation\noperative\noperator\nopium\nopossum\nopponent\n'
+    b'oppose\nopposing\nopposite\noppressed\noppressor\nopt\nopulently\n'
+    b'osmosis\nother\notter\nouch\nought\nounce\noutage\noutback\noutbid\n'
+    b'outboard\noutbound\noutbreak\noutburst\noutcast\noutclass\noutcome\n'
+    b'outdated\noutdoors\nouter\noutfield\noutfit\noutflank\noutgoing\n'
+    b'outgrow\nouthouse\nouting\noutlast\noutlet\noutline\noutlook\noutlying\n'
+    b'outmatch\noutmost\noutnumber\noutplayed\noutpost\noutpour\noutput\n'
+    b'outrage\noutrank\noutreach\noutright\noutscore\noutsell\noutshine\n'
+    b'outshoot\noutsider\noutskirts\noutsmart\noutsource\noutspoken\n'
+    b'outtakes\noutthink\noutward\noutweigh\noutwit\noval\novary\noven\n'
+    b'overact\noverall\noverarch\noverbid\noverbill\noverbite\noverblown\n'
+    b'overboard\noverbook\noverbuilt\novercast\novercoat\novercome\novercook\n'
+    b'overcrowd\noverdraft\noverdrawn\noverdress\noverdrive\noverdue\n'
+    b'overeager\novereater\noverexert\noverfed\noverfeed\noverfill\noverflow\n'
+    b'overfull\novergrown\noverhand\noverhang\noverhaul\noverhead\noverhear\n'
+    b'overheat\noverhung\noverjoyed\noverkill\noverlabor\noverlaid\noverlap\n'
+    b'overlay\noverload\noverlook\noverlord\noverlying\novernight\noverpass\n'
+    b'overpay\noverplant\noverplay\noverpower\noverprice\noverrate\n'
+    b'overreach\noverreact\noverride\noverripe\noverrule\noverrun\novershoot\n'
+    b'overshot\noversight\noversized\noversleep\noversold\noverspend\n'
+    b'overstate\noverstay\noverstep\noverstock\noverstuff\noversweet\n'
+    b'overtake\noverthrow\novertime\novertly\novertone\noverture\noverturn\n'
+    b'overuse\novervalue\noverview\noverwrite\nowl\noxford\noxidant\n'
+    b'oxidation\noxidize\noxidizing\noxygen\noxymoron\noyster\nozone\npaced\n'
+    b'pacemaker\npacific\npacifier\npacifism\npacifist\npacify\npadded\n'
+    b'padding\npaddle\npaddling\npadlock\npagan\npager\npaging\npajamas\n'
+    b'palace\npalatable\npalm\npalpable\npalpitate\npaltry\npampered\n'
+    b'pamperer\npampers\npamphlet\npanama\npancake\npancreas\npanda\n'
+    b'pandemic\npang\npanhandle\npanic\npanning\npanorama\npanoramic\n'
+    b'panther\npantomime\npantry\npants\npantyhose\npaparazzi\npapaya\npaper\n'
+    b'paprika\npapyrus\nparabola\nparachute\nparade\nparadox\nparagraph\n'
+    b'parakeet\nparalegal\nparalyses\nparalysis\nparalyze\nparamedic\n'
+    b'parameter\nparamount\nparasail\nparasite\nparasitic\nparcel\nparched\n'
+    b'parchment\npardon\nparish\nparka\nparking\nparkway\nparlor\nparmesan\n'
+    b'parole\nparrot\nparsley\nparsnip\npartake\nparted\nparting\npartition\n'
+    b'partly\npartner\npartridge\nparty\npassable\npassably\npassage\n'
+    b'passcode\npassenger\npasserby\npassing\npassion\npassive\npassivism\n'
+    b'passover\npassport\npassword\npasta\npasted\npastel\npastime\npastor\n'
+    b'pastrami\npasture\npasty\npatchwork\npatchy\npaternal\npaternity\npath\n'
+    b'patience\npatient\npatio\npatriarch\npatriot\npatrol\npatronage\n'
+    b'patronize\npauper\npavement\npaver\npavestone\npavilion\npaving\n'
+    b'pawing\npayable\npayback\npaycheck\npayday\npayee\npayer\npaying\n'
+    b'payment\npayphone\npayroll\npebble\npebbly\npecan\npectin\npeculiar\n'
+    b'peddling\npediatric\npedicure\npedigree\npedometer\npegboard\npelican\n'
+    b'pellet\npelt\npelvis\npenalize\npenalty\npencil\npendant\npending\n'
+    b'penholder\npenknife\npennant\npenniless\npenny\npenpal\npension\n'
+    b'pentagon\npentagram\npep\nperceive\npercent\nperch\npercolate\n'
+    b'perennial\nperfected\nperfectly\nperfume\nperiscope\nperish\nperjurer\n'
+    b'perjury\nperkiness\nperky\nperm\nperoxide\nperpetual\nperplexed\n'
+    b'persecute\npersevere\npersuaded\npersuader\npesky\npeso\npessimism\n'
+    b'pessimist\npester\npesticide\npetal\npetite\npetition\npetri\n'
+    b'petroleum\npetted\npetticoat\npettiness\npetty\npetunia\nphantom\n'
+    b'phobia\nphoenix\nphonebook\nphoney\nphonics\nphoniness\nphony\n'
+    b'phosphate\nphoto\nphrase\nphrasing\nplacard\nplacate\nplacidly\nplank\n'
+    b'planner\nplant\nplasma\nplaster\nplastic\nplated\nplatform\nplating\n'
+    b'platinum\nplatonic\nplatter\nplatypus\nplausible\nplausibly\nplayable\n'
+    b'playback\nplayer\nplayful\nplaygroup\nplayhouse\nplaying\nplaylist\n'
+    b'playmaker\nplaymate\nplayoff\nplaypen\nplayroom\nplayset\nplaything\n'
+    b'playtime\nplaza\npleading\npleat\npledge\nplentiful\nplenty\nplethora\n'
+    b'plexiglas\npliable\nplod\nplop\nplot\nplow\nploy\npluck\nplug\nplunder\n'
+    b'plunging\nplural\nplus\nplutonium\nplywood\npoach\npod\npoem\npoet\n'
+    b'pogo\npointed\npointer\npointing\npointless\npointy\npoise\npoison\n'
+    b'poker\npoking\npolar\npolice\npolicy\npolio\npolish\npolitely\npolka\n'
+    b'polo\npolyester\npolygon\npolygraph\npolymer\nponcho\npond\npony\n'
+    b'popcorn\npope\npoplar\npopper\npoppy\npopsicle\npopulace\npopular\n'
+    b'populate\nporcupine\npork\nporous\nporridge\nportable\nportal\n'
+    b'portfolio\nporthole\nportion\nportly\nportside\nposer\nposh\nposing\n'
+    b'possible\npossibly\npossum\npostage\npostal\npostbox\npostcard\nposted\n'
+    b'poster\nposting\npostnasal\nposture\npostwar\npouch\npounce\npouncing\n'
+    b'pound\npouring\npout\npowdered\npowdering\npowdery\npower\npowwow\npox\n'
+    b'praising\nprance\nprancing\npranker\nprankish\nprankster\nprayer\n'
+    b'praying\npreacher\npreaching\npreachy\npreamble\nprecinct\nprecise\n'
+    b'precision\nprecook\nprecut\npredator\npredefine\npredict\npreface\n'
+    b'prefix\npreflight\npreformed\npregame\npregnancy\npregnant\npreheated\n'
+    b'prelaunch\nprelaw\nprelude\npremiere\npremises\npremium\nprenatal\n'
+    b'preoccupy\npreorder\nprepaid\nprepay\npreplan\npreppy\npreschool\n'
+    b'prescribe\npreseason\npreset\npreshow\npresident\npresoak\npress\n'
+    b'presume\npresuming\npreteen\npretended\npretender\npretense\npretext\n'
+    b'pretty\npretzel\nprevail\nprevalent\nprevent\npreview\nprevious\n'
+    b'prewar\nprewashed\nprideful\npried\nprimal\nprimarily\nprimary\n'
+    b'primate\nprimer\nprimp\nprincess\nprint\nprior\nprism\nprison\nprissy\n'
+    b'pristine\nprivacy\nprivate\nprivatize\nprize\nproactive\nprobable\n'
+    b'probably\nprobation\nprobe\nprobing\nprobiotic\nproblem\nprocedure\n'
+    b'process\nproclaim\nprocreate\nprocurer\nprodigal\nprodigy\nproduce\n'
+    b'product\nprofane\nprofanity\nprofessed\nprofessor\nprofile\nprofound\n'
+    b'profusely\nprogeny\nprognosis\nprogram\nprogress\nprojector\nprologue\n'
+    b'prolonged\npromenade\nprominent\npromoter\npromotion\nprompter\n'
+    b'promptly\nprone\nprong\npronounce\npronto\nproofing\nproofread\nproofs\n'
+    b'propeller\nproperly\nproperty\nproponent\nproposal\npropose\nprops\n'
+    b'prorate\nprotector\nprotegee\nproton\nprototype\nprotozoan\nprotract\n'
+    b'protrude\nproud\nprovable\nproved\nproven\nprovided\nprovider\n'
+    b'providing\nprovince\nproving\nprovoke\nprovoking\nprovolone\nprowess\n'
+    b'prowler\nprowling\nproximity\nproxy\nprozac\nprude\nprudishly\nprune\n'
+    b'pruning\npry\npsychic\npublic\npublisher\npucker\npueblo\npug\npull\n'
+    b'pulmonary\npulp\npulsate\npulse\npulverize\npuma\npumice\npummel\n'
+    b'punch\npunctual\npunctuate\npunctured\npungent\npunisher\npunk\npupil\n'
+    b'puppet\npuppy\npurchase\npureblood\npurebred\npurely\npureness\n'
+    b'purgatory\npurge\npurging\npurifier\npurify\npurist\npuritan\npurity\n'
+    b'purple\npurplish\npurposely\npurr\npurse\npursuable\npursuant\npursuit\n'
+    b'purveyor\npushcart\npushchair\npusher\npushiness\npushing\npushover\n'
+    b'pushpin\npushup\npushy\nputdown\nputt\npuzzle\npuzzling\npyramid\n'
+    b'pyromania\npython\nquack\nquadrant\nquail\nquaintly\nquake\nquaking\n'
+    b'qualified\nqualifier\nqualify\nquality\nqualm\nquantum\nquarrel\n'
+    b'quarry\nquartered\nquarterly\nquarters\nquartet\nquench\nquery\n'
+    b'quicken\nquickly\nquickness\nquicksand\nquickstep\nquiet\nquill\nquilt\n'
+    b'quintet\nquintuple\nquirk\nquit\nquiver\nquizzical\nquotable\n'
+    b'quotation\nquote\nrabid\nrace\nracing\nracism\nrack\nracoon\nradar\n'
+    b'radial\nradiance\nradiantly\nradiated\nradiation\nradiator\nradio\n'
+    b'radish\nraffle\nraft\nrage\nragged\nraging\nragweed\nraider\nrailcar\n'
+    b'railing\nrailroad\nrailway\nraisin\nrake\nraking\nrally\nramble\n'
+    b'rambling\nramp\nramrod\nranch\nrancidity\nrandom\nranged\nranger\n'
+    b'ranging\nranked\nranking\nransack\nranting\nrants\nrare\nrarity\n'
+    b'rascal\nrash\nrasping\nravage\nraven\nravine\nraving\nravioli\n'
+    b'ravishing\nreabsorb\nreach\nreacquire\nreaction\nreactive\nreactor\n'
+    b'reaffirm\nream\nreanalyze\nreappear\nreapply\nreappoint\nreapprove\n'
+    b'rearrange\nrearview\nreason\nreassign\nreassure\nreattach\nreawake\n'
+    b'rebalance\nrebate\nrebel\nrebirth\nreboot\nreborn\nrebound\nrebuff\n'
+    b'rebuild\nrebuilt\nreburial\nrebuttal\nrecall\nrecant\nrecapture\n'
+    b'recast\nrecede\nrecent\nrecess\nrecharger\nrecipient\nrecital\nrecite\n'
+    b'reckless\nreclaim\nrecliner\nreclining\nrecluse\nreclusive\nrecognize\n'
+    b'recoil\nrecollect\nrecolor\nreconcile\nreconfirm\nreconvene\nrecopy\n'
+    b'record\nrecount\nrecoup\nrecovery\nrecreate\nrectal\nrectangle\n'
+    b'rectified\nrectify\nrecycled\nrecycler\nrecycling\nreemerge\nreenact\n'
+    b'reenter\nreentry\nreexamine\nreferable\nreferee\nreference\nrefill\n'
+    b'refinance\nrefined\nrefinery\nrefining\nrefinish\nreflected\nreflector\n'
+    b'reflex\nreflux\nrefocus\nrefold\nreforest\nreformat\nreformed\n'
+    b'reformer\nreformist\nrefract\nrefrain\nrefreeze\nrefresh\nrefried\n'
+    b'refueling\nrefund\nrefurbish\nrefurnish\nrefusal\nrefuse\nrefusing\n'
+    b'refutable\nrefute\nregain\nregalia\nregally\nreggae\nregime\nregion\n'
+    b'register\nregistrar\nregistry\nregress\nregretful\nregroup\nregular\n'
+    b'regulate\nregulator\nrehab\nreheat\nrehire\nrehydrate\nreimburse\n'
+    b'reissue\nreiterate\nrejoice\nrejoicing\nrejoin\nrekindle\nrelapse\n'
+    b'relapsing\nrelatable\nrelated\nrelation\nrelative\nrelax\nrelay\n'
+    b'relearn\nrelease\nrelenting\nreliable\nreliably\nreliance\nreliant\n'
+    b'relic\nrelieve\nrelieving\nrelight\nrelish\nrelive\nreload\nrelocate\n'
+    b'relock\nreluctant\nrely\nremake\nremark\nremarry\nrematch\nremedial\n'
+    b'remedy\nremember\nreminder\nremindful\nremission\nremix\nremnant\n'
+    b'remodeler\nremold\nremorse\nremote\nremovable\nremoval\nremoved\n'
+    b'remover\nremoving\nrename\nrenderer\nrendering\nrendition\nrenegade\n'
+    b'renewable\nrenewably\nrenewal\nrenewed\nrenounce\nrenovate\nrenovator\n'
+    b'rentable\nrental\nrented\nrenter\nreoccupy\nreoccur\nreopen\nreorder\n'
+    b'repackage\nrepacking\nrepaint\nrepair\nrepave\nrepaying\nrepayment\n'
+    b'repeal\nrepeated\nrepeater\nrepent\nrephrase\nreplace\nreplay\nreplica\n'
+    b'reply\nreporter\nrepose\nrepossess\nrepost\nrepressed\nreprimand\n'
+    b'reprint\nreprise\nreproach\nreprocess\nreproduce\nreprogram\nreps\n'
+    b'reptile\nreptilian\nrepugnant\nrepulsion\nrepulsive\nrepurpose\n'
+    b'reputable\nreputably\nrequest\nrequire\nrequisite\nreroute\nrerun\n'
+    b'resale\nresample\nrescuer\nreseal\nresearch\nreselect\nreseller\n'
+    b'resemble\nresend\nresent\nreset\nreshape\nreshoot\nreshuffle\n'
+    b'residence\nresidency\nresident\nresidual\nresidue\nresigned\nresilient\n'
+    b'resistant\nresisting\nresize\nresolute\nresolved\nresonant\nresonate\n'
+    b'resort\nresource\nrespect\nresubmit\nresult\nresume\nresupply\n'
+    b'resurface\nresurrect\nretail\nretainer\nretaining\nretake\nretaliate\n'
+    b'retention\nrethink\nretinal\nretired\nretiree\nretiring\nretold\n'
+    b'retool\nretorted\nretouch\nretrace\nretract\nretrain\nretread\nretreat\n'
+    b'retrial\nretrieval\nretriever\nretry\nreturn\nretying\nretype\nreunion\n'
+    b'reunite\nreusable\nreuse\nreveal\nreveler\nrevenge\nrevenue\nreverb\n'
+    b'revered\nreverence\nreverend\nreversal\nreverse\nreversing\nreversion\n'
+    b'revert\nrevisable\nrevise\nrevision\nrevisit\nrevivable\nrevival\n'
+    b'reviver\nreviving\nrevocable\nrevoke\nrevolt\nrevolver\nrevolving\n'
+    b'reward\nrewash\nrewind\nrewire\nreword\nrework\nrewrap\nrewrite\nrhyme\n'
+    b'ribbon\nribcage\nrice\nriches\nrichly\nrichness\nrickety\nricotta\n'
+    b'riddance\nridden\nride\nriding\nrifling\nrift\nrigging\nrigid\nrigor\n'
+    b'rimless\nrimmed\nrind\nrink\nrinse\nrinsing\nriot\nripcord\nripeness\n'
+    b'ripening\nripping\nripple\nrippling\nriptide\nrise\nrising\nrisk\n'
+    b'risotto\nritalin\nritzy\nrival\nriverbank\nriverbed\nriverboat\n'
+    b'riverside\nriveter\nriveting\nroamer\nroaming\nroast\nrobbing\nrobe\n'
+    b'robin\nrobotics\nrobust\nrockband\nrocker\nrocket\nrockfish\nrockiness\n'
+    b'rocking\nrocklike\nrockslide\nrockstar\nrocky\nrogue\nroman\nromp\n'
+    b'rope\nroping\nroster\nrosy\nrotten\nrotting\nrotunda\nroulette\n'
+    b'rounding\nroundish\nroundness\nroundup\nroundworm\nroutine\nrouting\n'
+    b'rover\nroving\nroyal\nrubbed\nrubber\nrubbing\nrubble\nrubdown\nruby\n'
+    b'ruckus\nrudder\nrug\nruined\nrule\nrumble\nrumbling\nrummage\nrumor\n'
+    b'runaround\nrundown\nrunner\nrunning\nrunny\nrunt\nrunway\nrupture\n'
+    b'rural\nruse\nrush\nrust\nrut\nsabbath\nsabotage\nsacrament\nsacred\n'
+    b'sacrifice\nsadden\nsaddlebag\nsaddled\nsaddling\nsadly\nsadness\n'
+    b'safari\nsafeguard\nsafehouse\nsafely\nsafeness\nsaffron\nsaga\nsage\n'
+    b'sagging\nsaggy\nsaid\nsaint\nsake\nsalad\nsalami\nsalaried\nsalary\n'
+    b'saline\nsalon\nsaloon\nsalsa\nsalt\nsalutary\nsalute\nsalvage\n'
+    b'salvaging\nsalvation\nsame\nsample\nsampling\nsanction\nsanctity\n'
+    b'sanctuary\nsandal\nsandbag\nsandbank\nsandbar\nsandblast\nsandbox\n'
+    b'sanded\nsandfish\nsanding\nsandlot\nsandpaper\nsandpit\nsandstone\n'
+    b'sandstorm\nsandworm\nsandy\nsanitary\nsanitizer\nsank\nsanta\nsapling\n'
+    b'sappiness\nsappy\nsarcasm\nsarcastic\nsardine\nsash\nsasquatch\nsassy\n'
+    b'satchel\nsatiable\nsatin\nsatirical\nsatisfied\nsatisfy\nsaturate\n'
+    b'saturday\nsauciness\nsaucy\nsauna\nsavage\nsavanna\nsaved\nsavings\n'
+    b'savior\nsavor\nsaxophone\nsay\nscabbed\nscabby\nscalded\nscalding\n'
+    b'scale\nscaling\nscallion\nscallop\nscalping\nscam\nscandal\nscanner\n'
+    b'scanning\nscant\nscapegoat\nscarce\nscarcity\nscarecrow\nscared\nscarf\n'
+    b'scarily\nscariness\nscarring\nscary\nscavenger\nscenic\nschedule\n'
+    b'schematic\nscheme\nscheming\nschilling\nschnapps\nscholar\nscience\n'
+    b'scientist\nscion\nscoff\nscolding\nscone\nscoop\nscooter\nscope\n'
+    b'scorch\nscorebook\nscorecard\nscored\nscoreless\nscorer\nscoring\n'
+    b'scorn\nscorpion\nscotch\nscoundrel\nscoured\nscouring\nscouting\n'
+    b'scouts\nscowling\nscrabble\nscraggly\nscrambled\nscrambler\nscrap\n'
+    b'scratch\nscrawny\nscreen\nscribble\nscribe\nscribing\nscrimmage\n'
+    b'script\nscroll\nscrooge\nscrounger\nscrubbed\nscrubber\nscruffy\n'
+    b'scrunch\nscrutiny\nscuba\nscuff\nsculptor\nsculpture\nscurvy\nscuttle\n'
+    b'secluded\nsecluding\nseclusion\nsecond\nsecrecy\nsecret\nsectional\n'
+    b'sector\nsecular\nsecurely\nsecurity\nsedan\nsedate\nsedation\nsedative\n'
+    b'sediment\nseduce\nseducing\nsegment\nseismic\nseizing\nseldom\n'
+    b'selected\nselection\nselective\nselector\nself\nseltzer\nsemantic\n'
+    b'semester\nsemicolon\nsemifinal\nseminar\nsemisoft\nsemisweet\nsenate\n'
+    b'senator\nsend\nsenior\nsenorita\nsensation\nsensitive\nsensitize\n'
+    b'sensually\nsensuous\nsepia\nseptember\nseptic\nseptum\nsequel\n'
+    b'sequence\nsequester\nseries\nsermon\nserotonin\nserpent\nserrated\n'
+    b'serve\nservice\nserving\nsesame\nsessions\nsetback\nsetting\nsettle\n'
+    b'settling\nsetup\nsevenfold\nseventeen\nseventh\nseventy\nseverity\n'
+    b'shabby\nshack\nshaded\nshadily\nshadiness\nshading\nshadow\nshady\n'
+    b'shaft\nshakable\nshakily\nshakiness\nshaking\nshaky\nshale\nshallot\n'
+    b'shallow\nshame\nshampoo\nshamrock\nshank\nshanty\nshape\nshaping\n'
+    b'share\nsharpener\nsharper\nsharpie\nsharply\nsharpness\nshawl\nsheath\n'
+    b'shed\nsheep\nsheet\nshelf\nshell\nshelter\nshelve\nshelving\nsherry\n'
+    b'shield\nshifter\nshifting\nshiftless\nshifty\nshimmer\nshimmy\nshindig\n'
+    b'shine\nshingle\nshininess\nshining\nshiny\nship\nshirt\nshivering\n'
+    b'shock\nshone\nshoplift\nshopper\nshopping\nshoptalk\nshore\nshortage\n'
+    b'shortcake\nshortcut\nshorten\nshorter\nshorthand\nshortlist\nshortly\n'
+    b'shortness\nshorts\nshortwave\nshorty\nshout\nshove\nshowbiz\nshowcase\n'
+    b'showdown\nshower\nshowgirl\nshowing\nshowman\nshown\nshowoff\n'
+    b'showpiece\nshowplace\nshowroom\nshowy\nshrank\nshrapnel\nshredder\n'
+    b'shredding\nshrewdly\nshriek\nshrill\nshrimp\nshrine\nshrink\nshrivel\n'
+    b'shrouded\nshrubbery\nshrubs\nshrug\nshrunk\nshucking\nshudder\nshuffle\n'
+    b'shuffling\nshun\nshush\nshut\nshy\nsiamese\nsiberian\nsibling\nsiding\n'
+    b'sierra\nsiesta\nsift\nsighing\nsilenced\nsilencer\nsilent\nsilica\n'
+    b'silicon\nsilk\nsilliness\nsilly\nsilo\nsilt\nsilver\nsimilarly\nsimile\n'
+    b'simmering\nsimple\nsimplify\nsimply\nsincere\nsincerity\nsinger\n'
+    b'singing\nsingle\nsingular\nsinister\nsinless\nsinner\nsinuous\nsip\n'
+    b'siren\nsister\nsitcom\nsitter\nsitting\nsituated\nsituation\nsixfold\n'
+    b'sixteen\nsixth\nsixties\nsixtieth\nsixtyfold\nsizable\nsizably\nsize\n'
+    b'sizing\nsizzle\nsizzling\nskater\nskating\nskedaddle\nskeletal\n'
+    b'skeleton\nskeptic\nsketch\nskewed\nskewer\nskid\nskied\nskier\nskies\n'
+    b'skiing\nskilled\nskillet\nskillful\nskimmed\nskimmer\nskimming\n'
+    b'skimpily\nskincare\nskinhead\nskinless\nskinning\nskinny\nskintight\n'
+    b'skipper\nskipping\nskirmish\nskirt\nskittle\nskydiver\nskylight\n'
+    b'skyline\nskype\nskyrocket\nskyward\nslab\nslacked\nslacker\nslacking\n'
+    b'slackness\nslacks\nslain\nslam\nslander\nslang\nslapping\nslapstick\n'
+    b'slashed\nslashing\nslate\nslather\nslaw\nsled\nsleek\nsleep\nsleet\n'
+    b'sleeve\nslept\nsliceable\nsliced\nslicer\nslicing\nslick\nslider\n'
+    b'slideshow\nsliding\nslighted\nslighting\nslightly\nslimness\nslimy\n'
+    b'slinging\nslingshot\nslinky\nslip\nslit\nsliver\nslobbery\nslogan\n'
+    b'sloped\nsloping\nsloppily\nsloppy\nslot\nslouching\nslouchy\nsludge\n'
+    b'slug\nslum\nslurp\nslush\nsly\nsmall\nsmartly\nsmartness\nsmasher\n'
+    b'smashing\nsmashup\nsmell\nsmelting\nsmile\nsmilingly\nsmirk\nsmite\n'
+    b'smith\nsmitten\nsmock\nsmog\nsmoked\nsmokeless\nsmokiness\nsmoking\n'
+    b'smoky\nsmolder\nsmooth\nsmother\nsmudge\nsmudgy\nsmuggler\nsmuggling\n'
+    b'smugly\nsmugness\nsnack\nsnagged\nsnaking\nsnap\nsnare\nsnarl\nsnazzy\n'
+    b'sneak\nsneer\nsneeze\nsneezing\nsnide\nsniff\nsnippet\nsnipping\n'
+    b'snitch\nsnooper\nsnooze\nsnore\nsnoring\nsnorkel\nsnort\nsnout\n'
+    b'snowbird\nsnowboard\nsnowbound\nsnowcap\nsnowdrift\nsnowdrop\nsnowfall\n'
+    b'snowfield\nsnowflake\nsnowiness\nsnowless\nsnowman\nsnowplow\nsnowshoe\n'
+    b'snowstorm\nsnowsuit\nsnowy\nsnub\nsnuff\nsnuggle\nsnugly\nsnugness\n'
+    b'speak\nspearfish\nspearhead\nspearman\nspearmint\nspecies\nspecimen\n'
+    b'specked\nspeckled\nspecks\nspectacle\nspectator\nspectrum\nspeculate\n'
+    b'speech\nspeed\nspellbind\nspeller\nspelling\nspendable\nspender\n'
+    b'spending\nspent\nspew\nsphere\nspherical\nsphinx\nspider\nspied\n'
+    b'spiffy\nspill\nspilt\nspinach\nspinal\nspindle\nspinner\nspinning\n'
+    b'spinout\nspinster\nspiny\nspiral\nspirited\nspiritism\nspirits\n'
+    b'spiritual\nsplashed\nsplashing\nsplashy\nsplatter\nspleen\nsplendid\n'
+    b'splendor\nsplice\nsplicing\nsplinter\nsplotchy\nsplurge\nspoilage\n'
+    b'spoiled\nspoiler\nspoiling\nspoils\nspoken\nspokesman\nsponge\nspongy\n'
+    b'sponsor\nspoof\nspookily\nspooky\nspool\nspoon\nspore\nsporting\n'
+    b'sports\nsporty\nspotless\nspotlight\nspotted\nspotter\nspotting\n'
+    b'spotty\nspousal\nspouse\nspout\nsprain\nsprang\nsprawl\nspray\nspree\n'
+    b'sprig\nspring\nsprinkled\nsprinkler\nsprint\nsprite\nsprout\nspruce\n'
+    b'sprung\nspry\nspud\nspur\nsputter\nspyglass\nsquabble\nsquad\nsquall\n'
+    b'squander\nsquash\nsquatted\nsquatter\nsquatting\nsqueak\nsquealer\n'
+    b'squealing\nsqueamish\nsqueegee\nsqueeze\nsqueezing\nsquid\nsquiggle\n'
+    b'squiggly\nsquint\nsquire\nsquirt\nsquishier\nsquishy\nstability\n'
+    b'stabilize\nstable\nstack\nstadium\nstaff\nstage\nstaging\nstagnant\n'
+    b'stagnate\nstainable\nstained\nstaining\nstainless\nstalemate\n'
+    b'staleness\nstalling\nstallion\nstamina\nstammer\nstamp\nstand\nstank\n'
+    b'staple\nstapling\nstarboard\nstarch\nstardom\nstardust\nstarfish\n'
+    b'stargazer\nstaring\nstark\nstarless\nstarlet\nstarlight\nstarlit\n'
+    b'starring\nstarry\nstarship\nstarter\nstarting\nstartle\nstartling\n'
+    b'startup\nstarved\nstarving\nstash\nstate\nstatic\nstatistic\nstatue\n'
+    b'stature\nstatus\nstatute\nstatutory\nstaunch\nstays\nsteadfast\n'
+    b'steadier\nsteadily\nsteadying\nsteam\nsteed\nsteep\nsteerable\n'
+    b'steering\nsteersman\nstegosaur\nstellar\nstem\nstench\nstencil\nstep\n'
+    b'stereo\nsterile\nsterility\nsterilize\nsterling\nsternness\nsternum\n'
+    b'stew\nstick\nstiffen\nstiffly\nstiffness\nstifle\nstifling\nstillness\n'
+    b'stilt\nstimulant\nstimulate\nstimuli\nstimulus\nstinger\nstingily\n'
+    b'stinging\nstingray\nstingy\nstinking\nstinky\nstipend\nstipulate\nstir\n'
+    b'stitch\nstock\nstoic\nstoke\nstole\nstomp\nstonewall\nstoneware\n'
+    b'stonework\nstoning\nstony\nstood\nstooge\nstool\nstoop\nstoplight\n'
+    b'stoppable\nstoppage\nstopped\nstopper\nstopping\nstopwatch\nstorable\n'
+    b'storage\nstoreroom\nstorewide\nstorm\nstout\nstove\nstowaway\nstowing\n'
+    b'straddle\nstraggler\nstrained\nstrainer\nstraining\nstrangely\n'
+    b'stranger\nstrangle\nstrategic\nstrategy\nstratus\nstraw\nstray\nstreak\n'
+    b'stream\nstreet\nstrength\nstrenuous\nstrep\nstress\nstretch\nstrewn\n'
+    b'stricken\nstrict\nstride\nstrife\nstrike\nstriking\nstrive\nstriving\n'
+    b'strobe\nstrode\nstroller\nstrongbox\nstrongly\nstrongman\nstruck\n'
+    b'structure\nstrudel\nstruggle\nstrum\nstrung\nstrut\nstubbed\nstubble\n'
+    b'stubbly\nstubborn\nstucco\nstuck\nstudent\nstudied\nstudio\nstudy\n'
+    b'stuffed\nstuffing\nstuffy\nstumble\nstumbling\nstump\nstung\nstunned\n'
+    b'stunner\nstunning\nstunt\nstupor\nsturdily\nsturdy\nstyling\nstylishly\n'
+    b'stylist\nstylized\nstylus\nsuave\nsubarctic\nsubatomic\nsubdivide\n'
+    b'subdued\nsubduing\nsubfloor\nsubgroup\nsubheader\nsubject\nsublease\n'
+    b'sublet\nsublevel\nsublime\nsubmarine\nsubmerge\nsubmersed\nsubmitter\n'
+    b'subpanel\nsubpar\nsubplot\nsubprime\nsubscribe\nsubscript\nsubsector\n'
+    b'subside\nsubsiding\nsubsidize\nsubsidy\nsubsoil\nsubsonic\nsubstance\n'
+    b'subsystem\nsubtext\nsubtitle\nsubtly\nsubtotal\nsubtract\nsubtype\n'
+    b'suburb\nsubway\nsubwoofer\nsubzero\nsucculent\nsuch\nsuction\nsudden\n'
+    b'sudoku\nsuds\nsufferer\nsuffering\nsuffice\nsuffix\nsuffocate\n'
+    b'suffrage\nsugar\nsuggest\nsuing\nsuitable\nsuitably\nsuitcase\nsuitor\n'
+    b'sulfate\nsulfide\nsulfite\nsulfur\nsulk\nsullen\nsulphate\nsulphuric\n'
+    b'sultry\nsuperbowl\nsuperglue\nsuperhero\nsuperior\nsuperjet\nsuperman\n'
+    b'supermom\nsupernova\nsupervise\nsupper\nsupplier\nsupply\nsupport\n'
+    b'supremacy\nsupreme\nsurcharge\nsurely\nsureness\nsurface\nsurfacing\n'
+    b'surfboard\nsurfer\nsurgery\nsurgical\nsurging\nsurname\nsurpass\n'
+    b'surplus\nsurprise\nsurreal\nsurrender\nsurrogate\nsurround\nsurvey\n'
+    b'survival\nsurvive\nsurviving\nsurvivor\nsushi\nsuspect\nsuspend\n'
+    b'suspense\nsustained\nsustainer\nswab\nswaddling\nswagger\nswampland\n'
+    b'swan\nswapping\nswarm\nsway\nswear\nsweat\nsweep\nswell\nswept\nswerve\n'
+    b'swifter\nswiftly\nswiftness\nswimmable\nswimmer\nswimming\nswimsuit\n'
+    b'swimwear\nswinger\nswinging\nswipe\nswirl\nswitch\nswivel\nswizzle\n'
+    b'swooned\nswoop\nswoosh\nswore\nsworn\nswung\nsycamore\nsympathy\n'
+    b'symphonic\nsymphony\nsymptom\nsynapse\nsyndrome\nsynergy\nsynopses\n'
+    b'synopsis\nsynthesis\nsynthetic\nsyrup\nsystem\nt-shirt\ntabasco\ntabby\n'
+    b'tableful\ntables\ntablet\ntableware\ntabloid\ntackiness\ntacking\n'
+    b'tackle\ntackling\ntacky\ntaco\ntactful\ntactical\ntactics\ntactile\n'
+    b'tactless\ntadpole\ntaekwondo\ntag\ntainted\ntake\ntaking\ntalcum\n'
+    b'talisman\ntall\ntalon\ntamale\ntameness\ntamer\ntamper\ntank\ntanned\n'
+    b'tannery\ntanning\ntantrum\ntapeless\ntapered\ntapering\ntapestry\n'
+    b'tapioca\ntapping\ntaps\ntarantula\ntarget\ntarmac\ntarnish\ntarot\n'
+    b'tartar\ntartly\ntartness\ntask\ntassel\ntaste\ntastiness\ntasting\n'
+    b'tasty\ntattered\ntattle\ntattling\ntattoo\ntaunt\ntavern\nthank\nthat\n'
+    b'thaw\ntheater\ntheatrics\nthee\ntheft\ntheme\ntheology\ntheorize\n'
+    b'thermal\nthermos\nthesaurus\nthese\nthesis\nthespian\nthicken\nthicket\n'
+    b'thickness\nthieving\nthievish\nthigh\nthimble\nthing\nthink\nthinly\n'
+    b'thinner\nthinness\nthinning\nthirstily\nthirsting\nthirsty\nthirteen\n'
+    b'thirty\nthong\nthorn\nthose\nthousand\nthrash\nthread\nthreaten\n'
+    b'threefold\nthrift\nthrill\nthrive\nthriving\nthroat\nthrobbing\nthrong\n'
+    b'throttle\nthrowaway\nthrowback\nthrower\nthrowing\nthud\nthumb\n'
+    b'thumping\nthursday\nthus\nthwarting\nthyself\ntiara\ntibia\ntidal\n'
+    b'tidbit\ntidiness\ntidings\ntidy\ntiger\ntighten\ntightly\ntightness\n'
+    b'tightrope\ntightwad\ntigress\ntile\ntiling\ntill\ntilt\ntimid\ntiming\n'
+    b'timothy\ntinderbox\ntinfoil\ntingle\ntingling\ntingly\ntinker\n'
+    b'tinkling\ntinsel\ntinsmith\ntint\ntinwork\ntiny\ntipoff\ntipped\n'
+    b'tipper\ntipping\ntiptoeing\ntiptop\ntiring\ntissue\ntrace\ntracing\n'
+    b'track\ntraction\ntractor\ntrade\ntrading\ntradition\ntraffic\ntragedy\n'
+    b'trailing\ntrailside\ntrain\ntraitor\ntrance\ntranquil\ntransfer\n'
+    b'transform\ntranslate\ntranspire\ntransport\ntranspose\ntrapdoor\n'
+    b'trapeze\ntrapezoid\ntrapped\ntrapper\ntrapping\ntraps\ntrash\ntravel\n'
+    b'traverse\ntravesty\ntray\ntreachery\ntreading\ntreadmill\ntreason\n'
+    b'treat\ntreble\ntree\ntrekker\ntremble\ntrembling\ntremor\ntrench\n'
+    b'trend\ntrespass\ntriage\ntrial\ntriangle\ntribesman\ntribunal\ntribune\n'
+    b'tributary\ntribute\ntriceps\ntrickery\ntrickily\ntricking\ntrickle\n'
+    b'trickster\ntricky\ntricolor\ntricycle\ntrident\ntried\ntrifle\n'
+    b'trifocals\ntrillion\ntrilogy\ntrimester\ntrimmer\ntrimming\ntrimness\n'
+    b'trinity\ntrio\ntripod\ntripping\ntriumph\ntrivial\ntrodden\ntrolling\n'
+    b'trombone\ntrophy\ntropical\ntropics\ntrouble\ntroubling\ntrough\n'
+    b'trousers\ntrout\ntrowel\ntruce\ntruck\ntruffle\ntrump\ntrunks\n'
+    b'trustable\ntrustee\ntrustful\ntrusting\ntrustless\ntruth\ntry\ntubby\n'
+    b'tubeless\ntubular\ntucking\ntuesday\ntug\ntuition\ntulip\ntumble\n'
+    b'tumbling\ntummy\nturban\nturbine\nturbofan\nturbojet\nturbulent\nturf\n'
+    b'turkey\nturmoil\nturret\nturtle\ntusk\ntutor\ntutu\ntux\ntweak\ntweed\n'
+    b'tweet\ntweezers\ntwelve\ntwentieth\ntwenty\ntwerp\ntwice\ntwiddle\n'
+    b'twiddling\ntwig\ntwilight\ntwine\ntwins\ntwirl\ntwistable\ntwisted\n'
+    b'twister\ntwisting\ntwisty\ntwitch\ntwitter\ntycoon\ntying\ntyke\nudder\n'
+    b'ultimate\nultimatum\nultra\numbilical\numbrella\numpire\nunabashed\n'
+    b'unable\nunadorned\nunadvised\nunafraid\nunaired\nunaligned\nunaltered\n'
+    b'unarmored\nunashamed\nunaudited\nunawake\nunaware\nunbaked\nunbalance\n'
+    b'unbeaten\nunbend\nunbent\nunbiased\nunbitten\nunblended\nunblessed\n'
+    b'unblock\nunbolted\nunbounded\nunboxed\nunbraided\nunbridle\nunbroken\n'
+    b'unbuckled\nunbundle\nunburned\nunbutton\nuncanny\nuncapped\nuncaring\n'
+    b'uncertain\nunchain\nunchanged\nuncharted\nuncheck\nuncivil\nunclad\n'
+    b'unclaimed\nunclamped\nunclasp\nuncle\nunclip\nuncloak\nunclog\n'
+    b'unclothed\nuncoated\nuncoiled\nuncolored\nuncombed\nuncommon\nuncooked\n'
+    b'uncork\nuncorrupt\nuncounted\nuncouple\nuncouth\nuncover\nuncross\n'
+    b'uncrown\nuncrushed\nuncured\nuncurious\nuncurled\nuncut\nundamaged\n'
+    b'undated\nundaunted\nundead\nundecided\nundefined\nunderage\nunderarm\n'
+    b'undercoat\nundercook\nundercut\nunderdog\nunderdone\nunderfed\n'
+    b'underfeed\nunderfoot\nundergo\nundergrad\nunderhand\nunderline\n'
+    b'underling\nundermine\nundermost\nunderpaid\nunderpass\nunderpay\n'
+    b'underrate\nundertake\nundertone\nundertook\nundertow\nunderuse\n'
+    b'underwear\nunderwent\nunderwire\nundesired\nundiluted\nundivided\n'
+    b'undocked\nundoing\nundone\nundrafted\nundress\nundrilled\nundusted\n'
+    b'undying\nunearned\nunearth\nunease\nuneasily\nuneasy\nuneatable\n'
+    b'uneaten\nunedited\nunelected\nunending\nunengaged\nunenvied\nunequal\n'
+    b'unethical\nuneven\nunexpired\nunexposed\nunfailing\nunfair\nunfasten\n'
+    b'unfazed\nunfeeling\nunfiled\nunfilled\nunfitted\nunfitting\nunfixable\n'
+    b'unfixed\nunflawed\nunfocused\nunfold\nunfounded\nunframed\nunfreeze\n'
+    b'unfrosted\nunfrozen\nunfunded\nunglazed\nungloved\nunglue\nungodly\n'
+    b'ungraded\nungreased\nunguarded\nunguided\nunhappily\nunhappy\nunharmed\n'
+    b'unhealthy\nunheard\nunhearing\nunheated\nunhelpful\nunhidden\nunhinge\n'
+    b'unhitched\nunholy\nunhook\nunicorn\nunicycle\nunified\nunifier\n'
+    b'uniformed\nuniformly\nunify\nunimpeded\nuninjured\nuninstall\n'
+    b'uninsured\nuninvited\nunion\nuniquely\nunisexual\nunison\nunissued\n'
+    b'unit\nuniversal\nuniverse\nunjustly\nunkempt\nunkind\nunknotted\n'
+    b'unknowing\nunknown\nunlaced\nunlatch\nunlawful\nunleaded\nunlearned\n'
+    b'unleash\nunless\nunleveled\nunlighted\nunlikable\nunlimited\nunlined\n'
+    b'unlinked\nunlisted\nunlit\nunlivable\nunloaded\nunloader\nunlocked\n'
+    b'unlocking\nunlovable\nunloved\nunlovely\nunloving\nunluckily\nunlucky\n'
+    b'unmade\nunmanaged\nunmanned\nunmapped\nunmarked\nunmasked\nunmasking\n'
+    b'unmatched\nunmindful\nunmixable\nunmixed\nunmolded\nunmoral\nunmovable\n'
+    b'unmoved\nunmoving\nunnamable\nunnamed\nunnatural\nunneeded\nunnerve\n'
+    b'unnerving\nunnoticed\nunopened\nunopposed\nunpack\nunpadded\nunpaid\n'
+    b'unpainted\nunpaired\nunpaved\nunpeeled\nunpicked\nunpiloted\nunpinned\n'
+    b'unplanned\nunplanted\nunpleased\nunpledged\nunplowed\nunplug\n'
+    b'unpopular\nunproven\nunquote\nunranked\nunrated\nunraveled\nunreached\n'
+    b'unread\nunreal\nunreeling\nunrefined\nunrelated\nunrented\nunrest\n'
+    b'unretired\nunrevised\nunrigged\nunripe\nunrivaled\nunroasted\nunrobed\n'
+    b'unroll\nunruffled\nunruly\nunrushed\nunsaddle\nunsafe\nunsaid\n'
+    b'unsalted\nunsaved\nunsavory\nunscathed\nunscented\nunscrew\nunsealed\n'
+    b'unseated\nunsecured\nunseeing\nunseemly\nunseen\nunselect\nunselfish\n'
+    b'unsent\nunsettled\nunshackle\nunshaken\nunshaved\nunshaven\nunsheathe\n'
+    b'unshipped\nunsightly\nunsigned\nunskilled\nunsliced\nunsmooth\nunsnap\n'
+    b'unsocial\nunsoiled\nunsold\nunsolved\nunsorted\nunspoiled\nunspoken\n'
+    b'unstable\nunstaffed\nunstamped\nunsteady\nunsterile\nunstirred\n'
+    b'unstitch\nunstopped\nunstuck\nunstuffed\nunstylish\nunsubtle\nunsubtly\n'
+    b'unsuited\nunsure\nunsworn\nuntagged\nuntainted\nuntaken\nuntamed\n'
+    b'untangled\nuntapped\nuntaxed\nunthawed\nunthread\nuntidy\nuntie\nuntil\n'
+    b'untimed\nuntimely\nuntitled\nuntoasted\nuntold\nuntouched\nuntracked\n'
+    b'untrained\nuntreated\nuntried\nuntrimmed\nuntrue\nuntruth\nunturned\n'
+    b'untwist\nuntying\nunusable\nunused\nunusual\nunvalued\nunvaried\n'
+    b'unvarying\nunveiled\nunveiling\nunvented\nunviable\nunvisited\nunvocal\n'
+    b'unwanted\nunwarlike\nunwary\nunwashed\nunwatched\nunweave\nunwed\n'
+    b'unwelcome\nunwell\nunwieldy\nunwilling\nunwind\nunwired\nunwitting\n'
+    b'unwomanly\nunworldly\nunworn\nunworried\nunworthy\nunwound\nunwoven\n'
+    b'unwrapped\nunwritten\nunzip\nupbeat\nupchuck\nupcoming\nupcountry\n'
+    b'update\nupfront\nupgrade\nupheaval\nupheld\nuphill\nuphold\nuplifted\n'
+    b'uplifting\nupload\nupon\nupper\nupright\nuprising\nupriver\nuproar\n'
+    b'uproot\nupscale\nupside\nupstage\nupstairs\nupstart\nupstate\nupstream\n'
+    b'upstroke\nupswing\nuptake\nuptight\nuptown\nupturned\nupward\nupwind\n'
+    b'uranium\nurban\nurchin\nurethane\nurgency\nurgent\nurging\nurologist\n'
+    b'urology\nusable\nusage\nuseable\nused\nuselessly\nuser\nusher\nusual\n'
+    b'utensil\nutility\nutilize\nutmost\nutopia\nutter\nvacancy\nvacant\n'
+    b'vacate\nvacation\nvagabond\nvagrancy\nvagrantly\nvaguely\nvagueness\n'
+    b'valiant\nvalid\nvalium\nvalley\nvaluables\nvalue\nvanilla\nvanish\n'
+    b'vanity\nvanquish\nvantage\nvaporizer\nvariable\nvariably\nvaried\n'
+    b'variety\nvarious\nvarmint\nvarnish\nvarsity\nvarying\nvascular\n'
+    b'vaseline\nvastly\nvastness\nveal\nvegan\nveggie\nvehicular\nvelcro\n'
+    b'velocity\nvelvet\nvendetta\nvending\nvendor\nveneering\nvengeful\n'
+    b'venomous\nventricle\nventure\nvenue\nvenus\nverbalize\nverbally\n'
+    b'verbose\nverdict\nverify\nverse\nversion\nversus\nvertebrae\nvertical\n'
+    b'vertigo\nvery\nvessel\nvest\nveteran\nveto\nvexingly\nviability\n'
+    b'viable\nvibes\nvice\nvicinity\nvictory\nvideo\nviewable\nviewer\n'
+    b'viewing\nviewless\nviewpoint\nvigorous\nvillage\nvillain\nvindicate\n'
+    b'vineyard\nvintage\nviolate\nviolation\nviolator\nviolet\nviolin\nviper\n'
+    b'viral\nvirtual\nvirtuous\nvirus\nvisa\nviscosity\nviscous\nviselike\n'
+    b'visible\nvisibly\nvision\nvisiting\nvisitor\nvisor\nvista\nvitality\n'
+    b'vitalize\nvitally\nvitamins\nvivacious\nvividly\nvividness\nvixen\n'
+    b'vocalist\nvocalize\nvocally\nvocation\nvoice\nvoicing\nvoid\nvolatile\n'
+    b'volley\nvoltage\nvolumes\nvoter\nvoting\nvoucher\nvowed\nvowel\nvoyage\n'
+    b'wackiness\nwad\nwafer\nwaffle\nwaged\nwager\nwages\nwaggle\nwagon\n'
+    b'wake\nwaking\nwalk\nwalmart\nwalnut\nwalrus\nwaltz\nwand\nwannabe\n'
+    b'wanted\nwanting\nwasabi\nwashable\nwashbasin\nwashboard\nwashbowl\n'
+    b'washcloth\nwashday\nwashed\nwasher\nwashhouse\nwashing\nwashout\n'
+    b'washroom\nwashstand\nwashtub\nwasp\nwasting\nwatch\nwater\nwaviness\n'
+    b'waving\nwavy\nwhacking\nwhacky\nwham\nwharf\nwheat\nwhenever\nwhiff\n'
+    b'whimsical\nwhinny\nwhiny\nwhisking\nwhoever\nwhole\nwhomever\nwhoopee\n'
+    b'whooping\nwhoops\nwhy\nwick\nwidely\nwiden\nwidget\nwidow\nwidth\n'
+    b'wieldable\nwielder\nwife\nwifi\nwikipedia\nwildcard\nwildcat\nwilder\n'
+    b'wildfire\nwildfowl\nwildland\nwildlife\nwildly\nwildness\nwilled\n'
+    b'willfully\nwilling\nwillow\nwillpower\nwilt\nwimp\nwince\nwincing\n'
+    b'wind\nwing\nwinking\nwinner\nwinnings\nwinter\nwipe\nwired\nwireless\n'
+    b'wiring\nwiry\nwisdom\nwise\nwish\nwisplike\nwispy\nwistful\nwizard\n'
+    b'wobble\nwobbling\nwobbly\nwok\nwolf\nwolverine\nwomanhood\nwomankind\n'
+    b'womanless\nwomanlike\nwomanly\nwomb\nwoof\nwooing\nwool\nwoozy\nword\n'
+    b'work\nworried\nworrier\nworrisome\nworry\nworsening\nworshiper\nworst\n'
+    b'wound\nwoven\nwow\nwrangle\nwrath\nwreath\nwreckage\nwrecker\nwrecking\n'
+    b'wrench\nwriggle\nwriggly\nwrinkle\nwrinkly\nwrist\nwriting\nwritten\n'
+    b'wrongdoer\nwronged\nwrongful\nwrongly\nwrongness\nwrought\nxbox\nxerox\n'
+    b'yahoo\nyam\nyanking\nyapping\nyard\nyarn\nyeah\nyearbook\nyearling\n'
+    b'yearly\nyearning\nyeast\nyelling\nyelp\nyen\nyesterday\nyiddish\nyield\n'
+    b'yin\nyippee\nyo-yo\nyodel\nyoga\nyogurt\nyonder\nyoyo\nyummy\nzap\n'
+    b'zealous\nzebra\nzen\nzeppelin\nzero\nzestfully\nzesty\nzigzagged\n'
+    b'zipfile\nzipping\nzippy\nzips\nzit\nzodiac\nzombie\nzone\nzoning\n'
+    b'zookeeper\nzoologist\nzoology\nzoom\n'
 )